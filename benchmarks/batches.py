@@ -0,0 +1,49 @@
+"""
+Rewriting a load of parsed INSERTs, spread over many partitions with some
+rows written more than once, as single partition batches: statements per
+second through optimize_cql, and how many batches and statements come out.
+
+Run from the repository root with: PYTHONPATH=. python benchmarks/batches.py
+"""
+import random
+import timeit
+
+from cql3parser import CQL3Nodes
+from cql3parser.batches import optimize_cql
+from cql3parser.schema import Catalog
+
+STATEMENTS = 20000
+
+SCHEMA = [
+    "CREATE KEYSPACE ks WITH replication = {'class': 'SimpleStrategy'}",
+    "CREATE TABLE ks.events (user bigint, at int, kind text, body text, "
+    "PRIMARY KEY (user, at))",
+]
+
+
+def main():
+    catalog = Catalog()
+    for text in SCHEMA:
+        catalog.apply(CQL3Nodes(text).statement())
+
+    insert = ("INSERT INTO ks.events (user, at, {0}) "
+              "VALUES ({1}, {2}, 'x{3}')")
+    statements = [CQL3Nodes(insert.format(
+        random.choice(['kind', 'body']), random.randint(0, 2000),
+        random.randint(0, 20), i)).statement() for i in range(STATEMENTS)]
+
+    for max_pending in [1000, 10000]:
+        batches = list(optimize_cql(statements, catalog,
+                                    max_pending=max_pending))
+        seconds = min(timeit.repeat(
+            lambda: list(optimize_cql(statements, catalog,
+                                      max_pending=max_pending)),
+            number=1, repeat=3))
+        print('max_pending {0:>6}: {1:,.0f} statements/second, '
+              '{2:,} batches of {3:,} statements'.format(
+                  max_pending, STATEMENTS / seconds, len(batches),
+                  sum(text.count('INSERT') for text in batches)))
+
+
+if __name__ == '__main__':
+    main()
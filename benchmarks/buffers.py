@@ -0,0 +1,103 @@
+"""
+Tokenizing and parsing UTF-8 encoded statements by decoding them first,
+against tokenizing and parsing the bytes in place with the buffers module,
+for statements as they arrive from the wire and for an mmap'd dump file.
+
+    PYTHONPATH=. python benchmarks/buffers.py
+"""
+import io
+import mmap
+import os
+import tempfile
+import timeit
+
+from cql3parser import CQL3, from_buffer, iter_buffer_statements
+from cql3parser.buffers import tokenize_buffer
+from cql3parser.lexer import tokenize
+from cql3parser.script import iter_statements, split_statements
+
+CORPUS = [
+    u"INSERT INTO ks.t (k, c, a) VALUES ('{0} th\xe9 {1}', {0}, 1.5)",
+    u"SELECT a, b FROM ks.\"caf\xe9\" WHERE k = '{1}' AND c > {0}",
+    u"DELETE a FROM ks.t WHERE k = '{1}' AND c = {0}",
+]
+
+
+def report(name, n, elapsed):
+    print('{0:32} {1:10.0f} statements/s'.format(name, n / elapsed))
+
+
+def wire(statements):
+    data = [statement.encode('utf-8') for statement in statements]
+    n = len(data)
+
+    def decoded(rule):
+        for d in data:
+            rule(d.decode('utf-8'))
+
+    def buffered(rule):
+        for d in data:
+            rule(d)
+
+    report('wire, tokenize decoded', n, timeit.timeit(
+        lambda: decoded(tokenize), number=1))
+    report('wire, tokenize_buffer', n, timeit.timeit(
+        lambda: buffered(tokenize_buffer), number=1))
+    report('wire, parse decoded', n, timeit.timeit(
+        lambda: decoded(lambda text: CQL3(text).statement()), number=1))
+    report('wire, from_buffer', n, timeit.timeit(
+        lambda: buffered(lambda d: from_buffer(d).statement()), number=1))
+
+
+def dump(statements):
+    fd, path = tempfile.mkstemp(suffix='.cql')
+    with os.fdopen(fd, 'wb') as f:
+        for statement in statements:
+            f.write((statement + u';\n').encode('utf-8'))
+
+    def text():
+        with io.open(path, 'r', encoding='utf-8') as f:
+            for statement in split_statements(f):
+                tokenize(statement)
+
+    def buffer():
+        with open(path, 'rb') as f:
+            m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            tokenize_buffer(m)
+            m.close()
+
+    def parse_text():
+        with io.open(path, 'r', encoding='utf-8') as f:
+            for statement in iter_statements(f):
+                pass
+
+    def parse_buffer():
+        with open(path, 'rb') as f:
+            m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            for statement in iter_buffer_statements(m):
+                pass
+            m.close()
+
+    n = len(statements)
+    try:
+        report('dump, split and tokenize text', n, timeit.timeit(
+            text, number=1))
+        report('dump, tokenize_buffer of mmap', n, timeit.timeit(
+            buffer, number=1))
+        report('dump, iter_statements', n, timeit.timeit(
+            parse_text, number=1))
+        report('dump, iter_buffer_statements', n, timeit.timeit(
+            parse_buffer, number=1))
+    finally:
+        os.remove(path)
+
+
+def main(n=10000):
+    statements = [CORPUS[i % len(CORPUS)].format(i, 'x' * 200)
+                  for i in range(n)]
+    wire(statements)
+    dump(statements)
+
+
+if __name__ == '__main__':
+    main()
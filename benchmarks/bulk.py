@@ -0,0 +1,42 @@
+"""
+Throughput of parse_many with different numbers of workers against parsing
+serially.
+
+    python benchmarks/bulk.py
+"""
+import multiprocessing
+import timeit
+
+from cql3parser import CQL3
+from cql3parser.bulk import parse_many
+
+CORPUS = [
+    "SELECT a, b FROM ks.t WHERE k = '{0}' AND c > {0} LIMIT 100",
+    "INSERT INTO ks.t (k, c, a) VALUES ('{0}', {0}, 1.5) USING TTL 3600",
+    "DELETE a FROM ks.t WHERE k = '{0}' AND c = {0}",
+]
+
+
+def main(n=20000):
+    statements = [CORPUS[i % len(CORPUS)].format(i) for i in range(n)]
+
+    def serial():
+        for q in statements:
+            CQL3(q).statement()
+
+    elapsed = timeit.timeit(serial, number=1)
+    print('serial     {0:8.0f} statements/s'.format(n / elapsed))
+
+    workers = 1
+    while workers <= multiprocessing.cpu_count():
+        elapsed = timeit.timeit(
+            lambda: list(parse_many(statements, workers=workers,
+                                    chunksize=500)),
+            number=1)
+        print('{0:2} workers {1:8.0f} statements/s'.format(
+            workers, n / elapsed))
+        workers *= 2
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""
+Parse a mixed workload with the statement rule, comparing dispatch on the
+leading keywords against trying every statement rule in order.
+
+    python benchmarks/dispatch.py
+"""
+import timeit
+
+from parsley import makeGrammar
+
+from cql3parser import CQL3, grammar
+from cql3parser.grammar import TokenGrammarBase, wrapTokenGrammar
+
+ORDERED_CHOICE = '''
+statement = ( use
+            | drop
+            | truncate
+            | grant
+            | revoke
+            | list_users
+            | list_permissions
+            | create_user
+            | alter_user
+            | create_index
+            | create_keyspace
+            | alter_keyspace
+            | select
+            | insert
+            | delete
+            | batch )
+'''
+
+# Roughly what a busy application and its migrations send, mostly DML.
+WORKLOAD = (
+    ["SELECT a, b FROM ks.t WHERE k = 'x' AND c > 10 LIMIT 100"] * 40 +
+    ["INSERT INTO ks.t (k, c, a, b) VALUES (?, ?, 'a', 1.5) "
+     "USING TTL 3600"] * 30 +
+    ["DELETE a FROM ks.t WHERE k = 'x' AND c = 1"] * 10 +
+    ["BEGIN BATCH INSERT INTO ks.t (k, c) VALUES ('x', 1); "
+     "DELETE FROM ks.t WHERE k = 'y' APPLY BATCH"] * 5 +
+    ["USE ks", "TRUNCATE ks.t", "DROP INDEX idx",
+     "GRANT SELECT ON KEYSPACE ks TO app",
+     "REVOKE MODIFY ON TABLE ks.t FROM app",
+     "LIST USERS", "LIST ALL PERMISSIONS OF app",
+     "CREATE USER app WITH PASSWORD 'secret' NOSUPERUSER",
+     "ALTER USER app NOSUPERUSER", "CREATE INDEX ON ks.t (a)",
+     "CREATE KEYSPACE ks WITH replication = {'class': 'SimpleStrategy'}",
+     "ALTER KEYSPACE ks WITH durable_writes = false"])
+
+
+def ordered_choice_grammar():
+    return wrapTokenGrammar(makeGrammar(
+        grammar._read_grammar() + ORDERED_CHOICE, grammar.bindings, 'cql3',
+        unwrap=True, extends=TokenGrammarBase))
+
+
+def main(number=5):
+    ordered = ordered_choice_grammar()
+
+    results = []
+    for parser in [ordered, CQL3]:
+        for q in WORKLOAD:
+            assert parser(q).statement() == CQL3(q).statement()
+
+        def parse():
+            for q in WORKLOAD:
+                parser(q).statement()
+
+        results.append(min(timeit.repeat(parse, number=number, repeat=3)) /
+                       (number * len(WORKLOAD)))
+
+    print('{0} statements  ordered choice {1:7.1f}us  dispatch {2:7.1f}us  '
+          '{3:4.2f}x'.format(len(WORKLOAD), results[0] * 1e6,
+                             results[1] * 1e6, results[0] / results[1]))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+"""
+Throughput of parsing statements which only differ in their literals, with
+CQL3 directly and with parse_fingerprinted sharing one cached template.
+
+    python benchmarks/fingerprint.py
+"""
+import timeit
+
+from cql3parser import CQL3
+from cql3parser.cache import LRUCache
+from cql3parser.fingerprint import fingerprint, parse_fingerprinted
+
+QUERY = ("SELECT a, b, c FROM ks.events "
+         "WHERE k = '{0}' AND ts >= {0} AND ts < {1} LIMIT 100")
+
+
+def main(number=2000):
+    queries = [QUERY.format(i, i + 10) for i in range(number)]
+
+    def parse():
+        for q in queries:
+            CQL3(q).select()
+
+    def fingerprinted():
+        cache = LRUCache()
+        for q in queries:
+            parse_fingerprinted(q, cache=cache)
+
+    def fingerprint_only():
+        for q in queries:
+            fingerprint(q)
+
+    for name, fn in [('CQL3(q).select()', parse),
+                     ('parse_fingerprinted', fingerprinted),
+                     ('fingerprint', fingerprint_only)]:
+        elapsed = min(timeit.repeat(fn, number=1, repeat=3))
+        print('{0:20} {1:10.0f} statements/s'.format(
+            name, number / elapsed))
+
+
+if __name__ == '__main__':
+    main()
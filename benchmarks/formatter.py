@@ -0,0 +1,63 @@
+"""
+Round trip the statements in cql3parser/test_grammar.py through the parser
+and cql3fmt and measure the throughput of each half.
+
+Run from the repository root with: PYTHONPATH=. python benchmarks/formatter.py
+"""
+import ast
+import os
+import timeit
+
+from cql3parser import CQL3Nodes
+from cql3parser.formatter import to_cql
+
+TEST_GRAMMAR = os.path.join(
+    os.path.dirname(__file__), '..', 'cql3parser', 'test_grammar.py')
+
+
+def corpus():
+    """
+    Every string literal in test_grammar.py which is a whole statement.
+    """
+    with open(TEST_GRAMMAR) as f:
+        tree = ast.parse(f.read())
+
+    statements = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Str):
+            continue
+        try:
+            CQL3Nodes(node.s).statement()
+        except Exception:
+            continue
+        statements.append(node.s)
+    return statements
+
+
+def best(stmt, number):
+    return min(timeit.repeat(stmt, number=number, repeat=5))
+
+
+def main():
+    texts = corpus()
+    parsed = [CQL3Nodes(text).statement() for text in texts]
+
+    for text, statement in zip(texts, parsed):
+        assert CQL3Nodes(to_cql(statement)).statement() == statement, text
+
+    number = 20
+    count = len(texts) * number
+    parse = best(lambda: [CQL3Nodes(text).statement() for text in texts],
+                 number)
+    render = best(lambda: [to_cql(statement) for statement in parsed],
+                  number)
+
+    print('{0} statements from test_grammar.py'.format(len(texts)))
+    print('  parse:  {0:.0f} statements/s'.format(count / parse))
+    print('  format: {0:.0f} statements/s'.format(count / render))
+    print('  round trip: {0:.0f} statements/s'.format(
+        count / (parse + render)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,38 @@
+"""
+Time a cold `import cql3parser` in a fresh interpreter, loading the parser
+from the generated module and compiling cql3.parsley with makeGrammar.
+
+    python benchmarks/import_time.py
+"""
+import subprocess
+import sys
+import timeit
+
+GENERATED = 'import cql3parser'
+
+# Blocking the generated module makes grammar._load fall back to makeGrammar.
+COMPILED = ("import sys; sys.modules['cql3parser._generated.cql3'] = None; "
+            "import cql3parser")
+
+
+def cold_import(statement, number):
+    best = None
+    for _ in range(number):
+        start = timeit.default_timer()
+        subprocess.check_call([sys.executable, '-c', statement])
+        elapsed = timeit.default_timer() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main(number=5):
+    generated = cold_import(GENERATED, number)
+    compiled = cold_import(COMPILED, number)
+
+    print('generated module: {0:8.4f}s'.format(generated))
+    print('makeGrammar:      {0:8.4f}s'.format(compiled))
+    print('speedup:          {0:8.1f}x'.format(compiled / generated))
+
+
+if __name__ == '__main__':
+    main()
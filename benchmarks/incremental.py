@@ -0,0 +1,38 @@
+"""
+Measure the latency of a keystroke in the middle of schema buffers of
+growing size, parsing the whole buffer against Document.edit.
+
+Run from the repository root with:
+
+    PYTHONPATH=. python benchmarks/incremental.py
+"""
+import time
+
+from cql3parser.incremental import Document
+
+STATEMENT = (u"CREATE INDEX idx_{0} ON ks.table_{0} (column_{0});\n"
+             u"INSERT INTO ks.table_{0} (a, b) VALUES ({0}, 'x');\n")
+
+
+def main():
+    for size in (10, 100, 1000, 5000):
+        text = u''.join(STATEMENT.format(i) for i in range(size // 2))
+
+        start = time.time()
+        document = Document(text)
+        full = time.time() - start
+
+        # Type a few characters into a value in the middle of the buffer.
+        offset = text.index(u"'x'", len(text) // 2) + 2
+        keystrokes = 20
+        start = time.time()
+        for i in range(keystrokes):
+            document = document.edit(offset + i, offset + i, u'y')
+        edit = (time.time() - start) / keystrokes
+
+        print('{0:5} statements: full parse {1:8.1f}ms, edit {2:.2f}ms'.format(
+            size, full * 1000, edit * 1000))
+
+
+if __name__ == '__main__':
+    main()
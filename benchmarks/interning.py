@@ -0,0 +1,49 @@
+"""
+Compare parsing with and without an InternPool: how many name objects the
+results hold on to and how long parsing takes.
+
+Run from the repository root with: PYTHONPATH=. python benchmarks/interning.py
+"""
+import time
+
+from cql3parser import CQL3Nodes, nodes
+from cql3parser.interning import InternPool, interning_parser
+
+STATEMENTS = [
+    "SELECT a, b, c FROM ks.t{0} WHERE k = {1}".format(i % 20, i)
+    for i in range(5000)
+]
+
+NAMES = (nodes.Identifier, nodes.Keyspace, nodes.Table, nodes.Column)
+
+
+def names(value, found):
+    if isinstance(value, NAMES):
+        found.add(id(value))
+    if isinstance(value, nodes.Node):
+        for field in value.__slots__:
+            names(getattr(value, field), found)
+    elif isinstance(value, list):
+        for item in value:
+            names(item, found)
+
+
+def run(label, parser):
+    start = time.time()
+    results = [parser(s).select() for s in STATEMENTS]
+    elapsed = time.time() - start
+
+    found = set()
+    for result in results:
+        names(result, found)
+    print('{0}: {1} name objects, {2:.0f} statements/s'.format(
+        label, len(found), len(STATEMENTS) / elapsed))
+
+
+def main():
+    run('CQL3Nodes          ', CQL3Nodes)
+    run('interning CQL3Nodes', interning_parser(InternPool(nodes)))
+
+
+if __name__ == '__main__':
+    main()
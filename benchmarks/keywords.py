@@ -0,0 +1,64 @@
+"""
+Micro-benchmarks for the keyword heavy rules, comparing the hashed keyword
+tables against the grammar level k and alias rules with list lookups they
+replaced.
+
+    python benchmarks/keywords.py
+"""
+import timeit
+
+from parsley import makeGrammar
+
+from cql3parser import CQL3, grammar
+from cql3parser.grammar import TokenGrammarBase, wrapTokenGrammar
+
+LIST_KEYWORDS = '''
+k :expected = tok('keyword'):kw ?(kw in keywords and kw == expected) -> kw
+
+a_keyspace = ( k('KEYSPACE') | k('SCHEMA') ) -> 'KEYSPACE'
+a_table = ( k('TABLE') | k('COLUMNFAMILY') ) -> 'TABLE'
+
+unreserved_keyword = ( word:kw ?(kw in unreserved_keywords) -> kw
+                     | native_type:nt -> nt.args[-1] )
+'''
+
+STATEMENTS = [
+    ('select',
+     "SELECT a, b, WRITETIME(c), TTL(d) FROM ks.t "
+     "WHERE k = 'x' AND c >= 1 AND c < 10 "
+     "ORDER BY c DESC LIMIT 10 ALLOW FILTERING"),
+    ('list_permissions',
+     "LIST ALL PERMISSIONS ON ks.t OF someone NORECURSIVE"),
+    ('list_permissions', "LIST SELECT PERMISSION ON ks.t"),
+    ('create_user',
+     "CREATE USER someone WITH PASSWORD 'secret' NOSUPERUSER"),
+]
+
+
+def list_keyword_grammar():
+    bindings = dict(grammar.bindings,
+                    keywords=grammar.keywords,
+                    unreserved_keywords=grammar.unreserved_keywords)
+    return wrapTokenGrammar(makeGrammar(
+        grammar._read_grammar() + LIST_KEYWORDS, bindings, 'cql3',
+        unwrap=True, extends=TokenGrammarBase))
+
+
+def main(number=2000):
+    lists = list_keyword_grammar()
+
+    for rule, q in STATEMENTS:
+        results = []
+        for parser in [lists, CQL3]:
+            assert getattr(parser(q), rule)() == getattr(CQL3(q), rule)()
+            results.append(min(timeit.repeat(
+                lambda: getattr(parser(q), rule)(),
+                number=number, repeat=3)) / number)
+
+        print('{0:17} lists {1:7.1f}us  tables {2:7.1f}us  {3:4.2f}x'.format(
+            rule, results[0] * 1e6, results[1] * 1e6,
+            results[0] / results[1]))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+Compare parsing long INSERT and SELECT statements with the token grammar
+against the character level grammar cql3parser used before it had a lexer.
+That grammar is read from the git history, so this needs a git checkout.
+
+    python benchmarks/lexer.py
+"""
+import os
+import subprocess
+import timeit
+import uuid
+
+from parsley import makeGrammar
+
+from cql3parser import CQL3, grammar
+from cql3parser.keywords import KEYWORDS
+
+# The last revision of the grammar before it was run over tokens.
+CHARACTERS = 'adf022c05960d795c1f8c62d5154514fe4d98ff5:cql3parser/cql3.parsley'
+
+
+def character_grammar():
+    bindings = dict(grammar.bindings, UUID=uuid.UUID, keywords=KEYWORDS)
+    source = subprocess.check_output(
+        ['git', 'show', CHARACTERS],
+        cwd=os.path.dirname(os.path.abspath(__file__)))
+    return makeGrammar(source.decode('utf-8'), bindings, 'cql3_characters')
+
+
+def long_insert(n):
+    columns = ', '.join('column_{0}'.format(i) for i in range(n))
+    values = ', '.join(
+        ["'value {0}'".format(i) if i % 3 == 0 else
+         str(i * 1.5) if i % 3 == 1 else
+         str(i) for i in range(n)])
+    return 'INSERT INTO ks.wide ({0}) VALUES ({1}) USING TTL 86400'.format(
+        columns, values)
+
+
+def long_select(n):
+    selectors = ', '.join('column_{0}'.format(i) for i in range(n))
+    keys = ', '.join("'key {0}'".format(i) for i in range(n))
+    return ('SELECT {0} FROM ks.wide WHERE key IN ({1}) '
+            'AND clustering >= 10 AND clustering < 100 '
+            'ORDER BY clustering DESC LIMIT 1000'.format(selectors, keys))
+
+
+def main(number=20):
+    characters = character_grammar()
+
+    for name, rule, make in [('INSERT', 'insert', long_insert),
+                             ('SELECT', 'select', long_select)]:
+        for n in [10, 100]:
+            q = make(n)
+            assert (getattr(characters(q), rule)() ==
+                    getattr(CQL3(q), rule)())
+
+            results = []
+            for parser in [characters, CQL3]:
+                results.append(min(timeit.repeat(
+                    lambda: getattr(parser(q), rule)(),
+                    number=number, repeat=3)) / number)
+
+            print('{0} {1:4} items ({2:5} chars): characters {3:8.2f}ms  '
+                  'tokens {4:8.2f}ms  {5:4.1f}x'.format(
+                      name, n, len(q), results[0] * 1000, results[1] * 1000,
+                      results[0] / results[1]))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""
+Scaling of long collection literals and IN lists from 10 to 100k items,
+comparing the literals and literal_map rules against the grammar level
+rules they replaced.  Reports the parse time per item and the growth in
+peak memory, measured in a fresh process for each parse.
+
+Run from the repository root with: PYTHONPATH=. python benchmarks/literals.py
+"""
+import resource
+import subprocess
+import sys
+import time
+
+from parsley import makeGrammar
+
+from cql3parser import grammar
+from cql3parser.grammar import TokenGrammarBase, wrapTokenGrammar
+
+GRAMMAR_RULES = '''
+map_pair = final_term:k ':' final_term:v -> (k, v)
+
+map = ( '{' '}' -> {}
+      | '{' map_pair:first (',' map_pair)*:rest '}'
+        -> dict([first] + rest) )
+
+term_list = final_term:first (',' final_term)*:rest -> [first] + rest
+
+terms = term:first (',' term)*:rest -> [first] + rest
+'''
+
+CASES = {
+    'IN list': lambda n: "SELECT * FROM t WHERE k IN ({0})".format(
+        ', '.join(str(i) for i in range(n))),
+    'IN list of ?': lambda n: "SELECT * FROM t WHERE k IN ({0})".format(
+        ', '.join('?' for i in range(n))),
+    'list': lambda n: "INSERT INTO t (k, l) VALUES (1, [{0}])".format(
+        ', '.join(str(i) for i in range(n))),
+    'set': lambda n: "INSERT INTO t (k, s) VALUES (1, {{{0}}})".format(
+        ', '.join("'v{0}'".format(i) for i in range(n))),
+    'map': lambda n: "INSERT INTO t (k, m) VALUES (1, {{{0}}})".format(
+        ', '.join("'k{0}': {0}".format(i) for i in range(n))),
+}
+
+SIZES = [10, 100, 1000, 10000, 100000]
+
+
+def parser(which):
+    if which == 'literals':
+        return grammar.CQL3Nodes
+    return wrapTokenGrammar(makeGrammar(
+        grammar._read_grammar() + GRAMMAR_RULES, grammar.node_bindings,
+        'cql3', unwrap=True, extends=TokenGrammarBase))
+
+
+def measure(which, case, size):
+    """
+    Parse one statement and print the seconds it took and the growth in
+    peak memory in kB, run in a fresh process.
+    """
+    cql = parser(which)
+    text = CASES[case](int(size))
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    start = time.time()
+    cql(text).statement()
+    elapsed = time.time() - start
+
+    after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print('{0} {1}'.format(elapsed, after - before))
+
+
+def run(which, case, size):
+    output = subprocess.check_output(
+        [sys.executable, __file__, which, case, str(size)])
+    elapsed, memory = output.split()
+    return float(elapsed), int(memory)
+
+
+def main():
+    print('{0:14}{1:>8}  {2:>22}  {3:>22}'.format(
+        '', 'items', 'grammar rules', 'literals'))
+    for case in sorted(CASES):
+        for size in SIZES:
+            row = []
+            for which in ('grammar', 'literals'):
+                elapsed, memory = run(which, case, size)
+                row.append('{0:7.1f}us/item {1:6}kB'.format(
+                    elapsed / size * 1e6, memory))
+            print('{0:14}{1:8}  {2}  {3}'.format(case, size, *row))
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        measure(*sys.argv[1:])
+    else:
+        main()
@@ -0,0 +1,74 @@
+"""
+Compare the memory and construction time of terms and cql3parser.nodes.
+
+Run from the repository root with: PYTHONPATH=. python benchmarks/nodes.py
+"""
+import sys
+import timeit
+
+from parsley import termMaker as t
+from terml.nodes import Term
+
+from cql3parser import CQL3, CQL3Nodes, nodes
+
+STATEMENT = (
+    "SELECT a, b, WRITETIME(c) FROM ks.t WHERE k = 'x' AND c > 10 "
+    "AND d IN (1, 2, 3) ORDER BY c DESC LIMIT 100")
+
+
+def deep_size(value, seen=None):
+    """
+    The bytes used by value and the containers and nodes it refers to, not
+    counting the strings and numbers both representations share.
+    """
+    if seen is None:
+        seen = set()
+    if id(value) in seen or isinstance(value, (str, int, float)):
+        return 0
+    seen.add(id(value))
+
+    size = sys.getsizeof(value)
+    if isinstance(value, Term):
+        size += deep_size(value.tag, seen) + deep_size(value.args, seen)
+    elif isinstance(value, nodes.Node):
+        for field in value.__slots__:
+            size += deep_size(getattr(value, field), seen)
+    elif isinstance(value, (list, tuple, set)):
+        for item in value:
+            size += deep_size(item, seen)
+    elif isinstance(value, dict):
+        for k, v in value.items():
+            size += deep_size(k, seen) + deep_size(v, seen)
+    elif hasattr(value, '__dict__'):
+        size += deep_size(value.__dict__, seen)
+    return size
+
+
+def best(stmt, number):
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number
+
+
+def main():
+    term = CQL3(STATEMENT).select()
+    node = CQL3Nodes(STATEMENT).select()
+    print('memory of a parsed select:')
+    print('  terms: {0} bytes'.format(deep_size(term)))
+    print('  nodes: {0} bytes'.format(deep_size(node)))
+
+    term_time = best(lambda: t.Column(t.Identifier('x')), 20000)
+    node_time = best(lambda: nodes.Column(nodes.Identifier('x')), 20000)
+    print('building Column(Identifier(x)):')
+    print('  terms: {0:.2f}us'.format(term_time * 1e6))
+    print('  nodes: {0:.2f}us ({1:.1f}x)'.format(
+        node_time * 1e6, term_time / node_time))
+
+    term_time = best(lambda: CQL3(STATEMENT).select(), 200)
+    node_time = best(lambda: CQL3Nodes(STATEMENT).select(), 200)
+    print('parsing the select:')
+    print('  CQL3:      {0:.1f}us'.format(term_time * 1e6))
+    print('  CQL3Nodes: {0:.1f}us ({1:.2f}x)'.format(
+        node_time * 1e6, term_time / node_time))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""
+Compare parsing without memoizing rules, with parsley's memoizing of rules
+without arguments and with packrat_parser memoizing every rule, on long IN
+lists and big map and set literals.
+
+Run from the repository root with: PYTHONPATH=. python benchmarks/packrat.py
+"""
+import timeit
+
+from cql3parser.grammar import (
+    CQL3, TokenGrammarBase, _load, packrat_parser)
+
+
+class NoMemoGrammarBase(TokenGrammarBase):
+    def _apply(self, rule, ruleName, args):
+        if args:
+            return TokenGrammarBase._apply(self, rule, ruleName, args)
+        try:
+            return rule()
+        except Exception as e:
+            e.trail.append(ruleName)
+            raise
+
+
+def in_list(n):
+    return "SELECT * FROM t WHERE k IN ({0})".format(
+        ', '.join(str(i) for i in range(n)))
+
+
+def map_literal(n):
+    return "INSERT INTO t (k, m) VALUES (1, {{{0}}})".format(
+        ', '.join("'k{0}': {0}".format(i) for i in range(n)))
+
+
+def set_literal(n):
+    return "INSERT INTO t (k, s) VALUES (1, {{{0}}})".format(
+        ', '.join("'v{0}'".format(i) for i in range(n)))
+
+
+CASES = [
+    ('short select', "SELECT a, b FROM ks.t WHERE k = 1 AND c > 'x'"),
+    ('IN list of 100', in_list(100)),
+    ('IN list of 1000', in_list(1000)),
+    ('map of 100', map_literal(100)),
+    ('map of 1000', map_literal(1000)),
+    ('set of 1000', set_literal(1000)),
+]
+
+
+def best(parser, text):
+    number = max(1, 20000 // len(text))
+    return min(timeit.repeat(lambda: parser(text).statement(),
+                             number=number, repeat=3)) / number
+
+
+def main():
+    parsers = [
+        ('no memo', _load(base=NoMemoGrammarBase)),
+        ('parsley', CQL3),
+        ('packrat', packrat_parser()),
+        ('packrat 256', packrat_parser(256)),
+    ]
+
+    print('{0:16}'.format('') + ''.join(
+        '{0:>14}'.format(name) for name, _ in parsers))
+    for name, text in CASES:
+        times = [best(parser, text) for _, parser in parsers]
+        print('{0:16}'.format(name) + ''.join(
+            '{0:12.2f}ms'.format(t * 1000) for t in times))
+
+
+if __name__ == '__main__':
+    main()
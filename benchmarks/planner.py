@@ -0,0 +1,56 @@
+"""
+The cost of planning SELECTs inline: planning each statement from scratch
+against planning with the plans memoized by statement shape, next to the
+cost of parsing the statement in the first place.
+
+Run from the repository root with: PYTHONPATH=. python benchmarks/planner.py
+"""
+import timeit
+
+from cql3parser import CQL3Nodes
+from cql3parser.planner import Planner
+from cql3parser.schema import Catalog
+
+SCHEMA = [
+    "CREATE KEYSPACE ks WITH replication = {'class': 'SimpleStrategy'}",
+    "CREATE TABLE ks.events (user uuid, day int, at timeuuid, kind text, "
+    "email text, body text, PRIMARY KEY ((user, day), at, kind))",
+    "CREATE INDEX ON ks.events (email)",
+]
+
+CASES = [
+    ('single', "SELECT * FROM ks.events WHERE user = ? AND day = 1"),
+    ('clustering', "SELECT body FROM ks.events WHERE user = ? AND day = 1 "
+                   "AND at > ? ORDER BY at DESC LIMIT 100"),
+    ('multi', "SELECT * FROM ks.events WHERE user IN (?, ?, ?) AND day = 1"),
+    ('index', "SELECT * FROM ks.events WHERE email = 'x'"),
+    ('filtered', "SELECT * FROM ks.events WHERE body = 'x' "
+                 "ALLOW FILTERING"),
+]
+
+
+def best(f, number):
+    return min(timeit.repeat(f, number=number, repeat=5)) / number
+
+
+def main():
+    catalog = Catalog()
+    for text in SCHEMA:
+        catalog.apply(CQL3Nodes(text).statement())
+
+    print('{0:12}{1:>12}{2:>12}{3:>12}'.format(
+        '', 'parse', 'uncached', 'memoized'))
+    for name, text in CASES:
+        statement = CQL3Nodes(text).statement()
+        planner = Planner(catalog)
+        table = catalog.table(statement.table)
+
+        parse = best(lambda: CQL3Nodes(text).statement(), 200)
+        uncached = best(lambda: planner._plan(statement, table), 10000)
+        memoized = best(lambda: planner.plan(statement), 10000)
+        print('{0:12}{1:10.1f}us{2:10.1f}us{3:10.1f}us'.format(
+            name, parse * 1e6, uncached * 1e6, memoized * 1e6))
+
+
+if __name__ == '__main__':
+    main()
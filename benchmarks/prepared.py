@@ -0,0 +1,39 @@
+"""
+Compare building statements by binding a prepared statement with parsing
+and formatting them.
+
+Run from the repository root with: PYTHONPATH=. python benchmarks/prepared.py
+"""
+import timeit
+
+from cql3parser import CQL3Nodes, prepare
+from cql3parser.formatter import to_cql
+
+TEMPLATE = ("INSERT INTO ks.events (id, kind, payload, tags) "
+            "VALUES (?, ?, ?, ?) USING TTL 86400")
+VALUES = [42, 'click', "{'x': 1}", ['a', 'b']]
+
+
+def text(values):
+    return TEMPLATE.replace('?', '{}').format(*[to_cql(v) for v in values])
+
+
+def best(stmt, number):
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number
+
+
+def main():
+    prepared = prepare(TEMPLATE)
+    assert CQL3Nodes(prepared.bind(VALUES)).statement() == CQL3Nodes(
+        text(VALUES)).statement()
+
+    reparse = best(lambda: to_cql(CQL3Nodes(text(VALUES)).statement()), 200)
+    bind = best(lambda: prepared.bind(VALUES), 20000)
+
+    print('parse and format: {0:.0f} statements/s'.format(1 / reparse))
+    print('bind:             {0:.0f} statements/s ({1:.0f}x)'.format(
+        1 / bind, reparse / bind))
+
+
+if __name__ == '__main__':
+    main()
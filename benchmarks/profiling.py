@@ -0,0 +1,47 @@
+"""
+Profile the grammar over a mixed workload, printing the hottest rules, and
+measure how much slower profiling makes parsing.
+
+    PYTHONPATH=. python benchmarks/profiling.py
+"""
+import timeit
+
+from cql3parser import CQL3
+from cql3parser.profiling import Profile, profiling_parser
+
+CORPUS = [
+    "SELECT a, b FROM ks.t WHERE k = '{0}' AND c > {0} LIMIT 100",
+    "INSERT INTO ks.t (k, c, a) VALUES ('{0}', {0}, 1.5) USING TTL 3600",
+    "DELETE a FROM ks.t WHERE k = '{0}' AND c = {0}",
+    "UPDATE ks.t SET a = 1 WHERE k = '{0}'",
+    "CREATE KEYSPACE ks{0} WITH replication = "
+    "{{'class': 'SimpleStrategy', 'replication_factor': 3}}",
+    "GRANT SELECT ON ks.t{0} TO user{0}",
+]
+
+
+def parse_all(parser, statements):
+    for statement in statements:
+        try:
+            parser(statement).statement()
+        except Exception:
+            pass
+
+
+def main(n=600):
+    statements = [CORPUS[i % len(CORPUS)].format(i) for i in range(n)]
+    profile = Profile()
+    profiled = profiling_parser(profile)
+
+    plain = timeit.timeit(lambda: parse_all(CQL3, statements), number=1)
+    profiling = timeit.timeit(
+        lambda: parse_all(profiled, statements), number=1)
+
+    print(profile.table(limit=20))
+    print('')
+    print('parsing {0:.3f}s, profiling {1:.3f}s, {2:.1f}x slower'.format(
+        plain, profiling, profiling / plain))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""
+Parsing a migration script with parse_script, which carries on past bad
+statements, against iter_statements on the same script without them.
+
+    PYTHONPATH=. python benchmarks/recovery.py
+"""
+import timeit
+
+from io import StringIO
+
+from cql3parser import iter_statements, parse_script
+
+CORPUS = [
+    u"INSERT INTO ks.t (k, c, a) VALUES ('{0}', {0}, 1.5);\n",
+    u"SELECT a, b FROM ks.t WHERE k = '{0}' AND c > {0};\n",
+    u"DELETE a FROM ks.t WHERE k = '{0}' AND c = {0};\n",
+]
+
+BAD = [
+    u"SELECT a, b FROM ks.t WHERE k = ;\n",
+    u"INSERT INTO ks.t (k) VALUES ('{0}')\n",
+    u"BEGIN BATCH DELETE a FROM ks.t WHERE k = '{0}';\n",
+]
+
+
+def main(n=5000, every=100):
+    good = [CORPUS[i % len(CORPUS)].format(i) for i in range(n)]
+    bad = list(good)
+    for i in range(0, n, every):
+        bad[i] = BAD[(i // every) % len(BAD)].format(i)
+    good, bad = u''.join(good), u''.join(bad)
+
+    elapsed = timeit.timeit(
+        lambda: list(iter_statements(StringIO(good))), number=1)
+    print('iter_statements, no errors  {0:8.0f} statements/s'.format(
+        n / elapsed))
+
+    elapsed = timeit.timeit(lambda: parse_script(StringIO(good)), number=1)
+    print('parse_script, no errors     {0:8.0f} statements/s'.format(
+        n / elapsed))
+
+    result = []
+    elapsed = timeit.timeit(
+        lambda: result.append(parse_script(StringIO(bad))), number=1)
+    statements, errors = result[0]
+    print('parse_script, {0} errors    {1:8.0f} statements/s, {2} '
+          'statements parsed'.format(len(errors), n / elapsed,
+                                     len(statements)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""
+Murmur3 token throughput: hashing keys one at a time in python, hashing
+them together with numpy, serializing bigint keys with numpy too, and
+routing parsed INSERTs.
+
+Run from the repository root with: PYTHONPATH=. python benchmarks/routing.py
+"""
+import os
+import random
+import timeit
+import uuid
+
+from cql3parser import CQL3Nodes
+from cql3parser.routing import (
+    group_by_range, key_tokens, murmur3, murmur3_many)
+from cql3parser.schema import Catalog
+
+KEYS = 1000000
+
+
+def rate(f, count):
+    return count / min(timeit.repeat(f, number=1, repeat=3))
+
+
+def main():
+    bigints = [random.randint(-2 ** 63, 2 ** 63 - 1) for _ in range(KEYS)]
+    uuids = [uuid.UUID(bytes=os.urandom(16)).bytes for _ in range(KEYS)]
+    texts = [('user-%d' % random.randint(0, 10 ** random.randint(1, 9))
+              ).encode('ascii') for _ in range(KEYS)]
+    bigint = CQL3Nodes('bigint').native_type()
+
+    print('{0:28}{1:>14}'.format('', 'keys/second'))
+    print('{0:28}{1:14,.0f}'.format(
+        'murmur3, uuid keys', rate(lambda: [murmur3(k) for k in uuids[:50000]],
+                                   50000)))
+    print('{0:28}{1:14,.0f}'.format(
+        'murmur3_many, uuid keys', rate(lambda: murmur3_many(uuids), KEYS)))
+    print('{0:28}{1:14,.0f}'.format(
+        'murmur3_many, text keys', rate(lambda: murmur3_many(texts), KEYS)))
+    print('{0:28}{1:14,.0f}'.format(
+        'key_tokens, bigint values',
+        rate(lambda: key_tokens(bigint, bigints), KEYS)))
+
+    catalog = Catalog()
+    for text in ["CREATE KEYSPACE ks WITH replication = {'class': 'x'}",
+                 "CREATE TABLE ks.t (k bigint PRIMARY KEY, v text)"]:
+        catalog.apply(CQL3Nodes(text).statement())
+    insert = "INSERT INTO ks.t (k, v) VALUES ({0}, 'x')"
+    statements = [CQL3Nodes(insert.format(k)).statement()
+                  for k in bigints[:5000]]
+    ring = sorted(random.randint(-2 ** 63, 2 ** 63 - 1) for _ in range(256))
+    print('{0:28}{1:14,.0f}'.format(
+        'group_by_range, INSERTs',
+        rate(lambda: group_by_range(statements, catalog, ring),
+             len(statements))))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""
+Replaying a migration history into a schema Catalog: parsing 100k DDL
+statements, applying them, and resolving columns against the result.
+
+Run from the repository root with: PYTHONPATH=. python benchmarks/schema.py
+"""
+import timeit
+
+from cql3parser import CQL3Nodes
+from cql3parser.schema import Catalog
+
+STATEMENTS = 100000
+
+
+def history(n):
+    """
+    Yield n statements migrating tables in a few keyspaces: each table is
+    created, altered, indexed and every fourth one dropped again.
+    """
+    count = 0
+    table = 0
+    while True:
+        keyspace = 'ks{0}'.format(table // 1000)
+        name = '{0}.t{1}'.format(keyspace, table)
+        if table % 1000 == 0:
+            statements = [
+                "CREATE KEYSPACE {0} WITH replication = "
+                "{{'class': 'SimpleStrategy', 'replication_factor': 3}}"
+                .format(keyspace)]
+        else:
+            statements = []
+
+        statements += [
+            "CREATE TABLE {0} (id uuid, day int, at timeuuid, v text, "
+            "PRIMARY KEY ((id, day), at)) WITH comment = 'x'".format(name),
+            "ALTER TABLE {0} ADD email text".format(name),
+            "ALTER TABLE {0} ADD tags set<text>".format(name),
+            "CREATE INDEX ON {0} (email)".format(name),
+            "ALTER TABLE {0} ALTER v TYPE blob".format(name),
+            "ALTER TABLE {0} WITH gc_grace_seconds = 10".format(name),
+            "ALTER TABLE {0} RENAME at TO time".format(name),
+        ]
+        if table % 4 == 3:
+            statements.append("DROP TABLE {0}".format(name))
+
+        for statement in statements:
+            yield statement
+            count += 1
+            if count == n:
+                return
+        table += 1
+
+
+def main():
+    texts = list(history(STATEMENTS))
+
+    start = timeit.default_timer()
+    statements = [CQL3Nodes(text).statement() for text in texts]
+    parse = timeit.default_timer() - start
+
+    catalog = Catalog()
+    start = timeit.default_timer()
+    catalog.apply_all(statements)
+    apply = timeit.default_timer() - start
+
+    tables = sum(len(k.tables) for k in catalog.keyspaces.values())
+    table = CQL3Nodes('ks1.t1000').table()
+    column = CQL3Nodes('email').column()
+    lookups = min(timeit.repeat(
+        lambda: catalog.column(table, column), number=100000, repeat=3))
+
+    print('{0} statements, {1} tables in {2} keyspaces'.format(
+        len(statements), tables, len(catalog.keyspaces)))
+    print('parse {0:8.2f}s  {1:6.1f}us/statement'.format(
+        parse, parse / len(statements) * 1e6))
+    print('apply {0:8.2f}s  {1:6.1f}us/statement'.format(
+        apply, apply / len(statements) * 1e6))
+    print('column lookup    {0:6.2f}us'.format(lookups / 100000 * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""
+The cost of recording source spans: parsing with CQL3Nodes, which records
+none, against parsing with CQL3Spans, and the memory the spans take.
+
+Run from the repository root with: PYTHONPATH=. python benchmarks/spans.py
+"""
+import sys
+import timeit
+
+from cql3parser import CQL3Nodes
+from cql3parser.spans import CQL3Spans, parse_spans
+
+CASES = [
+    ('use', "USE ks"),
+    ('short select', "SELECT a, b FROM ks.t WHERE k = 1 AND c > 'x'"),
+    ('select', "SELECT a, ttl(b), writetime(c) FROM ks.t "
+               "WHERE k = 'x' AND c IN (1, 2, 3) AND d > ? "
+               "ORDER BY c DESC LIMIT 10 ALLOW FILTERING"),
+    ('insert', "INSERT INTO ks.t (k, a, b, c) VALUES ('x', 1, {1, 2}, "
+               "{'a': 1}) USING TTL 3600 AND TIMESTAMP 12345"),
+    ('batch', "BEGIN BATCH " + "INSERT INTO t (k, v) VALUES (1, 'x'); " * 10 +
+              "APPLY BATCH"),
+]
+
+
+def best(parser, text):
+    return min(timeit.repeat(lambda: parser(text).statement(),
+                             number=200, repeat=5)) / 200
+
+
+def size(spans):
+    return (sys.getsizeof(spans.starts) + sys.getsizeof(spans.ends) +
+            sys.getsizeof(spans.nodes) + sys.getsizeof(spans._index))
+
+
+def main():
+    print('{0:14}{1:>12}{2:>12}{3:>10}{4:>8}{5:>12}'.format(
+        '', 'spans off', 'spans on', 'overhead', 'nodes', 'bytes/node'))
+    for name, text in CASES:
+        off = best(CQL3Nodes, text)
+        on = best(CQL3Spans, text)
+        _, spans = parse_spans(text)
+        print('{0:14}{1:10.0f}us{2:10.0f}us{3:9.0f}%{4:8}{5:12.0f}'.format(
+            name, off * 1e6, on * 1e6, (on / off - 1) * 100, len(spans),
+            size(spans) / float(len(spans))))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""
+Compare validating a batch of rows a column at a time, with and without
+numpy, against validating it a row at a time.
+
+Run from the repository root with: PYTHONPATH=. python benchmarks/validation.py
+"""
+import random
+import timeit
+
+from cql3parser import prepare, validation
+from cql3parser.validation import invalid_rows, validate
+
+INSERT = prepare("INSERT INTO t (id, n, total, ratio) VALUES (?, ?, ?, ?)",
+                 {'id': 'int', 'n': 'int', 'total': 'bigint',
+                  'ratio': 'float'})
+
+ROWS = [[i, random.randint(-1000, 1000), random.randint(0, 2 ** 40),
+         random.random()] for i in range(100000)]
+
+
+def by_row():
+    for row in ROWS:
+        validate(INSERT, row)
+
+
+def best(stmt):
+    return min(timeit.repeat(stmt, number=1, repeat=3))
+
+
+def main():
+    rows = best(by_row)
+    print('{0} rows'.format(len(ROWS)))
+    print('  by row:             {0:.3f}s'.format(rows))
+
+    numpy = validation.numpy
+    validation.numpy = None
+    python = best(lambda: invalid_rows(INSERT, ROWS))
+    print('  by column:          {0:.3f}s ({1:.1f}x)'.format(
+        python, rows / python))
+
+    validation.numpy = numpy
+    if numpy is not None:
+        vectorized = best(lambda: invalid_rows(INSERT, ROWS))
+        print('  by column, numpy:   {0:.3f}s ({1:.1f}x)'.format(
+            vectorized, rows / vectorized))
+
+
+if __name__ == '__main__':
+    main()
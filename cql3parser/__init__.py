@@ -1,5 +1,17 @@
-from cql3parser.grammar import CQL3
+from cql3parser.grammar import CQL3, CQL3Nodes
+from cql3parser.cache import parse_cached
+from cql3parser.script import iter_statements, parse_script
+from cql3parser.prepared import prepare
+from cql3parser.buffers import from_buffer, iter_buffer_statements
 
 CQL3  # appease pyflakes
+CQL3Nodes
+parse_cached
+iter_statements
+parse_script
+prepare
+from_buffer
+iter_buffer_statements
 
-__all__ = ('CQL3',)
+__all__ = ('CQL3', 'CQL3Nodes', 'parse_cached', 'iter_statements',
+           'parse_script', 'prepare', 'from_buffer', 'iter_buffer_statements')
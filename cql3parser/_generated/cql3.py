@@ -0,0 +1,2434 @@
+# Generated by cql3parser.generate from cql3.parsley, do not edit.
+# flake8: noqa
+
+GRAMMAR_HASH = 'f3c7e0fac167510531ab9bbccddb83cd905dcc7b'
+
+
+def createParserClass(GrammarBase, ruleGlobals):
+    if ruleGlobals is None:
+        ruleGlobals = {}
+    class cql3(GrammarBase):
+        def rule_a_keyspace(self):
+            _locals = {'self': self}
+            self.locals['a_keyspace'] = _locals
+            _G_python_1, lastError = 'KEYSPACE', None
+            self.considerError(lastError, 'a_keyspace')
+            _G_apply_2, lastError = self._apply(self.rule_alias, "alias", [_G_python_1])
+            self.considerError(lastError, 'a_keyspace')
+            return (_G_apply_2, self.currentError)
+
+
+        def rule_a_table(self):
+            _locals = {'self': self}
+            self.locals['a_table'] = _locals
+            _G_python_3, lastError = 'TABLE', None
+            self.considerError(lastError, 'a_table')
+            _G_apply_4, lastError = self._apply(self.rule_alias, "alias", [_G_python_3])
+            self.considerError(lastError, 'a_table')
+            return (_G_apply_4, self.currentError)
+
+
+        def rule_unreserved_keyword(self):
+            _locals = {'self': self}
+            self.locals['unreserved_keyword'] = _locals
+            def _G_or_5():
+                _G_apply_6, lastError = self._apply(self.rule_word, "word", [])
+                self.considerError(lastError, None)
+                _locals['kw'] = _G_apply_6
+                def _G_pred_7():
+                    _G_python_8, lastError = eval('kw in unreserved_keywords', self.globals, _locals), None
+                    self.considerError(lastError, None)
+                    return (_G_python_8, self.currentError)
+                _G_pred_9, lastError = self.pred(_G_pred_7)
+                self.considerError(lastError, None)
+                _G_python_10, lastError = eval('kw', self.globals, _locals), None
+                self.considerError(lastError, None)
+                return (_G_python_10, self.currentError)
+            def _G_or_11():
+                _G_apply_12, lastError = self._apply(self.rule_word, "word", [])
+                self.considerError(lastError, None)
+                _locals['kw'] = _G_apply_12
+                def _G_pred_13():
+                    _G_python_14, lastError = eval('kw in native_types', self.globals, _locals), None
+                    self.considerError(lastError, None)
+                    return (_G_python_14, self.currentError)
+                _G_pred_15, lastError = self.pred(_G_pred_13)
+                self.considerError(lastError, None)
+                _G_python_16, lastError = eval('native_types[kw]', self.globals, _locals), None
+                self.considerError(lastError, None)
+                return (_G_python_16, self.currentError)
+            _G_or_17, lastError = self._or([_G_or_5, _G_or_11])
+            self.considerError(lastError, 'unreserved_keyword')
+            return (_G_or_17, self.currentError)
+
+
+        def rule_native_type(self):
+            _locals = {'self': self}
+            self.locals['native_type'] = _locals
+            _G_apply_18, lastError = self._apply(self.rule_word, "word", [])
+            self.considerError(lastError, 'native_type')
+            _locals['kw'] = _G_apply_18
+            def _G_pred_19():
+                _G_python_20, lastError = eval('kw in native_types', self.globals, _locals), None
+                self.considerError(lastError, None)
+                return (_G_python_20, self.currentError)
+            _G_pred_21, lastError = self.pred(_G_pred_19)
+            self.considerError(lastError, 'native_type')
+            _G_python_22, lastError = eval('t.NativeType(kw, native_types[kw])', self.globals, _locals), None
+            self.considerError(lastError, 'native_type')
+            return (_G_python_22, self.currentError)
+
+
+        def rule_identifier(self):
+            _locals = {'self': self}
+            self.locals['identifier'] = _locals
+            _G_apply_23, lastError = self._apply(self.rule_word, "word", [])
+            self.considerError(lastError, 'identifier')
+            _locals['i'] = _G_apply_23
+            _G_python_24, lastError = eval('t.Identifier(i.lower())', self.globals, _locals), None
+            self.considerError(lastError, 'identifier')
+            return (_G_python_24, self.currentError)
+
+
+        def rule_quoted_name(self):
+            _locals = {'self': self}
+            self.locals['quoted_name'] = _locals
+            _G_python_25, lastError = 'quoted_name', None
+            self.considerError(lastError, 'quoted_name')
+            _G_apply_26, lastError = self._apply(self.rule_tok, "tok", [_G_python_25])
+            self.considerError(lastError, 'quoted_name')
+            _locals['n'] = _G_apply_26
+            _G_python_27, lastError = eval('t.QuotedName(n)', self.globals, _locals), None
+            self.considerError(lastError, 'quoted_name')
+            return (_G_python_27, self.currentError)
+
+
+        def rule_string(self):
+            _locals = {'self': self}
+            self.locals['string'] = _locals
+            _G_python_28, lastError = 'string', None
+            self.considerError(lastError, 'string')
+            _G_apply_29, lastError = self._apply(self.rule_tok, "tok", [_G_python_28])
+            self.considerError(lastError, 'string')
+            return (_G_apply_29, self.currentError)
+
+
+        def rule_integer(self):
+            _locals = {'self': self}
+            self.locals['integer'] = _locals
+            _G_python_30, lastError = 'integer', None
+            self.considerError(lastError, 'integer')
+            _G_apply_31, lastError = self._apply(self.rule_tok, "tok", [_G_python_30])
+            self.considerError(lastError, 'integer')
+            return (_G_apply_31, self.currentError)
+
+
+        def rule_float(self):
+            _locals = {'self': self}
+            self.locals['float'] = _locals
+            _G_python_32, lastError = 'float', None
+            self.considerError(lastError, 'float')
+            _G_apply_33, lastError = self._apply(self.rule_tok, "tok", [_G_python_32])
+            self.considerError(lastError, 'float')
+            return (_G_apply_33, self.currentError)
+
+
+        def rule_uuid(self):
+            _locals = {'self': self}
+            self.locals['uuid'] = _locals
+            _G_python_34, lastError = 'uuid', None
+            self.considerError(lastError, 'uuid')
+            _G_apply_35, lastError = self._apply(self.rule_tok, "tok", [_G_python_34])
+            self.considerError(lastError, 'uuid')
+            return (_G_apply_35, self.currentError)
+
+
+        def rule_timeuuid(self):
+            _locals = {'self': self}
+            self.locals['timeuuid'] = _locals
+            _G_apply_36, lastError = self._apply(self.rule_uuid, "uuid", [])
+            self.considerError(lastError, 'timeuuid')
+            return (_G_apply_36, self.currentError)
+
+
+        def rule_boolean(self):
+            _locals = {'self': self}
+            self.locals['boolean'] = _locals
+            def _G_or_37():
+                _G_python_38, lastError = 'TRUE', None
+                self.considerError(lastError, None)
+                _G_apply_39, lastError = self._apply(self.rule_k, "k", [_G_python_38])
+                self.considerError(lastError, None)
+                _G_python_40, lastError = True, None
+                self.considerError(lastError, None)
+                return (_G_python_40, self.currentError)
+            def _G_or_41():
+                _G_python_42, lastError = 'FALSE', None
+                self.considerError(lastError, None)
+                _G_apply_43, lastError = self._apply(self.rule_k, "k", [_G_python_42])
+                self.considerError(lastError, None)
+                _G_python_44, lastError = False, None
+                self.considerError(lastError, None)
+                return (_G_python_44, self.currentError)
+            _G_or_45, lastError = self._or([_G_or_37, _G_or_41])
+            self.considerError(lastError, 'boolean')
+            return (_G_or_45, self.currentError)
+
+
+        def rule_map(self):
+            _locals = {'self': self}
+            self.locals['map'] = _locals
+            def _G_or_46():
+                _G_exactly_47, lastError = self.exactly('{')
+                self.considerError(lastError, None)
+                _G_exactly_48, lastError = self.exactly('}')
+                self.considerError(lastError, None)
+                _G_python_49, lastError = {}, None
+                self.considerError(lastError, None)
+                return (_G_python_49, self.currentError)
+            def _G_or_50():
+                _G_exactly_51, lastError = self.exactly('{')
+                self.considerError(lastError, None)
+                _G_apply_52, lastError = self._apply(self.rule_literal_map, "literal_map", [])
+                self.considerError(lastError, None)
+                _locals['m'] = _G_apply_52
+                _G_exactly_53, lastError = self.exactly('}')
+                self.considerError(lastError, None)
+                _G_python_54, lastError = eval('m', self.globals, _locals), None
+                self.considerError(lastError, None)
+                return (_G_python_54, self.currentError)
+            _G_or_55, lastError = self._or([_G_or_46, _G_or_50])
+            self.considerError(lastError, 'map')
+            return (_G_or_55, self.currentError)
+
+
+        def rule_term_list(self):
+            _locals = {'self': self}
+            self.locals['term_list'] = _locals
+            _G_python_56, lastError = 'final_term', None
+            self.considerError(lastError, 'term_list')
+            _G_apply_57, lastError = self._apply(self.rule_literals, "literals", [_G_python_56])
+            self.considerError(lastError, 'term_list')
+            return (_G_apply_57, self.currentError)
+
+
+        def rule_list(self):
+            _locals = {'self': self}
+            self.locals['list'] = _locals
+            def _G_or_58():
+                _G_exactly_59, lastError = self.exactly('[')
+                self.considerError(lastError, None)
+                _G_exactly_60, lastError = self.exactly(']')
+                self.considerError(lastError, None)
+                _G_python_61, lastError = [], None
+                self.considerError(lastError, None)
+                return (_G_python_61, self.currentError)
+            def _G_or_62():
+                _G_exactly_63, lastError = self.exactly('[')
+                self.considerError(lastError, None)
+                _G_apply_64, lastError = self._apply(self.rule_term_list, "term_list", [])
+                self.considerError(lastError, None)
+                _locals['l'] = _G_apply_64
+                _G_exactly_65, lastError = self.exactly(']')
+                self.considerError(lastError, None)
+                _G_python_66, lastError = eval('l', self.globals, _locals), None
+                self.considerError(lastError, None)
+                return (_G_python_66, self.currentError)
+            _G_or_67, lastError = self._or([_G_or_58, _G_or_62])
+            self.considerError(lastError, 'list')
+            return (_G_or_67, self.currentError)
+
+
+        def rule_set(self):
+            _locals = {'self': self}
+            self.locals['set'] = _locals
+            def _G_or_68():
+                _G_exactly_69, lastError = self.exactly('{')
+                self.considerError(lastError, None)
+                _G_exactly_70, lastError = self.exactly('}')
+                self.considerError(lastError, None)
+                _G_python_71, lastError = eval('set([])', self.globals, _locals), None
+                self.considerError(lastError, None)
+                return (_G_python_71, self.currentError)
+            def _G_or_72():
+                _G_exactly_73, lastError = self.exactly('{')
+                self.considerError(lastError, None)
+                _G_apply_74, lastError = self._apply(self.rule_term_list, "term_list", [])
+                self.considerError(lastError, None)
+                _locals['l'] = _G_apply_74
+                _G_exactly_75, lastError = self.exactly('}')
+                self.considerError(lastError, None)
+                _G_python_76, lastError = eval('set(l)', self.globals, _locals), None
+                self.considerError(lastError, None)
+                return (_G_python_76, self.currentError)
+            _G_or_77, lastError = self._or([_G_or_68, _G_or_72])
+            self.considerError(lastError, 'set')
+            return (_G_or_77, self.currentError)
+
+
+        def rule_qmark(self):
+            _locals = {'self': self}
+            self.locals['qmark'] = _locals
+            def _G_or_78():
+                _G_exactly_79, lastError = self.exactly('?')
+                self.considerError(lastError, None)
+                _G_python_80, lastError = eval('t.Binding()', self.globals, _locals), None
+                self.considerError(lastError, None)
+                return (_G_python_80, self.currentError)
+            def _G_or_81():
+                _G_exactly_82, lastError = self.exactly(':')
+                self.considerError(lastError, None)
+                _G_apply_83, lastError = self._apply(self.rule_word, "word", [])
+                self.considerError(lastError, None)
+                _locals['n'] = _G_apply_83
+                _G_python_84, lastError = eval('t.NamedBinding(n.lower())', self.globals, _locals), None
+                self.considerError(lastError, None)
+                return (_G_python_84, self.currentError)
+            _G_or_85, lastError = self._or([_G_or_78, _G_or_81])
+            self.considerError(lastError, 'qmark')
+            return (_G_or_85, self.currentError)
+
+
+        def rule_final_term(self):
+            _locals = {'self': self}
+            self.locals['final_term'] = _locals
+            def _G_or_86():
+                _G_apply_87, lastError = self._apply(self.rule_string, "string", [])
+                self.considerError(lastError, None)
+                return (_G_apply_87, self.currentError)
+            def _G_or_88():
+                _G_apply_89, lastError = self._apply(self.rule_uuid, "uuid", [])
+                self.considerError(lastError, None)
+                return (_G_apply_89, self.currentError)
+            def _G_or_90():
+                _G_apply_91, lastError = self._apply(self.rule_float, "float", [])
+                self.considerError(lastError, None)
+                return (_G_apply_91, self.currentError)
+            def _G_or_92():
+                _G_apply_93, lastError = self._apply(self.rule_integer, "integer", [])
+                self.considerError(lastError, None)
+                return (_G_apply_93, self.currentError)
+            def _G_or_94():
+                _G_apply_95, lastError = self._apply(self.rule_boolean, "boolean", [])
+                self.considerError(lastError, None)
+                return (_G_apply_95, self.currentError)
+            _G_or_96, lastError = self._or([_G_or_86, _G_or_88, _G_or_90, _G_or_92, _G_or_94])
+            self.considerError(lastError, 'final_term')
+            return (_G_or_96, self.currentError)
+
+
+        def rule_term(self):
+            _locals = {'self': self}
+            self.locals['term'] = _locals
+            def _G_or_97():
+                _G_apply_98, lastError = self._apply(self.rule_final_term, "final_term", [])
+                self.considerError(lastError, None)
+                return (_G_apply_98, self.currentError)
+            def _G_or_99():
+                _G_apply_100, lastError = self._apply(self.rule_qmark, "qmark", [])
+                self.considerError(lastError, None)
+                return (_G_apply_100, self.currentError)
+            _G_or_101, lastError = self._or([_G_or_97, _G_or_99])
+            self.considerError(lastError, 'term')
+            return (_G_or_101, self.currentError)
+
+
+        def rule_terms(self):
+            _locals = {'self': self}
+            self.locals['terms'] = _locals
+            _G_python_102, lastError = 'term', None
+            self.considerError(lastError, 'terms')
+            _G_apply_103, lastError = self._apply(self.rule_literals, "literals", [_G_python_102])
+            self.considerError(lastError, 'terms')
+            return (_G_apply_103, self.currentError)
+
+
+        def rule_identifier_or_quoted(self):
+            _locals = {'self': self}
+            self.locals['identifier_or_quoted'] = _locals
+            def _G_or_104():
+                _G_apply_105, lastError = self._apply(self.rule_identifier, "identifier", [])
+                self.considerError(lastError, None)
+                return (_G_apply_105, self.currentError)
+            def _G_or_106():
+                _G_apply_107, lastError = self._apply(self.rule_quoted_name, "quoted_name", [])
+                self.considerError(lastError, None)
+                return (_G_apply_107, self.currentError)
+            _G_or_108, lastError = self._or([_G_or_104, _G_or_106])
+            self.considerError(lastError, 'identifier_or_quoted')
+            return (_G_or_108, self.currentError)
+
+
+        def rule_keyspace(self):
+            _locals = {'self': self}
+            self.locals['keyspace'] = _locals
+            _G_apply_109, lastError = self._apply(self.rule_identifier_or_quoted, "identifier_or_quoted", [])
+            self.considerError(lastError, 'keyspace')
+            _locals['n'] = _G_apply_109
+            _G_python_110, lastError = eval('t.Keyspace(n)', self.globals, _locals), None
+            self.considerError(lastError, 'keyspace')
+            return (_G_python_110, self.currentError)
+
+
+        def rule_keyspace_prefix(self):
+            _locals = {'self': self}
+            self.locals['keyspace_prefix'] = _locals
+            _G_apply_111, lastError = self._apply(self.rule_keyspace, "keyspace", [])
+            self.considerError(lastError, 'keyspace_prefix')
+            _locals['k'] = _G_apply_111
+            _G_exactly_112, lastError = self.exactly('.')
+            self.considerError(lastError, 'keyspace_prefix')
+            _G_python_113, lastError = eval('k', self.globals, _locals), None
+            self.considerError(lastError, 'keyspace_prefix')
+            return (_G_python_113, self.currentError)
+
+
+        def rule_table(self):
+            _locals = {'self': self}
+            self.locals['table'] = _locals
+            def _G_optional_114():
+                _G_apply_115, lastError = self._apply(self.rule_keyspace_prefix, "keyspace_prefix", [])
+                self.considerError(lastError, None)
+                return (_G_apply_115, self.currentError)
+            def _G_optional_116():
+                return (None, self.input.nullError())
+            _G_or_117, lastError = self._or([_G_optional_114, _G_optional_116])
+            self.considerError(lastError, 'table')
+            _locals['k'] = _G_or_117
+            _G_apply_118, lastError = self._apply(self.rule_identifier_or_quoted, "identifier_or_quoted", [])
+            self.considerError(lastError, 'table')
+            _locals['n'] = _G_apply_118
+            _G_python_119, lastError = eval('t.Table(n, k)', self.globals, _locals), None
+            self.considerError(lastError, 'table')
+            return (_G_python_119, self.currentError)
+
+
+        def rule_index(self):
+            _locals = {'self': self}
+            self.locals['index'] = _locals
+            _G_apply_120, lastError = self._apply(self.rule_identifier, "identifier", [])
+            self.considerError(lastError, 'index')
+            _locals['i'] = _G_apply_120
+            _G_python_121, lastError = eval('t.Index(i)', self.globals, _locals), None
+            self.considerError(lastError, 'index')
+            return (_G_python_121, self.currentError)
+
+
+        def rule_cident(self):
+            _locals = {'self': self}
+            self.locals['cident'] = _locals
+            def _G_or_122():
+                _G_apply_123, lastError = self._apply(self.rule_identifier, "identifier", [])
+                self.considerError(lastError, None)
+                return (_G_apply_123, self.currentError)
+            def _G_or_124():
+                _G_apply_125, lastError = self._apply(self.rule_quoted_name, "quoted_name", [])
+                self.considerError(lastError, None)
+                return (_G_apply_125, self.currentError)
+            def _G_or_126():
+                _G_apply_127, lastError = self._apply(self.rule_unreserved_keyword, "unreserved_keyword", [])
+                self.considerError(lastError, None)
+                return (_G_apply_127, self.currentError)
+            _G_or_128, lastError = self._or([_G_or_122, _G_or_124, _G_or_126])
+            self.considerError(lastError, 'cident')
+            return (_G_or_128, self.currentError)
+
+
+        def rule_column(self):
+            _locals = {'self': self}
+            self.locals['column'] = _locals
+            _G_apply_129, lastError = self._apply(self.rule_cident, "cident", [])
+            self.considerError(lastError, 'column')
+            _locals['n'] = _G_apply_129
+            _G_python_130, lastError = eval('t.Column(n)', self.globals, _locals), None
+            self.considerError(lastError, 'column')
+            return (_G_python_130, self.currentError)
+
+
+        def rule_columns(self):
+            _locals = {'self': self}
+            self.locals['columns'] = _locals
+            _G_apply_131, lastError = self._apply(self.rule_column, "column", [])
+            self.considerError(lastError, 'columns')
+            _locals['first'] = _G_apply_131
+            def _G_many_132():
+                _G_exactly_133, lastError = self.exactly(',')
+                self.considerError(lastError, None)
+                _G_apply_134, lastError = self._apply(self.rule_column, "column", [])
+                self.considerError(lastError, None)
+                return (_G_apply_134, self.currentError)
+            _G_many_135, lastError = self.many(_G_many_132)
+            self.considerError(lastError, 'columns')
+            _locals['rest'] = _G_many_135
+            _G_python_136, lastError = eval('[first] + rest', self.globals, _locals), None
+            self.considerError(lastError, 'columns')
+            return (_G_python_136, self.currentError)
+
+
+        def rule_user(self):
+            _locals = {'self': self}
+            self.locals['user'] = _locals
+            def _G_or_137():
+                _G_apply_138, lastError = self._apply(self.rule_identifier, "identifier", [])
+                self.considerError(lastError, None)
+                return (_G_apply_138, self.currentError)
+            def _G_or_139():
+                _G_apply_140, lastError = self._apply(self.rule_string, "string", [])
+                self.considerError(lastError, None)
+                return (_G_apply_140, self.currentError)
+            _G_or_141, lastError = self._or([_G_or_137, _G_or_139])
+            self.considerError(lastError, 'user')
+            _locals['n'] = _G_or_141
+            _G_python_142, lastError = eval('t.User(n)', self.globals, _locals), None
+            self.considerError(lastError, 'user')
+            return (_G_python_142, self.currentError)
+
+
+        def rule_property_value(self):
+            _locals = {'self': self}
+            self.locals['property_value'] = _locals
+            def _G_or_143():
+                _G_apply_144, lastError = self._apply(self.rule_boolean, "boolean", [])
+                self.considerError(lastError, None)
+                return (_G_apply_144, self.currentError)
+            def _G_or_145():
+                _G_apply_146, lastError = self._apply(self.rule_native_type, "native_type", [])
+                self.considerError(lastError, None)
+                return (_G_apply_146, self.currentError)
+            def _G_or_147():
+                _G_apply_148, lastError = self._apply(self.rule_word, "word", [])
+                self.considerError(lastError, None)
+                _locals['kw'] = _G_apply_148
+                def _G_pred_149():
+                    _G_python_150, lastError = eval('kw in unreserved_keywords', self.globals, _locals), None
+                    self.considerError(lastError, None)
+                    return (_G_python_150, self.currentError)
+                _G_pred_151, lastError = self.pred(_G_pred_149)
+                self.considerError(lastError, None)
+                _G_python_152, lastError = eval('t.Keyword(kw)', self.globals, _locals), None
+                self.considerError(lastError, None)
+                return (_G_python_152, self.currentError)
+            def _G_or_153():
+                _G_apply_154, lastError = self._apply(self.rule_string, "string", [])
+                self.considerError(lastError, None)
+                return (_G_apply_154, self.currentError)
+            def _G_or_155():
+                _G_apply_156, lastError = self._apply(self.rule_identifier, "identifier", [])
+                self.considerError(lastError, None)
+                return (_G_apply_156, self.currentError)
+            def _G_or_157():
+                _G_apply_158, lastError = self._apply(self.rule_float, "float", [])
+                self.considerError(lastError, None)
+                return (_G_apply_158, self.currentError)
+            def _G_or_159():
+                _G_apply_160, lastError = self._apply(self.rule_integer, "integer", [])
+                self.considerError(lastError, None)
+                return (_G_apply_160, self.currentError)
+            def _G_or_161():
+                _G_apply_162, lastError = self._apply(self.rule_map, "map", [])
+                self.considerError(lastError, None)
+                return (_G_apply_162, self.currentError)
+            _G_or_163, lastError = self._or([_G_or_143, _G_or_145, _G_or_147, _G_or_153, _G_or_155, _G_or_157, _G_or_159, _G_or_161])
+            self.considerError(lastError, 'property_value')
+            return (_G_or_163, self.currentError)
+
+
+        def rule_property(self):
+            _locals = {'self': self}
+            self.locals['property'] = _locals
+            _G_apply_164, lastError = self._apply(self.rule_cident, "cident", [])
+            self.considerError(lastError, 'property')
+            _locals['n'] = _G_apply_164
+            _G_exactly_165, lastError = self.exactly('=')
+            self.considerError(lastError, 'property')
+            _G_apply_166, lastError = self._apply(self.rule_property_value, "property_value", [])
+            self.considerError(lastError, 'property')
+            _locals['v'] = _G_apply_166
+            _G_python_167, lastError = eval('t.Property(n, v)', self.globals, _locals), None
+            self.considerError(lastError, 'property')
+            return (_G_python_167, self.currentError)
+
+
+        def rule_properties(self):
+            _locals = {'self': self}
+            self.locals['properties'] = _locals
+            _G_apply_168, lastError = self._apply(self.rule_property, "property", [])
+            self.considerError(lastError, 'properties')
+            _locals['first'] = _G_apply_168
+            def _G_many_169():
+                _G_python_170, lastError = 'AND', None
+                self.considerError(lastError, None)
+                _G_apply_171, lastError = self._apply(self.rule_k, "k", [_G_python_170])
+                self.considerError(lastError, None)
+                _G_apply_172, lastError = self._apply(self.rule_property, "property", [])
+                self.considerError(lastError, None)
+                return (_G_apply_172, self.currentError)
+            _G_many_173, lastError = self.many(_G_many_169)
+            self.considerError(lastError, 'properties')
+            _locals['rest'] = _G_many_173
+            _G_python_174, lastError = eval('t.Properties([first] + rest)', self.globals, _locals), None
+            self.considerError(lastError, 'properties')
+            return (_G_python_174, self.currentError)
+
+
+        def rule_set_operation(self):
+            _locals = {'self': self}
+            self.locals['set_operation'] = _locals
+            def _G_or_175():
+                _G_apply_176, lastError = self._apply(self.rule_final_term, "final_term", [])
+                self.considerError(lastError, None)
+                return (_G_apply_176, self.currentError)
+            def _G_or_177():
+                _G_apply_178, lastError = self._apply(self.rule_qmark, "qmark", [])
+                self.considerError(lastError, None)
+                return (_G_apply_178, self.currentError)
+            def _G_or_179():
+                _G_apply_180, lastError = self._apply(self.rule_set, "set", [])
+                self.considerError(lastError, None)
+                return (_G_apply_180, self.currentError)
+            def _G_or_181():
+                _G_apply_182, lastError = self._apply(self.rule_map, "map", [])
+                self.considerError(lastError, None)
+                return (_G_apply_182, self.currentError)
+            def _G_or_183():
+                _G_apply_184, lastError = self._apply(self.rule_list, "list", [])
+                self.considerError(lastError, None)
+                return (_G_apply_184, self.currentError)
+            _G_or_185, lastError = self._or([_G_or_175, _G_or_177, _G_or_179, _G_or_181, _G_or_183])
+            self.considerError(lastError, 'set_operation')
+            return (_G_or_185, self.currentError)
+
+
+        def rule_set_operations(self):
+            _locals = {'self': self}
+            self.locals['set_operations'] = _locals
+            _G_apply_186, lastError = self._apply(self.rule_set_operation, "set_operation", [])
+            self.considerError(lastError, 'set_operations')
+            _locals['first'] = _G_apply_186
+            def _G_many_187():
+                _G_exactly_188, lastError = self.exactly(',')
+                self.considerError(lastError, None)
+                _G_apply_189, lastError = self._apply(self.rule_set_operation, "set_operation", [])
+                self.considerError(lastError, None)
+                return (_G_apply_189, self.currentError)
+            _G_many_190, lastError = self.many(_G_many_187)
+            self.considerError(lastError, 'set_operations')
+            _locals['rest'] = _G_many_190
+            _G_python_191, lastError = eval('[first] + rest', self.globals, _locals), None
+            self.considerError(lastError, 'set_operations')
+            return (_G_python_191, self.currentError)
+
+
+        def rule_use(self):
+            _locals = {'self': self}
+            self.locals['use'] = _locals
+            _G_python_192, lastError = 'USE', None
+            self.considerError(lastError, 'use')
+            _G_apply_193, lastError = self._apply(self.rule_k, "k", [_G_python_192])
+            self.considerError(lastError, 'use')
+            _G_apply_194, lastError = self._apply(self.rule_keyspace, "keyspace", [])
+            self.considerError(lastError, 'use')
+            _locals['k'] = _G_apply_194
+            _G_python_195, lastError = eval('t.Use(k)', self.globals, _locals), None
+            self.considerError(lastError, 'use')
+            return (_G_python_195, self.currentError)
+
+
+        def rule_drop(self):
+            _locals = {'self': self}
+            self.locals['drop'] = _locals
+            _G_python_196, lastError = 'DROP', None
+            self.considerError(lastError, 'drop')
+            _G_apply_197, lastError = self._apply(self.rule_k, "k", [_G_python_196])
+            self.considerError(lastError, 'drop')
+            def _G_or_198():
+                _G_apply_199, lastError = self._apply(self.rule_a_keyspace, "a_keyspace", [])
+                self.considerError(lastError, None)
+                _G_apply_200, lastError = self._apply(self.rule_keyspace, "keyspace", [])
+                self.considerError(lastError, None)
+                return (_G_apply_200, self.currentError)
+            def _G_or_201():
+                _G_apply_202, lastError = self._apply(self.rule_a_table, "a_table", [])
+                self.considerError(lastError, None)
+                _G_apply_203, lastError = self._apply(self.rule_table, "table", [])
+                self.considerError(lastError, None)
+                return (_G_apply_203, self.currentError)
+            def _G_or_204():
+                _G_python_205, lastError = 'INDEX', None
+                self.considerError(lastError, None)
+                _G_apply_206, lastError = self._apply(self.rule_k, "k", [_G_python_205])
+                self.considerError(lastError, None)
+                _G_apply_207, lastError = self._apply(self.rule_index, "index", [])
+                self.considerError(lastError, None)
+                return (_G_apply_207, self.currentError)
+            def _G_or_208():
+                _G_python_209, lastError = 'USER', None
+                self.considerError(lastError, None)
+                _G_apply_210, lastError = self._apply(self.rule_k, "k", [_G_python_209])
+                self.considerError(lastError, None)
+                _G_apply_211, lastError = self._apply(self.rule_user, "user", [])
+                self.considerError(lastError, None)
+                return (_G_apply_211, self.currentError)
+            _G_or_212, lastError = self._or([_G_or_198, _G_or_201, _G_or_204, _G_or_208])
+            self.considerError(lastError, 'drop')
+            _locals['r'] = _G_or_212
+            _G_python_213, lastError = eval('t.Drop(r)', self.globals, _locals), None
+            self.considerError(lastError, 'drop')
+            return (_G_python_213, self.currentError)
+
+
+        def rule_truncate(self):
+            _locals = {'self': self}
+            self.locals['truncate'] = _locals
+            _G_python_214, lastError = 'TRUNCATE', None
+            self.considerError(lastError, 'truncate')
+            _G_apply_215, lastError = self._apply(self.rule_k, "k", [_G_python_214])
+            self.considerError(lastError, 'truncate')
+            _G_apply_216, lastError = self._apply(self.rule_table, "table", [])
+            self.considerError(lastError, 'truncate')
+            _locals['n'] = _G_apply_216
+            _G_python_217, lastError = eval('t.Truncate(n)', self.globals, _locals), None
+            self.considerError(lastError, 'truncate')
+            return (_G_python_217, self.currentError)
+
+
+        def rule_users(self):
+            _locals = {'self': self}
+            self.locals['users'] = _locals
+            _G_python_218, lastError = 'USERS', None
+            self.considerError(lastError, 'users')
+            _G_apply_219, lastError = self._apply(self.rule_k, "k", [_G_python_218])
+            self.considerError(lastError, 'users')
+            _G_python_220, lastError = eval('t.Users()', self.globals, _locals), None
+            self.considerError(lastError, 'users')
+            return (_G_python_220, self.currentError)
+
+
+        def rule_list_users(self):
+            _locals = {'self': self}
+            self.locals['list_users'] = _locals
+            _G_python_221, lastError = 'LIST', None
+            self.considerError(lastError, 'list_users')
+            _G_apply_222, lastError = self._apply(self.rule_k, "k", [_G_python_221])
+            self.considerError(lastError, 'list_users')
+            _G_apply_223, lastError = self._apply(self.rule_users, "users", [])
+            self.considerError(lastError, 'list_users')
+            _locals['u'] = _G_apply_223
+            _G_python_224, lastError = eval('t.List(u)', self.globals, _locals), None
+            self.considerError(lastError, 'list_users')
+            return (_G_python_224, self.currentError)
+
+
+        def rule_revoke(self):
+            _locals = {'self': self}
+            self.locals['revoke'] = _locals
+            _G_python_225, lastError = 'REVOKE', None
+            self.considerError(lastError, 'revoke')
+            _G_apply_226, lastError = self._apply(self.rule_k, "k", [_G_python_225])
+            self.considerError(lastError, 'revoke')
+            _G_apply_227, lastError = self._apply(self.rule_permission_or_all, "permission_or_all", [])
+            self.considerError(lastError, 'revoke')
+            _locals['p'] = _G_apply_227
+            _G_python_228, lastError = 'ON', None
+            self.considerError(lastError, 'revoke')
+            _G_apply_229, lastError = self._apply(self.rule_k, "k", [_G_python_228])
+            self.considerError(lastError, 'revoke')
+            _G_apply_230, lastError = self._apply(self.rule_resource, "resource", [])
+            self.considerError(lastError, 'revoke')
+            _locals['r'] = _G_apply_230
+            _G_python_231, lastError = 'FROM', None
+            self.considerError(lastError, 'revoke')
+            _G_apply_232, lastError = self._apply(self.rule_k, "k", [_G_python_231])
+            self.considerError(lastError, 'revoke')
+            _G_apply_233, lastError = self._apply(self.rule_user, "user", [])
+            self.considerError(lastError, 'revoke')
+            _locals['u'] = _G_apply_233
+            _G_python_234, lastError = eval('t.Revoke(p, r, u)', self.globals, _locals), None
+            self.considerError(lastError, 'revoke')
+            return (_G_python_234, self.currentError)
+
+
+        def rule_permission(self):
+            _locals = {'self': self}
+            self.locals['permission'] = _locals
+            def _G_or_235():
+                _G_python_236, lastError = 'CREATE', None
+                self.considerError(lastError, None)
+                _G_apply_237, lastError = self._apply(self.rule_k, "k", [_G_python_236])
+                self.considerError(lastError, None)
+                return (_G_apply_237, self.currentError)
+            def _G_or_238():
+                _G_python_239, lastError = 'ALTER', None
+                self.considerError(lastError, None)
+                _G_apply_240, lastError = self._apply(self.rule_k, "k", [_G_python_239])
+                self.considerError(lastError, None)
+                return (_G_apply_240, self.currentError)
+            def _G_or_241():
+                _G_python_242, lastError = 'DROP', None
+                self.considerError(lastError, None)
+                _G_apply_243, lastError = self._apply(self.rule_k, "k", [_G_python_242])
+                self.considerError(lastError, None)
+                return (_G_apply_243, self.currentError)
+            def _G_or_244():
+                _G_python_245, lastError = 'SELECT', None
+                self.considerError(lastError, None)
+                _G_apply_246, lastError = self._apply(self.rule_k, "k", [_G_python_245])
+                self.considerError(lastError, None)
+                return (_G_apply_246, self.currentError)
+            def _G_or_247():
+                _G_python_248, lastError = 'MODIFY', None
+                self.considerError(lastError, None)
+                _G_apply_249, lastError = self._apply(self.rule_k, "k", [_G_python_248])
+                self.considerError(lastError, None)
+                return (_G_apply_249, self.currentError)
+            def _G_or_250():
+                _G_python_251, lastError = 'AUTHORIZE', None
+                self.considerError(lastError, None)
+                _G_apply_252, lastError = self._apply(self.rule_k, "k", [_G_python_251])
+                self.considerError(lastError, None)
+                return (_G_apply_252, self.currentError)
+            _G_or_253, lastError = self._or([_G_or_235, _G_or_238, _G_or_241, _G_or_244, _G_or_247, _G_or_250])
+            self.considerError(lastError, 'permission')
+            _locals['p'] = _G_or_253
+            _G_python_254, lastError = eval('t.Permission(p)', self.globals, _locals), None
+            self.considerError(lastError, 'permission')
+            return (_G_python_254, self.currentError)
+
+
+        def rule_permission_or_all(self):
+            _locals = {'self': self}
+            self.locals['permission_or_all'] = _locals
+            def _G_or_255():
+                _G_python_256, lastError = 'ALL', None
+                self.considerError(lastError, None)
+                _G_apply_257, lastError = self._apply(self.rule_k, "k", [_G_python_256])
+                self.considerError(lastError, None)
+                def _G_optional_258():
+                    _G_python_259, lastError = 'PERMISSIONS', None
+                    self.considerError(lastError, None)
+                    _G_apply_260, lastError = self._apply(self.rule_k, "k", [_G_python_259])
+                    self.considerError(lastError, None)
+                    return (_G_apply_260, self.currentError)
+                def _G_optional_261():
+                    return (None, self.input.nullError())
+                _G_or_262, lastError = self._or([_G_optional_258, _G_optional_261])
+                self.considerError(lastError, None)
+                _G_python_263, lastError = eval('t.AllPermissions()', self.globals, _locals), None
+                self.considerError(lastError, None)
+                return (_G_python_263, self.currentError)
+            def _G_or_264():
+                _G_apply_265, lastError = self._apply(self.rule_permission, "permission", [])
+                self.considerError(lastError, None)
+                _locals['p'] = _G_apply_265
+                def _G_optional_266():
+                    _G_python_267, lastError = 'PERMISSION', None
+                    self.considerError(lastError, None)
+                    _G_apply_268, lastError = self._apply(self.rule_k, "k", [_G_python_267])
+                    self.considerError(lastError, None)
+                    return (_G_apply_268, self.currentError)
+                def _G_optional_269():
+                    return (None, self.input.nullError())
+                _G_or_270, lastError = self._or([_G_optional_266, _G_optional_269])
+                self.considerError(lastError, None)
+                _G_python_271, lastError = eval('p', self.globals, _locals), None
+                self.considerError(lastError, None)
+                return (_G_python_271, self.currentError)
+            _G_or_272, lastError = self._or([_G_or_255, _G_or_264])
+            self.considerError(lastError, 'permission_or_all')
+            return (_G_or_272, self.currentError)
+
+
+        def rule_resource(self):
+            _locals = {'self': self}
+            self.locals['resource'] = _locals
+            def _G_or_273():
+                _G_python_274, lastError = 'ALL', None
+                self.considerError(lastError, None)
+                _G_apply_275, lastError = self._apply(self.rule_k, "k", [_G_python_274])
+                self.considerError(lastError, None)
+                _G_python_276, lastError = 'KEYSPACES', None
+                self.considerError(lastError, None)
+                _G_apply_277, lastError = self._apply(self.rule_k, "k", [_G_python_276])
+                self.considerError(lastError, None)
+                _G_python_278, lastError = eval('t.AllKeyspaces()', self.globals, _locals), None
+                self.considerError(lastError, None)
+                return (_G_python_278, self.currentError)
+            def _G_or_279():
+                _G_apply_280, lastError = self._apply(self.rule_a_keyspace, "a_keyspace", [])
+                self.considerError(lastError, None)
+                _G_apply_281, lastError = self._apply(self.rule_keyspace, "keyspace", [])
+                self.considerError(lastError, None)
+                return (_G_apply_281, self.currentError)
+            def _G_or_282():
+                _G_apply_283, lastError = self._apply(self.rule_a_table, "a_table", [])
+                self.considerError(lastError, None)
+                _G_apply_284, lastError = self._apply(self.rule_table, "table", [])
+                self.considerError(lastError, None)
+                return (_G_apply_284, self.currentError)
+            _G_or_285, lastError = self._or([_G_or_273, _G_or_279, _G_or_282])
+            self.considerError(lastError, 'resource')
+            return (_G_or_285, self.currentError)
+
+
+        def rule_grant(self):
+            _locals = {'self': self}
+            self.locals['grant'] = _locals
+            _G_python_286, lastError = 'GRANT', None
+            self.considerError(lastError, 'grant')
+            _G_apply_287, lastError = self._apply(self.rule_k, "k", [_G_python_286])
+            self.considerError(lastError, 'grant')
+            _G_apply_288, lastError = self._apply(self.rule_permission_or_all, "permission_or_all", [])
+            self.considerError(lastError, 'grant')
+            _locals['p'] = _G_apply_288
+            _G_python_289, lastError = 'ON', None
+            self.considerError(lastError, 'grant')
+            _G_apply_290, lastError = self._apply(self.rule_k, "k", [_G_python_289])
+            self.considerError(lastError, 'grant')
+            _G_apply_291, lastError = self._apply(self.rule_resource, "resource", [])
+            self.considerError(lastError, 'grant')
+            _locals['r'] = _G_apply_291
+            _G_python_292, lastError = 'TO', None
+            self.considerError(lastError, 'grant')
+            _G_apply_293, lastError = self._apply(self.rule_k, "k", [_G_python_292])
+            self.considerError(lastError, 'grant')
+            _G_apply_294, lastError = self._apply(self.rule_user, "user", [])
+            self.considerError(lastError, 'grant')
+            _locals['u'] = _G_apply_294
+            _G_python_295, lastError = eval('t.Grant(p, r, u)', self.globals, _locals), None
+            self.considerError(lastError, 'grant')
+            return (_G_python_295, self.currentError)
+
+
+        def rule_list_permissions(self):
+            _locals = {'self': self}
+            self.locals['list_permissions'] = _locals
+            _G_python_296, lastError = 'LIST', None
+            self.considerError(lastError, 'list_permissions')
+            _G_apply_297, lastError = self._apply(self.rule_k, "k", [_G_python_296])
+            self.considerError(lastError, 'list_permissions')
+            _G_apply_298, lastError = self._apply(self.rule_permission_or_all, "permission_or_all", [])
+            self.considerError(lastError, 'list_permissions')
+            _locals['p'] = _G_apply_298
+            def _G_optional_299():
+                _G_python_300, lastError = 'ON', None
+                self.considerError(lastError, None)
+                _G_apply_301, lastError = self._apply(self.rule_k, "k", [_G_python_300])
+                self.considerError(lastError, None)
+                _G_apply_302, lastError = self._apply(self.rule_table, "table", [])
+                self.considerError(lastError, None)
+                return (_G_apply_302, self.currentError)
+            def _G_optional_303():
+                return (None, self.input.nullError())
+            _G_or_304, lastError = self._or([_G_optional_299, _G_optional_303])
+            self.considerError(lastError, 'list_permissions')
+            _locals['n'] = _G_or_304
+            def _G_optional_305():
+                _G_python_306, lastError = 'OF', None
+                self.considerError(lastError, None)
+                _G_apply_307, lastError = self._apply(self.rule_k, "k", [_G_python_306])
+                self.considerError(lastError, None)
+                _G_apply_308, lastError = self._apply(self.rule_user, "user", [])
+                self.considerError(lastError, None)
+                return (_G_apply_308, self.currentError)
+            def _G_optional_309():
+                return (None, self.input.nullError())
+            _G_or_310, lastError = self._or([_G_optional_305, _G_optional_309])
+            self.considerError(lastError, 'list_permissions')
+            _locals['u'] = _G_or_310
+            def _G_optional_311():
+                _G_apply_312, lastError = self._apply(self.rule_norecursive, "norecursive", [])
+                self.considerError(lastError, None)
+                return (_G_apply_312, self.currentError)
+            def _G_optional_313():
+                return (None, self.input.nullError())
+            _G_or_314, lastError = self._or([_G_optional_311, _G_optional_313])
+            self.considerError(lastError, 'list_permissions')
+            _locals['r'] = _G_or_314
+            _G_python_315, lastError = eval('t.ListPermissions(p, n, u, r)', self.globals, _locals), None
+            self.considerError(lastError, 'list_permissions')
+            return (_G_python_315, self.currentError)
+
+
+        def rule_norecursive(self):
+            _locals = {'self': self}
+            self.locals['norecursive'] = _locals
+            _G_python_316, lastError = 'NORECURSIVE', None
+            self.considerError(lastError, 'norecursive')
+            _G_apply_317, lastError = self._apply(self.rule_k, "k", [_G_python_316])
+            self.considerError(lastError, 'norecursive')
+            _G_python_318, lastError = eval('t.NoRecursive()', self.globals, _locals), None
+            self.considerError(lastError, 'norecursive')
+            return (_G_python_318, self.currentError)
+
+
+        def rule_password(self):
+            _locals = {'self': self}
+            self.locals['password'] = _locals
+            _G_apply_319, lastError = self._apply(self.rule_string, "string", [])
+            self.considerError(lastError, 'password')
+            return (_G_apply_319, self.currentError)
+
+
+        def rule_create_user(self):
+            _locals = {'self': self}
+            self.locals['create_user'] = _locals
+            _G_python_320, lastError = 'CREATE', None
+            self.considerError(lastError, 'create_user')
+            _G_apply_321, lastError = self._apply(self.rule_k, "k", [_G_python_320])
+            self.considerError(lastError, 'create_user')
+            _G_python_322, lastError = 'USER', None
+            self.considerError(lastError, 'create_user')
+            _G_apply_323, lastError = self._apply(self.rule_k, "k", [_G_python_322])
+            self.considerError(lastError, 'create_user')
+            _G_apply_324, lastError = self._apply(self.rule_user, "user", [])
+            self.considerError(lastError, 'create_user')
+            _locals['u'] = _G_apply_324
+            def _G_optional_325():
+                _G_python_326, lastError = 'WITH', None
+                self.considerError(lastError, None)
+                _G_apply_327, lastError = self._apply(self.rule_k, "k", [_G_python_326])
+                self.considerError(lastError, None)
+                _G_python_328, lastError = 'PASSWORD', None
+                self.considerError(lastError, None)
+                _G_apply_329, lastError = self._apply(self.rule_k, "k", [_G_python_328])
+                self.considerError(lastError, None)
+                _G_apply_330, lastError = self._apply(self.rule_password, "password", [])
+                self.considerError(lastError, None)
+                return (_G_apply_330, self.currentError)
+            def _G_optional_331():
+                return (None, self.input.nullError())
+            _G_or_332, lastError = self._or([_G_optional_325, _G_optional_331])
+            self.considerError(lastError, 'create_user')
+            _locals['p'] = _G_or_332
+            def _G_optional_333():
+                def _G_or_334():
+                    _G_python_335, lastError = 'SUPERUSER', None
+                    self.considerError(lastError, None)
+                    _G_apply_336, lastError = self._apply(self.rule_k, "k", [_G_python_335])
+                    self.considerError(lastError, None)
+                    _G_python_337, lastError = True, None
+                    self.considerError(lastError, None)
+                    return (_G_python_337, self.currentError)
+                def _G_or_338():
+                    _G_python_339, lastError = 'NOSUPERUSER', None
+                    self.considerError(lastError, None)
+                    _G_apply_340, lastError = self._apply(self.rule_k, "k", [_G_python_339])
+                    self.considerError(lastError, None)
+                    _G_python_341, lastError = False, None
+                    self.considerError(lastError, None)
+                    return (_G_python_341, self.currentError)
+                _G_or_342, lastError = self._or([_G_or_334, _G_or_338])
+                self.considerError(lastError, None)
+                return (_G_or_342, self.currentError)
+            def _G_optional_343():
+                return (None, self.input.nullError())
+            _G_or_344, lastError = self._or([_G_optional_333, _G_optional_343])
+            self.considerError(lastError, 'create_user')
+            _locals['s'] = _G_or_344
+            _G_python_345, lastError = eval('t.CreateUser(u, p, s)', self.globals, _locals), None
+            self.considerError(lastError, 'create_user')
+            return (_G_python_345, self.currentError)
+
+
+        def rule_alter_user(self):
+            _locals = {'self': self}
+            self.locals['alter_user'] = _locals
+            _G_python_346, lastError = 'ALTER', None
+            self.considerError(lastError, 'alter_user')
+            _G_apply_347, lastError = self._apply(self.rule_k, "k", [_G_python_346])
+            self.considerError(lastError, 'alter_user')
+            _G_python_348, lastError = 'USER', None
+            self.considerError(lastError, 'alter_user')
+            _G_apply_349, lastError = self._apply(self.rule_k, "k", [_G_python_348])
+            self.considerError(lastError, 'alter_user')
+            _G_apply_350, lastError = self._apply(self.rule_user, "user", [])
+            self.considerError(lastError, 'alter_user')
+            _locals['u'] = _G_apply_350
+            def _G_optional_351():
+                _G_python_352, lastError = 'WITH', None
+                self.considerError(lastError, None)
+                _G_apply_353, lastError = self._apply(self.rule_k, "k", [_G_python_352])
+                self.considerError(lastError, None)
+                _G_python_354, lastError = 'PASSWORD', None
+                self.considerError(lastError, None)
+                _G_apply_355, lastError = self._apply(self.rule_k, "k", [_G_python_354])
+                self.considerError(lastError, None)
+                _G_apply_356, lastError = self._apply(self.rule_password, "password", [])
+                self.considerError(lastError, None)
+                return (_G_apply_356, self.currentError)
+            def _G_optional_357():
+                return (None, self.input.nullError())
+            _G_or_358, lastError = self._or([_G_optional_351, _G_optional_357])
+            self.considerError(lastError, 'alter_user')
+            _locals['p'] = _G_or_358
+            def _G_optional_359():
+                def _G_or_360():
+                    _G_python_361, lastError = 'SUPERUSER', None
+                    self.considerError(lastError, None)
+                    _G_apply_362, lastError = self._apply(self.rule_k, "k", [_G_python_361])
+                    self.considerError(lastError, None)
+                    _G_python_363, lastError = True, None
+                    self.considerError(lastError, None)
+                    return (_G_python_363, self.currentError)
+                def _G_or_364():
+                    _G_python_365, lastError = 'NOSUPERUSER', None
+                    self.considerError(lastError, None)
+                    _G_apply_366, lastError = self._apply(self.rule_k, "k", [_G_python_365])
+                    self.considerError(lastError, None)
+                    _G_python_367, lastError = False, None
+                    self.considerError(lastError, None)
+                    return (_G_python_367, self.currentError)
+                _G_or_368, lastError = self._or([_G_or_360, _G_or_364])
+                self.considerError(lastError, None)
+                return (_G_or_368, self.currentError)
+            def _G_optional_369():
+                return (None, self.input.nullError())
+            _G_or_370, lastError = self._or([_G_optional_359, _G_optional_369])
+            self.considerError(lastError, 'alter_user')
+            _locals['s'] = _G_or_370
+            _G_python_371, lastError = eval('t.AlterUser(u, p, s)', self.globals, _locals), None
+            self.considerError(lastError, 'alter_user')
+            return (_G_python_371, self.currentError)
+
+
+        def rule_create_index(self):
+            _locals = {'self': self}
+            self.locals['create_index'] = _locals
+            _G_python_372, lastError = 'CREATE', None
+            self.considerError(lastError, 'create_index')
+            _G_apply_373, lastError = self._apply(self.rule_k, "k", [_G_python_372])
+            self.considerError(lastError, 'create_index')
+            _G_python_374, lastError = 'INDEX', None
+            self.considerError(lastError, 'create_index')
+            _G_apply_375, lastError = self._apply(self.rule_k, "k", [_G_python_374])
+            self.considerError(lastError, 'create_index')
+            def _G_optional_376():
+                def _G_not_377():
+                    _G_python_378, lastError = 'ON', None
+                    self.considerError(lastError, None)
+                    _G_apply_379, lastError = self._apply(self.rule_k, "k", [_G_python_378])
+                    self.considerError(lastError, None)
+                    return (_G_apply_379, self.currentError)
+                _G_not_380, lastError = self._not(_G_not_377)
+                self.considerError(lastError, None)
+                _G_apply_381, lastError = self._apply(self.rule_index, "index", [])
+                self.considerError(lastError, None)
+                return (_G_apply_381, self.currentError)
+            def _G_optional_382():
+                return (None, self.input.nullError())
+            _G_or_383, lastError = self._or([_G_optional_376, _G_optional_382])
+            self.considerError(lastError, 'create_index')
+            _locals['i'] = _G_or_383
+            _G_python_384, lastError = 'ON', None
+            self.considerError(lastError, 'create_index')
+            _G_apply_385, lastError = self._apply(self.rule_k, "k", [_G_python_384])
+            self.considerError(lastError, 'create_index')
+            _G_apply_386, lastError = self._apply(self.rule_table, "table", [])
+            self.considerError(lastError, 'create_index')
+            _locals['n'] = _G_apply_386
+            _G_exactly_387, lastError = self.exactly('(')
+            self.considerError(lastError, 'create_index')
+            _G_apply_388, lastError = self._apply(self.rule_column, "column", [])
+            self.considerError(lastError, 'create_index')
+            _locals['c'] = _G_apply_388
+            _G_exactly_389, lastError = self.exactly(')')
+            self.considerError(lastError, 'create_index')
+            _G_python_390, lastError = eval('t.CreateIndex(i, n, c)', self.globals, _locals), None
+            self.considerError(lastError, 'create_index')
+            return (_G_python_390, self.currentError)
+
+
+        def rule_create_keyspace(self):
+            _locals = {'self': self}
+            self.locals['create_keyspace'] = _locals
+            _G_python_391, lastError = 'CREATE', None
+            self.considerError(lastError, 'create_keyspace')
+            _G_apply_392, lastError = self._apply(self.rule_k, "k", [_G_python_391])
+            self.considerError(lastError, 'create_keyspace')
+            _G_python_393, lastError = 'KEYSPACE', None
+            self.considerError(lastError, 'create_keyspace')
+            _G_apply_394, lastError = self._apply(self.rule_k, "k", [_G_python_393])
+            self.considerError(lastError, 'create_keyspace')
+            _G_apply_395, lastError = self._apply(self.rule_keyspace, "keyspace", [])
+            self.considerError(lastError, 'create_keyspace')
+            _locals['k'] = _G_apply_395
+            _G_python_396, lastError = 'WITH', None
+            self.considerError(lastError, 'create_keyspace')
+            _G_apply_397, lastError = self._apply(self.rule_k, "k", [_G_python_396])
+            self.considerError(lastError, 'create_keyspace')
+            _G_apply_398, lastError = self._apply(self.rule_properties, "properties", [])
+            self.considerError(lastError, 'create_keyspace')
+            _locals['p'] = _G_apply_398
+            _G_python_399, lastError = eval('t.CreateKeyspace(k, p)', self.globals, _locals), None
+            self.considerError(lastError, 'create_keyspace')
+            return (_G_python_399, self.currentError)
+
+
+        def rule_alter_keyspace(self):
+            _locals = {'self': self}
+            self.locals['alter_keyspace'] = _locals
+            _G_python_400, lastError = 'ALTER', None
+            self.considerError(lastError, 'alter_keyspace')
+            _G_apply_401, lastError = self._apply(self.rule_k, "k", [_G_python_400])
+            self.considerError(lastError, 'alter_keyspace')
+            _G_python_402, lastError = 'KEYSPACE', None
+            self.considerError(lastError, 'alter_keyspace')
+            _G_apply_403, lastError = self._apply(self.rule_k, "k", [_G_python_402])
+            self.considerError(lastError, 'alter_keyspace')
+            _G_apply_404, lastError = self._apply(self.rule_keyspace, "keyspace", [])
+            self.considerError(lastError, 'alter_keyspace')
+            _locals['k'] = _G_apply_404
+            _G_python_405, lastError = 'WITH', None
+            self.considerError(lastError, 'alter_keyspace')
+            _G_apply_406, lastError = self._apply(self.rule_k, "k", [_G_python_405])
+            self.considerError(lastError, 'alter_keyspace')
+            _G_apply_407, lastError = self._apply(self.rule_properties, "properties", [])
+            self.considerError(lastError, 'alter_keyspace')
+            _locals['p'] = _G_apply_407
+            _G_python_408, lastError = eval('t.AlterKeyspace(k, p)', self.globals, _locals), None
+            self.considerError(lastError, 'alter_keyspace')
+            return (_G_python_408, self.currentError)
+
+
+        def rule_element_type(self):
+            _locals = {'self': self}
+            self.locals['element_type'] = _locals
+            def _G_or_409():
+                _G_apply_410, lastError = self._apply(self.rule_native_type, "native_type", [])
+                self.considerError(lastError, None)
+                return (_G_apply_410, self.currentError)
+            def _G_or_411():
+                _G_apply_412, lastError = self._apply(self.rule_string, "string", [])
+                self.considerError(lastError, None)
+                return (_G_apply_412, self.currentError)
+            _G_or_413, lastError = self._or([_G_or_409, _G_or_411])
+            self.considerError(lastError, 'element_type')
+            return (_G_or_413, self.currentError)
+
+
+        def rule_collection_type(self):
+            _locals = {'self': self}
+            self.locals['collection_type'] = _locals
+            def _G_or_414():
+                _G_python_415, lastError = 'MAP', None
+                self.considerError(lastError, None)
+                _G_apply_416, lastError = self._apply(self.rule_k, "k", [_G_python_415])
+                self.considerError(lastError, None)
+                _G_exactly_417, lastError = self.exactly('<')
+                self.considerError(lastError, None)
+                _G_apply_418, lastError = self._apply(self.rule_element_type, "element_type", [])
+                self.considerError(lastError, None)
+                _locals['kt'] = _G_apply_418
+                _G_exactly_419, lastError = self.exactly(',')
+                self.considerError(lastError, None)
+                _G_apply_420, lastError = self._apply(self.rule_element_type, "element_type", [])
+                self.considerError(lastError, None)
+                _locals['vt'] = _G_apply_420
+                _G_exactly_421, lastError = self.exactly('>')
+                self.considerError(lastError, None)
+                _G_python_422, lastError = eval("t.CollectionType('MAP', [kt, vt])", self.globals, _locals), None
+                self.considerError(lastError, None)
+                return (_G_python_422, self.currentError)
+            def _G_or_423():
+                _G_python_424, lastError = 'LIST', None
+                self.considerError(lastError, None)
+                _G_apply_425, lastError = self._apply(self.rule_k, "k", [_G_python_424])
+                self.considerError(lastError, None)
+                _G_exactly_426, lastError = self.exactly('<')
+                self.considerError(lastError, None)
+                _G_apply_427, lastError = self._apply(self.rule_element_type, "element_type", [])
+                self.considerError(lastError, None)
+                _locals['vt'] = _G_apply_427
+                _G_exactly_428, lastError = self.exactly('>')
+                self.considerError(lastError, None)
+                _G_python_429, lastError = eval("t.CollectionType('LIST', [vt])", self.globals, _locals), None
+                self.considerError(lastError, None)
+                return (_G_python_429, self.currentError)
+            def _G_or_430():
+                _G_python_431, lastError = 'SET', None
+                self.considerError(lastError, None)
+                _G_apply_432, lastError = self._apply(self.rule_k, "k", [_G_python_431])
+                self.considerError(lastError, None)
+                _G_exactly_433, lastError = self.exactly('<')
+                self.considerError(lastError, None)
+                _G_apply_434, lastError = self._apply(self.rule_element_type, "element_type", [])
+                self.considerError(lastError, None)
+                _locals['vt'] = _G_apply_434
+                _G_exactly_435, lastError = self.exactly('>')
+                self.considerError(lastError, None)
+                _G_python_436, lastError = eval("t.CollectionType('SET', [vt])", self.globals, _locals), None
+                self.considerError(lastError, None)
+                return (_G_python_436, self.currentError)
+            _G_or_437, lastError = self._or([_G_or_414, _G_or_423, _G_or_430])
+            self.considerError(lastError, 'collection_type')
+            return (_G_or_437, self.currentError)
+
+
+        def rule_comparator_type(self):
+            _locals = {'self': self}
+            self.locals['comparator_type'] = _locals
+            def _G_or_438():
+                _G_apply_439, lastError = self._apply(self.rule_collection_type, "collection_type", [])
+                self.considerError(lastError, None)
+                return (_G_apply_439, self.currentError)
+            def _G_or_440():
+                _G_apply_441, lastError = self._apply(self.rule_element_type, "element_type", [])
+                self.considerError(lastError, None)
+                return (_G_apply_441, self.currentError)
+            _G_or_442, lastError = self._or([_G_or_438, _G_or_440])
+            self.considerError(lastError, 'comparator_type')
+            return (_G_or_442, self.currentError)
+
+
+        def rule_column_definition(self):
+            _locals = {'self': self}
+            self.locals['column_definition'] = _locals
+            _G_apply_443, lastError = self._apply(self.rule_column, "column", [])
+            self.considerError(lastError, 'column_definition')
+            _locals['c'] = _G_apply_443
+            _G_apply_444, lastError = self._apply(self.rule_comparator_type, "comparator_type", [])
+            self.considerError(lastError, 'column_definition')
+            _locals['ty'] = _G_apply_444
+            def _G_or_445():
+                _G_python_446, lastError = 'PRIMARY', None
+                self.considerError(lastError, None)
+                _G_apply_447, lastError = self._apply(self.rule_k, "k", [_G_python_446])
+                self.considerError(lastError, None)
+                _G_python_448, lastError = 'KEY', None
+                self.considerError(lastError, None)
+                _G_apply_449, lastError = self._apply(self.rule_k, "k", [_G_python_448])
+                self.considerError(lastError, None)
+                _G_python_450, lastError = True, None
+                self.considerError(lastError, None)
+                return (_G_python_450, self.currentError)
+            def _G_or_451():
+                _G_python_452, lastError = False, None
+                self.considerError(lastError, None)
+                return (_G_python_452, self.currentError)
+            _G_or_453, lastError = self._or([_G_or_445, _G_or_451])
+            self.considerError(lastError, 'column_definition')
+            _locals['pk'] = _G_or_453
+            _G_python_454, lastError = eval('t.ColumnDefinition(c, ty, pk)', self.globals, _locals), None
+            self.considerError(lastError, 'column_definition')
+            return (_G_python_454, self.currentError)
+
+
+        def rule_partition_key(self):
+            _locals = {'self': self}
+            self.locals['partition_key'] = _locals
+            def _G_or_455():
+                _G_exactly_456, lastError = self.exactly('(')
+                self.considerError(lastError, None)
+                _G_apply_457, lastError = self._apply(self.rule_columns, "columns", [])
+                self.considerError(lastError, None)
+                _locals['cs'] = _G_apply_457
+                _G_exactly_458, lastError = self.exactly(')')
+                self.considerError(lastError, None)
+                _G_python_459, lastError = eval('cs', self.globals, _locals), None
+                self.considerError(lastError, None)
+                return (_G_python_459, self.currentError)
+            def _G_or_460():
+                _G_apply_461, lastError = self._apply(self.rule_column, "column", [])
+                self.considerError(lastError, None)
+                _locals['c'] = _G_apply_461
+                _G_python_462, lastError = eval('[c]', self.globals, _locals), None
+                self.considerError(lastError, None)
+                return (_G_python_462, self.currentError)
+            _G_or_463, lastError = self._or([_G_or_455, _G_or_460])
+            self.considerError(lastError, 'partition_key')
+            return (_G_or_463, self.currentError)
+
+
+        def rule_primary_key(self):
+            _locals = {'self': self}
+            self.locals['primary_key'] = _locals
+            _G_python_464, lastError = 'PRIMARY', None
+            self.considerError(lastError, 'primary_key')
+            _G_apply_465, lastError = self._apply(self.rule_k, "k", [_G_python_464])
+            self.considerError(lastError, 'primary_key')
+            _G_python_466, lastError = 'KEY', None
+            self.considerError(lastError, 'primary_key')
+            _G_apply_467, lastError = self._apply(self.rule_k, "k", [_G_python_466])
+            self.considerError(lastError, 'primary_key')
+            _G_exactly_468, lastError = self.exactly('(')
+            self.considerError(lastError, 'primary_key')
+            _G_apply_469, lastError = self._apply(self.rule_partition_key, "partition_key", [])
+            self.considerError(lastError, 'primary_key')
+            _locals['pk'] = _G_apply_469
+            def _G_many_470():
+                _G_exactly_471, lastError = self.exactly(',')
+                self.considerError(lastError, None)
+                _G_apply_472, lastError = self._apply(self.rule_column, "column", [])
+                self.considerError(lastError, None)
+                return (_G_apply_472, self.currentError)
+            _G_many_473, lastError = self.many(_G_many_470)
+            self.considerError(lastError, 'primary_key')
+            _locals['cs'] = _G_many_473
+            _G_exactly_474, lastError = self.exactly(')')
+            self.considerError(lastError, 'primary_key')
+            _G_python_475, lastError = eval('t.PrimaryKey(pk, cs)', self.globals, _locals), None
+            self.considerError(lastError, 'primary_key')
+            return (_G_python_475, self.currentError)
+
+
+        def rule_table_definition(self):
+            _locals = {'self': self}
+            self.locals['table_definition'] = _locals
+            def _G_or_476():
+                _G_apply_477, lastError = self._apply(self.rule_primary_key, "primary_key", [])
+                self.considerError(lastError, None)
+                return (_G_apply_477, self.currentError)
+            def _G_or_478():
+                _G_apply_479, lastError = self._apply(self.rule_column_definition, "column_definition", [])
+                self.considerError(lastError, None)
+                return (_G_apply_479, self.currentError)
+            _G_or_480, lastError = self._or([_G_or_476, _G_or_478])
+            self.considerError(lastError, 'table_definition')
+            return (_G_or_480, self.currentError)
+
+
+        def rule_table_definitions(self):
+            _locals = {'self': self}
+            self.locals['table_definitions'] = _locals
+            _G_apply_481, lastError = self._apply(self.rule_table_definition, "table_definition", [])
+            self.considerError(lastError, 'table_definitions')
+            _locals['first'] = _G_apply_481
+            def _G_many_482():
+                _G_exactly_483, lastError = self.exactly(',')
+                self.considerError(lastError, None)
+                _G_apply_484, lastError = self._apply(self.rule_table_definition, "table_definition", [])
+                self.considerError(lastError, None)
+                return (_G_apply_484, self.currentError)
+            _G_many_485, lastError = self.many(_G_many_482)
+            self.considerError(lastError, 'table_definitions')
+            _locals['rest'] = _G_many_485
+            def _G_optional_486():
+                _G_exactly_487, lastError = self.exactly(',')
+                self.considerError(lastError, None)
+                return (_G_exactly_487, self.currentError)
+            def _G_optional_488():
+                return (None, self.input.nullError())
+            _G_or_489, lastError = self._or([_G_optional_486, _G_optional_488])
+            self.considerError(lastError, 'table_definitions')
+            _G_python_490, lastError = eval('[first] + rest', self.globals, _locals), None
+            self.considerError(lastError, 'table_definitions')
+            return (_G_python_490, self.currentError)
+
+
+        def rule_clustering_column(self):
+            _locals = {'self': self}
+            self.locals['clustering_column'] = _locals
+            _G_apply_491, lastError = self._apply(self.rule_column, "column", [])
+            self.considerError(lastError, 'clustering_column')
+            _locals['c'] = _G_apply_491
+            def _G_or_492():
+                _G_python_493, lastError = 'ASC', None
+                self.considerError(lastError, None)
+                _G_apply_494, lastError = self._apply(self.rule_k, "k", [_G_python_493])
+                self.considerError(lastError, None)
+                return (_G_apply_494, self.currentError)
+            def _G_or_495():
+                _G_python_496, lastError = 'DESC', None
+                self.considerError(lastError, None)
+                _G_apply_497, lastError = self._apply(self.rule_k, "k", [_G_python_496])
+                self.considerError(lastError, None)
+                return (_G_apply_497, self.currentError)
+            _G_or_498, lastError = self._or([_G_or_492, _G_or_495])
+            self.considerError(lastError, 'clustering_column')
+            _locals['d'] = _G_or_498
+            _G_python_499, lastError = eval('t.OrderBy(c, d)', self.globals, _locals), None
+            self.considerError(lastError, 'clustering_column')
+            return (_G_python_499, self.currentError)
+
+
+        def rule_clustering_order(self):
+            _locals = {'self': self}
+            self.locals['clustering_order'] = _locals
+            _G_python_500, lastError = 'CLUSTERING', None
+            self.considerError(lastError, 'clustering_order')
+            _G_apply_501, lastError = self._apply(self.rule_k, "k", [_G_python_500])
+            self.considerError(lastError, 'clustering_order')
+            _G_python_502, lastError = 'ORDER', None
+            self.considerError(lastError, 'clustering_order')
+            _G_apply_503, lastError = self._apply(self.rule_k, "k", [_G_python_502])
+            self.considerError(lastError, 'clustering_order')
+            _G_python_504, lastError = 'BY', None
+            self.considerError(lastError, 'clustering_order')
+            _G_apply_505, lastError = self._apply(self.rule_k, "k", [_G_python_504])
+            self.considerError(lastError, 'clustering_order')
+            _G_exactly_506, lastError = self.exactly('(')
+            self.considerError(lastError, 'clustering_order')
+            _G_apply_507, lastError = self._apply(self.rule_clustering_column, "clustering_column", [])
+            self.considerError(lastError, 'clustering_order')
+            _locals['first'] = _G_apply_507
+            def _G_many_508():
+                _G_exactly_509, lastError = self.exactly(',')
+                self.considerError(lastError, None)
+                _G_apply_510, lastError = self._apply(self.rule_clustering_column, "clustering_column", [])
+                self.considerError(lastError, None)
+                return (_G_apply_510, self.currentError)
+            _G_many_511, lastError = self.many(_G_many_508)
+            self.considerError(lastError, 'clustering_order')
+            _locals['rest'] = _G_many_511
+            _G_exactly_512, lastError = self.exactly(')')
+            self.considerError(lastError, 'clustering_order')
+            _G_python_513, lastError = eval('t.ClusteringOrder([first] + rest)', self.globals, _locals), None
+            self.considerError(lastError, 'clustering_order')
+            return (_G_python_513, self.currentError)
+
+
+        def rule_table_property(self):
+            _locals = {'self': self}
+            self.locals['table_property'] = _locals
+            def _G_or_514():
+                _G_python_515, lastError = 'COMPACT', None
+                self.considerError(lastError, None)
+                _G_apply_516, lastError = self._apply(self.rule_k, "k", [_G_python_515])
+                self.considerError(lastError, None)
+                _G_python_517, lastError = 'STORAGE', None
+                self.considerError(lastError, None)
+                _G_apply_518, lastError = self._apply(self.rule_k, "k", [_G_python_517])
+                self.considerError(lastError, None)
+                _G_python_519, lastError = eval('t.CompactStorage()', self.globals, _locals), None
+                self.considerError(lastError, None)
+                return (_G_python_519, self.currentError)
+            def _G_or_520():
+                _G_apply_521, lastError = self._apply(self.rule_clustering_order, "clustering_order", [])
+                self.considerError(lastError, None)
+                return (_G_apply_521, self.currentError)
+            def _G_or_522():
+                _G_apply_523, lastError = self._apply(self.rule_property, "property", [])
+                self.considerError(lastError, None)
+                return (_G_apply_523, self.currentError)
+            _G_or_524, lastError = self._or([_G_or_514, _G_or_520, _G_or_522])
+            self.considerError(lastError, 'table_property')
+            return (_G_or_524, self.currentError)
+
+
+        def rule_table_properties(self):
+            _locals = {'self': self}
+            self.locals['table_properties'] = _locals
+            _G_apply_525, lastError = self._apply(self.rule_table_property, "table_property", [])
+            self.considerError(lastError, 'table_properties')
+            _locals['first'] = _G_apply_525
+            def _G_many_526():
+                _G_python_527, lastError = 'AND', None
+                self.considerError(lastError, None)
+                _G_apply_528, lastError = self._apply(self.rule_k, "k", [_G_python_527])
+                self.considerError(lastError, None)
+                _G_apply_529, lastError = self._apply(self.rule_table_property, "table_property", [])
+                self.considerError(lastError, None)
+                return (_G_apply_529, self.currentError)
+            _G_many_530, lastError = self.many(_G_many_526)
+            self.considerError(lastError, 'table_properties')
+            _locals['rest'] = _G_many_530
+            _G_python_531, lastError = eval('t.Properties([first] + rest)', self.globals, _locals), None
+            self.considerError(lastError, 'table_properties')
+            return (_G_python_531, self.currentError)
+
+
+        def rule_create_table(self):
+            _locals = {'self': self}
+            self.locals['create_table'] = _locals
+            _G_python_532, lastError = 'CREATE', None
+            self.considerError(lastError, 'create_table')
+            _G_apply_533, lastError = self._apply(self.rule_k, "k", [_G_python_532])
+            self.considerError(lastError, 'create_table')
+            _G_apply_534, lastError = self._apply(self.rule_a_table, "a_table", [])
+            self.considerError(lastError, 'create_table')
+            _G_apply_535, lastError = self._apply(self.rule_table, "table", [])
+            self.considerError(lastError, 'create_table')
+            _locals['n'] = _G_apply_535
+            _G_exactly_536, lastError = self.exactly('(')
+            self.considerError(lastError, 'create_table')
+            _G_apply_537, lastError = self._apply(self.rule_table_definitions, "table_definitions", [])
+            self.considerError(lastError, 'create_table')
+            _locals['ds'] = _G_apply_537
+            _G_exactly_538, lastError = self.exactly(')')
+            self.considerError(lastError, 'create_table')
+            def _G_optional_539():
+                _G_python_540, lastError = 'WITH', None
+                self.considerError(lastError, None)
+                _G_apply_541, lastError = self._apply(self.rule_k, "k", [_G_python_540])
+                self.considerError(lastError, None)
+                _G_apply_542, lastError = self._apply(self.rule_table_properties, "table_properties", [])
+                self.considerError(lastError, None)
+                return (_G_apply_542, self.currentError)
+            def _G_optional_543():
+                return (None, self.input.nullError())
+            _G_or_544, lastError = self._or([_G_optional_539, _G_optional_543])
+            self.considerError(lastError, 'create_table')
+            _locals['p'] = _G_or_544
+            _G_python_545, lastError = eval('t.CreateTable(n, ds, p)', self.globals, _locals), None
+            self.considerError(lastError, 'create_table')
+            return (_G_python_545, self.currentError)
+
+
+        def rule_alter_type(self):
+            _locals = {'self': self}
+            self.locals['alter_type'] = _locals
+            _G_python_546, lastError = 'ALTER', None
+            self.considerError(lastError, 'alter_type')
+            _G_apply_547, lastError = self._apply(self.rule_k, "k", [_G_python_546])
+            self.considerError(lastError, 'alter_type')
+            _G_apply_548, lastError = self._apply(self.rule_column, "column", [])
+            self.considerError(lastError, 'alter_type')
+            _locals['c'] = _G_apply_548
+            _G_python_549, lastError = 'TYPE', None
+            self.considerError(lastError, 'alter_type')
+            _G_apply_550, lastError = self._apply(self.rule_k, "k", [_G_python_549])
+            self.considerError(lastError, 'alter_type')
+            _G_apply_551, lastError = self._apply(self.rule_comparator_type, "comparator_type", [])
+            self.considerError(lastError, 'alter_type')
+            _locals['ty'] = _G_apply_551
+            _G_python_552, lastError = eval('t.AlterType(c, ty)', self.globals, _locals), None
+            self.considerError(lastError, 'alter_type')
+            return (_G_python_552, self.currentError)
+
+
+        def rule_add_column(self):
+            _locals = {'self': self}
+            self.locals['add_column'] = _locals
+            _G_python_553, lastError = 'ADD', None
+            self.considerError(lastError, 'add_column')
+            _G_apply_554, lastError = self._apply(self.rule_k, "k", [_G_python_553])
+            self.considerError(lastError, 'add_column')
+            _G_apply_555, lastError = self._apply(self.rule_column, "column", [])
+            self.considerError(lastError, 'add_column')
+            _locals['c'] = _G_apply_555
+            _G_apply_556, lastError = self._apply(self.rule_comparator_type, "comparator_type", [])
+            self.considerError(lastError, 'add_column')
+            _locals['ty'] = _G_apply_556
+            _G_python_557, lastError = eval('t.AddColumn(c, ty)', self.globals, _locals), None
+            self.considerError(lastError, 'add_column')
+            return (_G_python_557, self.currentError)
+
+
+        def rule_drop_column(self):
+            _locals = {'self': self}
+            self.locals['drop_column'] = _locals
+            _G_python_558, lastError = 'DROP', None
+            self.considerError(lastError, 'drop_column')
+            _G_apply_559, lastError = self._apply(self.rule_k, "k", [_G_python_558])
+            self.considerError(lastError, 'drop_column')
+            _G_apply_560, lastError = self._apply(self.rule_column, "column", [])
+            self.considerError(lastError, 'drop_column')
+            _locals['c'] = _G_apply_560
+            _G_python_561, lastError = eval('t.DropColumn(c)', self.globals, _locals), None
+            self.considerError(lastError, 'drop_column')
+            return (_G_python_561, self.currentError)
+
+
+        def rule_rename_column(self):
+            _locals = {'self': self}
+            self.locals['rename_column'] = _locals
+            _G_apply_562, lastError = self._apply(self.rule_column, "column", [])
+            self.considerError(lastError, 'rename_column')
+            _locals['c'] = _G_apply_562
+            _G_python_563, lastError = 'TO', None
+            self.considerError(lastError, 'rename_column')
+            _G_apply_564, lastError = self._apply(self.rule_k, "k", [_G_python_563])
+            self.considerError(lastError, 'rename_column')
+            _G_apply_565, lastError = self._apply(self.rule_column, "column", [])
+            self.considerError(lastError, 'rename_column')
+            _locals['to'] = _G_apply_565
+            _G_python_566, lastError = eval('t.RenameColumn(c, to)', self.globals, _locals), None
+            self.considerError(lastError, 'rename_column')
+            return (_G_python_566, self.currentError)
+
+
+        def rule_rename(self):
+            _locals = {'self': self}
+            self.locals['rename'] = _locals
+            _G_python_567, lastError = 'RENAME', None
+            self.considerError(lastError, 'rename')
+            _G_apply_568, lastError = self._apply(self.rule_k, "k", [_G_python_567])
+            self.considerError(lastError, 'rename')
+            _G_apply_569, lastError = self._apply(self.rule_rename_column, "rename_column", [])
+            self.considerError(lastError, 'rename')
+            _locals['first'] = _G_apply_569
+            def _G_many_570():
+                _G_python_571, lastError = 'AND', None
+                self.considerError(lastError, None)
+                _G_apply_572, lastError = self._apply(self.rule_k, "k", [_G_python_571])
+                self.considerError(lastError, None)
+                _G_apply_573, lastError = self._apply(self.rule_rename_column, "rename_column", [])
+                self.considerError(lastError, None)
+                return (_G_apply_573, self.currentError)
+            _G_many_574, lastError = self.many(_G_many_570)
+            self.considerError(lastError, 'rename')
+            _locals['rest'] = _G_many_574
+            _G_python_575, lastError = eval('t.Rename([first] + rest)', self.globals, _locals), None
+            self.considerError(lastError, 'rename')
+            return (_G_python_575, self.currentError)
+
+
+        def rule_alter_table(self):
+            _locals = {'self': self}
+            self.locals['alter_table'] = _locals
+            _G_python_576, lastError = 'ALTER', None
+            self.considerError(lastError, 'alter_table')
+            _G_apply_577, lastError = self._apply(self.rule_k, "k", [_G_python_576])
+            self.considerError(lastError, 'alter_table')
+            _G_apply_578, lastError = self._apply(self.rule_a_table, "a_table", [])
+            self.considerError(lastError, 'alter_table')
+            _G_apply_579, lastError = self._apply(self.rule_table, "table", [])
+            self.considerError(lastError, 'alter_table')
+            _locals['n'] = _G_apply_579
+            def _G_or_580():
+                _G_apply_581, lastError = self._apply(self.rule_alter_type, "alter_type", [])
+                self.considerError(lastError, None)
+                return (_G_apply_581, self.currentError)
+            def _G_or_582():
+                _G_apply_583, lastError = self._apply(self.rule_add_column, "add_column", [])
+                self.considerError(lastError, None)
+                return (_G_apply_583, self.currentError)
+            def _G_or_584():
+                _G_apply_585, lastError = self._apply(self.rule_drop_column, "drop_column", [])
+                self.considerError(lastError, None)
+                return (_G_apply_585, self.currentError)
+            def _G_or_586():
+                _G_python_587, lastError = 'WITH', None
+                self.considerError(lastError, None)
+                _G_apply_588, lastError = self._apply(self.rule_k, "k", [_G_python_587])
+                self.considerError(lastError, None)
+                _G_apply_589, lastError = self._apply(self.rule_properties, "properties", [])
+                self.considerError(lastError, None)
+                return (_G_apply_589, self.currentError)
+            def _G_or_590():
+                _G_apply_591, lastError = self._apply(self.rule_rename, "rename", [])
+                self.considerError(lastError, None)
+                return (_G_apply_591, self.currentError)
+            _G_or_592, lastError = self._or([_G_or_580, _G_or_582, _G_or_584, _G_or_586, _G_or_590])
+            self.considerError(lastError, 'alter_table')
+            _locals['o'] = _G_or_592
+            _G_python_593, lastError = eval('t.AlterTable(n, o)', self.globals, _locals), None
+            self.considerError(lastError, 'alter_table')
+            return (_G_python_593, self.currentError)
+
+
+        def rule_using_delete_objective(self):
+            _locals = {'self': self}
+            self.locals['using_delete_objective'] = _locals
+            _G_python_594, lastError = 'TIMESTAMP', None
+            self.considerError(lastError, 'using_delete_objective')
+            _G_apply_595, lastError = self._apply(self.rule_k, "k", [_G_python_594])
+            self.considerError(lastError, 'using_delete_objective')
+            _G_apply_596, lastError = self._apply(self.rule_integer, "integer", [])
+            self.considerError(lastError, 'using_delete_objective')
+            _locals['i'] = _G_apply_596
+            _G_python_597, lastError = eval('t.Timestamp(i)', self.globals, _locals), None
+            self.considerError(lastError, 'using_delete_objective')
+            return (_G_python_597, self.currentError)
+
+
+        def rule_using_objective(self):
+            _locals = {'self': self}
+            self.locals['using_objective'] = _locals
+            def _G_or_598():
+                _G_python_599, lastError = 'TTL', None
+                self.considerError(lastError, None)
+                _G_apply_600, lastError = self._apply(self.rule_k, "k", [_G_python_599])
+                self.considerError(lastError, None)
+                _G_apply_601, lastError = self._apply(self.rule_integer, "integer", [])
+                self.considerError(lastError, None)
+                _locals['i'] = _G_apply_601
+                _G_python_602, lastError = eval('t.TTL(i)', self.globals, _locals), None
+                self.considerError(lastError, None)
+                return (_G_python_602, self.currentError)
+            def _G_or_603():
+                _G_apply_604, lastError = self._apply(self.rule_using_delete_objective, "using_delete_objective", [])
+                self.considerError(lastError, None)
+                return (_G_apply_604, self.currentError)
+            _G_or_605, lastError = self._or([_G_or_598, _G_or_603])
+            self.considerError(lastError, 'using_objective')
+            return (_G_or_605, self.currentError)
+
+
+        def rule_using_delete(self):
+            _locals = {'self': self}
+            self.locals['using_delete'] = _locals
+            def _G_or_606():
+                _G_python_607, lastError = 'USING', None
+                self.considerError(lastError, None)
+                _G_apply_608, lastError = self._apply(self.rule_k, "k", [_G_python_607])
+                self.considerError(lastError, None)
+                _G_apply_609, lastError = self._apply(self.rule_using_delete_objective, "using_delete_objective", [])
+                self.considerError(lastError, None)
+                _locals['first'] = _G_apply_609
+                def _G_many_610():
+                    _G_python_611, lastError = 'AND', None
+                    self.considerError(lastError, None)
+                    _G_apply_612, lastError = self._apply(self.rule_k, "k", [_G_python_611])
+                    self.considerError(lastError, None)
+                    _G_apply_613, lastError = self._apply(self.rule_using_delete_objective, "using_delete_objective", [])
+                    self.considerError(lastError, None)
+                    return (_G_apply_613, self.currentError)
+                _G_many_614, lastError = self.many(_G_many_610)
+                self.considerError(lastError, None)
+                _locals['rest'] = _G_many_614
+                _G_python_615, lastError = eval('[first] + rest', self.globals, _locals), None
+                self.considerError(lastError, None)
+                return (_G_python_615, self.currentError)
+            def _G_or_616():
+                _G_python_617, lastError = [], None
+                self.considerError(lastError, None)
+                return (_G_python_617, self.currentError)
+            _G_or_618, lastError = self._or([_G_or_606, _G_or_616])
+            self.considerError(lastError, 'using_delete')
+            return (_G_or_618, self.currentError)
+
+
+        def rule_using(self):
+            _locals = {'self': self}
+            self.locals['using'] = _locals
+            def _G_or_619():
+                _G_python_620, lastError = 'USING', None
+                self.considerError(lastError, None)
+                _G_apply_621, lastError = self._apply(self.rule_k, "k", [_G_python_620])
+                self.considerError(lastError, None)
+                _G_apply_622, lastError = self._apply(self.rule_using_objective, "using_objective", [])
+                self.considerError(lastError, None)
+                _locals['first'] = _G_apply_622
+                def _G_many_623():
+                    _G_python_624, lastError = 'AND', None
+                    self.considerError(lastError, None)
+                    _G_apply_625, lastError = self._apply(self.rule_k, "k", [_G_python_624])
+                    self.considerError(lastError, None)
+                    _G_apply_626, lastError = self._apply(self.rule_using_objective, "using_objective", [])
+                    self.considerError(lastError, None)
+                    return (_G_apply_626, self.currentError)
+                _G_many_627, lastError = self.many(_G_many_623)
+                self.considerError(lastError, None)
+                _locals['rest'] = _G_many_627
+                _G_python_628, lastError = eval('[first] + rest', self.globals, _locals), None
+                self.considerError(lastError, None)
+                return (_G_python_628, self.currentError)
+            def _G_or_629():
+                _G_python_630, lastError = [], None
+                self.considerError(lastError, None)
+                return (_G_python_630, self.currentError)
+            _G_or_631, lastError = self._or([_G_or_619, _G_or_629])
+            self.considerError(lastError, 'using')
+            return (_G_or_631, self.currentError)
+
+
+        def rule_insert(self):
+            _locals = {'self': self}
+            self.locals['insert'] = _locals
+            _G_python_632, lastError = 'INSERT', None
+            self.considerError(lastError, 'insert')
+            _G_apply_633, lastError = self._apply(self.rule_k, "k", [_G_python_632])
+            self.considerError(lastError, 'insert')
+            _G_python_634, lastError = 'INTO', None
+            self.considerError(lastError, 'insert')
+            _G_apply_635, lastError = self._apply(self.rule_k, "k", [_G_python_634])
+            self.considerError(lastError, 'insert')
+            _G_apply_636, lastError = self._apply(self.rule_table, "table", [])
+            self.considerError(lastError, 'insert')
+            _locals['n'] = _G_apply_636
+            _G_exactly_637, lastError = self.exactly('(')
+            self.considerError(lastError, 'insert')
+            _G_apply_638, lastError = self._apply(self.rule_columns, "columns", [])
+            self.considerError(lastError, 'insert')
+            _locals['cs'] = _G_apply_638
+            _G_exactly_639, lastError = self.exactly(')')
+            self.considerError(lastError, 'insert')
+            _G_python_640, lastError = 'VALUES', None
+            self.considerError(lastError, 'insert')
+            _G_apply_641, lastError = self._apply(self.rule_k, "k", [_G_python_640])
+            self.considerError(lastError, 'insert')
+            _G_exactly_642, lastError = self.exactly('(')
+            self.considerError(lastError, 'insert')
+            _G_apply_643, lastError = self._apply(self.rule_set_operations, "set_operations", [])
+            self.considerError(lastError, 'insert')
+            _locals['ss'] = _G_apply_643
+            _G_exactly_644, lastError = self.exactly(')')
+            self.considerError(lastError, 'insert')
+            _G_apply_645, lastError = self._apply(self.rule_using, "using", [])
+            self.considerError(lastError, 'insert')
+            _locals['u'] = _G_apply_645
+            _G_python_646, lastError = eval('t.Insert(n, cs, ss, u)', self.globals, _locals), None
+            self.considerError(lastError, 'insert')
+            return (_G_python_646, self.currentError)
+
+
+        def rule_relation_operator(self):
+            _locals = {'self': self}
+            self.locals['relation_operator'] = _locals
+            def _G_or_647():
+                _G_exactly_648, lastError = self.exactly('=')
+                self.considerError(lastError, None)
+                return (_G_exactly_648, self.currentError)
+            def _G_or_649():
+                _G_exactly_650, lastError = self.exactly('<=')
+                self.considerError(lastError, None)
+                return (_G_exactly_650, self.currentError)
+            def _G_or_651():
+                _G_exactly_652, lastError = self.exactly('>=')
+                self.considerError(lastError, None)
+                return (_G_exactly_652, self.currentError)
+            def _G_or_653():
+                _G_exactly_654, lastError = self.exactly('<')
+                self.considerError(lastError, None)
+                return (_G_exactly_654, self.currentError)
+            def _G_or_655():
+                _G_exactly_656, lastError = self.exactly('>')
+                self.considerError(lastError, None)
+                return (_G_exactly_656, self.currentError)
+            _G_or_657, lastError = self._or([_G_or_647, _G_or_649, _G_or_651, _G_or_653, _G_or_655])
+            self.considerError(lastError, 'relation_operator')
+            return (_G_or_657, self.currentError)
+
+
+        def rule_token_columns(self):
+            _locals = {'self': self}
+            self.locals['token_columns'] = _locals
+            _G_python_658, lastError = 'TOKEN', None
+            self.considerError(lastError, 'token_columns')
+            _G_apply_659, lastError = self._apply(self.rule_k, "k", [_G_python_658])
+            self.considerError(lastError, 'token_columns')
+            _G_exactly_660, lastError = self.exactly('(')
+            self.considerError(lastError, 'token_columns')
+            _G_apply_661, lastError = self._apply(self.rule_columns, "columns", [])
+            self.considerError(lastError, 'token_columns')
+            _locals['cs'] = _G_apply_661
+            _G_exactly_662, lastError = self.exactly(')')
+            self.considerError(lastError, 'token_columns')
+            _G_python_663, lastError = eval('t.Token(cs)', self.globals, _locals), None
+            self.considerError(lastError, 'token_columns')
+            return (_G_python_663, self.currentError)
+
+
+        def rule_token_terms(self):
+            _locals = {'self': self}
+            self.locals['token_terms'] = _locals
+            _G_python_664, lastError = 'TOKEN', None
+            self.considerError(lastError, 'token_terms')
+            _G_apply_665, lastError = self._apply(self.rule_k, "k", [_G_python_664])
+            self.considerError(lastError, 'token_terms')
+            _G_exactly_666, lastError = self.exactly('(')
+            self.considerError(lastError, 'token_terms')
+            _G_apply_667, lastError = self._apply(self.rule_term_list, "term_list", [])
+            self.considerError(lastError, 'token_terms')
+            _locals['ts'] = _G_apply_667
+            _G_exactly_668, lastError = self.exactly(')')
+            self.considerError(lastError, 'token_terms')
+            _G_python_669, lastError = eval('t.Token(ts)', self.globals, _locals), None
+            self.considerError(lastError, 'token_terms')
+            return (_G_python_669, self.currentError)
+
+
+        def rule_token_relation(self):
+            _locals = {'self': self}
+            self.locals['token_relation'] = _locals
+            _G_apply_670, lastError = self._apply(self.rule_token_columns, "token_columns", [])
+            self.considerError(lastError, 'token_relation')
+            _locals['c'] = _G_apply_670
+            _G_apply_671, lastError = self._apply(self.rule_relation_operator, "relation_operator", [])
+            self.considerError(lastError, 'token_relation')
+            _locals['o'] = _G_apply_671
+            def _G_or_672():
+                _G_apply_673, lastError = self._apply(self.rule_string, "string", [])
+                self.considerError(lastError, None)
+                return (_G_apply_673, self.currentError)
+            def _G_or_674():
+                _G_apply_675, lastError = self._apply(self.rule_token_terms, "token_terms", [])
+                self.considerError(lastError, None)
+                return (_G_apply_675, self.currentError)
+            _G_or_676, lastError = self._or([_G_or_672, _G_or_674])
+            self.considerError(lastError, 'token_relation')
+            _locals['v'] = _G_or_676
+            _G_python_677, lastError = eval('t.Relation(c, o, v)', self.globals, _locals), None
+            self.considerError(lastError, 'token_relation')
+            return (_G_python_677, self.currentError)
+
+
+        def rule_relation(self):
+            _locals = {'self': self}
+            self.locals['relation'] = _locals
+            _G_apply_678, lastError = self._apply(self.rule_column, "column", [])
+            self.considerError(lastError, 'relation')
+            _locals['c'] = _G_apply_678
+            def _G_or_679():
+                _G_apply_680, lastError = self._apply(self.rule_relation_operator, "relation_operator", [])
+                self.considerError(lastError, None)
+                _locals['o'] = _G_apply_680
+                _G_apply_681, lastError = self._apply(self.rule_term, "term", [])
+                self.considerError(lastError, None)
+                _locals['v'] = _G_apply_681
+                _G_python_682, lastError = eval('o, v', self.globals, _locals), None
+                self.considerError(lastError, None)
+                return (_G_python_682, self.currentError)
+            def _G_or_683():
+                _G_python_684, lastError = 'IN', None
+                self.considerError(lastError, None)
+                _G_apply_685, lastError = self._apply(self.rule_k, "k", [_G_python_684])
+                self.considerError(lastError, None)
+                _G_exactly_686, lastError = self.exactly('(')
+                self.considerError(lastError, None)
+                _G_apply_687, lastError = self._apply(self.rule_terms, "terms", [])
+                self.considerError(lastError, None)
+                _locals['tl'] = _G_apply_687
+                _G_exactly_688, lastError = self.exactly(')')
+                self.considerError(lastError, None)
+                _G_python_689, lastError = eval("'in', tl", self.globals, _locals), None
+                self.considerError(lastError, None)
+                return (_G_python_689, self.currentError)
+            _G_or_690, lastError = self._or([_G_or_679, _G_or_683])
+            self.considerError(lastError, 'relation')
+            _locals['ov'] = _G_or_690
+            _G_python_691, lastError = eval('t.Relation(c, ov[0], ov[1])', self.globals, _locals), None
+            self.considerError(lastError, 'relation')
+            return (_G_python_691, self.currentError)
+
+
+        def rule_relations(self):
+            _locals = {'self': self}
+            self.locals['relations'] = _locals
+            def _G_or_692():
+                _G_apply_693, lastError = self._apply(self.rule_token_relation, "token_relation", [])
+                self.considerError(lastError, None)
+                return (_G_apply_693, self.currentError)
+            def _G_or_694():
+                _G_apply_695, lastError = self._apply(self.rule_relation, "relation", [])
+                self.considerError(lastError, None)
+                return (_G_apply_695, self.currentError)
+            _G_or_696, lastError = self._or([_G_or_692, _G_or_694])
+            self.considerError(lastError, 'relations')
+            _locals['first'] = _G_or_696
+            def _G_many_697():
+                _G_python_698, lastError = 'AND', None
+                self.considerError(lastError, None)
+                _G_apply_699, lastError = self._apply(self.rule_k, "k", [_G_python_698])
+                self.considerError(lastError, None)
+                def _G_or_700():
+                    _G_apply_701, lastError = self._apply(self.rule_token_relation, "token_relation", [])
+                    self.considerError(lastError, None)
+                    return (_G_apply_701, self.currentError)
+                def _G_or_702():
+                    _G_apply_703, lastError = self._apply(self.rule_relation, "relation", [])
+                    self.considerError(lastError, None)
+                    return (_G_apply_703, self.currentError)
+                _G_or_704, lastError = self._or([_G_or_700, _G_or_702])
+                self.considerError(lastError, None)
+                return (_G_or_704, self.currentError)
+            _G_many_705, lastError = self.many(_G_many_697)
+            self.considerError(lastError, 'relations')
+            _locals['rest'] = _G_many_705
+            _G_python_706, lastError = eval('[first] + rest', self.globals, _locals), None
+            self.considerError(lastError, 'relations')
+            return (_G_python_706, self.currentError)
+
+
+        def rule_selector(self):
+            _locals = {'self': self}
+            self.locals['selector'] = _locals
+            def _G_or_707():
+                def _G_or_708():
+                    _G_python_709, lastError = 'WRITETIME', None
+                    self.considerError(lastError, None)
+                    _G_apply_710, lastError = self._apply(self.rule_k, "k", [_G_python_709])
+                    self.considerError(lastError, None)
+                    return (_G_apply_710, self.currentError)
+                def _G_or_711():
+                    _G_python_712, lastError = 'TTL', None
+                    self.considerError(lastError, None)
+                    _G_apply_713, lastError = self._apply(self.rule_k, "k", [_G_python_712])
+                    self.considerError(lastError, None)
+                    return (_G_apply_713, self.currentError)
+                _G_or_714, lastError = self._or([_G_or_708, _G_or_711])
+                self.considerError(lastError, None)
+                _locals['fn'] = _G_or_714
+                _G_exactly_715, lastError = self.exactly('(')
+                self.considerError(lastError, None)
+                _G_apply_716, lastError = self._apply(self.rule_column, "column", [])
+                self.considerError(lastError, None)
+                _locals['c'] = _G_apply_716
+                _G_exactly_717, lastError = self.exactly(')')
+                self.considerError(lastError, None)
+                _G_python_718, lastError = eval('t.Function(fn, c)', self.globals, _locals), None
+                self.considerError(lastError, None)
+                return (_G_python_718, self.currentError)
+            def _G_or_719():
+                _G_apply_720, lastError = self._apply(self.rule_column, "column", [])
+                self.considerError(lastError, None)
+                return (_G_apply_720, self.currentError)
+            _G_or_721, lastError = self._or([_G_or_707, _G_or_719])
+            self.considerError(lastError, 'selector')
+            return (_G_or_721, self.currentError)
+
+
+        def rule_selectors(self):
+            _locals = {'self': self}
+            self.locals['selectors'] = _locals
+            def _G_or_722():
+                _G_exactly_723, lastError = self.exactly('*')
+                self.considerError(lastError, None)
+                _G_python_724, lastError = eval('t.SelectAll()', self.globals, _locals), None
+                self.considerError(lastError, None)
+                return (_G_python_724, self.currentError)
+            def _G_or_725():
+                _G_python_726, lastError = 'COUNT', None
+                self.considerError(lastError, None)
+                _G_apply_727, lastError = self._apply(self.rule_k, "k", [_G_python_726])
+                self.considerError(lastError, None)
+                _G_exactly_728, lastError = self.exactly('(')
+                self.considerError(lastError, None)
+                def _G_or_729():
+                    _G_exactly_730, lastError = self.exactly('*')
+                    self.considerError(lastError, None)
+                    return (_G_exactly_730, self.currentError)
+                def _G_or_731():
+                    _G_exactly_732, lastError = self.exactly('1')
+                    self.considerError(lastError, None)
+                    return (_G_exactly_732, self.currentError)
+                _G_or_733, lastError = self._or([_G_or_729, _G_or_731])
+                self.considerError(lastError, None)
+                _G_exactly_734, lastError = self.exactly(')')
+                self.considerError(lastError, None)
+                _G_python_735, lastError = eval('t.Count()', self.globals, _locals), None
+                self.considerError(lastError, None)
+                return (_G_python_735, self.currentError)
+            def _G_or_736():
+                _G_apply_737, lastError = self._apply(self.rule_selector, "selector", [])
+                self.considerError(lastError, None)
+                _locals['first'] = _G_apply_737
+                def _G_many_738():
+                    _G_exactly_739, lastError = self.exactly(',')
+                    self.considerError(lastError, None)
+                    _G_apply_740, lastError = self._apply(self.rule_selector, "selector", [])
+                    self.considerError(lastError, None)
+                    return (_G_apply_740, self.currentError)
+                _G_many_741, lastError = self.many(_G_many_738)
+                self.considerError(lastError, None)
+                _locals['rest'] = _G_many_741
+                _G_python_742, lastError = eval('[first] + rest', self.globals, _locals), None
+                self.considerError(lastError, None)
+                return (_G_python_742, self.currentError)
+            _G_or_743, lastError = self._or([_G_or_722, _G_or_725, _G_or_736])
+            self.considerError(lastError, 'selectors')
+            return (_G_or_743, self.currentError)
+
+
+        def rule_order_by(self):
+            _locals = {'self': self}
+            self.locals['order_by'] = _locals
+            _G_python_744, lastError = 'ORDER', None
+            self.considerError(lastError, 'order_by')
+            _G_apply_745, lastError = self._apply(self.rule_k, "k", [_G_python_744])
+            self.considerError(lastError, 'order_by')
+            _G_python_746, lastError = 'BY', None
+            self.considerError(lastError, 'order_by')
+            _G_apply_747, lastError = self._apply(self.rule_k, "k", [_G_python_746])
+            self.considerError(lastError, 'order_by')
+            _G_apply_748, lastError = self._apply(self.rule_column, "column", [])
+            self.considerError(lastError, 'order_by')
+            _locals['c'] = _G_apply_748
+            def _G_or_749():
+                _G_python_750, lastError = 'ASC', None
+                self.considerError(lastError, None)
+                _G_apply_751, lastError = self._apply(self.rule_k, "k", [_G_python_750])
+                self.considerError(lastError, None)
+                return (_G_apply_751, self.currentError)
+            def _G_or_752():
+                _G_python_753, lastError = 'DESC', None
+                self.considerError(lastError, None)
+                _G_apply_754, lastError = self._apply(self.rule_k, "k", [_G_python_753])
+                self.considerError(lastError, None)
+                return (_G_apply_754, self.currentError)
+            _G_or_755, lastError = self._or([_G_or_749, _G_or_752])
+            self.considerError(lastError, 'order_by')
+            _locals['d'] = _G_or_755
+            _G_python_756, lastError = eval('t.OrderBy(c, d)', self.globals, _locals), None
+            self.considerError(lastError, 'order_by')
+            return (_G_python_756, self.currentError)
+
+
+        def rule_limit(self):
+            _locals = {'self': self}
+            self.locals['limit'] = _locals
+            _G_python_757, lastError = 'LIMIT', None
+            self.considerError(lastError, 'limit')
+            _G_apply_758, lastError = self._apply(self.rule_k, "k", [_G_python_757])
+            self.considerError(lastError, 'limit')
+            _G_apply_759, lastError = self._apply(self.rule_integer, "integer", [])
+            self.considerError(lastError, 'limit')
+            _locals['l'] = _G_apply_759
+            _G_python_760, lastError = eval('t.Limit(l)', self.globals, _locals), None
+            self.considerError(lastError, 'limit')
+            return (_G_python_760, self.currentError)
+
+
+        def rule_allow_filtering(self):
+            _locals = {'self': self}
+            self.locals['allow_filtering'] = _locals
+            _G_python_761, lastError = 'ALLOW', None
+            self.considerError(lastError, 'allow_filtering')
+            _G_apply_762, lastError = self._apply(self.rule_k, "k", [_G_python_761])
+            self.considerError(lastError, 'allow_filtering')
+            _G_python_763, lastError = 'FILTERING', None
+            self.considerError(lastError, 'allow_filtering')
+            _G_apply_764, lastError = self._apply(self.rule_k, "k", [_G_python_763])
+            self.considerError(lastError, 'allow_filtering')
+            _G_python_765, lastError = eval('t.AllowFiltering()', self.globals, _locals), None
+            self.considerError(lastError, 'allow_filtering')
+            return (_G_python_765, self.currentError)
+
+
+        def rule_select(self):
+            _locals = {'self': self}
+            self.locals['select'] = _locals
+            _G_python_766, lastError = 'SELECT', None
+            self.considerError(lastError, 'select')
+            _G_apply_767, lastError = self._apply(self.rule_k, "k", [_G_python_766])
+            self.considerError(lastError, 'select')
+            _G_apply_768, lastError = self._apply(self.rule_selectors, "selectors", [])
+            self.considerError(lastError, 'select')
+            _locals['s'] = _G_apply_768
+            _G_python_769, lastError = 'FROM', None
+            self.considerError(lastError, 'select')
+            _G_apply_770, lastError = self._apply(self.rule_k, "k", [_G_python_769])
+            self.considerError(lastError, 'select')
+            _G_apply_771, lastError = self._apply(self.rule_table, "table", [])
+            self.considerError(lastError, 'select')
+            _locals['n'] = _G_apply_771
+            def _G_optional_772():
+                _G_python_773, lastError = 'WHERE', None
+                self.considerError(lastError, None)
+                _G_apply_774, lastError = self._apply(self.rule_k, "k", [_G_python_773])
+                self.considerError(lastError, None)
+                _G_apply_775, lastError = self._apply(self.rule_relations, "relations", [])
+                self.considerError(lastError, None)
+                return (_G_apply_775, self.currentError)
+            def _G_optional_776():
+                return (None, self.input.nullError())
+            _G_or_777, lastError = self._or([_G_optional_772, _G_optional_776])
+            self.considerError(lastError, 'select')
+            _locals['w'] = _G_or_777
+            def _G_optional_778():
+                _G_apply_779, lastError = self._apply(self.rule_order_by, "order_by", [])
+                self.considerError(lastError, None)
+                return (_G_apply_779, self.currentError)
+            def _G_optional_780():
+                return (None, self.input.nullError())
+            _G_or_781, lastError = self._or([_G_optional_778, _G_optional_780])
+            self.considerError(lastError, 'select')
+            _locals['o'] = _G_or_781
+            def _G_optional_782():
+                _G_apply_783, lastError = self._apply(self.rule_limit, "limit", [])
+                self.considerError(lastError, None)
+                return (_G_apply_783, self.currentError)
+            def _G_optional_784():
+                return (None, self.input.nullError())
+            _G_or_785, lastError = self._or([_G_optional_782, _G_optional_784])
+            self.considerError(lastError, 'select')
+            _locals['l'] = _G_or_785
+            def _G_optional_786():
+                _G_apply_787, lastError = self._apply(self.rule_allow_filtering, "allow_filtering", [])
+                self.considerError(lastError, None)
+                return (_G_apply_787, self.currentError)
+            def _G_optional_788():
+                return (None, self.input.nullError())
+            _G_or_789, lastError = self._or([_G_optional_786, _G_optional_788])
+            self.considerError(lastError, 'select')
+            _locals['af'] = _G_or_789
+            _G_python_790, lastError = eval('t.Select(s, n, w, o, l, af)', self.globals, _locals), None
+            self.considerError(lastError, 'select')
+            return (_G_python_790, self.currentError)
+
+
+        def rule_collection_column(self):
+            _locals = {'self': self}
+            self.locals['collection_column'] = _locals
+            _G_apply_791, lastError = self._apply(self.rule_column, "column", [])
+            self.considerError(lastError, 'collection_column')
+            _locals['c'] = _G_apply_791
+            _G_exactly_792, lastError = self.exactly('[')
+            self.considerError(lastError, 'collection_column')
+            _G_apply_793, lastError = self._apply(self.rule_term, "term", [])
+            self.considerError(lastError, 'collection_column')
+            _locals['k'] = _G_apply_793
+            _G_exactly_794, lastError = self.exactly(']')
+            self.considerError(lastError, 'collection_column')
+            _G_python_795, lastError = eval('t.CollectionItem(c, k)', self.globals, _locals), None
+            self.considerError(lastError, 'collection_column')
+            return (_G_python_795, self.currentError)
+
+
+        def rule_delete_selector(self):
+            _locals = {'self': self}
+            self.locals['delete_selector'] = _locals
+            def _G_or_796():
+                _G_apply_797, lastError = self._apply(self.rule_collection_column, "collection_column", [])
+                self.considerError(lastError, None)
+                return (_G_apply_797, self.currentError)
+            def _G_or_798():
+                _G_apply_799, lastError = self._apply(self.rule_column, "column", [])
+                self.considerError(lastError, None)
+                return (_G_apply_799, self.currentError)
+            _G_or_800, lastError = self._or([_G_or_796, _G_or_798])
+            self.considerError(lastError, 'delete_selector')
+            return (_G_or_800, self.currentError)
+
+
+        def rule_delete_selection(self):
+            _locals = {'self': self}
+            self.locals['delete_selection'] = _locals
+            _G_apply_801, lastError = self._apply(self.rule_delete_selector, "delete_selector", [])
+            self.considerError(lastError, 'delete_selection')
+            _locals['first'] = _G_apply_801
+            def _G_many_802():
+                _G_exactly_803, lastError = self.exactly(',')
+                self.considerError(lastError, None)
+                _G_apply_804, lastError = self._apply(self.rule_delete_selector, "delete_selector", [])
+                self.considerError(lastError, None)
+                return (_G_apply_804, self.currentError)
+            _G_many_805, lastError = self.many(_G_many_802)
+            self.considerError(lastError, 'delete_selection')
+            _locals['rest'] = _G_many_805
+            _G_python_806, lastError = eval('[first] + rest', self.globals, _locals), None
+            self.considerError(lastError, 'delete_selection')
+            return (_G_python_806, self.currentError)
+
+
+        def rule_delete(self):
+            _locals = {'self': self}
+            self.locals['delete'] = _locals
+            _G_python_807, lastError = 'DELETE', None
+            self.considerError(lastError, 'delete')
+            _G_apply_808, lastError = self._apply(self.rule_k, "k", [_G_python_807])
+            self.considerError(lastError, 'delete')
+            def _G_optional_809():
+                def _G_not_810():
+                    _G_python_811, lastError = 'FROM', None
+                    self.considerError(lastError, None)
+                    _G_apply_812, lastError = self._apply(self.rule_k, "k", [_G_python_811])
+                    self.considerError(lastError, None)
+                    return (_G_apply_812, self.currentError)
+                _G_not_813, lastError = self._not(_G_not_810)
+                self.considerError(lastError, None)
+                _G_apply_814, lastError = self._apply(self.rule_delete_selection, "delete_selection", [])
+                self.considerError(lastError, None)
+                return (_G_apply_814, self.currentError)
+            def _G_optional_815():
+                return (None, self.input.nullError())
+            _G_or_816, lastError = self._or([_G_optional_809, _G_optional_815])
+            self.considerError(lastError, 'delete')
+            _locals['c'] = _G_or_816
+            _G_python_817, lastError = 'FROM', None
+            self.considerError(lastError, 'delete')
+            _G_apply_818, lastError = self._apply(self.rule_k, "k", [_G_python_817])
+            self.considerError(lastError, 'delete')
+            _G_apply_819, lastError = self._apply(self.rule_table, "table", [])
+            self.considerError(lastError, 'delete')
+            _locals['n'] = _G_apply_819
+            def _G_optional_820():
+                _G_apply_821, lastError = self._apply(self.rule_using_delete, "using_delete", [])
+                self.considerError(lastError, None)
+                return (_G_apply_821, self.currentError)
+            def _G_optional_822():
+                return (None, self.input.nullError())
+            _G_or_823, lastError = self._or([_G_optional_820, _G_optional_822])
+            self.considerError(lastError, 'delete')
+            _locals['u'] = _G_or_823
+            _G_python_824, lastError = 'WHERE', None
+            self.considerError(lastError, 'delete')
+            _G_apply_825, lastError = self._apply(self.rule_k, "k", [_G_python_824])
+            self.considerError(lastError, 'delete')
+            _G_apply_826, lastError = self._apply(self.rule_relations, "relations", [])
+            self.considerError(lastError, 'delete')
+            _locals['w'] = _G_apply_826
+            _G_python_827, lastError = eval('t.Delete(c, n, u, w)', self.globals, _locals), None
+            self.considerError(lastError, 'delete')
+            return (_G_python_827, self.currentError)
+
+
+        def rule_batch_statement(self):
+            _locals = {'self': self}
+            self.locals['batch_statement'] = _locals
+            def _G_or_828():
+                _G_apply_829, lastError = self._apply(self.rule_insert, "insert", [])
+                self.considerError(lastError, None)
+                return (_G_apply_829, self.currentError)
+            def _G_or_830():
+                _G_apply_831, lastError = self._apply(self.rule_delete, "delete", [])
+                self.considerError(lastError, None)
+                return (_G_apply_831, self.currentError)
+            _G_or_832, lastError = self._or([_G_or_828, _G_or_830])
+            self.considerError(lastError, 'batch_statement')
+            _locals['s'] = _G_or_832
+            def _G_optional_833():
+                _G_exactly_834, lastError = self.exactly(';')
+                self.considerError(lastError, None)
+                return (_G_exactly_834, self.currentError)
+            def _G_optional_835():
+                return (None, self.input.nullError())
+            _G_or_836, lastError = self._or([_G_optional_833, _G_optional_835])
+            self.considerError(lastError, 'batch_statement')
+            _G_python_837, lastError = eval('s', self.globals, _locals), None
+            self.considerError(lastError, 'batch_statement')
+            return (_G_python_837, self.currentError)
+
+
+        def rule_batch_statements(self):
+            _locals = {'self': self}
+            self.locals['batch_statements'] = _locals
+            _G_apply_838, lastError = self._apply(self.rule_batch_statement, "batch_statement", [])
+            self.considerError(lastError, 'batch_statements')
+            _locals['first'] = _G_apply_838
+            def _G_many_839():
+                _G_apply_840, lastError = self._apply(self.rule_batch_statement, "batch_statement", [])
+                self.considerError(lastError, None)
+                return (_G_apply_840, self.currentError)
+            _G_many_841, lastError = self.many(_G_many_839)
+            self.considerError(lastError, 'batch_statements')
+            _locals['rest'] = _G_many_841
+            _G_python_842, lastError = eval('[first] + rest', self.globals, _locals), None
+            self.considerError(lastError, 'batch_statements')
+            return (_G_python_842, self.currentError)
+
+
+        def rule_batch(self):
+            _locals = {'self': self}
+            self.locals['batch'] = _locals
+            _G_python_843, lastError = 'BEGIN', None
+            self.considerError(lastError, 'batch')
+            _G_apply_844, lastError = self._apply(self.rule_k, "k", [_G_python_843])
+            self.considerError(lastError, 'batch')
+            _G_python_845, lastError = 'BATCH', None
+            self.considerError(lastError, 'batch')
+            _G_apply_846, lastError = self._apply(self.rule_k, "k", [_G_python_845])
+            self.considerError(lastError, 'batch')
+            _G_apply_847, lastError = self._apply(self.rule_batch_statements, "batch_statements", [])
+            self.considerError(lastError, 'batch')
+            _locals['s'] = _G_apply_847
+            _G_python_848, lastError = 'APPLY', None
+            self.considerError(lastError, 'batch')
+            _G_apply_849, lastError = self._apply(self.rule_k, "k", [_G_python_848])
+            self.considerError(lastError, 'batch')
+            _G_python_850, lastError = 'BATCH', None
+            self.considerError(lastError, 'batch')
+            _G_apply_851, lastError = self._apply(self.rule_k, "k", [_G_python_850])
+            self.considerError(lastError, 'batch')
+            _G_python_852, lastError = eval('t.Batch(s)', self.globals, _locals), None
+            self.considerError(lastError, 'batch')
+            return (_G_python_852, self.currentError)
+
+
+        def rule_statement(self):
+            _locals = {'self': self}
+            self.locals['statement'] = _locals
+            _G_python_853, lastError = eval('statement_rules', self.globals, _locals), None
+            self.considerError(lastError, 'statement')
+            _G_apply_854, lastError = self._apply(self.rule_dispatch, "dispatch", [_G_python_853])
+            self.considerError(lastError, 'statement')
+            return (_G_apply_854, self.currentError)
+
+
+    if cql3.globals is not None:
+        cql3.globals = cql3.globals.copy()
+        cql3.globals.update(ruleGlobals)
+    else:
+        cql3.globals = ruleGlobals
+    return cql3
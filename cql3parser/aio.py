@@ -0,0 +1,225 @@
+"""
+Parsing statements as they arrive on an asyncio stream.
+
+    async for statement in parse_stream(reader):
+        ...
+
+Statements are split as bytes arrive and parsed in an executor, so the event
+loop isn't blocked by parsing.  On python 2 this needs the trollius backport
+of asyncio, and statements are read with yield From(stream.next()) as
+there's no async for.
+"""
+import codecs
+import functools
+
+from collections import deque
+
+try:
+    import asyncio
+except ImportError:
+    import trollius as asyncio
+
+try:
+    StopAsyncIteration
+except NameError:
+    StopAsyncIteration = None
+
+from cql3parser.grammar import CQL3
+from cql3parser.script import StatementSplitter
+
+
+class StatementTooLarge(ValueError):
+    """
+    A statement is longer than the limit of the stream it arrived on.
+    """
+
+
+def _parse(parser, rule, text):
+    return getattr((parser or CQL3)(text), rule)()
+
+
+def _failed(exception, loop):
+    future = asyncio.Future(loop=loop)
+    future.set_exception(exception)
+    return future
+
+
+class StatementStream(object):
+    """
+    The statements parsed from a stream, see parse_stream.
+
+    Iterate over it with async for, or call next for a future of the next
+    statement.  A statement which fails to parse raises its ParseError in
+    its turn, iterating carries on with the statements after it.
+    """
+    def __init__(self, reader, rule='statement', parser=None, executor=None,
+                 max_size=1024 * 1024, max_pending=16, chunk_size=64 * 1024,
+                 loop=None):
+        self._reader = reader
+        self._rule = rule
+        self._parser = parser
+        self._executor = executor
+        self._max_size = max_size
+        self._max_pending = max_pending
+        self._chunk_size = chunk_size
+        self._loop = loop or asyncio.get_event_loop()
+
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self._splitter = StatementSplitter()
+        # The statements split but not yet handed to the executor, and the
+        # errors after them, then futures of the statements being parsed, in
+        # order, and of the callers of next waiting for them.
+        self._queued = deque()
+        self._pending = deque()
+        self._waiters = deque()
+        self._reading = None
+        self._eof = False
+
+    def __aiter__(self):
+        return self
+
+    def __anext__(self):
+        result = asyncio.Future(loop=self._loop)
+
+        def done(future):
+            if result.cancelled():
+                return
+            if future.exception() is not None:
+                result.set_exception(future.exception())
+            elif future.result() is None:
+                result.set_exception(StopAsyncIteration())
+            else:
+                result.set_result(future.result())
+
+        self.next().add_done_callback(done)
+        return result
+
+    def next(self):
+        """
+        Return a future of the next statement, which is None at the end of
+        the stream.
+        """
+        waiter = asyncio.Future(loop=self._loop)
+        self._waiters.append(waiter)
+        self._pump()
+        return waiter
+
+    def _pump(self):
+        """
+        Hand parsed statements to the waiters in order, and parse and read
+        more while fewer than max_pending statements are waiting to be
+        taken.
+        """
+        waiters, pending, queued = self._waiters, self._pending, self._queued
+        while True:
+            while queued and len(pending) < self._max_pending:
+                pending.append(self._submit(queued.popleft()))
+            if not (waiters and pending and pending[0].done()):
+                break
+
+            waiter = waiters.popleft()
+            if waiter.cancelled():
+                continue
+
+            future = pending.popleft()
+            if future.exception() is not None:
+                waiter.set_exception(future.exception())
+            else:
+                waiter.set_result(future.result())
+
+        if self._eof and not pending and not queued:
+            while waiters:
+                waiter = waiters.popleft()
+                if not waiter.cancelled():
+                    waiter.set_result(None)
+
+        if (not self._eof and self._reading is None and not queued and
+                len(pending) < self._max_pending):
+            self._reading = asyncio.ensure_future(
+                self._reader.read(self._chunk_size), loop=self._loop)
+            self._reading.add_done_callback(self._read)
+
+    def _read(self, reading):
+        self._reading = None
+        try:
+            data = reading.result()
+        except Exception as e:
+            self._eof = True
+            self._queued.append(e)
+            self._pump()
+            return
+
+        if not data:
+            self._eof = True
+
+        # Invalid bytes end the stream after the statements before them.
+        error = None
+        try:
+            text = self._decoder.decode(data, not data)
+        except UnicodeDecodeError as e:
+            error = e
+            text = e.object[:e.start].decode('utf-8')
+        try:
+            spans = self._splitter.feed_spans(text)
+            if not data and error is None:
+                spans += self._splitter.close_spans()
+        except Exception as e:
+            error = e
+            spans = []
+
+        self._queued.extend(spans)
+        if error is not None:
+            self._eof = True
+            self._queued.append(error)
+        # The statement being split can't be skipped without holding it, so
+        # a statement which is too large ends the stream.
+        elif self._splitter.buffered > self._max_size:
+            self._eof = True
+            self._queued.append(self._too_large())
+
+        self._pump()
+
+    def _submit(self, queued):
+        """
+        Return a future of a queued statement, parsing it in the executor,
+        or of a queued error.
+        """
+        if isinstance(queued, Exception):
+            return _failed(queued, self._loop)
+        if len(queued.text) > self._max_size:
+            return _failed(self._too_large(), self._loop)
+
+        future = self._loop.run_in_executor(
+            self._executor, functools.partial(
+                _parse, self._parser, self._rule, queued.text))
+        future.add_done_callback(lambda future: self._pump())
+        return future
+
+    def _too_large(self):
+        return StatementTooLarge(
+            'Statement longer than {0} characters'.format(self._max_size))
+
+
+def parse_stream(reader, rule='statement', parser=None, executor=None,
+                 max_size=1024 * 1024, max_pending=16, chunk_size=64 * 1024,
+                 loop=None):
+    """
+    Parse the UTF-8 encoded ;-separated statements read from an asyncio
+    StreamReader as they arrive, returning a StatementStream of them.  Bytes
+    which aren't UTF-8 raise UnicodeDecodeError and end the stream.
+
+    :param rule: The rule to parse each statement with.
+    :param parser: The parser to use, CQL3 by default.  Parsers can't be
+        pickled, so leave it as None with a process pool executor.
+    :param executor: The executor to parse in, by default the loop's.  Use
+        a ProcessPoolExecutor to parse on more than one core.
+    :param max_size: The longest statement, in characters, accepted.  A
+        longer statement raises StatementTooLarge and, unless it was already
+        complete, ends the stream.
+    :param max_pending: How many statements to parse ahead of the ones
+        taken from the stream.  The rest of the statements read wait to be
+        parsed, and reading stops, until they are taken.
+    :param chunk_size: How many bytes to read from reader at a time.
+    """
+    return StatementStream(reader, rule, parser, executor, max_size,
+                           max_pending, chunk_size, loop)
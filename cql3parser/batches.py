@@ -0,0 +1,342 @@
+"""
+Rewriting streams of writes as small single partition batches.
+
+    for text in optimize_cql(iter_statements(dump), catalog):
+        session.execute(text)
+
+A batch of writes to many partitions makes its coordinator wait on the
+replicas of every partition.  optimize_batches groups INSERT and DELETE
+statements, on their own or in BATCH statements, by the partition they
+write, which is worked out with routing.statement_keys.  A DELETE of
+several partitions with IN is split into a DELETE of each.  The statements
+of a partition are emitted as a batch once another would take it past
+max_statements statements or max_size characters of CQL, or once more than
+max_pending statements are waiting, the partition waiting longest first.  So
+however many statements are given no more than max_pending are held.
+
+Statements are applied in the order they are given.  While the statements
+of a partition are waiting:
+
+- A statement the same as one waiting is dropped.
+- An INSERT into a row merges into the INSERT waiting for that row if their
+  USING clauses are the same, the later values winning.  Otherwise the
+  waiting statements are emitted first.
+- A DELETE drops the values of the cells it deletes from the INSERTs
+  waiting, or the INSERTs themselves if it deletes their rows.
+- An INSERT after a DELETE is emitted in a later batch, as the statements
+  of a batch share a timestamp and Cassandra lets a tombstone win over a
+  write with the same timestamp.
+
+Writes with USING TIMESTAMP aren't merged or dropped, their timestamps and
+not their order decide which of them wins.
+"""
+from collections import OrderedDict
+
+from terml.nodes import Term
+
+from cql3parser import nodes
+from cql3parser.formatter import to_cql
+from cql3parser.nodes import from_term
+from cql3parser.routing import RoutingError, partition_keys, statement_keys
+from cql3parser.schema import _name
+
+MAX_STATEMENTS = 100
+# Cassandra warns about batches larger than batch_size_warn_threshold_in_kb,
+# 5kb by default.
+MAX_SIZE = 5 * 1024
+MAX_PENDING = 10000
+
+_BEGIN = 'BEGIN BATCH '
+_APPLY = 'APPLY BATCH'
+_SEPARATOR = '; '
+
+
+def _writes(statements):
+    """
+    The INSERTs and DELETEs of statements, with the statements of BATCHes
+    in their place, as nodes.
+    """
+    for statement in statements:
+        if isinstance(statement, Term):
+            statement = from_term(statement)
+        if isinstance(statement, nodes.Batch):
+            for s in statement.statements:
+                yield s
+        elif isinstance(statement, (nodes.Insert, nodes.Delete)):
+            yield statement
+        else:
+            raise RoutingError("Can't batch {0} statements".format(
+                type(statement).__name__))
+
+
+def _timestamped(using):
+    return any(isinstance(u, nodes.Timestamp) for u in using or ())
+
+
+def _split_delete(statement, table, catalog):
+    """
+    A DELETE of each partition a DELETE restricts with = and IN.
+    """
+    partitions = partition_keys(statement, catalog)
+    if len(partitions) == 1:
+        return [statement]
+
+    deletes = []
+    for values in partitions:
+        restricted = dict(zip(table.partition_key, values))
+        where = []
+        for relation in statement.where:
+            if (isinstance(relation.lhs, nodes.Column) and
+                    relation.operator in ('=', 'in') and
+                    _name(relation.lhs) in restricted):
+                relation = nodes.Relation(
+                    relation.lhs, '=', restricted[_name(relation.lhs)])
+            where.append(relation)
+        deletes.append(nodes.Delete(
+            statement.columns, statement.table, statement.using, where))
+    return deletes
+
+
+def _insert_row(statement, table):
+    """
+    The primary key values of the row an INSERT writes as CQL, or None if
+    any of them is bound by a marker.
+    """
+    values = dict(zip(map(_name, statement.columns), statement.values))
+    row = []
+    for name in table.primary_key:
+        value = values.get(name)
+        if value is None or isinstance(
+                value, (nodes.Binding, nodes.NamedBinding)):
+            return None
+        row.append(to_cql(value))
+    return tuple(row)
+
+
+def _delete_rows(statement, table):
+    """
+    The primary key values of the row a DELETE deletes as CQL, () if it
+    deletes its whole partition, or None if it deletes a range of rows.
+    """
+    restricted = {}
+    for relation in statement.where:
+        if (not isinstance(relation.lhs, nodes.Column) or
+                relation.operator != '='):
+            return None
+        restricted[_name(relation.lhs)] = to_cql(relation.value)
+
+    if sorted(restricted) == sorted(table.partition_key):
+        return ()
+    if sorted(restricted) == sorted(table.primary_key):
+        return tuple(restricted[name] for name in table.primary_key)
+    return None
+
+
+class _Partition(object):
+    """
+    The statements of a partition waiting to be emitted, as [statement,
+    text] entries or None for the ones a later statement dropped.
+
+    :ivar rows: The index in entries of the INSERT waiting for each row.
+    :ivar texts: The texts of the statements waiting.
+    """
+    __slots__ = ('entries', 'count', 'size', 'rows', 'texts', 'deleted')
+
+    def __init__(self):
+        self.entries = []
+        self.count = 0
+        self.size = len(_BEGIN) + len(_APPLY)
+        self.rows = {}
+        self.texts = set()
+        self.deleted = False
+
+    def append(self, statement, text):
+        self.entries.append([statement, text])
+        self.count += 1
+        self.size += len(text) + len(_SEPARATOR)
+        self.texts.add(text)
+
+    def replace(self, index, statement):
+        """
+        Replace the statement of an entry, or drop it if statement is None.
+        """
+        entry = self.entries[index]
+        self.texts.discard(entry[1])
+        self.size -= len(entry[1])
+        if statement is None:
+            self.entries[index] = None
+            self.count -= 1
+            self.size -= len(_SEPARATOR)
+            return
+        entry[0] = statement
+        entry[1] = to_cql(statement)
+        self.texts.add(entry[1])
+        self.size += len(entry[1])
+
+    def merge(self, index, statement, max_size):
+        """
+        Merge an INSERT into the INSERT of an entry, returning False if the
+        merged INSERT would take the partition past max_size.
+        """
+        waiting = self.entries[index][0]
+        values = OrderedDict(
+            (_name(c), [c, v]) for c, v in zip(waiting.columns,
+                                               waiting.values))
+        for column, value in zip(statement.columns, statement.values):
+            values.setdefault(_name(column), [column, None])[1] = value
+        merged = nodes.Insert(
+            waiting.table, [c for c, _ in values.values()],
+            [v for _, v in values.values()], waiting.using)
+
+        text = to_cql(merged)
+        if self.size - len(self.entries[index][1]) + len(text) > max_size:
+            return False
+        self.texts.discard(self.entries[index][1])
+        self.size += len(text) - len(self.entries[index][1])
+        self.entries[index] = [merged, text]
+        self.texts.add(text)
+        return True
+
+    def delete(self, statement, table):
+        """
+        Drop the waiting INSERTs, or their values, which a DELETE deletes.
+        """
+        self.deleted = True
+        rows = _delete_rows(statement, table)
+        if rows is None or _timestamped(statement.using):
+            return
+
+        if statement.columns is None:
+            columns = None
+        else:
+            columns = set(_name(c) for c in statement.columns
+                          if isinstance(c, nodes.Column))
+        for row, index in list(self.rows.items()):
+            insert = self.entries[index][0]
+            if row[:len(rows)] != rows or _timestamped(insert.using):
+                continue
+            if columns is None:
+                self.replace(index, None)
+                del self.rows[row]
+                continue
+            kept = [(c, v) for c, v in zip(insert.columns, insert.values)
+                    if _name(c) not in columns]
+            if len(kept) < len(insert.columns):
+                self.replace(index, nodes.Insert(
+                    insert.table, [c for c, _ in kept], [v for _, v in kept],
+                    insert.using))
+
+    def statements(self):
+        return [entry for entry in self.entries if entry is not None]
+
+
+def _optimize(statements, catalog, max_statements, max_size, max_pending):
+    """
+    Group statements by partition as optimize_batches does, yielding the
+    [statement, text] entries of each batch.
+    """
+    partitions = OrderedDict()
+    pending = [0]
+
+    def emit(key):
+        partition = partitions.pop(key)
+        pending[0] -= partition.count
+        return partition.statements()
+
+    for statement in _writes(statements):
+        table = catalog.table(statement.table)
+        if isinstance(statement, nodes.Delete):
+            splits = _split_delete(statement, table, catalog)
+        else:
+            splits = [statement]
+
+        for statement in splits:
+            key = (table.keyspace, table.name,
+                   statement_keys(statement, catalog)[0])
+            partition = partitions.get(key)
+            text = to_cql(statement)
+            insert = isinstance(statement, nodes.Insert)
+            # A DELETE may delete the row of a waiting INSERT without
+            # dropping it, so an INSERT after it is never a duplicate.
+            if insert and partition is not None and partition.deleted:
+                yield emit(key)
+                partition = None
+            if partition is not None and text in partition.texts:
+                continue
+
+            if insert:
+                row = _insert_row(statement, table)
+                if partition is not None and row in partition.rows:
+                    index = partition.rows[row]
+                    waiting = partition.entries[index][0]
+                    if (waiting.using == statement.using and
+                            not _timestamped(statement.using) and
+                            partition.merge(index, statement, max_size)):
+                        continue
+                    yield emit(key)
+                    partition = None
+
+            if partition is not None and (
+                    partition.count >= max_statements or
+                    partition.size + len(text) + len(_SEPARATOR) >
+                    max_size):
+                yield emit(key)
+                partition = None
+            if partition is None:
+                partition = partitions[key] = _Partition()
+
+            if isinstance(statement, nodes.Delete):
+                before = partition.count
+                partition.delete(statement, table)
+                pending[0] -= before - partition.count
+            elif row is not None:
+                partition.rows[row] = len(partition.entries)
+            partition.append(statement, text)
+            pending[0] += 1
+
+            while pending[0] > max_pending:
+                yield emit(next(iter(partitions)))
+
+    while partitions:
+        yield emit(next(iter(partitions)))
+
+
+def optimize_batches(statements, catalog, max_statements=MAX_STATEMENTS,
+                     max_size=MAX_SIZE, max_pending=MAX_PENDING):
+    """
+    Rewrite INSERT, DELETE and BATCH statements as batches which each write
+    one partition, see the module docstring.  Yields Batch nodes, or the
+    statement itself for a batch of one statement.
+
+    :param statements: An iterable of statements from CQL3 or CQL3Nodes,
+        consumed as the batches are.
+    :param catalog: The Catalog of the tables written.
+    :param max_statements: The most statements in a batch.
+    :param max_size: The most characters of CQL in a batch, unless a single
+        statement is larger.
+    :param max_pending: The most statements waiting to be emitted.
+    :raises RoutingError: If the partition of a statement can't be worked
+        out, or a statement isn't an INSERT, DELETE or BATCH.
+    :raises SchemaError: If a table isn't in catalog.
+    """
+    for entries in _optimize(statements, catalog, max_statements, max_size,
+                             max_pending):
+        if len(entries) == 1:
+            yield entries[0][0]
+        else:
+            yield nodes.Batch([statement for statement, _ in entries])
+
+
+def optimize_cql(statements, catalog, max_statements=MAX_STATEMENTS,
+                 max_size=MAX_SIZE, max_pending=MAX_PENDING):
+    """
+    The batches of optimize_batches rendered as CQL, reusing the text of
+    each statement worked out to measure the batches.
+    """
+    for entries in _optimize(statements, catalog, max_statements, max_size,
+                             max_pending):
+        if len(entries) == 1:
+            yield entries[0][1]
+        else:
+            yield _BEGIN + ''.join(
+                text + _SEPARATOR for _, text in entries) + _APPLY
@@ -0,0 +1,198 @@
+"""
+Parsing CQL straight from UTF-8 encoded buffers: bytes, bytearrays, mmaps
+and memoryviews, without decoding the whole buffer into a string first.
+
+The buffer is tokenized in place.  String literals, quoted names and
+identifiers are only decoded when the grammar uses their values, and token
+offsets, parse error positions and statement offsets are byte offsets into
+the buffer.
+"""
+import codecs
+import re
+
+from collections import namedtuple
+
+from cql3parser.grammar import CQL3, _TokenGrammarWrapper
+from cql3parser.keywords import KEYWORDS
+from cql3parser.lexer import Token, _token, _unquote, _values
+
+_token_bytes = re.compile(
+    _token.pattern.encode('ascii'), re.VERBOSE | re.DOTALL)
+
+# Words longer than this are identifiers without looking at them.
+_KEYWORD_LENGTH = max(len(keyword) for keyword in KEYWORDS)
+
+# The kinds of tokens, besides identifiers, decoded when they're used.
+_LAZY_KINDS = frozenset(['string', 'quoted_name'])
+
+# A statement in a buffer: the byte offsets where its text starts and ends,
+# and the parsed statement.
+BufferStatement = namedtuple('BufferStatement', 'start end value')
+
+
+def _decode(buffer, start, end, errors='strict'):
+    return codecs.utf_8_decode(buffer[start:end], errors, True)[0]
+
+
+class LazyToken(object):
+    """
+    A Token for a string literal, quoted name or identifier in a buffer,
+    which decodes its text and value when they're first used and keeps
+    them.
+    """
+    __slots__ = ('kind', 'start', 'end', '_buffer', '_text', '_value')
+
+    def __init__(self, kind, buffer, start, end):
+        self.kind = kind
+        self.start = start
+        self.end = end
+        self._buffer = buffer
+        self._text = None
+        self._value = None
+
+    def __repr__(self):
+        return 'LazyToken({0!r}, {1}, {2})'.format(
+            self.kind, self.start, self.end)
+
+    @property
+    def text(self):
+        if self._text is None:
+            self._text = _decode(self._buffer, self.start, self.end)
+        return self._text
+
+    @property
+    def value(self):
+        if self._value is None:
+            if self.kind == 'identifier':
+                self._value = self.text.upper()
+            else:
+                self._value = _unquote(self.text)
+        return self._value
+
+
+def _scannable(buffer):
+    """
+    The buffer, or a copy of it if re can't scan it in place, which is only
+    the case for memoryviews on python 2.
+    """
+    try:
+        _token_bytes.match(buffer, 0, 0)
+    except TypeError:
+        return buffer.tobytes()
+    return buffer
+
+
+def _iter_tokens(buffer, start, end):
+    for m in _token_bytes.finditer(buffer, start, end):
+        kind = m.lastgroup
+        if kind == 'ws':
+            continue
+
+        start, end = m.span()
+        if kind == 'word':
+            value = None
+            if end - start <= _KEYWORD_LENGTH:
+                value = m.group().decode('ascii').upper()
+            if value in KEYWORDS:
+                yield Token('keyword', m.group().decode('ascii'), value,
+                            start, end)
+            else:
+                yield LazyToken('identifier', buffer, start, end)
+        elif kind in _LAZY_KINDS:
+            yield LazyToken(kind, buffer, start, end)
+        elif kind == 'error':
+            # A byte which can't start a token, maybe part of a character.
+            text = _decode(buffer, start, end, 'replace')
+            yield Token(kind, text, text, start, end)
+        else:
+            text = m.group().decode('ascii')
+            value = _values[kind](text) if kind in _values else text
+            yield Token(kind, text, value, start, end)
+
+
+def tokenize_buffer(buffer, start=0, end=None):
+    """
+    Split the UTF-8 encoded CQL in buffer between byte offsets start and end
+    into a list of Tokens like cql3parser.lexer.tokenize, with LazyTokens for
+    string literals, quoted names and identifiers.
+    """
+    buffer = _scannable(buffer)
+    if end is None:
+        end = len(buffer)
+    return list(_iter_tokens(buffer, start, end))
+
+
+class _BufferGrammarWrapper(_TokenGrammarWrapper):
+    """
+    Reports parse errors at the end of the input by the byte offset of the
+    end of the parsed part of the buffer.
+    """
+    def __init__(self, grammar, input, tokens, end):
+        _TokenGrammarWrapper.__init__(self, grammar, input, tokens)
+        self._end = end
+
+    def _position(self, index):
+        if index < len(self._tokens):
+            return self._tokens[index].start
+        return self._end
+
+
+def _wrap(parser, buffer, tokens, end):
+    return _BufferGrammarWrapper(
+        parser._grammarClass(tokens), buffer, tokens, end)
+
+
+def from_buffer(buffer, start=0, end=None, parser=CQL3):
+    """
+    Creates a parser for the UTF-8 encoded CQL in buffer between byte
+    offsets start and end, with methods for invoking each rule, like
+    CQL3(text).  Parse errors are reported at byte offsets into buffer.
+
+    :param parser: CQL3, CQL3Nodes or any other parser made for the grammar.
+    """
+    buffer = _scannable(buffer)
+    if end is None:
+        end = len(buffer)
+    return _wrap(parser, buffer, list(_iter_tokens(buffer, start, end)), end)
+
+
+def _is(token, kind, value):
+    return token.kind == kind and token.value == value
+
+
+def iter_buffer_statements(buffer, parser=CQL3):
+    """
+    Yield a BufferStatement for each ;-separated statement in a buffer, like
+    cql3parser.script.iter_statements does for files.
+
+    The buffer is tokenized as statements are parsed, so only the tokens of
+    the statement being parsed are held in memory and an mmap of a large
+    dump is only paged in once.
+    """
+    buffer = _scannable(buffer)
+    tokens = []
+    batch = False
+
+    for token in _iter_tokens(buffer, 0, len(buffer)):
+        if _is(token, 'punctuation', ';') and not batch:
+            if tokens:
+                yield _statement(parser, buffer, tokens)
+            tokens = []
+            continue
+
+        # The ; between the statements of a batch belong to the batch.
+        if not tokens and _is(token, 'keyword', 'BEGIN'):
+            batch = True
+        elif (batch and _is(token, 'keyword', 'BATCH') and
+              _is(tokens[-1], 'keyword', 'APPLY')):
+            batch = False
+        tokens.append(token)
+
+    if tokens:
+        yield _statement(parser, buffer, tokens)
+
+
+def _statement(parser, buffer, tokens):
+    start, end = tokens[0].start, tokens[-1].end
+    return BufferStatement(
+        start, end, _wrap(parser, buffer, tokens, end).statement())
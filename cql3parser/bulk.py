@@ -0,0 +1,94 @@
+"""
+Parsing large numbers of statements in parallel with a process pool.
+
+On python 2 this needs the futures backport of concurrent.futures.
+"""
+import multiprocessing
+
+from collections import deque, namedtuple
+from concurrent.futures import (
+    FIRST_COMPLETED, ProcessPoolExecutor, wait)
+from itertools import islice
+
+from cql3parser.grammar import CQL3
+
+# The outcome of parsing the statement at index in the input, value is the
+# parsed statement or None if parsing raised error.
+Result = namedtuple('Result', 'index value error')
+
+
+def _parse_chunk(rule, chunk):
+    """
+    Parse a chunk of (index, text) pairs in a worker process.  The grammar is
+    loaded when the worker first imports cql3parser, not for every chunk.
+    """
+    results = []
+    for index, text in chunk:
+        try:
+            results.append(Result(index, getattr(CQL3(text), rule)(), None))
+        except Exception as e:
+            results.append(Result(index, None, e))
+    return results
+
+
+def _chunks(iterable, chunksize):
+    items = enumerate(iterable)
+    while True:
+        chunk = list(islice(items, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _completed(pending, ordered):
+    """
+    Wait for the next chunk, or any chunk if not ordered, and return its
+    results.
+    """
+    if ordered:
+        return pending.popleft().result()
+
+    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+    results = []
+    for future in done:
+        pending.remove(future)
+        results.extend(future.result())
+    return results
+
+
+def parse_many(iterable, workers=None, chunksize=100, rule='statement',
+               ordered=True):
+    """
+    Parse every statement in iterable with the named rule using a pool of
+    worker processes, yielding a Result for each of them.
+
+    Errors are reported in the Result of the statement that raised them
+    instead of stopping the rest of the batch.  Only a few chunks per worker
+    are in flight at any time, so iterable can be arbitrarily long.
+
+    :param workers: The number of worker processes, defaults to the number
+        of CPUs.
+    :param chunksize: How many statements to send to a worker at once.
+    :param ordered: Yield results in input order, otherwise yield them as
+        chunks complete.
+    """
+    if workers is None:
+        workers = multiprocessing.cpu_count()
+
+    chunks = _chunks(iterable, chunksize)
+    max_pending = workers * 2
+
+    with ProcessPoolExecutor(workers) as executor:
+        pending = deque()
+
+        for chunk in chunks:
+            pending.append(executor.submit(_parse_chunk, rule, chunk))
+            if len(pending) < max_pending:
+                continue
+
+            for result in _completed(pending, ordered):
+                yield result
+
+        while pending:
+            for result in _completed(pending, ordered):
+                yield result
@@ -0,0 +1,209 @@
+"""
+Caching of parse results for frequently repeated statements.
+"""
+import re
+import threading
+
+from collections import namedtuple
+
+from parsley import ParseError
+
+from cql3parser.grammar import CQL3
+
+CacheInfo = namedtuple('CacheInfo', 'hits misses evictions maxsize currsize')
+
+# String literals and quoted names, everything else is outside of quotes.
+_quoted_or_space = re.compile(
+    r"""('[^']*(?:''[^']*)*'|"[^"]*(?:""[^"]*)*")|\s+""")
+
+
+def _collapse(match):
+    return match.group(1) or ' '
+
+
+def normalize(text):
+    """
+    Normalize the whitespace in a statement so that statements which only
+    differ in formatting share a cache entry.
+
+    Runs of whitespace outside of string literals and quoted names become a
+    single space and leading and trailing whitespace is removed.
+    """
+    return _quoted_or_space.sub(_collapse, text).strip()
+
+
+class FrozenList(tuple):
+    """
+    A tuple which is equal to a list of the same items.
+    """
+    __slots__ = ()
+
+    def __eq__(self, other):
+        if isinstance(other, list):
+            other = tuple(other)
+        return tuple.__eq__(self, other)
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        if equal is NotImplemented:
+            return equal
+        return not equal
+
+    __hash__ = tuple.__hash__
+
+
+class FrozenDict(dict):
+    """
+    A dict which can't be changed.
+    """
+    __slots__ = ()
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError('FrozenDict is immutable')
+
+    __setitem__ = __delitem__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+
+
+def freeze(value):
+    """
+    Return an immutable version of a parse result so it can be shared between
+    callers, equal to the result.  Lists become FrozenLists, sets frozensets
+    and dicts FrozenDicts, everything the grammar returns otherwise already
+    is immutable.
+    """
+    if isinstance(value, list):
+        return FrozenList([freeze(v) for v in value])
+    if isinstance(value, set):
+        return frozenset([freeze(v) for v in value])
+    if isinstance(value, dict):
+        return FrozenDict((freeze(k), freeze(v)) for k, v in value.items())
+    return value
+
+
+_PREV, _NEXT, _KEY, _VALUE = range(4)
+
+
+class LRUCache(object):
+    """
+    A thread safe mapping which holds at most maxsize items, evicting the
+    least recently used item to make room for new ones.
+    """
+    def __init__(self, maxsize=1024):
+        if maxsize < 1:
+            raise ValueError('maxsize must be at least 1')
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self._links = {}
+
+        # The root of a circular doubly linked list, root[_NEXT] is the least
+        # recently used link and root[_PREV] the most recently used.
+        self._root = []
+        self._root[:] = [self._root, self._root, None, None]
+
+    def __len__(self):
+        return len(self._links)
+
+    def __contains__(self, key):
+        return key in self._links
+
+    def _unlink(self, link):
+        link[_PREV][_NEXT] = link[_NEXT]
+        link[_NEXT][_PREV] = link[_PREV]
+
+    def _append(self, link):
+        root = self._root
+        link[_PREV] = root[_PREV]
+        link[_NEXT] = root
+        root[_PREV][_NEXT] = link
+        root[_PREV] = link
+
+    def _evict(self):
+        while len(self._links) > self.maxsize:
+            oldest = self._root[_NEXT]
+            self._unlink(oldest)
+            del self._links[oldest[_KEY]]
+            self.evictions += 1
+
+    def get(self, key, default=None):
+        with self._lock:
+            link = self._links.get(key)
+            if link is None:
+                self.misses += 1
+                return default
+
+            self.hits += 1
+            self._unlink(link)
+            self._append(link)
+            return link[_VALUE]
+
+    def put(self, key, value):
+        with self._lock:
+            link = self._links.get(key)
+            if link is not None:
+                self._unlink(link)
+                link[_VALUE] = value
+            else:
+                link = [None, None, key, value]
+                self._links[key] = link
+
+            self._append(link)
+            self._evict()
+
+    def resize(self, maxsize):
+        """
+        Change the maximum size, evicting items if the cache shrinks.
+        """
+        if maxsize < 1:
+            raise ValueError('maxsize must be at least 1')
+
+        with self._lock:
+            self.maxsize = maxsize
+            self._evict()
+
+    def clear(self):
+        with self._lock:
+            self._links.clear()
+            self._root[:] = [self._root, self._root, None, None]
+            self.hits = self.misses = self.evictions = 0
+
+    def info(self):
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions,
+                             self.maxsize, len(self._links))
+
+
+statement_cache = LRUCache()
+
+_missing = object()
+
+
+def parse_cached(text, rule='select', cache=None):
+    """
+    Parse text with the named rule, reusing the result of an earlier parse of
+    the same (normalized) text.  Results are shared, so lists, sets and dicts
+    are returned frozen, see freeze.
+
+    :param cache: The LRUCache to use, defaults to statement_cache.
+    :raises ParseError: If text doesn't match the rule, with the position in
+        text rather than in its normalized form.
+    """
+    if cache is None:
+        cache = statement_cache
+
+    key = (rule, normalize(text))
+    result = cache.get(key, _missing)
+    if result is _missing:
+        try:
+            result = freeze(getattr(CQL3(key[1]), rule)())
+        except ParseError:
+            # Parse text itself for an error about it.
+            return freeze(getattr(CQL3(text), rule)())
+        cache.put(key, result)
+
+    return result
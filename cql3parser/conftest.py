@@ -0,0 +1,177 @@
+"""
+Test data and fixtures shared by the test modules.
+"""
+from io import StringIO
+
+import pytest
+
+from cql3parser import CQL3Nodes
+from cql3parser.schema import Catalog
+from cql3parser.script import split_statements
+
+# Statements as they might be written, and the canonical CQL for each.
+CANONICAL = [
+    ("use   KS", "USE ks"),
+    ('use "Ks"', 'USE "Ks"'),
+    ('use "a""b"', 'USE "a""b"'),
+    ("drop schema ks", "DROP KEYSPACE ks"),
+    ("drop columnfamily ks.t", "DROP TABLE ks.t"),
+    ("drop index idx", "DROP INDEX idx"),
+    ("drop user 'bob'", "DROP USER 'bob'"),
+    ("truncate t", "TRUNCATE t"),
+    ("list users", "LIST USERS"),
+    ("grant all permissions on all keyspaces to bob",
+     "GRANT ALL PERMISSIONS ON ALL KEYSPACES TO bob"),
+    ("grant select permission on schema ks to bob",
+     "GRANT SELECT ON KEYSPACE ks TO bob"),
+    ("revoke modify on columnfamily ks.t from 'bob'",
+     "REVOKE MODIFY ON TABLE ks.t FROM 'bob'"),
+    ("list all on ks.t of bob norecursive",
+     "LIST ALL PERMISSIONS ON ks.t OF bob NORECURSIVE"),
+    ("list alter", "LIST ALTER"),
+    ("create user bob with password 'it''s' superuser",
+     "CREATE USER bob WITH PASSWORD 'it''s' SUPERUSER"),
+    ("alter user bob nosuperuser", "ALTER USER bob NOSUPERUSER"),
+    ("create index on t (c)", "CREATE INDEX ON t (c)"),
+    ("create index i on ks.t (c)", "CREATE INDEX i ON ks.t (c)"),
+    ("create keyspace ks with replication = {'replication_factor': 1, "
+     "'class': 'SimpleStrategy'} and durable_writes = FALSE",
+     "CREATE KEYSPACE ks WITH replication = {'class': 'SimpleStrategy', "
+     "'replication_factor': 1} AND durable_writes = false"),
+    ("alter keyspace ks with comment = 'x' and ratio = 0.5 and mode = fast",
+     "ALTER KEYSPACE ks WITH comment = 'x' AND ratio = 0.5 AND mode = fast"),
+    ("alter keyspace ks with a = ttl and b = int and c = 'ttl'",
+     "ALTER KEYSPACE ks WITH a = TTL AND b = INT AND c = 'ttl'"),
+    ("create columnfamily ks.t (k int primary key, v text, "
+     "m map<text, 'org.Foo'>,)",
+     "CREATE TABLE ks.t (k INT PRIMARY KEY, v TEXT, "
+     "m MAP<TEXT, 'org.Foo'>)"),
+    ("create table t (a int, b int, c set<uuid>, primary key ((a), b)) "
+     "with compact storage and clustering order by (b desc) "
+     "and comment = 'x'",
+     "CREATE TABLE t (a INT, b INT, c SET<UUID>, PRIMARY KEY (a, b)) "
+     "WITH COMPACT STORAGE AND CLUSTERING ORDER BY (b DESC) "
+     "AND comment = 'x'"),
+    ("create table t (a int, b int, primary key ((a, b)))",
+     "CREATE TABLE t (a INT, b INT, PRIMARY KEY ((a, b)))"),
+    ("alter table t alter v type blob", "ALTER TABLE t ALTER v TYPE BLOB"),
+    ("alter columnfamily ks.t add l list<int>",
+     "ALTER TABLE ks.t ADD l LIST<INT>"),
+    ("alter table t drop v", "ALTER TABLE t DROP v"),
+    ("alter table t with comment = 'x' and gc_grace_seconds = 10",
+     "ALTER TABLE t WITH comment = 'x' AND gc_grace_seconds = 10"),
+    ("alter table t rename a to b and \"C\" to d",
+     "ALTER TABLE t RENAME a TO b AND \"C\" TO d"),
+    ("insert into t (a, b, c, d, e) values (?, 'x', {2, 1}, [1.5, -2], "
+     "{'k': 1}) using ttl 10 and timestamp 100",
+     "INSERT INTO t (a, b, c, d, e) VALUES (?, 'x', {1, 2}, [1.5, -2], "
+     "{'k': 1}) USING TTL 10 AND TIMESTAMP 100"),
+    ("select * from t", "SELECT * FROM t"),
+    ("select count(1) from t", "SELECT COUNT(*) FROM t"),
+    ("select a, writetime(b), ttl(\"C\") from ks.t "
+     "where k = 'x' and c >= ? "
+     "and d in (1, 2) and token(k) > token('a') "
+     "order by c desc limit 10 allow filtering",
+     "SELECT a, WRITETIME(b), TTL(\"C\") FROM ks.t "
+     "WHERE k = 'x' AND c >= ? "
+     "AND d IN (1, 2) AND TOKEN(k) > TOKEN('a') "
+     "ORDER BY c DESC LIMIT 10 ALLOW FILTERING"),
+    ("select * from t where a = :Foo and b in (?, 1)",
+     "SELECT * FROM t WHERE a = :foo AND b IN (?, 1)"),
+    ("delete from t where k = 1", "DELETE FROM t WHERE k = 1"),
+    ("delete a, b['k'] from t using timestamp 5 where k = true",
+     "DELETE a, b['k'] FROM t USING TIMESTAMP 5 WHERE k = true"),
+    ("begin batch insert into t (a) values (1) "
+     "delete from t where a = 2; apply batch",
+     "BEGIN BATCH INSERT INTO t (a) VALUES (1); "
+     "DELETE FROM t WHERE a = 2; APPLY BATCH"),
+]
+
+# A script and the statements split_statements splits it into.
+SCRIPT = u"""
+USE ks;
+CREATE KEYSPACE ks WITH replication = {'class': 'SimpleStrategy'};
+INSERT INTO foo (bar, baz) VALUES ('semi;colon', 'it''s; here');
+SELECT "odd;name" FROM foo WHERE bar = 'x';
+begin batch
+    INSERT INTO foo (bar, baz) VALUES ('a', 'b');
+    DELETE bar FROM foo WHERE baz = 'apply batch;';
+apply batch;
+
+DROP TABLE foo
+"""
+
+STATEMENTS = [
+    u"USE ks",
+    u"CREATE KEYSPACE ks WITH replication = {'class': 'SimpleStrategy'}",
+    u"INSERT INTO foo (bar, baz) VALUES ('semi;colon', 'it''s; here')",
+    u"SELECT \"odd;name\" FROM foo WHERE bar = 'x'",
+    u"begin batch\n"
+    u"    INSERT INTO foo (bar, baz) VALUES ('a', 'b');\n"
+    u"    DELETE bar FROM foo WHERE baz = 'apply batch;';\n"
+    u"apply batch",
+    u"DROP TABLE foo",
+]
+
+# The tables of the catalog fixture.
+SCHEMA = u"""
+CREATE KEYSPACE ks WITH replication = {'class': 'SimpleStrategy'};
+USE ks;
+CREATE TABLE users (name text PRIMARY KEY, age int, email text);
+CREATE TABLE events (
+    user uuid,
+    day int,
+    at timeuuid,
+    kind text,
+    email text,
+    body text,
+    PRIMARY KEY ((user, day), at, kind)
+);
+CREATE INDEX ON events (email);
+CREATE TABLE readings (
+    user int,
+    day text,
+    at timeuuid,
+    v blob,
+    PRIMARY KEY ((user, day), at)
+);
+CREATE TABLE posts (
+    user int,
+    at int,
+    kind text,
+    body text,
+    PRIMARY KEY (user, at)
+);
+CREATE TABLE custom (k 'org.example.Key' PRIMARY KEY);
+"""
+
+
+def pytest_generate_tests(metafunc):
+    """
+    Run the tests taking canonical once for each pair in CANONICAL.
+    """
+    if 'canonical' in metafunc.fixturenames:
+        metafunc.parametrize('canonical', CANONICAL)
+
+
+@pytest.fixture
+def canonical_statements():
+    return [text for text, _ in CANONICAL]
+
+
+@pytest.fixture
+def script():
+    return SCRIPT
+
+
+@pytest.fixture
+def script_statements():
+    return list(STATEMENTS)
+
+
+@pytest.fixture
+def catalog():
+    catalog = Catalog()
+    for text in split_statements(StringIO(SCHEMA)):
+        catalog.apply(CQL3Nodes(text).statement())
+    return catalog
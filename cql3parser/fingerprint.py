@@ -0,0 +1,142 @@
+"""
+Statement fingerprinting, for caching statements which only differ in their
+literal values.
+
+fingerprint() replaces the literals of a statement with ? placeholders,
+returning the template and the values it removed.  Templates are parsed once
+with parse_cached and the values are substituted back into the cached term.
+"""
+from collections import namedtuple
+
+from parsley import termMaker as t
+from terml.nodes import Term, coerceToTerm
+
+from cql3parser.cache import FrozenList, parse_cached
+from cql3parser.lexer import tokenize
+
+Fingerprint = namedtuple('Fingerprint', 'template values')
+
+# Placeholders which were already in the statement are recorded in
+# Fingerprint.values as BINDING so substitute leaves them alone.
+BINDING = t.Binding()
+
+_operators = frozenset(['=', '<', '>', '<=', '>='])
+
+_literals = frozenset(['string', 'uuid', 'float', 'integer'])
+
+_booleans = {'TRUE': True, 'FALSE': False}
+
+_closing = {'(': ')', '[': ']', '{': '}'}
+
+
+def fingerprint(text):
+    """
+    Replace the literals in a statement with ? placeholders.
+
+    Only literals in positions where the grammar accepts a placeholder (the
+    right hand side of a relation, the VALUES of an INSERT and the key of a
+    collection item) are replaced.  Literals anywhere else, like LIMIT or
+    USING TTL arguments, IN lists and properties, are part of the template.
+    Whitespace in the template is normalized like cql3parser.cache.normalize.
+
+    :returns: A Fingerprint of the template and a tuple of the literal values
+        in the order they appeared.
+    """
+    out = []
+    values = []
+
+    stack = []
+    values_paren = None
+    in_with = False
+    token_paren = None
+    token_relation = False
+    end = 0
+    prev = prev_kind = before_prev_kind = None
+
+    for token in tokenize(text):
+        kind, value = token.kind, token.text
+
+        if token.start > end and out:
+            out.append(' ')
+        end = token.end
+
+        if kind in _literals or (kind == 'keyword' and
+                                 token.value in _booleans):
+            replaceable = (
+                (prev in _operators and not in_with and
+                 not token_relation) or
+                (values_paren is not None and len(stack) == values_paren and
+                 prev in ('(', ',')) or
+                (prev == '[' and
+                 before_prev_kind in ('identifier', 'keyword',
+                                      'quoted_name')))
+
+            if replaceable:
+                values.append(_booleans.get(token.value, token.value)
+                              if kind == 'keyword' else token.value)
+                value = '?'
+        elif kind == 'keyword':
+            if token.value == 'WITH':
+                in_with = True
+            elif token.value == 'VALUES':
+                values_paren = len(stack) + 1
+            elif token.value == 'TOKEN':
+                token_paren = len(stack) + 1
+        elif value in _operators:
+            token_relation = prev == ')' and token_relation
+        elif value == '?':
+            values.append(BINDING)
+        elif value in _closing:
+            stack.append(_closing[value])
+        elif stack and value == stack[-1]:
+            if len(stack) == values_paren:
+                values_paren = None
+            token_relation = len(stack) == token_paren
+            if token_relation:
+                token_paren = None
+            stack.pop()
+
+        out.append(value)
+        before_prev_kind = prev_kind
+        prev, prev_kind = value, kind
+
+    return Fingerprint(''.join(out), tuple(values))
+
+
+def substitute(term, values):
+    """
+    Replace the bindings in a parsed template, in order, with values.
+    """
+    values = iter(values)
+    result = _substitute(term, values)
+    for _ in values:
+        raise ValueError('More values than bindings')
+    return result
+
+
+def _substitute(term, values):
+    if isinstance(term, FrozenList):
+        return FrozenList([_substitute(t, values) for t in term])
+    if term.tag.name == 'Binding' and not term.args:
+        try:
+            return coerceToTerm(next(values))
+        except StopIteration:
+            raise ValueError('More bindings than values')
+
+    if not term.args:
+        return term
+
+    return Term(term.tag, term.data,
+                tuple([_substitute(arg, values) for arg in term.args]))
+
+
+def parse_fingerprinted(text, rule='select', cache=None):
+    """
+    Parse text with the named rule, sharing a cached parse with every
+    statement which has the same fingerprint.
+    """
+    template, values = fingerprint(text)
+    parsed = parse_cached(template, rule, cache)
+    if not values:
+        return parsed
+    return substitute(parsed, values)
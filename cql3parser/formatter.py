@@ -0,0 +1,603 @@
+"""
+cql3fmt, rendering parse results back into canonical CQL.
+
+Keywords are upper case, unquoted identifiers lower case, names are only
+quoted when they were quoted names and every clause is separated by a single
+space.  Collections are written in a stable order, so formatting the result
+of parsing two statements which only differ in those details gives the same
+text.
+
+Run as python -m cql3parser.formatter [file] to reformat a script.
+"""
+import sys
+import uuid
+
+from terml.nodes import Term
+
+from cql3parser import nodes
+from cql3parser.grammar import CQL3Nodes
+from cql3parser.nodes import from_term
+from cql3parser.script import split_statements
+from cql3parser.types import integer_types, text_types
+
+
+class _ByNodeType(dict):
+    """
+    A dict keyed by classes which finds the ReadOnly versions of the node
+    classes in it too.
+    """
+    def __missing__(self, cls):
+        node_type = getattr(cls, 'node_type', None)
+        if node_type is None or node_type is cls:
+            raise KeyError(cls)
+        value = self[cls] = self[node_type]
+        return value
+
+
+def _render(value, out):
+    try:
+        render = _renderers[type(value)]
+    except KeyError:
+        raise TypeError("Can't format {0!r}".format(value))
+    render(value, out)
+
+
+def _join(values, out, separator=', ', render=_render):
+    first = True
+    for value in values:
+        if not first:
+            out.append(separator)
+        first = False
+        render(value, out)
+
+
+def _sorted(values):
+    """
+    The CQL of each of values in a stable order.
+    """
+    return sorted(to_cql(value) for value in values)
+
+
+# Literals
+
+def _string(value, out):
+    out.append("'")
+    out.append(value.replace("'", "''"))
+    out.append("'")
+
+
+def _boolean(value, out):
+    out.append('true' if value else 'false')
+
+
+def _number(value, out):
+    out.append(str(value))
+
+
+def _float(value, out):
+    out.append(repr(value))
+
+
+def _list(value, out):
+    out.append('[')
+    _join(value, out)
+    out.append(']')
+
+
+def _set(value, out):
+    out.append('{')
+    out.append(', '.join(_sorted(value)))
+    out.append('}')
+
+
+def _map(value, out):
+    pairs = sorted((to_cql(k), to_cql(v)) for k, v in value.items())
+    out.append('{')
+    out.append(', '.join(k + ': ' + v for k, v in pairs))
+    out.append('}')
+
+
+def _term(value, out):
+    _render(from_term(value), out)
+
+
+# Names
+
+def _identifier(value, out):
+    out.append(value.name)
+
+
+def _quoted_name(value, out):
+    out.append('"')
+    out.append(value.name.replace('"', '""'))
+    out.append('"')
+
+
+def _name(value, out):
+    _render(value.name, out)
+
+
+def _column(value, out):
+    # Unreserved keywords are plain strings, not identifiers.
+    if isinstance(value.name, text_types):
+        out.append(value.name)
+    else:
+        _render(value.name, out)
+
+
+def _table(value, out):
+    if value.keyspace is not None:
+        _render(value.keyspace, out)
+        out.append('.')
+    _render(value.name, out)
+
+
+# The keyword naming what kind of thing a name is, in DROP and permissions.
+_kinds = _ByNodeType({
+    nodes.Keyspace: 'KEYSPACE ',
+    nodes.Table: 'TABLE ',
+    nodes.Index: 'INDEX ',
+    nodes.User: 'USER ',
+})
+
+
+def _kind(value, out):
+    out.append(_kinds[type(value)])
+    _render(value, out)
+
+
+# Terms and clauses
+
+def _properties(value, out):
+    _join(value.properties, out, ' AND ')
+
+
+def _property(value, out):
+    _render(value.name, out)
+    out.append(' = ')
+    _render(value.value, out)
+
+
+def _using(using, out):
+    if using:
+        out.append(' USING ')
+        _join(using, out, ' AND ')
+
+
+def _timestamp(value, out):
+    out.append('TIMESTAMP ')
+    _render(value.value, out)
+
+
+def _ttl(value, out):
+    out.append('TTL ')
+    _render(value.value, out)
+
+
+def _token(value, out):
+    out.append('TOKEN(')
+    _join(value.items, out)
+    out.append(')')
+
+
+def _relation(value, out):
+    _render(value.lhs, out)
+    if value.operator == 'in':
+        out.append(' IN (')
+        _join(value.value, out)
+        out.append(')')
+    else:
+        out.append(' ')
+        out.append(value.operator)
+        out.append(' ')
+        _render(value.value, out)
+
+
+def _function(value, out):
+    out.append(value.name)
+    out.append('(')
+    _render(value.column, out)
+    out.append(')')
+
+
+def _order_by(value, out):
+    out.append(' ORDER BY ')
+    _render(value.column, out)
+    out.append(' ')
+    out.append(value.direction)
+
+
+def _collection_item(value, out):
+    _render(value.column, out)
+    out.append('[')
+    _render(value.key, out)
+    out.append(']')
+
+
+# Tables
+
+def _native_type(value, out):
+    out.append(value.name)
+
+
+def _keyword_value(value, out):
+    out.append(value.name)
+
+
+def _collection_type(value, out):
+    out.append(value.kind)
+    out.append('<')
+    _join(value.types, out)
+    out.append('>')
+
+
+def _column_definition(value, out):
+    _render(value.column, out)
+    out.append(' ')
+    _render(value.type, out)
+    if value.primary_key:
+        out.append(' PRIMARY KEY')
+
+
+def _primary_key(value, out):
+    out.append('PRIMARY KEY (')
+    if len(value.partition_key) > 1:
+        out.append('(')
+        _join(value.partition_key, out)
+        out.append(')')
+    else:
+        _join(value.partition_key, out)
+    for column in value.clustering:
+        out.append(', ')
+        _render(column, out)
+    out.append(')')
+
+
+def _clustering_column(value, out):
+    _render(value.column, out)
+    out.append(' ')
+    out.append(value.direction)
+
+
+def _clustering_order(value, out):
+    out.append('CLUSTERING ORDER BY (')
+    _join(value.columns, out, render=_clustering_column)
+    out.append(')')
+
+
+def _alter_type(value, out):
+    out.append('ALTER ')
+    _render(value.column, out)
+    out.append(' TYPE ')
+    _render(value.type, out)
+
+
+def _add_column(value, out):
+    out.append('ADD ')
+    _render(value.column, out)
+    out.append(' ')
+    _render(value.type, out)
+
+
+def _drop_column(value, out):
+    out.append('DROP ')
+    _render(value.column, out)
+
+
+def _rename_column(value, out):
+    _render(value.column, out)
+    out.append(' TO ')
+    _render(value.new_name, out)
+
+
+def _rename(value, out):
+    out.append('RENAME ')
+    _join(value.columns, out, ' AND ')
+
+
+def _permission(value, out):
+    out.append(value.name)
+
+
+class _Marked(list):
+    """
+    Rendered text which records the index in it of each bind marker.
+    """
+    def __init__(self):
+        list.__init__(self)
+        self.markers = []
+
+
+def _binding(value, out):
+    if isinstance(out, _Marked):
+        out.markers.append(len(out))
+    if isinstance(value, nodes.NamedBinding):
+        out.append(':' + value.name)
+    else:
+        out.append('?')
+
+
+def _keyword(keyword):
+    def render(value, out):
+        out.append(keyword)
+    return render
+
+
+# Statements
+
+def _use(value, out):
+    out.append('USE ')
+    _render(value.keyspace, out)
+
+
+def _drop(value, out):
+    out.append('DROP ')
+    _kind(value.target, out)
+
+
+def _truncate(value, out):
+    out.append('TRUNCATE ')
+    _render(value.table, out)
+
+
+def _list_users(value, out):
+    out.append('LIST USERS')
+
+
+def _permission_statement(keyword, preposition):
+    def render(value, out):
+        out.append(keyword)
+        _render(value.permission, out)
+        out.append(' ON ')
+        if type(value.resource) is nodes.AllKeyspaces:
+            out.append('ALL KEYSPACES')
+        else:
+            _kind(value.resource, out)
+        out.append(preposition)
+        _render(value.user, out)
+    return render
+
+
+def _list_permissions(value, out):
+    out.append('LIST ')
+    _render(value.permission, out)
+    if value.table is not None:
+        out.append(' ON ')
+        _render(value.table, out)
+    if value.user is not None:
+        out.append(' OF ')
+        _render(value.user, out)
+    if value.norecursive is not None:
+        out.append(' NORECURSIVE')
+
+
+def _user_statement(keyword):
+    def render(value, out):
+        out.append(keyword)
+        _render(value.user, out)
+        if value.password is not None:
+            out.append(' WITH PASSWORD ')
+            _string(value.password, out)
+        if value.superuser is not None:
+            out.append(' SUPERUSER' if value.superuser else ' NOSUPERUSER')
+    return render
+
+
+def _create_index(value, out):
+    out.append('CREATE INDEX ')
+    if value.index is not None:
+        _render(value.index, out)
+        out.append(' ')
+    out.append('ON ')
+    _render(value.table, out)
+    out.append(' (')
+    _render(value.column, out)
+    out.append(')')
+
+
+def _keyspace_statement(keyword):
+    def render(value, out):
+        out.append(keyword)
+        _render(value.keyspace, out)
+        out.append(' WITH ')
+        _render(value.properties, out)
+    return render
+
+
+def _create_table(value, out):
+    out.append('CREATE TABLE ')
+    _render(value.table, out)
+    out.append(' (')
+    _join(value.definitions, out)
+    out.append(')')
+    if value.properties is not None:
+        out.append(' WITH ')
+        _render(value.properties, out)
+
+
+def _alter_table(value, out):
+    out.append('ALTER TABLE ')
+    _render(value.table, out)
+    out.append(' ')
+    if type(value.operation) is nodes.Properties:
+        out.append('WITH ')
+    _render(value.operation, out)
+
+
+def _insert(value, out):
+    out.append('INSERT INTO ')
+    _render(value.table, out)
+    out.append(' (')
+    _join(value.columns, out)
+    out.append(') VALUES (')
+    _join(value.values, out)
+    out.append(')')
+    _using(value.using, out)
+
+
+def _select(value, out):
+    out.append('SELECT ')
+    if isinstance(value.selectors, list):
+        _join(value.selectors, out)
+    else:
+        _render(value.selectors, out)
+    out.append(' FROM ')
+    _render(value.table, out)
+    if value.where is not None:
+        out.append(' WHERE ')
+        _join(value.where, out, ' AND ')
+    if value.order_by is not None:
+        _order_by(value.order_by, out)
+    if value.limit is not None:
+        out.append(' LIMIT ')
+        _render(value.limit.value, out)
+    if value.allow_filtering is not None:
+        out.append(' ALLOW FILTERING')
+
+
+def _delete(value, out):
+    out.append('DELETE ')
+    if value.columns is not None:
+        _join(value.columns, out)
+        out.append(' ')
+    out.append('FROM ')
+    _render(value.table, out)
+    _using(value.using, out)
+    out.append(' WHERE ')
+    _join(value.where, out, ' AND ')
+
+
+def _batch(value, out):
+    out.append('BEGIN BATCH ')
+    for statement in value.statements:
+        _render(statement, out)
+        out.append('; ')
+    out.append('APPLY BATCH')
+
+
+_renderers = _ByNodeType({
+    bool: _boolean,
+    float: _float,
+    uuid.UUID: _number,
+    list: _list,
+    set: _set,
+    dict: _map,
+    Term: _term,
+
+    nodes.Identifier: _identifier,
+    nodes.QuotedName: _quoted_name,
+    nodes.Keyspace: _name,
+    nodes.Table: _table,
+    nodes.Index: _name,
+    nodes.Column: _column,
+    nodes.User: _name,
+    nodes.Keyword: _keyword_value,
+
+    nodes.Binding: _binding,
+    nodes.NamedBinding: _binding,
+    nodes.Properties: _properties,
+    nodes.Property: _property,
+    nodes.Timestamp: _timestamp,
+    nodes.TTL: _ttl,
+    nodes.Token: _token,
+    nodes.Relation: _relation,
+    nodes.Function: _function,
+    nodes.SelectAll: _keyword('*'),
+    nodes.Count: _keyword('COUNT(*)'),
+    nodes.CollectionItem: _collection_item,
+
+    nodes.NativeType: _native_type,
+    nodes.CollectionType: _collection_type,
+    nodes.ColumnDefinition: _column_definition,
+    nodes.PrimaryKey: _primary_key,
+    nodes.ClusteringOrder: _clustering_order,
+    nodes.CompactStorage: _keyword('COMPACT STORAGE'),
+    nodes.AlterType: _alter_type,
+    nodes.AddColumn: _add_column,
+    nodes.DropColumn: _drop_column,
+    nodes.RenameColumn: _rename_column,
+    nodes.Rename: _rename,
+
+    nodes.Permission: _permission,
+    nodes.AllPermissions: _keyword('ALL PERMISSIONS'),
+
+    nodes.Use: _use,
+    nodes.Drop: _drop,
+    nodes.Truncate: _truncate,
+    nodes.List: _list_users,
+    nodes.Grant: _permission_statement('GRANT ', ' TO '),
+    nodes.Revoke: _permission_statement('REVOKE ', ' FROM '),
+    nodes.ListPermissions: _list_permissions,
+    nodes.CreateUser: _user_statement('CREATE USER '),
+    nodes.AlterUser: _user_statement('ALTER USER '),
+    nodes.CreateIndex: _create_index,
+    nodes.CreateKeyspace: _keyspace_statement('CREATE KEYSPACE '),
+    nodes.AlterKeyspace: _keyspace_statement('ALTER KEYSPACE '),
+    nodes.CreateTable: _create_table,
+    nodes.AlterTable: _alter_table,
+    nodes.Insert: _insert,
+    nodes.Select: _select,
+    nodes.Delete: _delete,
+    nodes.Batch: _batch,
+})
+
+for _type in text_types:
+    _renderers[_type] = _string
+for _type in integer_types:
+    _renderers[_type] = _number
+
+
+def to_cql(value):
+    """
+    Render the result of any grammar rule, as terms from CQL3 or nodes from
+    CQL3Nodes, as canonical CQL text.
+
+    :raises TypeError: If value isn't something the grammar returns.
+    """
+    out = []
+    _render(value, out)
+    return ''.join(out)
+
+
+def to_cql_fragments(value):
+    """
+    Render value like to_cql, split into a list of the text between bind
+    markers with None in place of each marker.
+    """
+    out = _Marked()
+    _render(value, out)
+    fragments = []
+    start = 0
+    for index in out.markers:
+        fragments.extend([''.join(out[start:index]), None])
+        start = index + 1
+    fragments.append(''.join(out[start:]))
+    return fragments
+
+
+def cql3fmt(text):
+    """
+    Reformat a statement as canonical CQL.
+    """
+    return to_cql(CQL3Nodes(text).statement())
+
+
+def format_script(script, output):
+    """
+    Write every statement of the script file to output, one canonical
+    statement per line.
+    """
+    for text in split_statements(script):
+        output.write(cql3fmt(text) + ';\n')
+
+
+def main(path=None):
+    if path is None:
+        format_script(sys.stdin, sys.stdout)
+    else:
+        with open(path, 'r') as script:
+            format_script(script, sys.stdout)
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
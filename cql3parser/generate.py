@@ -0,0 +1,46 @@
+"""
+Generate cql3parser/_generated/cql3.py from cql3.parsley.
+
+Compiling the grammar with parsley.makeGrammar is by far the slowest part of
+importing cql3parser, so the compiled parser is kept as a python module and
+regenerated whenever cql3.parsley changes:
+
+    python -m cql3parser.generate
+"""
+import os
+import sys
+
+from ometa.builder import writePython
+from ometa.grammar import OMeta
+
+from cql3parser.grammar import grammar_hash, _read_grammar
+
+GENERATED_PATH = os.path.join(
+    os.path.dirname(__file__), '_generated', 'cql3.py')
+
+HEADER = '''\
+# Generated by cql3parser.generate from cql3.parsley, do not edit.
+# flake8: noqa
+
+GRAMMAR_HASH = {0!r}
+
+
+'''
+
+
+def generate(source, name='cql3'):
+    """
+    Return the source of a python module defining createParserClass for the
+    given grammar source.
+    """
+    tree = OMeta(source).parseGrammar(name)
+    return HEADER.format(grammar_hash(source)) + writePython(tree) + '\n'
+
+
+def main(path=GENERATED_PATH):
+    with open(path, 'w') as f:
+        f.write(generate(_read_grammar()))
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
@@ -1,137 +1,403 @@
+import hashlib
 import os
-import uuid
 
-from parsley import makeGrammar, termMaker
+try:
+    import copyreg
+except ImportError:
+    import copy_reg as copyreg
 
+from ometa.runtime import (
+    InputStream, OMetaBase, ParseError, EOFError, expected)
+from parsley import makeGrammar, termMaker, _GrammarWrapper
+from terml.nodes import Term
+
+from cql3parser.keywords import (
+    ALIASES, UNRESERVED_KEYWORDS, keywords, unreserved_keywords)
+from cql3parser import nodes
+from cql3parser.lexer import tokenize
 from cql3parser.types import native_types
 
-keywords = [
-    'SELECT',
-    'FROM',
-    'WHERE',
-    'AND',
-    'KEY',
-    'INSERT',
-    'UPDATE',
-    'WITH',
-    'LIMIT',
-    'USING',
-    'USE',
-    'COUNT',
-    'SET',
-    'BEGIN',
-    'UNLOGGED',
-    'BATCH',
-    'APPLY',
-    'TRUNCATE',
-    'DELETE',
-    'IN',
-    'CREATE',
-    'KEYSPACE',
-    'SCHEMA',
-    'KEYSPACES',
-    'COLUMNFAMILY',
-    'TABLE',
-    'INDEX',
-    'ON',
-    'TO',
-    'DROP',
-    'PRIMARY',
-    'INTO',
-    'VALUES',
-    'TIMESTAMP',
-    'TTL',
-    'ALTER',
-    'RENAME',
-    'ADD',
-    'TYPE',
-    'COMPACT',
-    'STORAGE',
-    'ORDER',
-    'BY',
-    'ASC',
-    'DESC',
-    'ALLOW',
-    'FILTERING',
-
-    'GRANT',
-    'ALL',
-    'PERMISSION',
-    'PERMISSIONS',
-    'OF',
-    'REVOKE',
-    'MODIFY',
-    'AUTHORIZE',
-    'NORECURSIVE',
-
-    'USER',
-    'USERS',
-    'SUPERUSER',
-    'NOSUPERUSER',
-    'PASSWORD',
-
-    'CLUSTERING',
-    'ASCII',
-    'BIGINT',
-    'BLOB',
-    'BOOLEAN',
-    'COUNTER',
-    'DECIMAL',
-    'FLOAT',
-    'INET',
-    'INT',
-    'TEXT',
-    'UUID',
-    'VARCHAR',
-    'VARINT',
-    'TIMEUUID',
-    'TOKEN',
-    'WRITETIME',
-
-    'MAP',
-    'LIST',
-
-    'TRUE',
-    'FALSE',
-]
-
-unreserved_keywords = [
-    'KEY',
-    'CLUSTERING',
-    'COUNT',
-    'TTL',
-    'COMPACT',
-    'STORAGE',
-    'TYPE',
-    'VALUES',
-    'WRITETIME',
-    'MAP',
-    'LIST',
-    'FILTERING',
-    'PERMISSION',
-    'PERMISSIONS',
-    'KEYSPACES',
-    'ALL',
-    'USER',
-    'USERS',
-    'SUPERUSER',
-    'NOSUPERUSER',
-    'PASSWORD'
-]
+keywords  # appease pyflakes, these are still exported from here
+unreserved_keywords
+
+# The statement rule to use for each leading keyword, or pair of leading
+# keywords when the first one isn't enough to tell.
+
+statement_rules = {
+    'USE': 'use',
+    'DROP': 'drop',
+    'TRUNCATE': 'truncate',
+    'GRANT': 'grant',
+    'REVOKE': 'revoke',
+    'LIST': 'list_permissions',
+    ('LIST', 'USERS'): 'list_users',
+    ('CREATE', 'USER'): 'create_user',
+    ('CREATE', 'INDEX'): 'create_index',
+    ('CREATE', 'KEYSPACE'): 'create_keyspace',
+    ('CREATE', 'TABLE'): 'create_table',
+    ('CREATE', 'COLUMNFAMILY'): 'create_table',
+    ('ALTER', 'USER'): 'alter_user',
+    ('ALTER', 'KEYSPACE'): 'alter_keyspace',
+    ('ALTER', 'TABLE'): 'alter_table',
+    ('ALTER', 'COLUMNFAMILY'): 'alter_table',
+    'SELECT': 'select',
+    'INSERT': 'insert',
+    'DELETE': 'delete',
+    'BEGIN': 'batch',
+}
 
 bindings = {
-    'UUID': uuid.UUID,
-    'keywords': keywords,
-    'unreserved_keywords': unreserved_keywords,
+    'statement_rules': statement_rules,
+    'unreserved_keywords': UNRESERVED_KEYWORDS,
     'native_types': native_types,
     't': termMaker
 }
 
+# The same grammar building cql3parser.nodes instead of terms.
+node_bindings = dict(bindings, t=nodes)
+
+
+# The kinds of tokens which are literals, final_term in the grammar, whose
+# value is the value of the token.  TRUE and FALSE are keywords.
+_LITERAL_KINDS = frozenset(['string', 'uuid', 'float', 'integer'])
+_BOOLEANS = {'TRUE': True, 'FALSE': False}
+
+
+class TokenGrammarBase(OMetaBase):
+    """
+    Base class for grammars over the tokens produced by
+    cql3parser.lexer.tokenize, providing the rules which match tokens.
+    """
+    def exactly(self, wanted):
+        """
+        Match a token by its text, in the grammar this is written as '(' or
+        '<=' for example.
+        """
+        token, e = self.input.head()
+        if token.text != wanted:
+            raise e.withMessage(expected('token', wanted))
+
+        self.input = self.input.tail()
+        return token.text, e
+
+    rule_exactly = exactly
+
+    def rule_tok(self, kind):
+        """
+        Match a token of the given kind and return its value.
+        """
+        token, e = self.input.head()
+        if token.kind != kind:
+            raise e.withMessage(expected(kind))
+
+        self.input = self.input.tail()
+        return token.value, e
+
+    def rule_k(self, keyword):
+        """
+        Match a keyword, k('SELECT') for example, and return it.
+        """
+        token, e = self.input.head()
+        if token.kind != 'keyword' or token.value != keyword:
+            raise e.withMessage(expected('keyword', keyword))
+
+        self.input = self.input.tail()
+        return keyword, e
+
+    def rule_alias(self, canonical):
+        """
+        Match any keyword which is an alias for the canonical keyword and
+        return the canonical keyword.
+        """
+        token, e = self.input.head()
+        if token.kind != 'keyword' or ALIASES.get(token.value) != canonical:
+            raise e.withMessage(expected('keyword', canonical))
+
+        self.input = self.input.tail()
+        return canonical, e
+
+    def rule_dispatch(self, table):
+        """
+        Apply the rule table maps the leading keywords to, trying the first
+        two keywords as a tuple before the first keyword on its own.
+        """
+        token, e = self.input.head()
+        rule = None
+        if token.kind == 'keyword':
+            try:
+                second, _ = self.input.tail().head()
+            except EOFError:
+                second = None
+
+            if second is not None and second.kind == 'keyword':
+                rule = table.get((token.value, second.value))
+            if rule is None:
+                rule = table.get(token.value)
+
+        if rule is None:
+            raise e.withMessage(expected('statement'))
+
+        return self.apply(rule)
+
+    def _literal(self, tokens, i, rule):
+        """
+        Return the value of the rule at token i, taking literal tokens
+        directly instead of applying rule, and the index of the next token.
+        """
+        if i < len(tokens):
+            token = tokens[i]
+            if token.kind in _LITERAL_KINDS:
+                return token.value, i + 1
+            if token.kind == 'keyword' and token.value in _BOOLEANS:
+                return _BOOLEANS[token.value], i + 1
+            # Only bind markers start with these, skip trying the literals.
+            if rule == 'term' and token.text in ('?', ':'):
+                rule = 'qmark'
+
+        self.input = InputStream(tokens, i)
+        value, _ = self.apply(rule)
+        return value, self.input.position
+
+    def _sequence(self, item):
+        """
+        Match item (',' item)*, where item(i) parses an item at token i like
+        _literal, and return the list of items.
+        """
+        tokens = self.input.data
+        value, end = item(self.input.position)
+        values = [value]
+
+        # Like many, return the error which ended the list so the furthest
+        # error is reported if what follows the list fails.
+        while True:
+            self.input = InputStream(tokens, end)
+            try:
+                self.exactly(',')
+                value, end = item(end + 1)
+            except ParseError as e:
+                error = e
+                break
+            values.append(value)
+
+        self.input = InputStream(tokens, end)
+        return values, error
+
+    def rule_literals(self, rule):
+        """
+        Match a comma separated list of rule, final_term or term, and return
+        the list of their values.
+
+        This is the same as rule:first (',' rule)*:rest -> [first] + rest,
+        except that literals are read straight from the tokens.  Long
+        collection literals and IN lists don't make an input stream and
+        memo for every token, so their parse time grows linearly.
+        """
+        tokens = self.input.data
+        return self._sequence(lambda i: self._literal(tokens, i, rule))
+
+    def rule_literal_map(self):
+        """
+        Match comma separated final_term ':' final_term pairs and return
+        them as a dict, reading literals like literals.
+        """
+        tokens = self.input.data
+
+        def pair(i):
+            key, i = self._literal(tokens, i, 'final_term')
+            self.input = InputStream(tokens, i)
+            self.exactly(':')
+            value, i = self._literal(tokens, i + 1, 'final_term')
+            return (key, value), i
+
+        pairs, e = self._sequence(pair)
+        return dict(pairs), e
+
+    def rule_word(self):
+        """
+        Match a keyword or identifier and return its upper case name.
+        """
+        token, e = self.input.head()
+        if token.kind != 'keyword' and token.kind != 'identifier':
+            raise e.withMessage(expected('identifier'))
+
+        self.input = self.input.tail()
+        return token.value, e
+
+
+def _copy_error(e):
+    if isinstance(e, EOFError):
+        return EOFError(e.input, e.position)
+    return ParseError(e.input, e.position, e.error, list(e.trail))
+
+
+class PackratGrammarBase(TokenGrammarBase):
+    """
+    TokenGrammarBase memoizing the result of every rule application,
+    including the rules with arguments like k('SELECT') and tok('float')
+    which OMetaBase runs again every time, in a table for each parse.
+
+    Once the table holds memo_size results rules are run without memoizing
+    them.  Unlike OMetaBase left recursive rules aren't supported, the CQL3
+    grammar has none.
+    """
+    memo_size = 4096
+
+    def __init__(self, *args, **kwargs):
+        TokenGrammarBase.__init__(self, *args, **kwargs)
+        self._memo = {}
 
-def _load():
-    grammar = os.path.join(os.path.dirname(__file__), 'cql3.parsley')
-    with open(grammar, 'r') as g:
-        return makeGrammar(g.read(), bindings, 'cql3')
+    def _apply(self, rule, ruleName, args):
+        position = getattr(self.input, 'position', None)
+        code = getattr(rule, 'func_code', None) or rule.__code__
+        if position is None or code.co_argcount - 1 != len(args):
+            return OMetaBase._apply(self, rule, ruleName, args)
+
+        key = (position, ruleName) + tuple(args)
+        try:
+            memo = self._memo.get(key)
+        except TypeError:
+            # Unhashable arguments, like the table dispatch is given.
+            return rule(*args)
+
+        if memo is None:
+            try:
+                memo = (rule(*args), self.input, None)
+            except ParseError as e:
+                if not args:
+                    e.trail.append(ruleName)
+                memo = (None, None, _copy_error(e))
+                if len(self._memo) < self.memo_size:
+                    self._memo[key] = memo
+                raise
+
+            if len(self._memo) < self.memo_size:
+                self._memo[key] = memo
+
+        value, input, error = memo
+        if error is not None:
+            raise _copy_error(error)
+
+        self.input = input
+        return value
+
+
+class _TokenGrammarWrapper(_GrammarWrapper):
+    """
+    Invokes rules like parsley's wrapper, reporting parse errors by their
+    position in the text instead of in the list of tokens.
+    """
+    def __init__(self, grammar, input, tokens):
+        _GrammarWrapper.__init__(self, grammar, input)
+        self._tokens = tokens
+
+    def _position(self, index):
+        if index < len(self._tokens):
+            return self._tokens[index].start
+        return len(self._input)
+
+    def __getattr__(self, name):
+        invoke = _GrammarWrapper.__getattr__(self, name)
+
+        def invokeRule(*args):
+            try:
+                return invoke(*args)
+            except EOFError as e:
+                raise EOFError(self._input, self._position(e.position))
+            except ParseError as e:
+                raise ParseError(self._input, self._position(e.position),
+                                 e.error, e.trail)
+
+        return invokeRule
+
+
+def wrapTokenGrammar(g):
+    def makeParser(input):
+        """
+        Creates a parser for the given CQL text, with methods for invoking
+        each rule.
+
+        :param input: The string you want to parse.
+        """
+        tokens = tokenize(input)
+        return _TokenGrammarWrapper(g(tokens), input, tokens)
+    makeParser._grammarClass = g
+    return makeParser
+
+
+# Terms and parse errors can't be pickled as they are, Term.__iter__ raises
+# and ParseError doesn't take its args in __init__, so tell pickle how.
+
+def _reduce_term(term):
+    return Term, (term.tag, term.data, term.args)
+
+
+def _reduce_parse_error(e):
+    return ParseError, (e.input, e.position, e.error, e.trail)
+
+
+def _reduce_eof_error(e):
+    return EOFError, (e.input, e.position)
+
+
+copyreg.pickle(Term, _reduce_term)
+copyreg.pickle(ParseError, _reduce_parse_error)
+copyreg.pickle(EOFError, _reduce_eof_error)
+
+
+GRAMMAR_PATH = os.path.join(os.path.dirname(__file__), 'cql3.parsley')
+
+
+def _read_grammar():
+    with open(GRAMMAR_PATH, 'r') as g:
+        return g.read()
+
+
+def grammar_hash(source):
+    """
+    The version of a grammar source, used to tell whether the generated
+    parser module is still current.
+    """
+    return hashlib.sha1(source.encode('utf-8')).hexdigest()
+
+
+def _load(bindings=bindings, base=TokenGrammarBase):
+    """
+    Load the parser from the generated module in cql3parser._generated,
+    which is a plain python import.  If it is missing or was generated from
+    a different version of cql3.parsley fall back to compiling the grammar.
+
+    :param base: The TokenGrammarBase subclass the parser extends.
+    """
+    source = _read_grammar()
+
+    try:
+        from cql3parser._generated import cql3 as generated
+    except ImportError:
+        generated = None
+
+    if generated is None or generated.GRAMMAR_HASH != grammar_hash(source):
+        g = makeGrammar(source, bindings, 'cql3', unwrap=True,
+                        extends=base)
+    else:
+        g = generated.createParserClass(base, bindings)
+
+    return wrapTokenGrammar(g)
 
 
 CQL3 = _load()
+CQL3Nodes = _load(node_bindings)
+
+
+def packrat_parser(memo_size=PackratGrammarBase.memo_size,
+                   bindings=bindings):
+    """
+    Make a parser like CQL3, or CQL3Nodes given node_bindings, which
+    memoizes every rule application, see PackratGrammarBase.  This pays off
+    for statements where rules backtrack over the same tokens a lot and
+    costs a little everywhere else.
+
+    :param memo_size: The most results memoized for each parse.
+    """
+    base = type('PackratGrammarBase', (PackratGrammarBase,),
+                {'memo_size': memo_size})
+    return _load(bindings, base)
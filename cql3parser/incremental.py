@@ -0,0 +1,203 @@
+"""
+Incremental parsing of a buffer of statements, for editors and shells which
+parse the whole buffer after every change.
+
+A Document holds the parsed statements of a buffer.  Document.edit applies a
+change to the text and only splits and parses again from the statement
+before the change up to the first statement boundary after it which was
+also a boundary before the change.  Every statement after that, and any
+statement whose text didn't change, keeps its parse result.
+"""
+from collections import namedtuple
+
+from ometa.runtime import ParseError
+
+from cql3parser.grammar import CQL3Nodes
+from cql3parser.script import StatementSplitter
+
+# A statement in a Document: its text, the offsets in the document where the
+# text starts and ends, the offset just after its ; and either the result of
+# parsing it or the ParseError parsing it raised.
+Statement = namedtuple('Statement', 'text start end stop value error')
+
+# How much text to split at a time while looking for the end of an edit.
+CHUNK_SIZE = 4096
+
+
+def _parse(parser, span, reuse):
+    old = reuse.get(span.text)
+    if old is not None:
+        return Statement(span.text, span.start, span.end, span.stop,
+                         old.value, old.error)
+
+    try:
+        value, error = parser(span.text).statement(), None
+    except ParseError as e:
+        value, error = None, e
+    return Statement(span.text, span.start, span.end, span.stop, value, error)
+
+
+def _shift(statement, delta):
+    return Statement(statement.text, statement.start + delta,
+                     statement.end + delta, statement.stop + delta,
+                     statement.value, statement.error)
+
+
+class Document(object):
+    """
+    The statements in a buffer of text, parsed with parser.
+
+    Editing a document doesn't change it, it returns a new document.
+    Documents share the statements the edit didn't touch and, so that an edit
+    doesn't have to move every statement after it, the offsets of the
+    statements from _gap on are all off by _delta until they're looked at.
+
+    :ivar text: The text of the buffer.
+    """
+    def __init__(self, text, parser=CQL3Nodes):
+        self.text = text
+        self.parser = parser
+
+        splitter = StatementSplitter()
+        spans = splitter.feed_spans(text) + splitter.close_spans()
+        self._statements = [_parse(parser, span, {}) for span in spans]
+        self._gap = len(self._statements)
+        self._delta = 0
+
+    @classmethod
+    def _from_parts(cls, text, parser, statements, gap, delta):
+        document = cls.__new__(cls)
+        document.text = text
+        document.parser = parser
+        document._statements = statements
+        document._gap = gap
+        document._delta = delta
+        return document
+
+    def __repr__(self):
+        return '<Document of {0} statements>'.format(len(self._statements))
+
+    def __len__(self):
+        return len(self._statements)
+
+    def __getitem__(self, index):
+        statement = self._statements[index]
+        if index < 0:
+            index += len(self._statements)
+        if index >= self._gap and self._delta:
+            return _shift(statement, self._delta)
+        return statement
+
+    @property
+    def statements(self):
+        """
+        A list of a Statement for each statement in the text.
+        """
+        return [self[i] for i in range(len(self._statements))]
+
+    @property
+    def errors(self):
+        """
+        The statements which failed to parse.
+        """
+        return [s for s in self.statements if s.error is not None]
+
+    def _stop(self, index):
+        stop = self._statements[index].stop
+        if index >= self._gap:
+            stop += self._delta
+        return stop
+
+    def _first_stop_after(self, offset):
+        """
+        The index of the first statement which stops after offset.
+        """
+        low, high = 0, len(self._statements)
+        while low < high:
+            middle = (low + high) // 2
+            if self._stop(middle) <= offset:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def statement_at(self, offset):
+        """
+        The statement which offset is in, counting the ; ending it, or None
+        if offset is past the last statement.
+        """
+        i = self._first_stop_after(offset)
+        if i < len(self._statements):
+            return self[i]
+        return None
+
+    def edit(self, start, end, text):
+        """
+        Return a new Document with the text between offsets start and end
+        replaced by text.
+        """
+        new_text = self.text[:start] + text + self.text[end:]
+        delta = len(text) - (end - start)
+        old = self._statements
+        gap = self._gap
+
+        # Statements which stop before the edit are kept as they are, unless
+        # it is the last one and has no ; which the edit could extend.
+        first = self._first_stop_after(start)
+        if first and first == len(old) and self._stop(first - 1) == len(
+                self.text):
+            first -= 1
+
+        statements = old[:min(first, gap)]
+        statements.extend(_shift(s, self._delta) for s in old[gap:first])
+        offset = statements[-1].stop if statements else 0
+
+        # Split and parse from there until a statement stops where one
+        # stopped before the edit, everything after that is unchanged.
+        # Statements whose text is unchanged are reused as splitting gets to
+        # them.
+        splitter = StatementSplitter(offset)
+        reuse = {}
+        seen = first
+        resume = None
+        while resume is None:
+            chunk = new_text[offset:offset + CHUNK_SIZE]
+            offset += len(chunk)
+            if chunk:
+                spans = splitter.feed_spans(chunk)
+            else:
+                spans = splitter.close_spans()
+                resume = len(old)
+
+            for span in spans:
+                while seen < len(old) and self._stop(seen) + delta <= (
+                        span.stop):
+                    reuse[old[seen].text] = old[seen]
+                    seen += 1
+
+                statements.append(_parse(self.parser, span, reuse))
+
+                i = self._first_stop_after(span.stop - delta - 1)
+                if (i < len(old) and self._stop(i) >= end and
+                        self._stop(i) == span.stop - delta):
+                    resume = i + 1
+                    break
+
+        # The statements after that move by delta, those after the old gap
+        # were already off by self._delta.  Only one of those runs can stay
+        # off by the new delta, move the shorter one now.
+        before = old[resume:gap]
+        after = old[max(resume, gap):]
+        if len(before) <= len(after):
+            statements.extend(_shift(s, delta) for s in before)
+            new_gap = len(statements)
+            statements.extend(after)
+            new_delta = self._delta + delta
+        else:
+            new_gap = len(statements)
+            statements.extend(before)
+            statements.extend(_shift(s, self._delta) for s in after)
+            new_delta = delta
+
+        return Document._from_parts(
+            new_text, self.parser, statements, new_gap, new_delta)
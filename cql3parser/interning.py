@@ -0,0 +1,86 @@
+"""
+Sharing the names in parse results between parses.
+
+Every parse builds new identifiers, tables and columns even though a
+program only ever sees a few hundred different schema names.  A parser made
+by interning_parser builds them through an InternPool instead, which hands
+out the object it built for an earlier parse with the same arguments.
+
+The names handed out are shared by every result which uses them, so they're
+read-only: terms are immutable anyway and the nodes an InternPool builds are
+nodes.ReadOnly, raising AttributeError when an attribute is set.  Copy one
+with copy.copy to change it.
+"""
+from parsley import termMaker
+
+from cql3parser.cache import LRUCache, _missing
+from cql3parser.grammar import _load, bindings
+from cql3parser.nodes import Node, node_key, read_only
+
+# What the grammar builds for names, the arguments of each of these are
+# strings or other interned names, keyed by node_key.
+INTERNED = frozenset(['Identifier', 'QuotedName', 'Keyspace', 'Table',
+                      'Column'])
+
+
+class InternPool(object):
+    """
+    Builds syntax tree nodes like builder, the t of the grammar, reusing the
+    names it built before, which are read-only.
+
+    At most maxsize names are kept, the least recently used are forgotten
+    and built again the next time they're seen.
+
+    :param builder: parsley.termMaker or cql3parser.nodes.
+    """
+    def __init__(self, builder=termMaker, maxsize=4096):
+        self.builder = builder
+        self._names = LRUCache(maxsize)
+
+    def __getattr__(self, name):
+        # Only called the first time each name is looked up, the result is
+        # kept as an attribute for the lookups after that.
+        make = getattr(self.builder, name)
+        if name not in INTERNED:
+            setattr(self, name, make)
+            return make
+
+        if isinstance(make, type) and issubclass(make, Node):
+            make = read_only(make)
+        names = self._names
+
+        def intern(*args):
+            key = (name,) + tuple([node_key(arg) for arg in args])
+            value = names.get(key, _missing)
+            if value is _missing:
+                value = make(*args)
+                names.put(key, value)
+            return value
+
+        setattr(self, name, intern)
+        return intern
+
+    def __len__(self):
+        return len(self._names)
+
+    def resize(self, maxsize):
+        self._names.resize(maxsize)
+
+    def clear(self):
+        self._names.clear()
+
+    def info(self):
+        return self._names.info()
+
+
+def interning_parser(pool=None):
+    """
+    Make a parser like CQL3, or CQL3Nodes for a pool of cql3parser.nodes,
+    which builds names through pool.
+
+    :param pool: The InternPool to use, defaults to a new one building
+        terms.
+    """
+    if pool is None:
+        pool = InternPool()
+    return _load(dict(bindings, t=pool))
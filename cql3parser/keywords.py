@@ -0,0 +1,129 @@
+keywords = [
+    'SELECT',
+    'FROM',
+    'WHERE',
+    'AND',
+    'KEY',
+    'INSERT',
+    'UPDATE',
+    'WITH',
+    'LIMIT',
+    'USING',
+    'USE',
+    'COUNT',
+    'SET',
+    'BEGIN',
+    'UNLOGGED',
+    'BATCH',
+    'APPLY',
+    'TRUNCATE',
+    'DELETE',
+    'IN',
+    'CREATE',
+    'KEYSPACE',
+    'SCHEMA',
+    'KEYSPACES',
+    'COLUMNFAMILY',
+    'TABLE',
+    'INDEX',
+    'ON',
+    'TO',
+    'DROP',
+    'PRIMARY',
+    'INTO',
+    'VALUES',
+    'TIMESTAMP',
+    'TTL',
+    'ALTER',
+    'RENAME',
+    'ADD',
+    'TYPE',
+    'COMPACT',
+    'STORAGE',
+    'ORDER',
+    'BY',
+    'ASC',
+    'DESC',
+    'ALLOW',
+    'FILTERING',
+
+    'GRANT',
+    'ALL',
+    'PERMISSION',
+    'PERMISSIONS',
+    'OF',
+    'REVOKE',
+    'MODIFY',
+    'AUTHORIZE',
+    'NORECURSIVE',
+
+    'USER',
+    'USERS',
+    'SUPERUSER',
+    'NOSUPERUSER',
+    'PASSWORD',
+
+    'CLUSTERING',
+    'ASCII',
+    'BIGINT',
+    'BLOB',
+    'BOOLEAN',
+    'COUNTER',
+    'DECIMAL',
+    'FLOAT',
+    'INET',
+    'INT',
+    'TEXT',
+    'UUID',
+    'VARCHAR',
+    'VARINT',
+    'TIMEUUID',
+    'TOKEN',
+    'WRITETIME',
+
+    'MAP',
+    'LIST',
+
+    'TRUE',
+    'FALSE',
+]
+
+unreserved_keywords = [
+    'KEY',
+    'CLUSTERING',
+    'COUNT',
+    'TTL',
+    'COMPACT',
+    'STORAGE',
+    'TYPE',
+    'VALUES',
+    'WRITETIME',
+    'MAP',
+    'LIST',
+    'FILTERING',
+    'PERMISSION',
+    'PERMISSIONS',
+    'KEYSPACES',
+    'ALL',
+    'USER',
+    'USERS',
+    'SUPERUSER',
+    'NOSUPERUSER',
+    'PASSWORD'
+]
+
+# Hashed versions of the lists above, built once for the lexer and grammar.
+
+KEYWORDS = frozenset(keywords)
+
+UNRESERVED_KEYWORDS = frozenset(unreserved_keywords)
+
+# Some keywords are aliases for other keywords, this maps each of them to the
+# name I like best.
+
+ALIASES = {
+    'KEYSPACE': 'KEYSPACE',
+    'SCHEMA': 'KEYSPACE',
+    'TABLE': 'TABLE',
+    'COLUMNFAMILY': 'TABLE',
+}
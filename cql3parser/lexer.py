@@ -0,0 +1,72 @@
+"""
+A single pass tokenizer for CQL3, the CQL3 grammar runs over its tokens.
+"""
+import re
+import uuid
+
+from collections import namedtuple
+
+from cql3parser.keywords import KEYWORDS
+
+# kind is one of the group names in _token below, except words which are
+# split into keywords and identifiers.  value is the canonical value of the
+# token: the upper case name of keywords and identifiers, the unquoted text of
+# strings and quoted names, the python value of numbers and uuids and the text
+# of everything else.  start and end are offsets into the tokenized text.
+Token = namedtuple('Token', 'kind text value start end')
+
+_token = re.compile(r"""
+    (?P<ws>\s+)
+  | (?P<string>'[^']*(?:''[^']*)*')
+  | (?P<quoted_name>"[^"]*(?:""[^"]*)*")
+  | (?P<uuid>[0-9a-fA-F]{8}-(?:[0-9a-fA-F]{4}-){3}[0-9a-fA-F]{12})
+  | (?P<float>-?[0-9]+(?:\.[0-9]+(?:[eE][+-]?[0-9]+)?|[eE][+-]?[0-9]+))
+  | (?P<integer>-?[0-9]+)
+  | (?P<word>[a-zA-Z][a-zA-Z0-9_]*)
+  | (?P<punctuation><=|>=|[=<>(),.;:?*\[\]{}])
+  | (?P<error>.)
+""", re.VERBOSE | re.DOTALL)
+
+
+def _unquote(text):
+    quote = text[0]
+    return text[1:-1].replace(quote + quote, quote)
+
+
+_values = {
+    'string': _unquote,
+    'quoted_name': _unquote,
+    'uuid': uuid.UUID,
+    'float': float,
+    'integer': int,
+}
+
+
+def tokenize(text):
+    """
+    Split text into a list of Tokens, skipping whitespace.
+
+    Characters which can't start a token become tokens of kind 'error', so
+    tokenizing never fails and the grammar reports the error where it finds
+    one.
+    """
+    tokens = []
+    append = tokens.append
+
+    for m in _token.finditer(text):
+        kind = m.lastgroup
+        if kind == 'ws':
+            continue
+
+        value = m.group()
+        if kind == 'word':
+            value = value.upper()
+            kind = 'keyword' if value in KEYWORDS else 'identifier'
+            append(Token(kind, m.group(), value, m.start(), m.end()))
+        elif kind in _values:
+            append(Token(kind, value, _values[kind](value),
+                         m.start(), m.end()))
+        else:
+            append(Token(kind, value, value, m.start(), m.end()))
+
+    return tokens
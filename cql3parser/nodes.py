@@ -0,0 +1,273 @@
+"""
+Typed syntax tree nodes for CQL3.
+
+The grammar builds its results with t.<Name>(...), CQL3 binds t to parsley's
+termMaker and builds Terms while CQL3Nodes binds t to this module and builds
+these classes instead.  They are compact __slots__ classes with a named
+attribute for each argument of the corresponding term.  to_term and
+from_term convert between the two.
+"""
+from parsley import termMaker
+from terml.nodes import Term
+
+_classes = {}
+
+
+class Node(object):
+    """
+    Base class for syntax tree nodes, subclasses are made with _node.
+
+    :cvar node_type: The class made by _node, which the read_only version
+        of a class shares.
+    """
+    __slots__ = ()
+    node_type = None
+
+    def __eq__(self, other):
+        if self.node_type is not getattr(other, 'node_type', None):
+            return NotImplemented
+        for field in self.__slots__:
+            if getattr(self, field) != getattr(other, field):
+                return False
+        return True
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        if equal is NotImplemented:
+            return equal
+        return not equal
+
+    # Nodes are mutable and may hold lists, hash node_key(node) instead.
+    __hash__ = None
+
+    def __repr__(self):
+        return '{0}({1})'.format(type(self).__name__, ', '.join(
+            '{0}={1!r}'.format(f, getattr(self, f)) for f in self.__slots__))
+
+    def __reduce__(self):
+        return self.node_type, tuple([getattr(self, f)
+                                      for f in self.__slots__])
+
+
+class ReadOnly(object):
+    """
+    Mixin for nodes which may be shared, like the names an InternPool hands
+    out, whose attributes can't be set or deleted.  Copies of them, made
+    with copy or pickle, are ordinary nodes.
+    """
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Can't set {0} of a read-only {1}".format(
+            name, type(self).__name__))
+
+    def __delattr__(self, name):
+        raise AttributeError("Can't delete {0} of a read-only {1}".format(
+            name, type(self).__name__))
+
+
+def _node(name, fields=''):
+    """
+    Make a Node subclass with the given space separated fields and an
+    __init__ taking them positionally.
+    """
+    fields = tuple(fields.split())
+    source = 'def __init__(self{0}):\n{1}'.format(
+        ''.join(', ' + f for f in fields),
+        ''.join('    self.{0} = {0}\n'.format(f) for f in fields) or
+        '    pass\n')
+    namespace = {}
+    exec(source, namespace)
+
+    cls = type(name, (Node,), {
+        '__slots__': fields,
+        '__init__': namespace['__init__'],
+    })
+    cls.node_type = cls
+    _classes[name] = cls
+    return cls
+
+
+_read_only = {}
+
+
+def read_only(cls):
+    """
+    The ReadOnly version of a node class, which compares equal to and is
+    formatted like cls.
+    """
+    try:
+        return _read_only[cls]
+    except KeyError:
+        pass
+
+    fields = cls.__slots__
+    source = 'def __init__(self{0}):\n{1}'.format(
+        ''.join(', ' + f for f in fields),
+        ''.join('    _set(self, {0!r}, {0})\n'.format(f) for f in fields) or
+        '    pass\n')
+    namespace = {'_set': object.__setattr__}
+    exec(source, namespace)
+
+    read_only_cls = _read_only[cls] = type(cls.__name__, (ReadOnly, cls), {
+        '__slots__': (),
+        '__init__': namespace['__init__'],
+    })
+    # Only the __slots__ a class is made with add attributes, these are for
+    # the code which walks the fields of nodes.
+    read_only_cls.__slots__ = fields
+    return read_only_cls
+
+
+# Names
+
+Identifier = _node('Identifier', 'name')
+QuotedName = _node('QuotedName', 'name')
+NativeType = _node('NativeType', 'name java_type')
+Keyspace = _node('Keyspace', 'name')
+Table = _node('Table', 'name keyspace')
+Index = _node('Index', 'name')
+Column = _node('Column', 'name')
+User = _node('User', 'name')
+Keyword = _node('Keyword', 'name')
+
+# Terms and clauses
+
+Binding = _node('Binding')
+NamedBinding = _node('NamedBinding', 'name')
+Property = _node('Property', 'name value')
+Properties = _node('Properties', 'properties')
+Timestamp = _node('Timestamp', 'value')
+TTL = _node('TTL', 'value')
+Token = _node('Token', 'items')
+Relation = _node('Relation', 'lhs operator value')
+Function = _node('Function', 'name column')
+SelectAll = _node('SelectAll')
+Count = _node('Count')
+OrderBy = _node('OrderBy', 'column direction')
+Limit = _node('Limit', 'value')
+AllowFiltering = _node('AllowFiltering')
+CollectionItem = _node('CollectionItem', 'column key')
+
+# Tables
+
+CollectionType = _node('CollectionType', 'kind types')
+ColumnDefinition = _node('ColumnDefinition', 'column type primary_key')
+PrimaryKey = _node('PrimaryKey', 'partition_key clustering')
+ClusteringOrder = _node('ClusteringOrder', 'columns')
+CompactStorage = _node('CompactStorage')
+AlterType = _node('AlterType', 'column type')
+AddColumn = _node('AddColumn', 'column type')
+DropColumn = _node('DropColumn', 'column')
+RenameColumn = _node('RenameColumn', 'column new_name')
+Rename = _node('Rename', 'columns')
+
+# Permissions
+
+Permission = _node('Permission', 'name')
+AllPermissions = _node('AllPermissions')
+AllKeyspaces = _node('AllKeyspaces')
+NoRecursive = _node('NoRecursive')
+Users = _node('Users')
+
+# Statements
+
+Use = _node('Use', 'keyspace')
+Drop = _node('Drop', 'target')
+Truncate = _node('Truncate', 'table')
+List = _node('List', 'target')
+Grant = _node('Grant', 'permission resource user')
+Revoke = _node('Revoke', 'permission resource user')
+ListPermissions = _node('ListPermissions',
+                        'permission table user norecursive')
+CreateUser = _node('CreateUser', 'user password superuser')
+AlterUser = _node('AlterUser', 'user password superuser')
+CreateIndex = _node('CreateIndex', 'index table column')
+CreateKeyspace = _node('CreateKeyspace', 'keyspace properties')
+AlterKeyspace = _node('AlterKeyspace', 'keyspace properties')
+CreateTable = _node('CreateTable', 'table definitions properties')
+AlterTable = _node('AlterTable', 'table operation')
+Insert = _node('Insert', 'table columns values using')
+Select = _node('Select',
+               'selectors table where order_by limit allow_filtering')
+Delete = _node('Delete', 'columns table using where')
+Batch = _node('Batch', 'statements')
+
+
+def node_key(value):
+    """
+    An immutable, hashable key for a node, and everything in it, which is
+    equal for equal nodes.
+    """
+    if isinstance(value, Node):
+        return (value.node_type,) + tuple([node_key(getattr(value, f))
+                                           for f in value.__slots__])
+    if isinstance(value, list):
+        return tuple([node_key(v) for v in value])
+    if isinstance(value, (set, frozenset)):
+        return frozenset([node_key(v) for v in value])
+    if isinstance(value, dict):
+        return frozenset((node_key(k), node_key(v))
+                         for k, v in value.items())
+    return value
+
+
+def _term_args(value):
+    """
+    Convert the nodes in value to terms, leaving everything termMaker can
+    coerce on its own.
+    """
+    if isinstance(value, Node):
+        return to_term(value)
+    if isinstance(value, list):
+        return [_term_args(v) for v in value]
+    if isinstance(value, tuple):
+        return tuple([_term_args(v) for v in value])
+    if isinstance(value, set):
+        return set([_term_args(v) for v in value])
+    if isinstance(value, dict):
+        return dict((_term_args(k), _term_args(v))
+                    for k, v in value.items())
+    return value
+
+
+def to_term(node):
+    """
+    Convert a node, and everything in it, to the term CQL3 would have
+    returned.
+    """
+    if not isinstance(node, Node):
+        return _term_args(node)
+
+    return getattr(termMaker, type(node).__name__)(
+        *[_term_args(getattr(node, f)) for f in node.__slots__])
+
+
+def from_term(term):
+    """
+    Convert a term returned by CQL3 to the node CQL3Nodes would have
+    returned.
+
+    Terms don't distinguish an empty map from an empty set, both become {}.
+    """
+    if not isinstance(term, Term):
+        return term
+
+    name = term.tag.name
+    if term.data is not None:
+        return term.data
+    if name == 'null':
+        return None
+    if name == 'true':
+        return True
+    if name == 'false':
+        return False
+    if name == '.tuple.':
+        return [from_term(arg) for arg in term.args]
+    if name == '.bag.':
+        if not term.args or term.args[0].tag.name == '.attr.':
+            return dict((from_term(attr.args[0]), from_term(attr.args[1]))
+                        for attr in term.args)
+        return set([from_term(arg) for arg in term.args])
+
+    return _classes[name](*[from_term(arg) for arg in term.args])
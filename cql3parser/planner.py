@@ -0,0 +1,228 @@
+"""
+Planning SELECTs against a schema Catalog before they are sent, to catch the
+ones which make the cluster scan.
+
+    planner = Planner(catalog)
+    plan = planner.plan(CQL3Nodes(text).statement())
+    if plan.kind in SCANS or plan.problems:
+        ...
+
+A plan classifies how Cassandra would read the rows of a SELECT, estimates
+its cost in partitions read and lists the reasons Cassandra would reject it.
+Plans only depend on the shape of a statement, its table, the columns and
+operators of its relations, the length of its IN lists, its ORDER BY, LIMIT
+and ALLOW FILTERING, not on the values it is bound to.  So statements of the
+same shape, like every execution of a prepared statement, share a plan which
+is computed once.
+"""
+from collections import namedtuple
+
+from terml.nodes import Term
+
+from cql3parser import nodes
+from cql3parser.cache import LRUCache
+from cql3parser.nodes import from_term
+from cql3parser.schema import _name
+
+# Every partition key column is restricted by =.
+SINGLE_PARTITION = 'single_partition'
+# Every partition key column is restricted by = or IN, with at least one IN.
+MULTI_PARTITION = 'multi_partition'
+# The partition key is restricted by a range of TOKEN(...).
+TOKEN_RANGE = 'token_range'
+# A secondary index is used to find the partitions.
+INDEX_SCAN = 'index_scan'
+# Every partition is read and filtered by the relations.
+FILTERED_SCAN = 'filtered_scan'
+# Every partition is read, there are no relations.
+FULL_SCAN = 'full_scan'
+
+# The kinds of plans which read from every node of the cluster.
+SCANS = frozenset([TOKEN_RANGE, INDEX_SCAN, FILTERED_SCAN, FULL_SCAN])
+
+# How many partitions a table is assumed to have.
+DEFAULT_PARTITIONS = 1000000
+
+# The fraction of the partitions a secondary index is assumed to match.
+INDEX_SELECTIVITY = 0.01
+
+# The plan of a SELECT: its kind, the estimated number of partitions it reads,
+# how many partitions the partition key restricts it to for single and multi
+# partition plans, the IndexSchema of the secondary index it uses, whether
+# it filters rows and so needs ALLOW FILTERING, and a tuple of the reasons
+# Cassandra would reject it.
+Plan = namedtuple('Plan', 'kind cost partitions index filtering problems')
+
+
+def _relation_shape(relation):
+    lhs = relation.lhs
+    if isinstance(lhs, nodes.Token):
+        lhs = ('token',) + tuple([_name(c) for c in lhs.items])
+    else:
+        lhs = _name(lhs)
+    if relation.operator == 'in':
+        return lhs, 'in', len(relation.value)
+    return lhs, relation.operator
+
+
+def _shape(select, table):
+    """
+    The parts of a SELECT the plan of it depends on, as a hashable key.
+    """
+    order_by = select.order_by
+    if order_by is not None:
+        order_by = _name(order_by.column), order_by.direction
+    limit = select.limit
+    if limit is not None:
+        limit = limit.value
+    return (table.keyspace, table.name,
+            tuple([_relation_shape(r) for r in select.where or ()]),
+            order_by, limit, select.allow_filtering is not None)
+
+
+class Planner(object):
+    """
+    Plans SELECT statements against a Catalog, remembering the plans of the
+    most recently planned statement shapes.
+
+    :param partitions: How many partitions tables are assumed to have, for
+        estimating the cost of scans.
+    :param maxsize: The most plans to remember.
+    """
+    def __init__(self, catalog, partitions=DEFAULT_PARTITIONS, maxsize=4096):
+        self.catalog = catalog
+        self.partitions = partitions
+        self.cache = LRUCache(maxsize)
+
+    def plan(self, statement):
+        """
+        Plan a statement parsed by CQL3Nodes, or CQL3 though converting terms
+        is slower.  Statements other than SELECTs have no plan.
+
+        :returns: A Plan or None if statement isn't a SELECT.
+        :raises SchemaError: If the table or a column of the SELECT isn't in
+            the catalog.
+        """
+        if isinstance(statement, Term):
+            statement = from_term(statement)
+        if not isinstance(statement, nodes.Select):
+            return None
+
+        table = self.catalog.table(statement.table)
+        key = (self.catalog.version, _shape(statement, table))
+        plan = self.cache.get(key)
+        if plan is None:
+            plan = self._plan(statement, table)
+            self.cache.put(key, plan)
+        return plan
+
+    def _plan(self, select, table):
+        catalog = self.catalog
+        problems = []
+
+        # The relations on each column, and the relations on TOKEN(...).
+        restrictions = {}
+        tokens = []
+        for relation in select.where or ():
+            if isinstance(relation.lhs, nodes.Token):
+                if [_name(c) for c in relation.lhs.items] != (
+                        table.partition_key):
+                    problems.append(
+                        'The token function must be applied to all '
+                        'partition key components in order')
+                tokens.append(relation)
+                continue
+
+            column = catalog.column(table, relation.lhs)
+            restrictions.setdefault(column.name, []).append(relation)
+
+        # How many partitions = and IN on the partition key restrict the
+        # SELECT to, if they restrict every column.
+        restricted = True
+        partitions = 1
+        for name in table.partition_key:
+            for relation in restrictions.get(name, ()):
+                if relation.operator == '=':
+                    break
+                if relation.operator == 'in':
+                    partitions *= len(relation.value)
+                    break
+            else:
+                restricted = False
+
+            if any(r.operator not in ('=', 'in')
+                   for r in restrictions.get(name, ())):
+                problems.append(
+                    'Only EQ and IN relations are supported on the partition '
+                    'key {0} (unless you use the token() function)'.format(
+                        name))
+
+        # Clustering columns can be restricted in order, each but the last
+        # restricted one by =, anything else is filtered.
+        filtered = set()
+        gap = False
+        for name in table.clustering:
+            relations = restrictions.get(name)
+            if not relations:
+                gap = True
+                continue
+            if gap:
+                filtered.add(name)
+            if any(r.operator != '=' for r in relations):
+                gap = True
+
+        index = None
+        for name in table.column_names:
+            relations = restrictions.get(name)
+            if not relations or table.columns[name].kind != 'regular':
+                continue
+            if (index is None and name in table.indexes and
+                    any(r.operator == '=' for r in relations)):
+                index = table.indexes[name]
+            else:
+                filtered.add(name)
+
+        if tokens:
+            kind = TOKEN_RANGE
+            filtered.update(restrictions)
+        elif restricted:
+            kind = SINGLE_PARTITION if partitions == 1 else MULTI_PARTITION
+        elif index is not None:
+            kind = INDEX_SCAN
+            filtered.update(set(restrictions) - set([index.column]))
+        elif restrictions:
+            kind = FILTERED_SCAN
+            filtered.update(restrictions)
+        else:
+            kind = FULL_SCAN
+        filtering = bool(filtered)
+
+        if kind in (SINGLE_PARTITION, MULTI_PARTITION):
+            index = None
+            cost = float(partitions)
+        else:
+            partitions = None
+            cost = float(self.partitions)
+            if kind == INDEX_SCAN:
+                cost *= INDEX_SELECTIVITY
+            # Scans stop once they have LIMIT rows, unless they are thrown
+            # away by filtering.
+            if select.limit is not None and not filtering:
+                cost = min(cost, float(select.limit.value))
+
+        if select.order_by is not None:
+            if kind not in (SINGLE_PARTITION, MULTI_PARTITION):
+                problems.append(
+                    'ORDER BY is only supported when the partition key is '
+                    'restricted by an EQ or an IN')
+            if _name(select.order_by.column) not in table.clustering:
+                problems.append(
+                    'Order by is currently only supported on the clustered '
+                    'columns of the PRIMARY KEY')
+
+        if filtering and select.allow_filtering is None:
+            problems.append(
+                'Cannot execute this query as it might involve data '
+                'filtering, use ALLOW FILTERING')
+
+        return Plan(kind, cost, partitions, index, filtering, tuple(problems))
@@ -0,0 +1,157 @@
+"""
+Prepared statements, parsed once and bound to values many times.
+
+prepare parses a statement with ? or :name bind markers and works out which
+column each marker is bound to.  Binding fills the values into the canonical
+text of the statement around the markers, without parsing it again.
+"""
+from collections import namedtuple
+
+from cql3parser import nodes
+from cql3parser.formatter import to_cql, to_cql_fragments
+from cql3parser.grammar import CQL3Nodes
+from cql3parser.types import native_types
+
+# A bind marker: its position among the markers, its name for :name markers
+# and None for ?, the Column it is bound to if any and the NativeType of that
+# column if it is known.
+Variable = namedtuple('Variable', 'index name column type')
+
+_BINDINGS = (nodes.Binding, nodes.NamedBinding)
+
+
+def _column_name(column):
+    if isinstance(column.name, nodes.Node):
+        return column.name.name
+    return column.name.lower()
+
+
+def _markers(statement):
+    """
+    Yield (binding, column) for each bind marker in statement, in the order
+    they appear in its canonical text.
+    """
+    if isinstance(statement, nodes.Batch):
+        for s in statement.statements:
+            for marker in _markers(s):
+                yield marker
+
+    elif isinstance(statement, nodes.Insert):
+        for column, value in zip(statement.columns, statement.values):
+            if isinstance(value, _BINDINGS):
+                yield value, column
+
+    elif isinstance(statement, (nodes.Select, nodes.Delete)):
+        if isinstance(statement, nodes.Delete):
+            for item in statement.columns or ():
+                if isinstance(item, nodes.CollectionItem) and isinstance(
+                        item.key, _BINDINGS):
+                    yield item.key, None
+
+        for relation in statement.where or ():
+            column = relation.lhs
+            if not isinstance(column, nodes.Column):
+                column = None
+
+            if relation.operator == 'in':
+                values = relation.value
+            else:
+                values = [relation.value]
+
+            for value in values:
+                if isinstance(value, _BINDINGS):
+                    yield value, column
+
+
+def _variables(statement, types):
+    variables = []
+    for index, (binding, column) in enumerate(_markers(statement)):
+        name = getattr(binding, 'name', None)
+
+        type = None
+        if column is not None:
+            keyword = types.get(_column_name(column))
+            if keyword is not None:
+                if keyword.upper() not in native_types:
+                    raise ValueError(
+                        '{0!r}, the type of {1}, is not a native type'
+                        .format(keyword, to_cql(column)))
+                keyword = keyword.upper()
+                type = nodes.NativeType(keyword, native_types[keyword])
+
+        variables.append(Variable(index, name, column, type))
+    return variables
+
+
+class PreparedStatement(object):
+    """
+    A statement with bind markers, see prepare.
+
+    :ivar statement: The statement as parsed by CQL3Nodes.
+    :ivar variables: A Variable for each bind marker in order.
+    :ivar text: The canonical text of the statement.
+    """
+    def __init__(self, statement, types=None):
+        self.statement = statement
+        self.variables = tuple(_variables(statement, types or {}))
+        self.text = to_cql(statement)
+
+        self._fragments = to_cql_fragments(statement)
+        if len(self._fragments) != 2 * len(self.variables) + 1:
+            raise ValueError(
+                'Bind markers in {0!r} are only supported as values'.format(
+                    self.text))
+
+        names = set(v.name for v in self.variables)
+        if None in names and len(names) > 1:
+            raise ValueError("Can't mix ? and :name bind markers")
+
+        self._named = None not in names
+
+    def __repr__(self):
+        return 'PreparedStatement({0!r})'.format(self.text)
+
+    def bind(self, values):
+        """
+        Return the text of the statement with values in place of its bind
+        markers.
+
+        :param values: A sequence with a value for each marker in order, or
+            for :name markers a mapping of names to values.  Values are
+            anything the grammar returns for literals, a Binding leaves the
+            marker in place.
+        :raises ValueError: If a marker doesn't have a value.
+        """
+        fragments = self._fragments[:]
+        fragments[1::2] = [to_cql(value) for value in self.ordered(values)]
+        return ''.join(fragments)
+
+    def ordered(self, values):
+        """
+        Return values as a sequence with a value for each marker in order,
+        see bind.
+        """
+        if hasattr(values, 'keys'):
+            if not self._named:
+                raise ValueError('Only :name markers can be bound by name')
+            try:
+                values = [values[v.name] for v in self.variables]
+            except KeyError as e:
+                raise ValueError('No value for :{0}'.format(e.args[0]))
+
+        if len(values) != len(self.variables):
+            raise ValueError('Expected {0} values, got {1}'.format(
+                len(self.variables), len(values)))
+
+        return values
+
+
+def prepare(text, types=None):
+    """
+    Parse a statement with bind markers into a PreparedStatement.
+
+    :param types: A mapping of column names to native type keywords, like
+        {'id': 'uuid'}, used to type the variables bound to those columns.
+    :raises ValueError: If a type in types isn't a native type keyword.
+    """
+    return PreparedStatement(CQL3Nodes(text).statement(), types)
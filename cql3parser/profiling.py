@@ -0,0 +1,198 @@
+"""
+Profiling the grammar: how often each rule is applied, how often it fails,
+how long it takes and how much text it consumes.
+
+Python profilers only see the generic frames of the parsley runtime, a
+parser made with profiling_parser records these per rule in a Profile
+instead.  A Profile prints as a table and can be loaded by pstats:
+
+    profile = Profile()
+    parser = profiling_parser(profile)
+    parser(text).statement()
+    print(profile.table())
+    pstats.Stats(profile).sort_stats('tottime').print_stats(10)
+"""
+import marshal
+import re
+import timeit
+
+from ometa.runtime import ParseError
+
+from cql3parser.grammar import (
+    GRAMMAR_PATH, TokenGrammarBase, _load, _read_grammar, bindings)
+
+_rule_definition = re.compile(r'^(\w+)\s*=', re.MULTILINE)
+
+_timer = timeit.default_timer
+
+
+class RuleStats(object):
+    """
+    The statistics of one rule.
+
+    :ivar calls: How many times the rule was applied.
+    :ivar failures: How many of those failed, making the caller backtrack.
+    :ivar tottime: Seconds spent in the rule, not counting other rules.
+    :ivar cumtime: Seconds spent in the rule including the rules it applied,
+        counting recursive applications once.
+    :ivar consumed: Characters of text matched by successful applications.
+    :ivar callers: How many times each other rule applied this one.
+    """
+    __slots__ = ('calls', 'failures', 'tottime', 'cumtime', 'consumed',
+                 'callers', 'location')
+
+    def __init__(self, location):
+        self.calls = self.failures = self.consumed = 0
+        self.tottime = self.cumtime = 0.0
+        self.callers = {}
+        self.location = location
+
+    def __repr__(self):
+        return ('<RuleStats calls={0} failures={1} tottime={2:.6f} '
+                'cumtime={3:.6f} consumed={4}>'.format(
+                    self.calls, self.failures, self.tottime, self.cumtime,
+                    self.consumed))
+
+
+def _grammar_lines():
+    """
+    The line each rule of cql3.parsley is defined on.
+    """
+    source = _read_grammar()
+    lines = {}
+    for m in _rule_definition.finditer(source):
+        lines.setdefault(m.group(1), source.count('\n', 0, m.start()) + 1)
+    return lines
+
+
+class Profile(object):
+    """
+    Statistics for each rule applied by the parsers profiling into it.
+
+    :ivar rules: A mapping of rule names to RuleStats.
+    """
+    def __init__(self):
+        self.rules = {}
+        self._lines = None
+
+    def __repr__(self):
+        return '<Profile of {0} rules>'.format(len(self.rules))
+
+    def clear(self):
+        self.rules.clear()
+
+    def _location(self, rule, name):
+        """
+        Where a rule is defined, as a pstats (file, line, name) key: the line
+        in cql3.parsley or for rules written in python their function.
+        """
+        if self._lines is None:
+            self._lines = _grammar_lines()
+        if name in self._lines:
+            return GRAMMAR_PATH, self._lines[name], name
+
+        code = getattr(rule, 'func_code', None) or rule.__code__
+        return code.co_filename, code.co_firstlineno, name
+
+    def table(self, sort='tottime', limit=None):
+        """
+        Format the statistics as a table, one rule per row.
+
+        :param sort: The RuleStats attribute to sort by, largest first.
+        :param limit: The most rules to include.
+        """
+        rules = sorted(self.rules.items(),
+                       key=lambda item: getattr(item[1], sort), reverse=True)
+        rows = ['{0:24}{1:>10}{2:>10}{3:>12}{4:>12}{5:>10}'.format(
+            'rule', 'calls', 'failures', 'tottime', 'cumtime', 'consumed')]
+        for name, stats in rules[:limit]:
+            rows.append('{0:24}{1:10}{2:10}{3:12.6f}{4:12.6f}{5:10}'.format(
+                name, stats.calls, stats.failures, stats.tottime,
+                stats.cumtime, stats.consumed))
+        return '\n'.join(rows)
+
+    def create_stats(self):
+        """
+        Fill in self.stats in the format of cProfile, so pstats.Stats can
+        load this profile.
+        """
+        self.stats = {}
+        for stats in self.rules.values():
+            callers = dict(
+                (self.rules[caller].location, count)
+                for caller, count in stats.callers.items())
+            self.stats[stats.location] = (
+                stats.calls, stats.calls, stats.tottime, stats.cumtime,
+                callers)
+
+    def dump_stats(self, path):
+        """
+        Write the profile to a file, which pstats.Stats(path) can read.
+        """
+        self.create_stats()
+        with open(path, 'wb') as f:
+            marshal.dump(self.stats, f)
+
+
+class ProfilingGrammarBase(TokenGrammarBase):
+    """
+    TokenGrammarBase recording the statistics of every rule application in
+    its profile.
+    """
+    profile = None
+
+    def __init__(self, *args, **kwargs):
+        TokenGrammarBase.__init__(self, *args, **kwargs)
+        # For each rule being applied, its name and the time spent in the
+        # rules it applied, and how many applications of each are active.
+        self._stack = []
+        self._active = {}
+
+    def _apply(self, rule, ruleName, args):
+        stats = self.profile.rules.get(ruleName)
+        if stats is None:
+            stats = self.profile.rules[ruleName] = RuleStats(
+                self.profile._location(rule, ruleName))
+
+        stack = self._stack
+        if stack:
+            caller = stack[-1][0]
+            stats.callers[caller] = stats.callers.get(caller, 0) + 1
+
+        active = self._active
+        active[ruleName] = active.get(ruleName, 0) + 1
+        stack.append([ruleName, 0.0])
+        start = self.input.position
+        began = _timer()
+        try:
+            result = TokenGrammarBase._apply(self, rule, ruleName, args)
+        except ParseError:
+            stats.failures += 1
+            raise
+        else:
+            end = self.input.position
+            if end > start:
+                tokens = self.input.data
+                stats.consumed += tokens[end - 1].end - tokens[start].start
+            return result
+        finally:
+            elapsed = _timer() - began
+            stats.calls += 1
+            stats.tottime += elapsed - stack.pop()[1]
+            if stack:
+                stack[-1][1] += elapsed
+
+            active[ruleName] -= 1
+            if not active[ruleName]:
+                stats.cumtime += elapsed
+
+
+def profiling_parser(profile, bindings=bindings):
+    """
+    Make a parser like CQL3, or CQL3Nodes given node_bindings, recording
+    the statistics of every rule it applies in profile.  Profiling makes
+    parsing about a third slower, parse with CQL3 when not profiling.
+    """
+    base = type('ProfilingGrammarBase', (ProfilingGrammarBase,),
+                {'profile': profile})
+    return _load(bindings, base)
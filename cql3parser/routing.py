@@ -0,0 +1,474 @@
+"""
+Token aware routing: the Murmur3Partitioner tokens of the partitions a
+statement writes or reads, worked out from the statement and a schema
+Catalog without asking the cluster.
+
+    tokens = statement_tokens(CQL3Nodes(text).statement(), catalog)
+    groups = group_by_range(statements, catalog, ring)
+
+Partition key values are serialized like Cassandra serializes them with the
+marshal type of their column, see types.native_types, and hashed with
+Cassandra's variant of MurmurHash3.  Hashing many keys at once with
+murmur3_many, or key_tokens for single column keys, is vectorized with numpy
+when it is installed.
+"""
+import binascii
+import datetime
+import decimal
+import itertools
+import socket
+import struct
+
+from bisect import bisect_left
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from terml.nodes import Term
+
+from cql3parser import nodes
+from cql3parser.nodes import from_term
+from cql3parser.schema import _name
+from cql3parser.types import _type
+
+MIN_TOKEN = -2 ** 63
+MAX_TOKEN = 2 ** 63 - 1
+
+_MASK = 2 ** 64 - 1
+_C1 = 0x87c37b91114253d5
+_C2 = 0x4cf5ad432745937f
+_F1 = 0xff51afd7ed558ccd
+_F2 = 0xc4ceb9fe1a85ec53
+
+_BINDINGS = (nodes.Binding, nodes.NamedBinding)
+
+# What serializers raise for values which aren't valid for their type.
+_invalid = (TypeError, ValueError, AttributeError, OverflowError,
+            struct.error, socket.error, decimal.InvalidOperation)
+
+
+class RoutingError(ValueError):
+    """
+    The partition key of a statement can't be worked out or serialized.
+    """
+
+
+# Serializing
+
+def _text(encoding):
+    def serialize(value):
+        if isinstance(value, bytes):
+            return value
+        return value.encode(encoding)
+    return serialize
+
+
+# The python types of blob values, on python 2 buffers too.
+try:
+    _blob_types = (bytes, bytearray, memoryview, buffer)
+except NameError:
+    _blob_types = (bytes, bytearray, memoryview)
+
+
+def _blob(value):
+    if not isinstance(value, _blob_types):
+        raise TypeError('{0!r} is not a byte string'.format(value))
+    if isinstance(value, memoryview):
+        return value.tobytes()
+    return bytes(value)
+
+
+def _boolean(value):
+    return b'\x01' if value else b'\x00'
+
+
+def _varint(value):
+    size = (value if value >= 0 else ~value).bit_length() // 8 + 1
+    return binascii.unhexlify('{0:0{1}x}'.format(
+        value % (1 << (8 * size)), 2 * size))
+
+
+def _decimal(value):
+    if isinstance(value, float):
+        value = repr(value)
+    sign, digits, exponent = decimal.Decimal(value).as_tuple()
+    unscaled = int(''.join(map(str, digits)))
+    if sign:
+        unscaled = -unscaled
+    return struct.pack('>i', -exponent) + _varint(unscaled)
+
+
+_epoch = datetime.datetime(1970, 1, 1)
+
+
+def _timestamp(value):
+    if isinstance(value, datetime.datetime):
+        if value.tzinfo is not None:
+            value = value.replace(tzinfo=None) - value.utcoffset()
+        delta = value - _epoch
+        value = (delta.days * 86400 + delta.seconds) * 1000 + (
+            delta.microseconds // 1000)
+    return struct.pack('>q', value)
+
+
+def _uuid(value):
+    return value.bytes
+
+
+def _inet(value):
+    family = socket.AF_INET6 if ':' in value else socket.AF_INET
+    return socket.inet_pton(family, value)
+
+
+# A function serializing values of each marshal type to bytes.
+serializers = {
+    _type('AsciiType'): _text('ascii'),
+    _type('LongType'): struct.Struct('>q').pack,
+    _type('BytesType'): _blob,
+    _type('BooleanType'): _boolean,
+    _type('CounterColumnType'): struct.Struct('>q').pack,
+    _type('DecimalType'): _decimal,
+    _type('DoubleType'): struct.Struct('>d').pack,
+    _type('FloatType'): struct.Struct('>f').pack,
+    _type('InetAddressType'): _inet,
+    _type('Int32Type'): struct.Struct('>i').pack,
+    _type('UTF8Type'): _text('utf-8'),
+    _type('DateType'): _timestamp,
+    _type('UUIDType'): _uuid,
+    _type('IntegerType'): _varint,
+    _type('TimeUUIDType'): _uuid,
+}
+
+
+def _serializer(type):
+    if isinstance(type, nodes.NativeType):
+        return serializers[type.java_type]
+    raise RoutingError(
+        "Can't serialize partition key values of type {0!r}".format(type))
+
+
+def serialize(type, value):
+    """
+    Serialize a value of a column of the given NativeType like Cassandra.
+    """
+    try:
+        return _serializer(type)(value)
+    except _invalid as e:
+        raise RoutingError('Invalid {0} value {1!r}: {2}'.format(
+            type.name, value, e))
+
+
+def routing_key(components):
+    """
+    The partition key bytes of serialized partition key components, composite
+    keys are each component prefixed by its length and followed by a 0.
+    """
+    if len(components) == 1:
+        return components[0]
+    return b''.join(
+        struct.pack('>H', len(c)) + c + b'\x00' for c in components)
+
+
+# Hashing
+
+def _rotl(x, r):
+    return ((x << r) | (x >> (64 - r))) & _MASK
+
+
+def _fmix(k):
+    k ^= k >> 33
+    k = (k * _F1) & _MASK
+    k ^= k >> 33
+    k = (k * _F2) & _MASK
+    k ^= k >> 33
+    return k
+
+
+def murmur3(key):
+    """
+    The Murmur3Partitioner token of a partition key, the first 64 bits of
+    MurmurHash3_x64_128 as Cassandra computes it.  Unlike the reference
+    implementation Cassandra sign extends the bytes of the tail, and the
+    token of an empty key is the minimum token.
+    """
+    length = len(key)
+    if not length:
+        return MIN_TOKEN
+    nblocks = length >> 4
+    h1 = h2 = 0
+
+    blocks = struct.unpack_from('<{0}Q'.format(nblocks * 2), key)
+    for i in range(0, nblocks * 2, 2):
+        k1 = _rotl((blocks[i] * _C1) & _MASK, 31)
+        h1 ^= (k1 * _C2) & _MASK
+        h1 = (_rotl(h1, 27) + h2) & _MASK
+        h1 = (h1 * 5 + 0x52dce729) & _MASK
+
+        k2 = _rotl((blocks[i + 1] * _C2) & _MASK, 33)
+        h2 ^= (k2 * _C1) & _MASK
+        h2 = (_rotl(h2, 31) + h1) & _MASK
+        h2 = (h2 * 5 + 0x38495ab5) & _MASK
+
+    tail = struct.unpack_from('{0}b'.format(length & 15), key, nblocks * 16)
+    if len(tail) > 8:
+        k2 = 0
+        for shift, byte in enumerate(tail[8:]):
+            k2 ^= (byte << (8 * shift)) & _MASK
+        k2 = _rotl((k2 * _C2) & _MASK, 33)
+        h2 ^= (k2 * _C1) & _MASK
+    if tail:
+        k1 = 0
+        for shift, byte in enumerate(tail[:8]):
+            k1 ^= (byte << (8 * shift)) & _MASK
+        k1 = _rotl((k1 * _C1) & _MASK, 31)
+        h1 ^= (k1 * _C2) & _MASK
+
+    h1 ^= length
+    h2 ^= length
+    h1 = (h1 + h2) & _MASK
+    h2 = (h2 + h1) & _MASK
+    h1 = (_fmix(h1) + _fmix(h2)) & _MASK
+
+    if h1 > MAX_TOKEN:
+        h1 -= 1 << 64
+    # Cassandra never uses the minimum token for a key which isn't empty.
+    return MAX_TOKEN if h1 == MIN_TOKEN else int(h1)
+
+
+if numpy is not None:
+    _u64 = numpy.uint64
+
+    def _numpy_rotl(x, r):
+        return (x << _u64(r)) | (x >> _u64(64 - r))
+
+    def _numpy_fmix(k):
+        k ^= k >> _u64(33)
+        k *= _u64(_F1)
+        k ^= k >> _u64(33)
+        k *= _u64(_F2)
+        k ^= k >> _u64(33)
+        return k
+
+    def _numpy_tail(tail):
+        """
+        Xor the sign extended bytes of the columns of tail into one uint64
+        for each row, the first column in the low byte.
+        """
+        k = numpy.zeros(len(tail), numpy.uint64)
+        signed = tail.view(numpy.int8).astype(numpy.int64).view(numpy.uint64)
+        for shift in range(tail.shape[1]):
+            k ^= signed[:, shift] << _u64(8 * shift)
+        return k
+
+
+def _murmur3_rows(rows):
+    """
+    The tokens of the keys in the rows of a 2d uint8 array, as int64s.
+    """
+    if not rows.shape[1]:
+        return numpy.full(rows.shape[0], MIN_TOKEN, numpy.int64)
+    count, length = rows.shape
+    nblocks = length >> 4
+    h1 = numpy.zeros(count, numpy.uint64)
+    h2 = numpy.zeros(count, numpy.uint64)
+
+    blocks = numpy.ascontiguousarray(rows[:, :nblocks * 16]).view(
+        numpy.dtype('<u8')).astype(numpy.uint64)
+    for i in range(0, nblocks * 2, 2):
+        k1 = _numpy_rotl(blocks[:, i] * _u64(_C1), 31)
+        h1 ^= k1 * _u64(_C2)
+        h1 = _numpy_rotl(h1, 27) + h2
+        h1 = h1 * _u64(5) + _u64(0x52dce729)
+
+        k2 = _numpy_rotl(blocks[:, i + 1] * _u64(_C2), 33)
+        h2 ^= k2 * _u64(_C1)
+        h2 = _numpy_rotl(h2, 31) + h1
+        h2 = h2 * _u64(5) + _u64(0x38495ab5)
+
+    tail = rows[:, nblocks * 16:]
+    if tail.shape[1] > 8:
+        k2 = _numpy_rotl(_numpy_tail(tail[:, 8:]) * _u64(_C2), 33)
+        h2 ^= k2 * _u64(_C1)
+    if tail.shape[1]:
+        k1 = _numpy_rotl(_numpy_tail(tail[:, :8]) * _u64(_C1), 31)
+        h1 ^= k1 * _u64(_C2)
+
+    h1 ^= _u64(length)
+    h2 ^= _u64(length)
+    h1 += h2
+    h2 += h1
+    tokens = (_numpy_fmix(h1) + _numpy_fmix(h2)).view(numpy.int64)
+    tokens[tokens == MIN_TOKEN] = MAX_TOKEN
+    return tokens
+
+
+def murmur3_many(keys):
+    """
+    The tokens of a sequence of partition keys, as a numpy int64 array if
+    numpy is installed and a list otherwise.  With numpy keys of the same
+    length are hashed together.
+    """
+    if numpy is None:
+        return [murmur3(key) for key in keys]
+
+    lengths = numpy.fromiter(map(len, keys), numpy.int64, len(keys))
+    data = numpy.frombuffer(b''.join(keys), numpy.uint8)
+    tokens = numpy.empty(len(keys), numpy.int64)
+    if not len(keys):
+        return tokens
+
+    if (lengths == lengths[0]).all():
+        tokens[:] = _murmur3_rows(data.reshape(len(keys), lengths[0]))
+        return tokens
+
+    starts = numpy.cumsum(lengths) - lengths
+    for length in numpy.unique(lengths):
+        which = numpy.flatnonzero(lengths == length)
+        rows = data[starts[which, None] + numpy.arange(length)]
+        tokens[which] = _murmur3_rows(rows)
+    return tokens
+
+
+# Fixed width marshal types, values of which numpy can serialize at once,
+# and the python types of the values it serializes like struct does.
+_numpy_types = {
+    _type('LongType'): ('>i8', (int,)),
+    _type('CounterColumnType'): ('>i8', (int,)),
+    _type('Int32Type'): ('>i4', (int,)),
+    _type('DoubleType'): ('>f8', (int, float)),
+}
+
+
+def key_tokens(type, values):
+    """
+    The tokens of partition keys of a single column of the given NativeType,
+    as murmur3_many returns them.  Integer and float keys are serialized
+    with numpy when it is installed.
+    """
+    if (numpy is not None and isinstance(type, nodes.NativeType) and
+            type.java_type in _numpy_types):
+        dtype, types = _numpy_types[type.java_type]
+        if set(value.__class__ for value in values) <= set(types):
+            dtype = numpy.dtype(dtype)
+            try:
+                array = numpy.array(values, dtype.newbyteorder('='))
+            except OverflowError as e:
+                raise RoutingError('Invalid {0} values: {1}'.format(
+                    type.name, e))
+            if dtype.kind == 'i' and (array != values).any():
+                raise RoutingError('Invalid {0} values: out of range'.format(
+                    type.name))
+            return _murmur3_rows(array.astype(dtype).view(numpy.uint8).reshape(
+                len(array), dtype.itemsize))
+
+    return murmur3_many([serialize(type, value) for value in values])
+
+
+# Statements
+
+def partition_keys(statement, catalog):
+    """
+    The partition key values of each partition an INSERT writes, or a DELETE
+    or SELECT restricts with = and IN relations, as tuples in partition key
+    order.
+
+    :raises RoutingError: If a partition key column isn't restricted to
+        literal values.
+    :raises SchemaError: If the table isn't in catalog.
+    """
+    if isinstance(statement, Term):
+        statement = from_term(statement)
+
+    choices = {}
+    if isinstance(statement, nodes.Insert):
+        for column, value in zip(statement.columns, statement.values):
+            choices[_name(column)] = [value]
+    elif isinstance(statement, (nodes.Delete, nodes.Select)):
+        for relation in statement.where or ():
+            if not isinstance(relation.lhs, nodes.Column):
+                continue
+            if relation.operator == '=':
+                choices[_name(relation.lhs)] = [relation.value]
+            elif relation.operator == 'in':
+                choices[_name(relation.lhs)] = relation.value
+    else:
+        raise RoutingError("Can't route {0} statements".format(
+            type(statement).__name__))
+
+    columns = []
+    for name in catalog.table(statement.table).partition_key:
+        if name not in choices:
+            raise RoutingError(
+                'Partition key column {0} is not restricted'.format(name))
+        if any(isinstance(value, _BINDINGS) for value in choices[name]):
+            raise RoutingError(
+                'Partition key column {0} is bound by a marker'.format(name))
+        columns.append(choices[name])
+    return list(itertools.product(*columns))
+
+
+def statement_keys(statement, catalog):
+    """
+    The serialized partition key of each partition of a statement, see
+    partition_keys.
+    """
+    if isinstance(statement, Term):
+        statement = from_term(statement)
+    partitions = partition_keys(statement, catalog)
+    table = catalog.table(statement.table)
+    serializers = [_serializer(table.columns[name].type)
+                   for name in table.partition_key]
+    keys = []
+    for values in partitions:
+        try:
+            keys.append(routing_key(
+                [s(v) for s, v in zip(serializers, values)]))
+        except _invalid as e:
+            raise RoutingError('Invalid partition key {0!r}: {1}'.format(
+                values, e))
+    return keys
+
+
+def statement_tokens(statement, catalog):
+    """
+    The token of each partition of a statement, see partition_keys.
+    """
+    return [murmur3(key) for key in statement_keys(statement, catalog)]
+
+
+def token_range(token, ring):
+    """
+    The token of the node of a ring owning a token, a node owns the tokens
+    after the token of the node before it up to and including its own.
+
+    :param ring: The sorted tokens of the nodes.
+    """
+    return ring[bisect_left(ring, token) % len(ring)]
+
+
+def group_by_range(statements, catalog, ring):
+    """
+    Group statements by the node of the ring owning the first partition they
+    write or read, returning a dict of node tokens to lists of statements in
+    their original order.  Tokens are hashed together with murmur3_many.
+
+    :param ring: The sorted tokens of the nodes.
+    """
+    statements = [from_term(s) if isinstance(s, Term) else s
+                  for s in statements]
+    keys = [statement_keys(s, catalog)[0] for s in statements]
+    tokens = murmur3_many(keys)
+
+    if numpy is not None:
+        ring_array = numpy.array(ring, numpy.int64)
+        owners = ring_array[numpy.searchsorted(ring_array, tokens) %
+                            len(ring)].tolist()
+    else:
+        owners = [token_range(token, ring) for token in tokens]
+
+    groups = {}
+    for owner, statement in zip(owners, statements):
+        groups.setdefault(owner, []).append(statement)
+    return groups
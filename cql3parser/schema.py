@@ -0,0 +1,462 @@
+"""
+A schema catalog built by applying DDL statements in order.
+
+    catalog = Catalog()
+    for statement in iter_statements(migrations):
+        catalog.apply(statement)
+    catalog.column(CQL3Nodes('ks.users').table(), 'email')
+
+Keyspaces, tables, columns and indexes are kept in dicts keyed by name, and
+each table keeps its secondary indexes keyed by column, so resolving a name
+in a query against the catalog is a hash lookup whatever the schema's size.
+Statements are the results of CQL3 or CQL3Nodes, statements which don't
+change the schema are ignored.
+"""
+from collections import namedtuple
+
+from terml.nodes import Term
+
+from cql3parser import nodes
+from cql3parser.nodes import from_term
+
+# A column of a table: its name, its type as the grammar returns it, a
+# NativeType, a CollectionType or the class name of a custom type, and its
+# kind, 'partition_key', 'clustering' or 'regular'.
+ColumnSchema = namedtuple('ColumnSchema', 'name type kind')
+
+# A secondary index on a column of a table.
+IndexSchema = namedtuple('IndexSchema', 'name keyspace table column')
+
+
+class SchemaError(ValueError):
+    """
+    A statement can't be applied to the catalog, or a name isn't in it.
+    """
+
+
+def _name(value):
+    """
+    The name of a Keyspace, Table, Index, Column or Property, as used by the
+    catalog.  Unquoted names are lower case, unreserved keywords too.
+    """
+    if isinstance(value, (nodes.Identifier, nodes.QuotedName)):
+        return value.name
+    if isinstance(value, nodes.Node):
+        return _name(value.name)
+    return value.lower()
+
+
+def _properties(properties):
+    """
+    The plain properties of a Properties node as a dict.
+    """
+    return dict((_name(p.name), p.value) for p in properties.properties
+                if isinstance(p, nodes.Property))
+
+
+class KeyspaceSchema(object):
+    """
+    A keyspace in a Catalog.
+
+    :ivar properties: The properties of the keyspace by name.
+    :ivar tables: The TableSchema of each table by name.
+    :ivar indexes: The IndexSchema of each index by name, index names are
+        unique within a keyspace.
+    """
+    __slots__ = ('name', 'properties', 'tables', 'indexes')
+
+    def __init__(self, name, properties):
+        self.name = name
+        self.properties = properties
+        self.tables = {}
+        self.indexes = {}
+
+    def __repr__(self):
+        return '<KeyspaceSchema {0} of {1} tables>'.format(
+            self.name, len(self.tables))
+
+
+class TableSchema(object):
+    """
+    A table in a Catalog.
+
+    :ivar columns: The ColumnSchema of each column by name.
+    :ivar column_names: The names of the columns in the order they were
+        defined.
+    :ivar partition_key: The names of the partition key columns in order.
+    :ivar clustering: The names of the clustering columns in order.
+    :ivar properties: The properties of the table by name.
+    :ivar compact_storage: Whether the table was created WITH COMPACT
+        STORAGE.
+    :ivar clustering_order: 'ASC' or 'DESC' for each clustering column with
+        a CLUSTERING ORDER.
+    :ivar indexes: The IndexSchema of each indexed column by column name.
+    """
+    __slots__ = ('keyspace', 'name', 'columns', 'column_names',
+                 'partition_key', 'clustering', 'properties',
+                 'compact_storage', 'clustering_order', 'indexes')
+
+    def __init__(self, keyspace, name):
+        self.keyspace = keyspace
+        self.name = name
+        self.columns = {}
+        self.column_names = []
+        self.partition_key = []
+        self.clustering = []
+        self.properties = {}
+        self.compact_storage = False
+        self.clustering_order = {}
+        self.indexes = {}
+
+    def __repr__(self):
+        return '<TableSchema {0}.{1} of {2} columns>'.format(
+            self.keyspace, self.name, len(self.columns))
+
+    @property
+    def primary_key(self):
+        """
+        The names of the partition key and clustering columns in order.
+        """
+        return self.partition_key + self.clustering
+
+
+class Catalog(object):
+    """
+    The schema made by the DDL statements applied to it, see apply.
+
+    :ivar keyspaces: The KeyspaceSchema of each keyspace by name.
+    :ivar keyspace: The name of the keyspace of the last USE, which tables
+        without a keyspace are in.
+    :ivar version: How many statements have changed the schema, anything
+        derived from the catalog is stale once it changes.
+    """
+    def __init__(self):
+        self.keyspaces = {}
+        self.keyspace = None
+        self.version = 0
+
+    def __repr__(self):
+        return '<Catalog of {0} keyspaces>'.format(len(self.keyspaces))
+
+    def apply(self, statement):
+        """
+        Apply a statement to the schema.  USE, CREATE, ALTER and DROP of
+        keyspaces, tables and indexes change it, TRUNCATE checks its table
+        exists and other statements are ignored.
+
+        :raises SchemaError: If the statement isn't valid for the schema, the
+            catalog isn't changed.
+        """
+        if isinstance(statement, Term):
+            statement = from_term(statement)
+
+        apply = self._statements.get(type(statement))
+        if apply is not None:
+            apply(self, statement)
+            if type(statement) not in self._unchanged:
+                self.version += 1
+
+    def apply_all(self, statements):
+        """
+        Apply each of statements in order.
+        """
+        apply = self.apply
+        for statement in statements:
+            apply(statement)
+
+    # Lookups
+
+    def get_keyspace(self, keyspace=None):
+        """
+        The KeyspaceSchema of a Keyspace or keyspace name, by default the
+        keyspace of the last USE.
+
+        :raises SchemaError: If there's no such keyspace.
+        """
+        if keyspace is None:
+            keyspace = self.keyspace
+            if keyspace is None:
+                raise SchemaError('No keyspace has been specified')
+        elif isinstance(keyspace, nodes.Node):
+            keyspace = _name(keyspace)
+
+        try:
+            return self.keyspaces[keyspace]
+        except KeyError:
+            raise SchemaError('Keyspace {0} does not exist'.format(keyspace))
+
+    def table(self, table, keyspace=None):
+        """
+        The TableSchema of a Table, or of a table name in keyspace.  Tables
+        without a keyspace are in the keyspace of the last USE.
+
+        :raises SchemaError: If there's no such table.
+        """
+        if isinstance(table, TableSchema):
+            return table
+        if isinstance(table, nodes.Table):
+            if table.keyspace is not None:
+                keyspace = table.keyspace
+            table = _name(table)
+
+        tables = self.get_keyspace(keyspace).tables
+        try:
+            return tables[table]
+        except KeyError:
+            raise SchemaError('Table {0} does not exist'.format(table))
+
+    def column(self, table, column, keyspace=None):
+        """
+        The ColumnSchema of a Column, or column name, of a table as found by
+        Catalog.table.
+
+        :raises SchemaError: If there's no such table or column.
+        """
+        table = self.table(table, keyspace)
+        if isinstance(column, nodes.Node):
+            column = _name(column)
+
+        try:
+            return table.columns[column]
+        except KeyError:
+            raise SchemaError('Column {0} does not exist in {1}'.format(
+                column, table.name))
+
+    def index(self, table, column, keyspace=None):
+        """
+        The IndexSchema of the secondary index on a column of a table as
+        found by Catalog.table, or None if it isn't indexed.
+
+        :raises SchemaError: If there's no such table.
+        """
+        table = self.table(table, keyspace)
+        if isinstance(column, nodes.Node):
+            column = _name(column)
+        return table.indexes.get(column)
+
+    # Statements
+
+    def _use(self, statement):
+        self.keyspace = self.get_keyspace(statement.keyspace).name
+
+    def _create_keyspace(self, statement):
+        name = _name(statement.keyspace)
+        if name in self.keyspaces:
+            raise SchemaError(
+                'Cannot add existing keyspace {0}'.format(name))
+        self.keyspaces[name] = KeyspaceSchema(
+            name, _properties(statement.properties))
+
+    def _alter_keyspace(self, statement):
+        keyspace = self.get_keyspace(statement.keyspace)
+        keyspace.properties.update(_properties(statement.properties))
+
+    def _create_table(self, statement):
+        table = statement.table
+        keyspace = self.get_keyspace(table.keyspace)
+        name = _name(table)
+        if name in keyspace.tables:
+            raise SchemaError('Cannot add already existing table {0}'.format(
+                name))
+
+        schema = TableSchema(keyspace.name, name)
+        types = {}
+        primary_keys = []
+        for definition in statement.definitions:
+            if isinstance(definition, nodes.PrimaryKey):
+                primary_keys.append(
+                    ([_name(c) for c in definition.partition_key],
+                     [_name(c) for c in definition.clustering]))
+                continue
+
+            column = _name(definition.column)
+            if column in types:
+                raise SchemaError('Multiple definition of {0}'.format(
+                    column))
+            types[column] = definition.type
+            schema.column_names.append(column)
+            if definition.primary_key:
+                primary_keys.append(([column], []))
+
+        if len(primary_keys) != 1:
+            raise SchemaError('{0} PRIMARY KEY specified for {1}'.format(
+                'Multiple' if primary_keys else 'No', name))
+        schema.partition_key, schema.clustering = primary_keys[0]
+
+        kinds = dict.fromkeys(schema.column_names, 'regular')
+        for kind, columns in (('partition_key', schema.partition_key),
+                              ('clustering', schema.clustering)):
+            for column in columns:
+                if column not in types:
+                    raise SchemaError(
+                        'Unknown definition {0} referenced in PRIMARY '
+                        'KEY'.format(column))
+                kinds[column] = kind
+
+        for column in schema.column_names:
+            schema.columns[column] = ColumnSchema(
+                column, types[column], kinds[column])
+
+        if statement.properties is not None:
+            for p in statement.properties.properties:
+                if isinstance(p, nodes.CompactStorage):
+                    schema.compact_storage = True
+                elif isinstance(p, nodes.ClusteringOrder):
+                    for order in p.columns:
+                        column = _name(order.column)
+                        if kinds.get(column) != 'clustering':
+                            raise SchemaError(
+                                'Missing CLUSTERING ORDER for column '
+                                '{0}'.format(column))
+                        schema.clustering_order[column] = order.direction
+            schema.properties = _properties(statement.properties)
+
+        keyspace.tables[name] = schema
+
+    def _alter_table(self, statement):
+        table = self.table(statement.table)
+        operation = statement.operation
+        apply = self._operations[type(operation)]
+        apply(self, table, operation)
+
+    def _alter_type(self, table, operation):
+        column = self.column(table, operation.column)
+        table.columns[column.name] = column._replace(type=operation.type)
+
+    def _add_column(self, table, operation):
+        name = _name(operation.column)
+        if name in table.columns:
+            raise SchemaError(
+                'Invalid column name {0} because it conflicts with an '
+                'existing column'.format(name))
+        table.columns[name] = ColumnSchema(name, operation.type, 'regular')
+        table.column_names.append(name)
+
+    def _drop_column(self, table, operation):
+        column = self.column(table, operation.column)
+        if column.kind != 'regular':
+            raise SchemaError('Cannot drop PRIMARY KEY part {0}'.format(
+                column.name))
+
+        del table.columns[column.name]
+        table.column_names.remove(column.name)
+        index = table.indexes.pop(column.name, None)
+        if index is not None:
+            del self.keyspaces[table.keyspace].indexes[index.name]
+
+    def _rename(self, table, operation):
+        renames = []
+        renamed = set()
+        new_names = set()
+        for rename in operation.columns:
+            column = self.column(table, rename.column)
+            new_name = _name(rename.new_name)
+            if column.kind == 'regular':
+                raise SchemaError(
+                    'Cannot rename non PRIMARY KEY part {0}'.format(
+                        column.name))
+            if column.name in renamed:
+                raise SchemaError('Cannot rename {0} more than once'.format(
+                    column.name))
+            # Even a column renamed away by this statement keeps its name
+            # until the statement is applied.
+            if new_name in table.columns:
+                raise SchemaError(
+                    'Cannot rename {0} to {1}, a column of the same name '
+                    'already exists'.format(column.name, new_name))
+            if new_name in new_names:
+                raise SchemaError(
+                    'Cannot rename {0} to {1}, another column is renamed to '
+                    '{1}'.format(column.name, new_name))
+            renamed.add(column.name)
+            new_names.add(new_name)
+            renames.append((column, new_name))
+
+        keyspace = self.keyspaces[table.keyspace]
+        for column, new_name in renames:
+            del table.columns[column.name]
+            table.columns[new_name] = column._replace(name=new_name)
+            for names in (table.column_names, table.partition_key,
+                          table.clustering):
+                if column.name in names:
+                    names[names.index(column.name)] = new_name
+            if column.name in table.clustering_order:
+                table.clustering_order[new_name] = table.clustering_order.pop(
+                    column.name)
+
+            index = table.indexes.pop(column.name, None)
+            if index is not None:
+                index = index._replace(column=new_name)
+                table.indexes[new_name] = keyspace.indexes[index.name] = index
+
+    def _alter_properties(self, table, operation):
+        table.properties.update(_properties(operation))
+
+    def _create_index(self, statement):
+        table = self.table(statement.table)
+        column = self.column(table, statement.column)
+        if column.name in table.indexes:
+            raise SchemaError('Index already exists on {0}'.format(
+                column.name))
+
+        if statement.index is None:
+            # The name Cassandra gives indexes created without one.
+            name = '{0}_{1}_idx'.format(table.name, column.name)
+        else:
+            name = _name(statement.index)
+
+        keyspace = self.keyspaces[table.keyspace]
+        if name in keyspace.indexes:
+            raise SchemaError('Duplicate index name {0}'.format(name))
+
+        index = IndexSchema(name, table.keyspace, table.name, column.name)
+        table.indexes[column.name] = keyspace.indexes[name] = index
+
+    def _drop(self, statement):
+        target = statement.target
+        if isinstance(target, nodes.Keyspace):
+            name = self.keyspaces.pop(self.get_keyspace(target).name).name
+            if name == self.keyspace:
+                self.keyspace = None
+
+        elif isinstance(target, nodes.Table):
+            table = self.table(target)
+            keyspace = self.keyspaces[table.keyspace]
+            del keyspace.tables[table.name]
+            for index in table.indexes.values():
+                del keyspace.indexes[index.name]
+
+        elif isinstance(target, nodes.Index):
+            # Indexes are dropped from the keyspace of the last USE.
+            keyspace = self.get_keyspace()
+            name = _name(target)
+            try:
+                index = keyspace.indexes.pop(name)
+            except KeyError:
+                raise SchemaError('Index {0} could not be found'.format(name))
+            del keyspace.tables[index.table].indexes[index.column]
+
+    def _truncate(self, statement):
+        self.table(statement.table)
+
+    _statements = {
+        nodes.Use: _use,
+        nodes.CreateKeyspace: _create_keyspace,
+        nodes.AlterKeyspace: _alter_keyspace,
+        nodes.CreateTable: _create_table,
+        nodes.AlterTable: _alter_table,
+        nodes.CreateIndex: _create_index,
+        nodes.Drop: _drop,
+        nodes.Truncate: _truncate,
+    }
+
+    # Statements which are applied without changing the schema.
+    _unchanged = frozenset([nodes.Use, nodes.Truncate])
+
+    _operations = {
+        nodes.AlterType: _alter_type,
+        nodes.AddColumn: _add_column,
+        nodes.DropColumn: _drop_column,
+        nodes.Rename: _rename,
+        nodes.Properties: _alter_properties,
+    }
@@ -0,0 +1,389 @@
+"""
+Parsing scripts of ;-separated statements, like schema dumps and migrations.
+"""
+import re
+
+from collections import deque, namedtuple
+
+from ometa.runtime import ParseError, expected
+
+from cql3parser.grammar import CQL3, statement_rules
+from cql3parser.lexer import tokenize
+
+# Pieces of a script: runs of plain text, string literals, quoted names and
+# statement separators.
+_piece = re.compile(r"""
+    [^;'"]+
+  | '[^']*(?:''[^']*)*'
+  | "[^"]*(?:""[^"]*)*"
+  | ;
+""", re.VERBOSE)
+
+_begin_batch = re.compile(
+    r'\s*BEGIN\s+(?:(?:UNLOGGED|COUNTER)\s+)?BATCH\b', re.IGNORECASE)
+_apply_batch = re.compile(r'\bAPPLY\s+BATCH\b', re.IGNORECASE)
+
+# The separators and quotes which end a run of plain text.
+_special = re.compile(r"[;'\"]")
+# Words, whitespace and punctuation in plain text.
+_word = re.compile(r'(\w+)|(\s+)|.', re.DOTALL)
+# Long enough for the longest batch keyword to be told from longer words.
+_WORD_LENGTH = len('UNLOGGED') + 1
+
+# Where the splitter is in the current statement: at its start, after BEGIN
+# and after BEGIN UNLOGGED or COUNTER, in any other statement, in a batch, or
+# after the APPLY BATCH ending a batch.
+_START, _BEGIN, _BEGIN_KIND, _STATEMENT, _BATCH, _APPLIED = range(6)
+
+# A statement found by StatementSplitter: its text, the offsets in the script
+# where the text starts and ends and the offset just after the ; ending it, or
+# of the end of the script for the last statement.
+Span = namedtuple('Span', 'text start end stop')
+
+# A statement parsed by recover_statements: its text, the offsets in the
+# script where the text starts and ends, the parsed statement or None and
+# the ParseError parsing it raised or None, whose position is an offset into
+# text.  A statement missing the ; after it has both.
+ScriptStatement = namedtuple('ScriptStatement', 'text start end value error')
+
+# The keywords statements start with, where recovery resumes after an error.
+_statement_keywords = frozenset(
+    rule[0] if isinstance(rule, tuple) else rule for rule in statement_rules)
+
+
+class StatementSplitter(object):
+    """
+    Split text fed in arbitrary chunks into statements.
+
+    Statements are separated by ; outside of string literals and quoted
+    names, except inside BEGIN BATCH ... APPLY BATCH where the ; between the
+    batched statements belong to the batch.  Only the statement currently
+    being split is held in memory, and each character fed is scanned once
+    however small the chunks are.
+
+    :param offset: The offset in the script of the first text fed.
+    """
+    def __init__(self, offset=0):
+        self._buffer = ''
+        self._offset = offset
+        self._pieces = []
+        self._size = 0
+        self._start = self._end = None
+        self._state = _START
+        # The quote of the string literal or quoted name being scanned.
+        self._quote = None
+        # The start of the word being scanned, long enough to tell whether
+        # it's one of the batch keywords, and the word before it if only
+        # whitespace is between them.
+        self._word = None
+        self._last = None
+
+    @property
+    def buffered(self):
+        """
+        How much text of the statement being split is held.
+        """
+        return len(self._buffer) + self._size
+
+    def feed(self, text):
+        """
+        Add text to the script and return a list of the statements it
+        completed.
+        """
+        return [span.text for span in self.feed_spans(text)]
+
+    def close(self):
+        """
+        End the script, returning a list with the last statement if it
+        wasn't followed by a ;.
+        """
+        return [span.text for span in self.close_spans()]
+
+    def feed_spans(self, text):
+        """
+        Like feed, but returning a Span for each statement.
+        """
+        self._buffer += text
+        return self._split(final=False)
+
+    def close_spans(self):
+        """
+        Like close, but returning a Span for the last statement.  An
+        unterminated string or quoted name is left for the parser to
+        complain about.
+        """
+        spans = self._split(final=True)
+        self._end_word()
+        return spans + self._finish(self._offset)
+
+    def _append(self, piece, offset):
+        if not piece:
+            return
+        self._pieces.append(piece)
+        self._size += len(piece)
+
+        stripped = piece.strip()
+        if stripped:
+            if self._start is None:
+                self._start = offset + piece.index(stripped[0])
+            self._end = offset + piece.rindex(stripped[-1]) + 1
+
+    def _finish(self, stop):
+        statement = ''.join(self._pieces).strip()
+        spans = []
+        if statement:
+            spans.append(Span(statement, self._start, self._end, stop))
+
+        self._pieces = []
+        self._size = 0
+        self._start = self._end = None
+        self._state = _START
+        self._word = self._last = None
+        return spans
+
+    def _scan_words(self, text):
+        """
+        Follow the words of plain text, which may continue in the next
+        chunk, to find where a batch begins and is applied.
+        """
+        for m in _word.finditer(text):
+            word, space = m.groups()
+            if word is not None:
+                if self._word is None:
+                    self._word = ''
+                if len(self._word) < _WORD_LENGTH:
+                    self._word += word[:_WORD_LENGTH].upper()
+                continue
+            self._end_word()
+            if space is None:
+                self._punctuation()
+
+    def _end_word(self):
+        word = self._word
+        if word is None:
+            return
+        self._word = None
+
+        state = self._state
+        if state == _START:
+            self._state = _BEGIN if word == 'BEGIN' else _STATEMENT
+        elif state == _BEGIN:
+            if word == 'BATCH':
+                self._state = _BATCH
+            elif word in ('UNLOGGED', 'COUNTER'):
+                self._state = _BEGIN_KIND
+            else:
+                self._state = _STATEMENT
+        elif state == _BEGIN_KIND:
+            self._state = _BATCH if word == 'BATCH' else _STATEMENT
+        elif state == _BATCH:
+            if word == 'BATCH' and self._last == 'APPLY':
+                self._state = _APPLIED
+            self._last = word
+
+    def _punctuation(self):
+        if self._state in (_START, _BEGIN, _BEGIN_KIND):
+            self._state = _STATEMENT
+        self._last = None
+
+    def _split(self, final):
+        spans = []
+        buffer = self._buffer
+        end = len(buffer)
+        pos = 0
+
+        while pos < end:
+            quote = self._quote
+            if quote is not None:
+                i = buffer.find(quote, pos)
+                if i < 0:
+                    self._append(buffer[pos:], self._offset + pos)
+                    pos = end
+                elif i + 1 == end and not final:
+                    # The quote might be the first of an escaped quote, keep
+                    # it until the next chunk tells.
+                    self._append(buffer[pos:i], self._offset + pos)
+                    pos = i
+                    break
+                else:
+                    if i + 1 < end and buffer[i + 1] == quote:
+                        i += 1
+                    else:
+                        self._quote = None
+                    self._append(buffer[pos:i + 1], self._offset + pos)
+                    pos = i + 1
+                continue
+
+            m = _special.search(buffer, pos)
+            stop = end if m is None else m.start()
+            self._scan_words(buffer[pos:stop])
+            self._append(buffer[pos:stop], self._offset + pos)
+            pos = stop
+            if m is None:
+                break
+
+            self._end_word()
+            pos += 1
+            if m.group() == ';' and self._state != _BATCH:
+                spans.extend(self._finish(self._offset + pos))
+                continue
+            self._punctuation()
+            if m.group() != ';':
+                self._quote = m.group()
+            self._append(m.group(), self._offset + stop)
+
+        self._buffer = buffer[pos:]
+        self._offset += pos
+        return spans
+
+
+def split_statements(fileobj, chunk_size=64 * 1024):
+    """
+    Yield the text of each statement in a file, reading it chunk_size
+    characters at a time.
+    """
+    splitter = StatementSplitter()
+    while True:
+        chunk = fileobj.read(chunk_size)
+        if not chunk:
+            break
+
+        for statement in splitter.feed(chunk):
+            yield statement
+
+    for statement in splitter.close():
+        yield statement
+
+
+def iter_statements(fileobj, chunk_size=64 * 1024):
+    """
+    Yield the parsed statements of a file, one at a time.
+
+    The file is read in chunks so only the statement being parsed is held in
+    memory, however large the file is.
+    """
+    for text in split_statements(fileobj, chunk_size):
+        yield CQL3(text).statement()
+
+
+def _resume(text, position):
+    """
+    The offset in text of the first statement keyword at or after the
+    parse error at position, not counting the one text starts with, or None.
+    """
+    for token in tokenize(text):
+        if (token.start >= position and token.start > 0 and
+                token.kind == 'keyword' and
+                token.value in _statement_keywords):
+            return token.start
+    return None
+
+
+def _first_separator(text):
+    """
+    The offset of the first ; in text outside of strings and quoted names,
+    or None.
+    """
+    pos = 0
+    while pos < len(text):
+        m = _piece.match(text, pos)
+        if m is None:
+            return None
+        if m.group() == ';':
+            return m.start()
+        pos = m.end()
+    return None
+
+
+def _split_again(span, offset):
+    """
+    Split the text of span from offset as a script of its own.
+    """
+    splitter = StatementSplitter(span.start + offset)
+    return splitter.feed_spans(span.text[offset:]) + splitter.close_spans()
+
+
+def _recover(parser, spans):
+    """
+    Parse spans, splitting any which fail at the next statement keyword
+    after the error and parsing the rest of it as more statements.
+    """
+    pending = deque(spans)
+    while pending:
+        span = pending.popleft()
+
+        # A batch which is never applied swallows the rest of the script,
+        # end it at its first ; instead.
+        if (_begin_batch.match(span.text) and
+                not _apply_batch.search(span.text)):
+            end = _first_separator(span.text)
+            if end is not None:
+                pending.extendleft(reversed(_split_again(span, end + 1)))
+                text = span.text[:end].rstrip()
+                span = Span(text, span.start, span.start + len(text),
+                            span.start + end + 1)
+
+        try:
+            value = parser(span.text).statement()
+        except ParseError as e:
+            resume = _resume(span.text, e.position)
+            if resume is None:
+                yield ScriptStatement(
+                    span.text, span.start, span.end, None, e)
+                continue
+
+            # The text up to there may be a whole statement missing its ;.
+            text = span.text[:resume].rstrip()
+            try:
+                value = parser(text).statement()
+            except ParseError:
+                value = None
+            else:
+                e = ParseError(text, len(text), expected('token', ';'))
+            yield ScriptStatement(
+                text, span.start, span.start + len(text), value, e)
+
+            pending.extendleft(reversed(_split_again(span, resume)))
+        else:
+            yield ScriptStatement(span.text, span.start, span.end, value, None)
+
+
+def recover_statements(fileobj, parser=CQL3, chunk_size=64 * 1024):
+    """
+    Yield a ScriptStatement for each statement in a file, like
+    iter_statements but carrying on past statements which fail to parse.
+
+    After an error parsing resumes at the next ; or, when a ; is missing,
+    at the next keyword which starts a statement, like SELECT, INSERT or
+    BEGIN.  A statement which only failed because the ; after it is missing
+    is parsed too and reported with an error expecting the ;.
+    """
+    splitter = StatementSplitter()
+    while True:
+        chunk = fileobj.read(chunk_size)
+        if not chunk:
+            break
+
+        for statement in _recover(parser, splitter.feed_spans(chunk)):
+            yield statement
+
+    for statement in _recover(parser, splitter.close_spans()):
+        yield statement
+
+
+def parse_script(fileobj, parser=CQL3, chunk_size=64 * 1024):
+    """
+    Parse every statement in a file in one pass, returning a list of the
+    statements which parsed and a list of (offset, ParseError) for every
+    error, where offset is the position of the error in the file.  See
+    recover_statements.
+    """
+    statements = []
+    errors = []
+    for statement in recover_statements(fileobj, parser, chunk_size):
+        if statement.value is not None:
+            statements.append(statement.value)
+        if statement.error is not None:
+            errors.append(
+                (statement.start + statement.error.position, statement.error))
+    return statements, errors
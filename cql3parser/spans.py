@@ -0,0 +1,108 @@
+"""
+Source spans for syntax tree nodes, for error reporting, linting and
+rewriting.
+
+Nodes are compact __slots__ objects without room for offsets, so spans are
+kept in a side table: Spans holds the nodes in a list and their start and
+end offsets in parallel integer arrays.  Spans are only recorded by
+CQL3Spans, parsing with CQL3Nodes costs nothing extra.
+"""
+from array import array
+
+from cql3parser.grammar import TokenGrammarBase, _load, node_bindings
+from cql3parser.nodes import Node
+
+
+class Spans(object):
+    """
+    The offsets in the parsed text of the nodes built while parsing it.
+
+    A node which the grammar passes on from one rule to another keeps the
+    span of the rule which built it.  Spans are looked up by identity, not
+    equality, as equal nodes can come from different parts of the text.
+
+    :ivar nodes: The nodes in the order they were built.
+    :ivar starts: An array('i') of the offset each node starts at.
+    :ivar ends: An array('i') of the offset each node ends at.
+    """
+    def __init__(self):
+        self.nodes = []
+        self.starts = array('i')
+        self.ends = array('i')
+        self._index = {}
+
+    def __repr__(self):
+        return '<Spans of {0} nodes>'.format(len(self.nodes))
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def __contains__(self, node):
+        return id(node) in self._index
+
+    def __getitem__(self, node):
+        """
+        The (start, end) offsets of node.
+
+        :raises KeyError: If node wasn't built by the parse.
+        """
+        i = self._index[id(node)]
+        return self.starts[i], self.ends[i]
+
+    def add(self, node, start, end):
+        """
+        Record the span of node, unless it already has one.
+        """
+        if id(node) in self._index:
+            return
+        self._index[id(node)] = len(self.nodes)
+        self.nodes.append(node)
+        self.starts.append(start)
+        self.ends.append(end)
+
+    def text(self, node, source):
+        """
+        The text of node in source, the text that was parsed.
+        """
+        start, end = self[node]
+        return source[start:end]
+
+
+class SpanGrammarBase(TokenGrammarBase):
+    """
+    TokenGrammarBase recording the span of every rule application which
+    builds a Node in self.spans.
+    """
+    def __init__(self, *args, **kwargs):
+        TokenGrammarBase.__init__(self, *args, **kwargs)
+        self.spans = Spans()
+
+    def _apply(self, rule, ruleName, args):
+        # Rules with arguments, like k and tok, never build nodes.
+        if args:
+            return TokenGrammarBase._apply(self, rule, ruleName, args)
+
+        start = self.input.position
+        result = TokenGrammarBase._apply(self, rule, ruleName, args)
+
+        end = self.input.position
+        if isinstance(result[0], Node) and end > start:
+            tokens = self.input.data
+            self.spans.add(result[0], tokens[start].start, tokens[end - 1].end)
+        return result
+
+
+# CQL3Nodes, recording the span of every node in the Spans of each parse.
+CQL3Spans = _load(node_bindings, SpanGrammarBase)
+
+
+def parse_spans(text, rule='statement', parser=CQL3Spans):
+    """
+    Parse text with the named rule, returning the result and the Spans of
+    its nodes.
+
+    :param parser: CQL3Spans, or another parser made with SpanGrammarBase.
+    """
+    wrapper = parser(text)
+    value = getattr(wrapper, rule)()
+    return value, wrapper._grammar.spans
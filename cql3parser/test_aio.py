@@ -0,0 +1,200 @@
+import socket
+import threading
+
+import pytest
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from parsley import ParseError
+
+try:
+    import asyncio
+except ImportError:
+    asyncio = pytest.importorskip('trollius')
+
+from cql3parser import CQL3, CQL3Nodes
+from cql3parser import aio
+from cql3parser.aio import StatementTooLarge, parse_stream
+
+
+@pytest.fixture
+def loop(request):
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+
+    def close():
+        asyncio.set_event_loop(None)
+        loop.close()
+    request.addfinalizer(close)
+    return loop
+
+
+class CountingReader(object):
+    """
+    A StreamReader counting how many times it was read.
+    """
+    def __init__(self, reader):
+        self.reader = reader
+        self.reads = 0
+
+    def read(self, n):
+        self.reads += 1
+        return self.reader.read(n)
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    """
+    A ThreadPoolExecutor counting how many calls were submitted to it.
+    """
+    def __init__(self):
+        ThreadPoolExecutor.__init__(self, 1)
+        self.submitted = 0
+
+    def submit(self, *args, **kwargs):
+        self.submitted += 1
+        return ThreadPoolExecutor.submit(self, *args, **kwargs)
+
+
+@pytest.fixture
+def connect(loop, request):
+    """
+    Return a reader for a socket the given data is sent to and closed.
+    """
+    def connect(data):
+        read, write = socket.socketpair()
+        request.addfinalizer(read.close)
+        reader, _ = loop.run_until_complete(
+            asyncio.open_connection(sock=read))
+
+        def send():
+            write.sendall(data)
+            write.close()
+        sender = threading.Thread(target=send)
+        sender.start()
+        request.addfinalizer(sender.join)
+        return CountingReader(reader)
+    return connect
+
+
+def collect(loop, stream):
+    results = []
+    while True:
+        try:
+            value = loop.run_until_complete(stream.next())
+        except (ParseError, StatementTooLarge) as e:
+            results.append(e)
+            continue
+
+        if value is None:
+            return results
+        results.append(value)
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 64 * 1024])
+def test_parse_stream(loop, connect, script, script_statements,
+                      chunk_size):
+    reader = connect(script.encode('utf-8'))
+    assert collect(loop, parse_stream(reader, chunk_size=chunk_size)) == [
+        CQL3(text).statement() for text in script_statements]
+
+
+def test_multibyte_characters(loop, connect):
+    reader = connect(u"SELECT * FROM t WHERE k = 'th\xe9';".encode('utf-8'))
+    [select] = collect(loop, parse_stream(reader, chunk_size=1))
+    assert select == CQL3(u"SELECT * FROM t WHERE k = 'th\xe9'").statement()
+
+
+@pytest.mark.parametrize('chunk_size', [1, 64 * 1024])
+def test_invalid_utf8(loop, connect, chunk_size):
+    reader = connect(b'USE ks; USE \xff; USE b;')
+    stream = parse_stream(reader, chunk_size=chunk_size)
+
+    def next():
+        return loop.run_until_complete(
+            asyncio.wait_for(stream.next(), 2, loop=loop))
+
+    assert next() == CQL3('USE ks').statement()
+    with pytest.raises(UnicodeDecodeError):
+        next()
+    assert next() is None
+
+
+def test_parse_errors(loop, connect):
+    reader = connect(b'USE ks; SELECT; USE other')
+    first, error, second = collect(loop, parse_stream(reader))
+    assert first == CQL3('USE ks').statement()
+    assert isinstance(error, ParseError)
+    assert second == CQL3('USE other').statement()
+
+
+def test_parser_and_rule(loop, connect):
+    reader = connect(b'ks; "Other"')
+    keyspaces = collect(
+        loop, parse_stream(reader, rule='keyspace', parser=CQL3Nodes))
+    assert keyspaces == [
+        CQL3Nodes('ks').keyspace(), CQL3Nodes('"Other"').keyspace()]
+
+
+def test_executor(loop, connect, script, script_statements):
+    reader = connect(script.encode('utf-8'))
+    with ProcessPoolExecutor(2) as executor:
+        statements = collect(loop, parse_stream(reader, executor=executor))
+    assert statements == [
+        CQL3(text).statement() for text in script_statements]
+
+
+def test_too_large(loop, connect):
+    reader = connect(b'USE ks; SELECT * FROM foo; USE b;')
+    first, error, second = collect(loop, parse_stream(reader, max_size=10))
+    assert first == CQL3('USE ks').statement()
+    assert isinstance(error, StatementTooLarge)
+    assert second == CQL3('USE b').statement()
+
+
+def test_too_large_ends_stream(loop, connect):
+    """
+    A statement can't be skipped before it is complete.
+    """
+    reader = connect(b'USE ks; SELECT * FROM foooooooooooo; USE b;')
+    results = collect(loop, parse_stream(reader, max_size=10, chunk_size=4))
+    assert len(results) == 2
+    assert isinstance(results[1], StatementTooLarge)
+
+
+def test_backpressure(loop, connect):
+    reader = connect(b'USE ks;' * 1000)
+    stream = parse_stream(reader, max_pending=4, chunk_size=7)
+    assert loop.run_until_complete(stream.next()) == CQL3(
+        'USE ks').statement()
+
+    # Nothing is taken from the stream, so it stops reading.
+    loop.run_until_complete(asyncio.sleep(0.1))
+    assert reader.reads <= 6
+
+    assert len(collect(loop, stream)) == 999
+    assert reader.reads == 1001
+
+
+def test_backpressure_in_one_chunk(loop, connect):
+    reader = connect(b'USE ks;' * 100)
+    with CountingExecutor() as executor:
+        stream = parse_stream(reader, executor=executor, max_pending=4)
+        assert loop.run_until_complete(stream.next()) == CQL3(
+            'USE ks').statement()
+
+        # The statement taken and the four after it are all that's parsed.
+        loop.run_until_complete(asyncio.sleep(0.1))
+        assert executor.submitted == 5
+
+        assert len(collect(loop, stream)) == 99
+        assert executor.submitted == 100
+
+
+@pytest.mark.skipif(aio.StopAsyncIteration is None,
+                    reason='async iteration needs python 3.5')
+def test_anext(loop, connect):
+    stream = parse_stream(connect(b'USE ks'))
+    assert stream.__aiter__() is stream
+    assert loop.run_until_complete(stream.__anext__()) == CQL3(
+        'USE ks').statement()
+    with pytest.raises(aio.StopAsyncIteration):
+        loop.run_until_complete(stream.__anext__())
@@ -0,0 +1,240 @@
+import pytest
+
+from cql3parser import CQL3, CQL3Nodes
+from cql3parser.batches import optimize_batches, optimize_cql
+from cql3parser.formatter import to_cql
+from cql3parser.nodes import Batch
+from cql3parser.routing import RoutingError, statement_keys
+from cql3parser.schema import SchemaError
+
+
+def statements(*texts):
+    return [CQL3Nodes(text).statement() for text in texts]
+
+
+def optimize(catalog, texts, **options):
+    return [to_cql(b) for b in optimize_batches(
+        statements(*texts), catalog, **options)]
+
+
+def test_groups_by_partition(catalog):
+    batch = CQL3Nodes(
+        "BEGIN BATCH "
+        "INSERT INTO posts (user, at, body) VALUES (1, 1, 'a'); "
+        "INSERT INTO posts (user, at, body) VALUES (2, 1, 'b'); "
+        "INSERT INTO posts (user, at, body) VALUES (1, 2, 'c'); "
+        "APPLY BATCH").statement()
+    assert [to_cql(b) for b in optimize_batches([batch], catalog)] == [
+        "BEGIN BATCH "
+        "INSERT INTO posts (user, at, body) VALUES (1, 1, 'a'); "
+        "INSERT INTO posts (user, at, body) VALUES (1, 2, 'c'); "
+        "APPLY BATCH",
+        "INSERT INTO posts (user, at, body) VALUES (2, 1, 'b')",
+    ]
+
+
+def test_single_partition(catalog):
+    results = list(optimize_batches(statements(
+        "INSERT INTO posts (user, at) VALUES (1, 1)",
+        "INSERT INTO posts (user, at) VALUES (3, 1)",
+        "INSERT INTO posts (user, at) VALUES (1, 2)",
+        "INSERT INTO posts (user, at) VALUES (3, 2)",
+        "DELETE FROM posts WHERE user = 3 AND at = 5",
+    ), catalog))
+    assert [len(b.statements) for b in results] == [2, 3]
+    for batch in results:
+        assert isinstance(batch, Batch)
+        keys = set(statement_keys(s, catalog)[0] for s in batch.statements)
+        assert len(keys) == 1
+
+
+def test_merges_rows(catalog):
+    assert optimize(catalog, [
+        "INSERT INTO users (name, age) VALUES ('a', 1)",
+        "INSERT INTO users (name, email, age) VALUES ('a', 'x', 2)",
+        "INSERT INTO users (name, age) VALUES ('a', 3)",
+    ]) == [
+        "INSERT INTO users (name, age, email) VALUES ('a', 3, 'x')",
+    ]
+
+
+def test_different_using(catalog):
+    assert optimize(catalog, [
+        "INSERT INTO users (name, age) VALUES ('a', 1) USING TTL 10",
+        "INSERT INTO users (name, age) VALUES ('a', 2)",
+        "INSERT INTO users (name, age) VALUES ('a', 3)",
+    ]) == [
+        "INSERT INTO users (name, age) VALUES ('a', 1) USING TTL 10",
+        "INSERT INTO users (name, age) VALUES ('a', 3)",
+    ]
+
+
+def test_timestamps(catalog):
+    texts = [
+        "INSERT INTO users (name, age) VALUES ('a', 1) USING TIMESTAMP 5",
+        "INSERT INTO users (name, age) VALUES ('a', 2) USING TIMESTAMP 4",
+        "DELETE FROM users USING TIMESTAMP 3 WHERE name = 'a'",
+    ]
+    assert optimize(catalog, texts) == texts[:1] + [
+        'BEGIN BATCH {0}; {1}; APPLY BATCH'.format(*texts[1:])]
+
+
+def test_duplicates(catalog):
+    assert optimize(catalog, [
+        "DELETE email FROM users WHERE name = 'a'",
+        "INSERT INTO posts (user, at) VALUES (1, 1) USING TIMESTAMP 1",
+        "DELETE email FROM users WHERE name = 'a'",
+        "INSERT INTO posts (user, at) VALUES (1, 1) USING TIMESTAMP 1",
+    ]) == [
+        "DELETE email FROM users WHERE name = 'a'",
+        "INSERT INTO posts (user, at) VALUES (1, 1) USING TIMESTAMP 1",
+    ]
+
+
+def test_delete_rows(catalog):
+    assert optimize(catalog, [
+        "INSERT INTO posts (user, at, body) VALUES (1, 1, 'a')",
+        "INSERT INTO posts (user, at, body) VALUES (1, 2, 'b')",
+        "DELETE FROM posts WHERE user = 1 AND at = 1",
+    ]) == [
+        "BEGIN BATCH "
+        "INSERT INTO posts (user, at, body) VALUES (1, 2, 'b'); "
+        "DELETE FROM posts WHERE user = 1 AND at = 1; "
+        "APPLY BATCH",
+    ]
+
+    assert optimize(catalog, [
+        "INSERT INTO posts (user, at, body) VALUES (1, 1, 'a')",
+        "INSERT INTO posts (user, at, body) VALUES (1, 2, 'b')",
+        "DELETE FROM posts WHERE user = 1",
+    ]) == ["DELETE FROM posts WHERE user = 1"]
+
+    texts = [
+        "INSERT INTO posts (user, at, body) VALUES (1, 1, 'a')",
+        "DELETE FROM posts WHERE user = 1 AND at > 0",
+    ]
+    assert optimize(catalog, texts) == [
+        'BEGIN BATCH {0}; {1}; APPLY BATCH'.format(*texts)]
+
+
+def test_delete_cells(catalog):
+    assert optimize(catalog, [
+        "INSERT INTO posts (user, at, kind, body) VALUES (1, 1, 'k', 'a')",
+        "INSERT INTO posts (user, at, kind, body) VALUES (1, 2, 'k', 'b')",
+        "DELETE body FROM posts WHERE user = 1 AND at = 1",
+        "DELETE kind FROM posts WHERE user = 1",
+    ]) == [
+        "BEGIN BATCH "
+        "INSERT INTO posts (user, at) VALUES (1, 1); "
+        "INSERT INTO posts (user, at, body) VALUES (1, 2, 'b'); "
+        "DELETE body FROM posts WHERE user = 1 AND at = 1; "
+        "DELETE kind FROM posts WHERE user = 1; "
+        "APPLY BATCH",
+    ]
+
+
+def test_insert_after_delete(catalog):
+    assert optimize(catalog, [
+        "DELETE FROM users WHERE name = 'a'",
+        "INSERT INTO users (name, age) VALUES ('a', 1)",
+    ]) == [
+        "DELETE FROM users WHERE name = 'a'",
+        "INSERT INTO users (name, age) VALUES ('a', 1)",
+    ]
+
+
+def test_insert_after_range_delete(catalog):
+    texts = [
+        "INSERT INTO posts (user, at, body) VALUES (1, 1, 'x')",
+        "DELETE FROM posts WHERE user = 1 AND at > 0",
+        "INSERT INTO posts (user, at, body) VALUES (1, 1, 'x')",
+    ]
+    assert optimize(catalog, texts) == [
+        'BEGIN BATCH {0}; {1}; APPLY BATCH'.format(*texts[:2]), texts[2]]
+
+
+def test_splits_delete_in(catalog):
+    assert optimize(catalog, [
+        "INSERT INTO posts (user, at) VALUES (2, 1)",
+        "DELETE body FROM posts WHERE user IN (1, 2) AND at = 1",
+    ]) == [
+        "BEGIN BATCH "
+        "INSERT INTO posts (user, at) VALUES (2, 1); "
+        "DELETE body FROM posts WHERE user = 2 AND at = 1; "
+        "APPLY BATCH",
+        "DELETE body FROM posts WHERE user = 1 AND at = 1",
+    ]
+
+
+def test_max_statements(catalog):
+    texts = ["INSERT INTO posts (user, at) VALUES (1, {0})".format(i)
+             for i in range(7)]
+    assert [len(b.statements) if isinstance(b, Batch) else 1
+            for b in optimize_batches(statements(*texts), catalog,
+                                      max_statements=3)] == [3, 3, 1]
+
+
+def test_max_size(catalog):
+    texts = ["INSERT INTO posts (user, at, body) VALUES (1, {0}, '{1}')"
+             .format(i, 'x' * 100) for i in range(20)]
+    results = list(optimize_cql(statements(*texts), catalog, max_size=500))
+    assert len(results) > 1
+    assert all(len(text) <= 500 for text in results)
+    assert ''.join(results).count('INSERT') == 20
+
+    [result] = optimize(catalog, texts[:1], max_size=10)
+    assert result == texts[0]
+
+
+def test_max_pending(catalog):
+    texts = ["INSERT INTO users (name) VALUES ('{0}')".format(i)
+             for i in range(10)]
+    given = []
+
+    def stream():
+        for statement in statements(*texts):
+            given.append(statement)
+            yield statement
+
+    results = optimize_batches(stream(), catalog, max_pending=3)
+    assert to_cql(next(results)) == texts[0]
+    assert len(given) == 4
+    assert [to_cql(s) for s in results] == texts[1:]
+
+
+def test_optimize_cql(catalog):
+    texts = [
+        "INSERT INTO posts (user, at) VALUES (1, 1)",
+        "INSERT INTO users (name, age) VALUES ('a', 1)",
+        "INSERT INTO users (name, age) VALUES ('b', 1)",
+        "DELETE FROM posts WHERE user = 1 AND at = 2",
+        "INSERT INTO users (name, email) VALUES ('a', 'x')",
+    ]
+    assert list(optimize_cql(statements(*texts), catalog)) == optimize(
+        catalog, texts)
+
+
+def test_terms(catalog):
+    texts = [
+        "INSERT INTO posts (user, at) VALUES (1, 1)",
+        "INSERT INTO posts (user, at) VALUES (1, 2)",
+    ]
+    assert list(optimize_batches(
+        [CQL3(text).statement() for text in texts], catalog)) == list(
+        optimize_batches(statements(*texts), catalog))
+
+
+@pytest.mark.parametrize('text', [
+    "SELECT * FROM users WHERE name = 'a'",
+    "INSERT INTO users (name) VALUES (?)",
+    "DELETE FROM posts WHERE at = 1",
+])
+def test_unbatchable(catalog, text):
+    with pytest.raises(RoutingError):
+        list(optimize_batches(statements(text), catalog))
+
+
+def test_unknown_table(catalog):
+    with pytest.raises(SchemaError):
+        list(optimize_batches(statements(
+            "INSERT INTO missing (k) VALUES (1)"), catalog))
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+import mmap
+import tempfile
+
+import pytest
+
+from parsley import ParseError, termMaker as t
+
+from cql3parser import CQL3, CQL3Nodes, buffers, nodes
+from cql3parser.buffers import (
+    LazyToken, _decode, from_buffer, iter_buffer_statements, tokenize_buffer)
+from cql3parser.lexer import tokenize
+
+STATEMENT = u"""INSERT INTO "café" (k, v) VALUES ('thé', 1.5)"""
+
+
+@pytest.fixture
+def mapped(request):
+    def mapped(data):
+        f = tempfile.TemporaryFile()
+        request.addfinalizer(f.close)
+        f.write(data)
+        f.flush()
+        m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        request.addfinalizer(m.close)
+        return m
+    return mapped
+
+
+@pytest.fixture(params=['bytes', 'bytearray', 'memoryview', 'mmap'])
+def wrap(request, mapped):
+    return {
+        'bytes': bytes,
+        'bytearray': bytearray,
+        'memoryview': memoryview,
+        'mmap': mapped,
+    }[request.param]
+
+
+def test_tokens(wrap):
+    data = STATEMENT.encode('utf-8')
+    tokens = tokenize_buffer(wrap(data))
+    assert [(token.kind, token.text, token.value) for token in tokens] == [
+        (token.kind, token.text, token.value)
+        for token in tokenize(STATEMENT)]
+    assert [data[token.start:token.end] for token in tokens] == [
+        token.text.encode('utf-8') for token in tokens]
+
+
+def test_lazy_tokens():
+    tokens = tokenize_buffer(b"SELECT foo FROM bar WHERE k = 'x'")
+    lazy = [token for token in tokens if isinstance(token, LazyToken)]
+    assert [token.kind for token in lazy] == [
+        'identifier', 'identifier', 'identifier', 'string']
+    assert all(token._value is None for token in lazy)
+    assert lazy[0].value == u'FOO'
+    assert lazy[-1].value == u'x'
+
+
+def test_decoded_once(monkeypatch):
+    decoded = []
+
+    def decode(buffer, start, end, errors='strict'):
+        decoded.append((start, end))
+        return _decode(buffer, start, end, errors)
+
+    monkeypatch.setattr(buffers, '_decode', decode)
+    literal = u"'{0}'".format(u'\xe9' * 100000)
+    text = u"INSERT INTO t (k, m) VALUES (1, {{{0}: 1}})".format(literal)
+    assert from_buffer(text.encode('utf-8')).statement() == (
+        CQL3(text).statement())
+
+    start = len(text[:text.index(literal)].encode('utf-8'))
+    assert decoded.count((start, start + len(literal.encode('utf-8')))) == 1
+
+
+def test_statement(wrap):
+    data = STATEMENT.encode('utf-8')
+    assert from_buffer(wrap(data)).statement() == CQL3(STATEMENT).statement()
+    assert from_buffer(wrap(data), parser=CQL3Nodes).statement() == (
+        CQL3Nodes(STATEMENT).statement())
+
+
+def test_range():
+    data = b'USE ks; USE other;'
+    assert from_buffer(data, 8, 17).statement() == t.Use(
+        t.Keyspace(t.Identifier('other')))
+    assert from_buffer(data, 4, 6).keyspace() == t.Keyspace(
+        t.Identifier('ks'))
+
+
+@pytest.mark.parametrize('text', [
+    u"SELECT * FROM \"café\" WHERE",
+    u"USE 'thé' ks",
+    u"USE ks é",
+])
+def test_errors(text):
+    """
+    Errors are at the byte offset of where CQL3 finds them in the text.
+    """
+    with pytest.raises(ParseError) as expected:
+        CQL3(text).statement()
+    with pytest.raises(ParseError) as e:
+        from_buffer(text.encode('utf-8')).statement()
+    assert e.value.position == len(
+        text[:expected.value.position].encode('utf-8'))
+
+
+def test_errors_in_range():
+    with pytest.raises(ParseError) as e:
+        from_buffer(b'USE ks; SELECT * FROM t WHERE;', 8, 29).statement()
+    assert e.value.position == 29
+
+
+def test_iter_buffer_statements(wrap, script, script_statements):
+    data = script.encode('utf-8')
+    statements = list(iter_buffer_statements(wrap(data)))
+    assert [data[s.start:s.end].decode('utf-8') for s in statements] == (
+        script_statements)
+    assert [s.value for s in statements] == [
+        CQL3(text).statement() for text in script_statements]
+
+
+def test_iter_buffer_statements_nodes():
+    statements = iter_buffer_statements(b'USE ks;;', CQL3Nodes)
+    assert list(statements) == [(0, 6, nodes.Use(nodes.Keyspace(
+        nodes.Identifier('ks'))))]
+
+
+def test_iter_buffer_statements_errors():
+    statements = iter_buffer_statements(b'USE ks; USE;')
+    assert next(statements).value == CQL3('USE ks').statement()
+    with pytest.raises(ParseError) as e:
+        next(statements)
+    assert e.value.position == 11
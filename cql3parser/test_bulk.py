@@ -0,0 +1,61 @@
+import pickle
+
+import pytest
+
+from parsley import ParseError, termMaker as t
+
+from cql3parser import CQL3
+from cql3parser.bulk import parse_many
+
+STATEMENTS = [
+    "USE ks",
+    "SELECT * FROM foo WHERE k = 'bar'",
+    "SELECT * FROM",
+    "INSERT INTO foo (a, b) VALUES (1, {'x': 1.5})",
+    "BEGIN BATCH DELETE FROM foo WHERE a = 1 APPLY BATCH",
+] * 5
+
+
+def test_pickle_terms():
+    statement = CQL3(STATEMENTS[3]).statement()
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        assert pickle.loads(pickle.dumps(statement, protocol)) == statement
+
+
+def test_pickle_parse_error():
+    with pytest.raises(ParseError) as e:
+        CQL3("SELECT * FROM").select()
+
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        error = pickle.loads(pickle.dumps(e.value, protocol))
+        assert error == e.value
+        assert error.input == e.value.input
+        assert str(error) == str(e.value)
+
+
+def test_parse_many_ordered():
+    results = list(parse_many(STATEMENTS, workers=2, chunksize=3))
+
+    assert [r.index for r in results] == list(range(len(STATEMENTS)))
+    for statement, result in zip(STATEMENTS, results):
+        if statement == "SELECT * FROM":
+            assert result.value is None
+            assert isinstance(result.error, ParseError)
+        else:
+            assert result.value == CQL3(statement).statement()
+            assert result.error is None
+
+
+def test_parse_many_unordered():
+    results = list(parse_many(iter(STATEMENTS), workers=2, chunksize=2,
+                              ordered=False))
+    assert sorted(r.index for r in results) == list(range(len(STATEMENTS)))
+
+
+def test_parse_many_rule():
+    use, drop = parse_many(['USE ks', 'DROP TABLE foo'], workers=1,
+                           rule='use')
+
+    assert use == (0, t.Use(t.Keyspace(t.Identifier('ks'))), None)
+    assert drop.error.position == 0
+    assert drop.error.input == 'DROP TABLE foo'
@@ -0,0 +1,141 @@
+import threading
+
+import pytest
+
+from parsley import ParseError, termMaker as t
+
+from cql3parser import CQL3, parse_cached
+from cql3parser.cache import LRUCache, normalize
+
+
+def test_normalize():
+    assert normalize("  SELECT *\n\tFROM  foo ") == "SELECT * FROM foo"
+
+
+def test_normalize_preserves_quoted_whitespace():
+    assert normalize(
+        "SELECT  \"a  b\" FROM foo WHERE k =  'x  ''  y'"
+    ) == "SELECT \"a  b\" FROM foo WHERE k = 'x  ''  y'"
+
+
+def test_lru_eviction():
+    cache = LRUCache(2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1
+    cache.put('c', 3)
+
+    assert 'a' in cache
+    assert 'b' not in cache
+    assert 'c' in cache
+    assert cache.info() == (1, 0, 1, 2, 2)
+
+
+def test_lru_put_existing():
+    cache = LRUCache(2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.put('a', 3)
+    cache.put('c', 4)
+
+    assert cache.get('a') == 3
+    assert cache.get('b') is None
+    assert len(cache) == 2
+
+
+def test_lru_resize():
+    cache = LRUCache(3)
+    for i in range(3):
+        cache.put(i, i)
+
+    cache.resize(1)
+    assert len(cache) == 1
+    assert 2 in cache
+    assert cache.evictions == 2
+
+    with pytest.raises(ValueError):
+        cache.resize(0)
+
+
+def test_lru_clear():
+    cache = LRUCache()
+    cache.put('a', 1)
+    cache.get('a')
+    cache.get('b')
+    cache.clear()
+    assert cache.info() == (0, 0, 0, 1024, 0)
+
+
+def test_parse_cached():
+    cache = LRUCache()
+    q = "SELECT * FROM foo WHERE k = 'bar'"
+
+    first = parse_cached(q, cache=cache)
+    assert first == CQL3(q).select()
+    assert parse_cached(" SELECT *\nFROM foo WHERE k = 'bar'",
+                        cache=cache) is first
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_parse_cached_rule():
+    cache = LRUCache()
+    assert parse_cached('USE ks', 'use', cache) == t.Use(
+        t.Keyspace(t.Identifier('ks')))
+
+    with pytest.raises(ParseError):
+        parse_cached('USE ks', 'drop', cache=cache)
+    assert ('drop', 'USE ks') not in cache
+
+
+def test_parse_cached_results_are_immutable():
+    cache = LRUCache()
+    text = "k = 1 AND j = 2"
+    result = parse_cached(text, 'relations', cache)
+    assert result == CQL3(text).relations()
+    assert CQL3(text).relations() == result
+    assert parse_cached(text, 'relations', cache) is result
+    with pytest.raises(TypeError):
+        result[0] = None
+
+    result = parse_cached("{'a': 1}", 'map', cache)
+    assert result == {'a': 1}
+    with pytest.raises(TypeError):
+        result['b'] = 2
+
+    assert parse_cached("{1, 2}", 'set', cache) == set([1, 2])
+
+
+def test_parse_cached_error_positions():
+    cache = LRUCache()
+    text = "SELECT  *\n\n  FROM foo WHERE"
+    with pytest.raises(ParseError) as cached:
+        parse_cached(text, cache=cache)
+    with pytest.raises(ParseError) as uncached:
+        CQL3(text).select()
+    assert cached.value.input == text
+    assert cached.value.position == uncached.value.position
+
+
+def test_parse_cached_threads():
+    cache = LRUCache(8)
+    statements = ['SELECT * FROM t{0}'.format(i) for i in range(16)]
+    errors = []
+
+    def worker():
+        try:
+            for _ in range(5):
+                for q in statements:
+                    assert parse_cached(q, cache=cache) == CQL3(q).select()
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    info = cache.info()
+    assert info.hits + info.misses == 4 * 5 * 16
+    assert info.currsize == 8
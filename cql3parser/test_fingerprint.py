@@ -0,0 +1,121 @@
+import uuid
+
+import pytest
+
+from parsley import termMaker as t
+from terml.nodes import coerceToTerm
+
+from cql3parser import CQL3
+from cql3parser.cache import LRUCache
+from cql3parser.fingerprint import (
+    BINDING, fingerprint, parse_fingerprinted, substitute)
+
+
+@pytest.mark.parametrize(
+    ('literal', 'rule'),
+    [("'foo'", 'string'),
+     ("'foo''s'", 'string'),
+     ("''", 'string'),
+     ('10', 'integer'),
+     ('-0012', 'integer'),
+     ('1.5', 'float'),
+     ('-1.0e-9', 'float'),
+     ('1E10', 'float'),
+     (str(uuid.uuid4()), 'uuid'),
+     ('true', 'boolean'),
+     ('FALSE', 'boolean')])
+def test_literal_values(literal, rule):
+    """
+    Extracted values are the same as parsing the literal with its rule.
+    """
+    template, values = fingerprint('SELECT * FROM t WHERE k = ' + literal)
+    assert template == 'SELECT * FROM t WHERE k = ?'
+    assert values == (getattr(CQL3(literal), rule)(),)
+
+
+def test_select():
+    assert fingerprint(
+        "SELECT  a, b FROM ks.t\nWHERE k = 'abc' AND c > 10 AND d <= ? "
+        "LIMIT 100"
+    ) == (
+        "SELECT a, b FROM ks.t WHERE k = ? AND c > ? AND d <= ? LIMIT 100",
+        ('abc', 10, BINDING))
+
+
+def test_quoted_names_and_identifiers():
+    assert fingerprint(
+        'SELECT "a = 1" FROM t2 WHERE k2 = 2'
+    ) == ('SELECT "a = 1" FROM t2 WHERE k2 = ?', (2,))
+
+
+def test_insert():
+    assert fingerprint(
+        "INSERT INTO t (a, b, c, d) VALUES (1, 'x', {'k': 2}, [3, 4]) "
+        "USING TTL 10"
+    ) == (
+        "INSERT INTO t (a, b, c, d) VALUES (?, ?, {'k': 2}, [3, 4]) "
+        "USING TTL 10",
+        (1, 'x'))
+
+
+def test_kept_literals():
+    """
+    Literals where the grammar doesn't accept a placeholder stay in the
+    template.
+    """
+    for q in ["SELECT * FROM t WHERE k IN (1, 2, 3)",
+              "SELECT * FROM t WHERE TOKEN(k) > TOKEN('a')",
+              "SELECT * FROM t WHERE TOKEN(k) > 'a'",
+              "CREATE USER u WITH PASSWORD 'p'",
+              "CREATE KEYSPACE ks WITH replication = {'class': 'x'} "
+              "AND durable_writes = true",
+              "DELETE FROM t USING TIMESTAMP 10 WHERE k IN ('a')"]:
+        assert fingerprint(q) == (q, ())
+
+
+def test_token_relation_then_relation():
+    assert fingerprint(
+        "SELECT * FROM t WHERE TOKEN(k) > 'a' AND c = 1"
+    ) == ("SELECT * FROM t WHERE TOKEN(k) > 'a' AND c = ?", (1,))
+
+
+def test_delete_collection_item():
+    assert fingerprint(
+        "DELETE todo['2012-9-24'] FROM users WHERE user_id = 'frodo'"
+    ) == ("DELETE todo[?] FROM users WHERE user_id = ?",
+          ('2012-9-24', 'frodo'))
+
+
+def test_substitute():
+    template = CQL3("k = ? AND j = ?").relations()
+    assert substitute(coerceToTerm(template), [1, BINDING]) == coerceToTerm([
+        t.Relation(t.Column(t.Identifier('k')), '=', 1),
+        t.Relation(t.Column(t.Identifier('j')), '=', t.Binding())])
+
+    with pytest.raises(ValueError):
+        substitute(coerceToTerm(template), [1])
+
+    with pytest.raises(ValueError):
+        substitute(coerceToTerm(template), [1, 2, 3])
+
+
+def test_parse_fingerprinted():
+    cache = LRUCache()
+    for key in ['a', 'b', 'c']:
+        q = ("SELECT * FROM t WHERE k = '{0}' AND c > ? LIMIT 10"
+             .format(key))
+        assert parse_fingerprinted(q, cache=cache) == CQL3(q).select()
+
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_parse_fingerprinted_insert():
+    q = "INSERT INTO foo (bar, baz) VALUES (1, 'foo')"
+    assert parse_fingerprinted(
+        q, 'insert', LRUCache()) == CQL3(q).insert()
+
+
+def test_parse_fingerprinted_list():
+    q = "k = 1 AND j = 'x'"
+    assert parse_fingerprinted(
+        q, 'relations', LRUCache()) == CQL3(q).relations()
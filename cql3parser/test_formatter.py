@@ -0,0 +1,58 @@
+import uuid
+
+from io import BytesIO
+
+import pytest
+
+from parsley import termMaker as t
+
+from cql3parser import CQL3, CQL3Nodes
+from cql3parser.formatter import cql3fmt, format_script, to_cql
+
+
+def test_cql3fmt(canonical):
+    text, expected = canonical
+    assert cql3fmt(text) == expected
+    assert cql3fmt(expected) == expected
+
+
+def test_terms(canonical):
+    text, expected = canonical
+    assert to_cql(CQL3(text).statement()) == expected
+
+
+def test_round_trip(canonical):
+    text, expected = canonical
+    assert CQL3Nodes(expected).statement() == CQL3Nodes(text).statement()
+
+
+def test_uuid():
+    """
+    Terms can't hold uuids, but nodes can.
+    """
+    assert cql3fmt(
+        "select * from t where k = 62C36092-82a1-3a00-93d1-46196ee77204"
+    ) == "SELECT * FROM t WHERE k = 62c36092-82a1-3a00-93d1-46196ee77204"
+
+
+def test_rule_results():
+    assert to_cql(CQL3("ks.t").table()) == "ks.t"
+    assert to_cql(CQL3("a = 1 AND b < 'x'").relations()) == (
+        "[a = 1, b < 'x']")
+    assert to_cql(t.Properties([t.Property(t.Identifier('a'), 1)])) == (
+        "a = 1")
+    assert to_cql(uuid.UUID(int=0)) == (
+        "00000000-0000-0000-0000-000000000000")
+    assert to_cql(1.0) == "1.0"
+    assert to_cql(set()) == "{}"
+
+
+def test_unformattable():
+    with pytest.raises(TypeError):
+        to_cql(object())
+
+
+def test_format_script():
+    output = BytesIO()
+    format_script(BytesIO(b"use ks;\nselect  *\n  from t;"), output)
+    assert output.getvalue() == b"USE ks;\nSELECT * FROM t;\n"
@@ -0,0 +1,43 @@
+from ometa.runtime import OMetaBase
+from parsley import wrapGrammar
+
+from cql3parser import CQL3, generate, grammar
+from cql3parser._generated import cql3 as generated
+
+
+def test_generated_module_is_current():
+    """
+    The generated parser module matches the current cql3.parsley, if this
+    fails run `python -m cql3parser.generate`.
+    """
+    source = grammar._read_grammar()
+    assert generated.GRAMMAR_HASH == grammar.grammar_hash(source)
+
+    with open(generate.GENERATED_PATH, 'r') as f:
+        assert f.read() == generate.generate(source)
+
+
+def test_loads_generated_module():
+    assert CQL3._grammarClass.__module__ == generated.__name__
+
+
+def test_stale_generated_module(monkeypatch):
+    """
+    If cql3.parsley has changed since the module was generated the grammar is
+    compiled from source instead.
+    """
+    monkeypatch.setattr(generated, 'GRAMMAR_HASH', 'stale')
+    parser = grammar._load()
+    assert parser._grammarClass.__module__ != generated.__name__
+    assert parser('USE ks').use() == CQL3('USE ks').use()
+
+
+def test_generate():
+    source = "greeting = 'hello' -> 'hi'\n"
+    namespace = {}
+    exec(generate.generate(source, 'greeting'), namespace)
+
+    assert namespace['GRAMMAR_HASH'] == grammar.grammar_hash(source)
+
+    parser = wrapGrammar(namespace['createParserClass'](OMetaBase, {}))
+    assert parser('hello').greeting() == 'hi'
@@ -6,7 +6,7 @@ from itertools import product
 
 from parsley import ParseError, termMaker as t
 
-from cql3parser import CQL3, grammar, types
+from cql3parser import CQL3, grammar, keywords, types
 
 
 @pytest.mark.parametrize(
@@ -32,6 +32,17 @@ def test_undefined_keyword():
         assert CQL3('foobar').k('foobar')
 
 
+def test_keyword_tables():
+    """
+    The hashed keyword tables agree with the exported keyword lists.
+    """
+    assert keywords.KEYWORDS == frozenset(grammar.keywords)
+    assert keywords.UNRESERVED_KEYWORDS == frozenset(
+        grammar.unreserved_keywords)
+    assert set(keywords.ALIASES) <= keywords.KEYWORDS
+    assert set(keywords.ALIASES.values()) <= keywords.KEYWORDS
+
+
 def test_keywords_consume_leading_whitespace():
     """
     Matching a keyword should consume leading whitespace, this makes
@@ -50,6 +61,9 @@ def test_alias_keywords():
     assert CQL3('COLUMNFAMILY').a_table() == 'TABLE'
     assert CQL3('TABLE').a_table() == 'TABLE'
 
+    with pytest.raises(ParseError):
+        CQL3('TABLE').a_keyspace()
+
 
 @pytest.mark.parametrize(
     ("keyword", "expected"),
@@ -145,6 +159,41 @@ def test_set():
     assert CQL3("{1, 2, 1, 1}").set() == set([1, 2])
 
 
+def test_long_collections():
+    """
+    Long collection literals are matched without a rule per item.
+    """
+    items = list(range(10000))
+    assert CQL3(repr(items)).list() == items
+    assert CQL3(
+        '{' + ', '.join(str(i) for i in items) + '}').set() == set(items)
+    assert CQL3('{' + ', '.join(
+        "'{0}': {0}".format(i) for i in items) + '}').map() == dict(
+        (str(i), i) for i in items)
+
+
+def test_collections_of_terms():
+    assert CQL3("[true, 1.5, 'x', -1]").list() == [True, 1.5, 'x', -1]
+    assert CQL3("{'a': 1, 'a': 2}").map() == {'a': 2}
+
+    u = uuid.uuid4()
+    assert CQL3("{{{0}: {0}}}".format(u)).map() == {u: u}
+
+
+@pytest.mark.parametrize(('text', 'position'), [
+    ("[1, 2,]", 6),
+    ("[1, 2", 5),
+    ("[1, ?]", 4),
+    ("{'a': 1, 'b'}", 12),
+    ("{'a': 1, 'b': }", 14),
+    ("{'a' 1}", 5),
+])
+def test_collection_errors(text, position):
+    with pytest.raises(ParseError) as e:
+        CQL3(text).set_operation()
+    assert e.value.position == position
+
+
 def test_set_operations():
     assert CQL3("1, 2, 'foo'").set_operations() == [1, 2, 'foo']
     assert CQL3(
@@ -215,6 +264,10 @@ def test_properties():
         t.Property(t.Identifier('foo'), 1.0)])
     assert CQL3("foo = bar").properties() == t.Properties([
         t.Property(t.Identifier('foo'), t.Identifier('bar'))])
+    assert CQL3("foo = ttl AND bar = int").properties() == t.Properties([
+        t.Property(t.Identifier('foo'), t.Keyword('TTL')),
+        t.Property(t.Identifier('bar'),
+                   t.NativeType('INT', types.native_types['INT']))])
 
 
 def test_USE():
@@ -481,6 +534,82 @@ def test_ALTER_KEYSPACE():
                         'replication_factor': '1'})]))
 
 
+def test_column_types():
+    assert CQL3('int').comparator_type() == t.NativeType(
+        'INT', types.native_types['INT'])
+    assert CQL3("'org.example.FooType'").comparator_type() == (
+        'org.example.FooType')
+    assert CQL3('map<text, int>').comparator_type() == t.CollectionType(
+        'MAP', [t.NativeType('TEXT', types.native_types['TEXT']),
+                t.NativeType('INT', types.native_types['INT'])])
+    assert CQL3('list<uuid>').comparator_type() == t.CollectionType(
+        'LIST', [t.NativeType('UUID', types.native_types['UUID'])])
+    assert CQL3("set<'Foo'>").comparator_type() == t.CollectionType(
+        'SET', ['Foo'])
+
+    with pytest.raises(ParseError):
+        CQL3('list<set<int>>').comparator_type()
+
+
+def test_CREATE_TABLE():
+    int_type = t.NativeType('INT', types.native_types['INT'])
+    assert CQL3(
+        "CREATE TABLE ks.t (k int PRIMARY KEY, v int)"
+    ).create_table() == t.CreateTable(
+        t.Table(t.Identifier('t'), t.Keyspace(t.Identifier('ks'))),
+        [t.ColumnDefinition(t.Column(t.Identifier('k')), int_type, True),
+         t.ColumnDefinition(t.Column(t.Identifier('v')), int_type, False)],
+        None)
+
+    assert CQL3(
+        "CREATE COLUMNFAMILY t (a int, b int, c int, "
+        "PRIMARY KEY ((a, b), c)) "
+        "WITH COMPACT STORAGE AND CLUSTERING ORDER BY (c DESC) "
+        "AND comment = 'x'"
+    ).create_table() == t.CreateTable(
+        t.Table(t.Identifier('t'), None),
+        [t.ColumnDefinition(t.Column(t.Identifier('a')), int_type, False),
+         t.ColumnDefinition(t.Column(t.Identifier('b')), int_type, False),
+         t.ColumnDefinition(t.Column(t.Identifier('c')), int_type, False),
+         t.PrimaryKey([t.Column(t.Identifier('a')),
+                       t.Column(t.Identifier('b'))],
+                      [t.Column(t.Identifier('c'))])],
+        t.Properties([
+            t.CompactStorage(),
+            t.ClusteringOrder([t.OrderBy(t.Column(t.Identifier('c')),
+                                         'DESC')]),
+            t.Property(t.Identifier('comment'), 'x')]))
+
+    assert CQL3(
+        "CREATE TABLE t (a int, PRIMARY KEY (a))"
+    ).create_table() == t.CreateTable(
+        t.Table(t.Identifier('t'), None),
+        [t.ColumnDefinition(t.Column(t.Identifier('a')), int_type, False),
+         t.PrimaryKey([t.Column(t.Identifier('a'))], [])],
+        None)
+
+
+def test_ALTER_TABLE():
+    table = t.Table(t.Identifier('t'), None)
+    column = t.Column(t.Identifier('c'))
+    blob = t.NativeType('BLOB', types.native_types['BLOB'])
+
+    assert CQL3('ALTER TABLE t ALTER c TYPE blob').alter_table() == (
+        t.AlterTable(table, t.AlterType(column, blob)))
+    assert CQL3('ALTER COLUMNFAMILY t ADD c blob').alter_table() == (
+        t.AlterTable(table, t.AddColumn(column, blob)))
+    assert CQL3('ALTER TABLE t DROP c').alter_table() == (
+        t.AlterTable(table, t.DropColumn(column)))
+    assert CQL3("ALTER TABLE t WITH comment = 'x'").alter_table() == (
+        t.AlterTable(table, t.Properties([
+            t.Property(t.Identifier('comment'), 'x')])))
+    assert CQL3('ALTER TABLE t RENAME a TO b AND c TO d').alter_table() == (
+        t.AlterTable(table, t.Rename([
+            t.RenameColumn(t.Column(t.Identifier('a')),
+                           t.Column(t.Identifier('b'))),
+            t.RenameColumn(column, t.Column(t.Identifier('d')))])))
+
+
 def test_INSERT():
     assert CQL3(
         "INSERT INTO foo (bar, baz) VALUES (?, 'foo')"
@@ -522,6 +651,17 @@ def test_in_relation():
         t.Column(t.Identifier('key')), 'in', ['foo', 'bar', 'baz', 0])]
 
 
+def test_in_relation_bindings():
+    assert CQL3(
+        "key IN (?, 1, :name, 'x')"
+    ).relations() == [t.Relation(
+        t.Column(t.Identifier('key')), 'in',
+        [t.Binding(), 1, t.NamedBinding('name'), 'x'])]
+
+    with pytest.raises(ParseError):
+        CQL3("key IN (1, )").relations()
+
+
 def test_token_relation():
     assert CQL3(
         "TOKEN(foo, bar) > TOKEN('one', 'two')"
@@ -657,3 +797,14 @@ APPLY BATCH
             t.Table(t.Identifier('foo'), None),
             [],
             [t.Relation(t.Column(t.Identifier('baz')), '=', 'bar')])])
+
+
+def test_parse_error_position():
+    """
+    Parse errors report their position in the text, not in the tokens.
+    """
+    with pytest.raises(ParseError) as e:
+        CQL3("SELECT * FROM table WHERE key = @").select()
+
+    assert e.value.position == 32
+    assert e.value.input == "SELECT * FROM table WHERE key = @"
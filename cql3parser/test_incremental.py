@@ -0,0 +1,118 @@
+import random
+
+import pytest
+
+from cql3parser import incremental
+from cql3parser.incremental import Document
+
+SCRIPT = u"""USE ks;
+CREATE KEYSPACE ks WITH replication = {'class': 'SimpleStrategy'};
+INSERT INTO foo (bar, baz) VALUES ('semi;colon', 'it''s; here');
+SELECT "odd;name" FROM foo WHERE bar = 'x';
+BEGIN BATCH
+    INSERT INTO foo (bar, baz) VALUES ('a', 'b');
+    DELETE bar FROM foo WHERE baz = 'apply batch;';
+APPLY BATCH;
+DROP TABLE foo
+"""
+
+
+def summary(document):
+    return [(s.text, s.start, s.end, s.stop, s.value, s.error is None)
+            for s in document.statements]
+
+
+def test_document():
+    document = Document(SCRIPT)
+
+    assert len(document) == 6
+    assert [s.value.__class__.__name__ for s in document.statements] == [
+        'Use', 'CreateKeyspace', 'Insert', 'Select', 'Batch', 'Drop']
+    assert document.errors == []
+
+    for s in document.statements:
+        assert SCRIPT[s.start:s.end] == s.text
+
+
+def test_errors():
+    document = Document(u"USE ks; SELECT FROM; DROP TABLE t")
+    assert [s.text for s in document.errors] == [u"SELECT FROM"]
+    assert document.errors[0].value is None
+
+
+def test_statement_at():
+    document = Document(SCRIPT)
+
+    assert document.statement_at(0).text == u"USE ks"
+    assert document.statement_at(6).text == u"USE ks"
+    assert document.statement_at(7).value.__class__.__name__ == (
+        'CreateKeyspace')
+    assert document.statement_at(len(SCRIPT) - 1).text == u"DROP TABLE foo"
+    assert Document(u"USE ks; ").statement_at(7) is None
+
+
+def test_edit_reuses_statements():
+    document = Document(SCRIPT)
+    start = SCRIPT.index("'x'")
+    edited = document.edit(start, start + 3, u"'changed'")
+
+    assert edited.text == SCRIPT.replace("'x'", "'changed'")
+    assert summary(edited) == summary(Document(edited.text))
+    for before, after in zip(document.statements, edited.statements):
+        if before.text == after.text:
+            assert before.value is after.value
+        else:
+            assert after.text.endswith(u"'changed'")
+
+    # The original document is unchanged.
+    assert summary(document) == summary(Document(SCRIPT))
+
+
+def test_edit_parses_only_the_changed_statement():
+    parsed = []
+
+    def parser(text):
+        parsed.append(text)
+        return incremental.CQL3Nodes(text)
+
+    document = Document(SCRIPT, parser)
+    del parsed[:]
+
+    start = SCRIPT.index('ks;')
+    document.edit(start, start + 2, u'other')
+    assert parsed == [u"USE other"]
+
+
+@pytest.mark.parametrize(('start', 'end', 'text'), [
+    (0, 0, u"USE a; "),
+    (0, 7, u""),
+    (6, 7, u""),
+    (6, 6, u" x"),
+    (len(SCRIPT), len(SCRIPT), u"; USE end"),
+    (len(SCRIPT) - 4, len(SCRIPT), u"bar;"),
+    (SCRIPT.index('semi'), SCRIPT.index('semi'), u"'"),
+    (SCRIPT.index('BEGIN'), SCRIPT.index('BEGIN') + 5, u"USE"),
+    (SCRIPT.index('APPLY'), SCRIPT.index('APPLY') + 5, u""),
+    (0, len(SCRIPT), u""),
+])
+def test_edit(start, end, text):
+    edited = Document(SCRIPT).edit(start, end, text)
+    assert summary(edited) == summary(
+        Document(SCRIPT[:start] + text + SCRIPT[end:]))
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_random_edits(seed, monkeypatch):
+    monkeypatch.setattr(incremental, 'CHUNK_SIZE', 16)
+    r = random.Random(seed)
+    pieces = [u";", u"'", u'"', u" ", u"USE ks", u"x", u"BEGIN BATCH ",
+              u"APPLY BATCH", u"DROP TABLE t;", u"\n"]
+
+    document = Document(SCRIPT)
+    for _ in range(30):
+        start = r.randint(0, len(document.text))
+        end = r.randint(start, min(len(document.text), start + 10))
+        text = u''.join(r.choice(pieces) for _ in range(r.randint(0, 3)))
+
+        document = document.edit(start, end, text)
+        assert summary(document) == summary(Document(document.text))
@@ -0,0 +1,122 @@
+import copy
+import pickle
+
+import pytest
+
+from cql3parser import CQL3, CQL3Nodes, nodes
+from cql3parser.formatter import to_cql
+from cql3parser.interning import InternPool, interning_parser
+
+SELECT = "SELECT a, b FROM ks.t WHERE a = 1"
+
+
+def test_same_results():
+    parser = interning_parser()
+    assert parser(SELECT).select() == CQL3(SELECT).select()
+
+
+def test_nodes():
+    parser = interning_parser(InternPool(nodes))
+    assert parser(SELECT).select() == CQL3Nodes(SELECT).select()
+
+
+@pytest.mark.parametrize('builder', [None, nodes])
+def test_shared_names(builder):
+    if builder is None:
+        parser = interning_parser()
+    else:
+        parser = interning_parser(InternPool(builder))
+
+    first = parser(SELECT).select()
+    second = parser("SELECT b FROM ks.t WHERE b = 2").select()
+
+    if builder is None:
+        assert first.args[1] is second.args[1]
+        assert first.args[0].args[1] is second.args[0].args[0]
+    else:
+        assert first.table is second.table
+        assert first.selectors[1] is second.selectors[0]
+        assert first.table.keyspace.name is second.table.keyspace.name
+
+
+def test_case_insensitive_names():
+    parser = interning_parser(InternPool(nodes))
+    assert (parser('USE ks').use().keyspace is
+            parser('USE KS').use().keyspace)
+
+
+def test_quoted_names():
+    parser = interning_parser(InternPool(nodes))
+    assert (parser('USE "Ks"').use().keyspace is
+            parser('USE "Ks"').use().keyspace)
+    assert (parser('USE "Ks"').use().keyspace is not
+            parser('USE ks').use().keyspace)
+
+
+def test_other_terms_not_shared():
+    parser = interning_parser(InternPool(nodes))
+    assert (parser(SELECT).select().where[0] is not
+            parser(SELECT).select().where[0])
+
+
+def test_bounded():
+    pool = InternPool(nodes, maxsize=3)
+    parser = interning_parser(pool)
+
+    first = parser('USE ks').use().keyspace
+    assert len(pool) == 2
+    parser('USE other').use()
+    assert len(pool) == 3
+    assert pool.info().evictions == 1
+
+    assert parser('USE ks').use().keyspace is not first
+    assert parser('USE ks').use().keyspace == first
+
+
+def test_clear():
+    pool = InternPool(nodes)
+    parser = interning_parser(pool)
+
+    first = parser('USE ks').use().keyspace
+    pool.clear()
+    assert len(pool) == 0
+    assert parser('USE ks').use().keyspace is not first
+
+
+def test_resize():
+    pool = InternPool(nodes)
+    parser = interning_parser(pool)
+    parser(SELECT).select()
+
+    pool.resize(2)
+    assert len(pool) == 2
+    assert pool.info().maxsize == 2
+
+
+def test_read_only():
+    parser = interning_parser(InternPool(nodes))
+    select = parser(SELECT).select()
+    table = select.table
+    with pytest.raises(AttributeError):
+        table.name = nodes.Identifier('other')
+    with pytest.raises(AttributeError):
+        del table.keyspace.name
+    assert parser(SELECT).select().table.name == nodes.Identifier('t')
+
+    # Only the shared names are read-only, and copies of them aren't.
+    select.table = copy.copy(table)
+    select.table.name = nodes.Identifier('other')
+    assert to_cql(select) == "SELECT a, b FROM ks.other WHERE a = 1"
+    assert table.name == nodes.Identifier('t')
+
+
+def test_read_only_nodes_like_others():
+    parser = interning_parser(InternPool(nodes))
+    select = parser(SELECT).select()
+    other = CQL3Nodes(SELECT).select()
+    assert select == other and other == select
+    assert nodes.node_key(select) == nodes.node_key(other)
+    assert to_cql(select) == to_cql(other) == SELECT
+    assert to_cql(parser('DROP TABLE ks.t').drop()) == 'DROP TABLE ks.t'
+    assert nodes.to_term(select) == CQL3(SELECT).select()
+    assert type(pickle.loads(pickle.dumps(select.table))) is nodes.Table
@@ -0,0 +1,65 @@
+import uuid
+
+import pytest
+
+from cql3parser.lexer import Token, tokenize
+
+
+def kinds(text):
+    return [(token.kind, token.value) for token in tokenize(text)]
+
+
+def test_keywords_and_identifiers():
+    assert kinds('SELECT foo_b4r FROM Table') == [
+        ('keyword', 'SELECT'),
+        ('identifier', 'FOO_B4R'),
+        ('keyword', 'FROM'),
+        ('keyword', 'TABLE')]
+
+
+def test_token_offsets():
+    assert tokenize("  USE ks;") == [
+        Token('keyword', 'USE', 'USE', 2, 5),
+        Token('identifier', 'ks', 'KS', 6, 8),
+        Token('punctuation', ';', ';', 8, 9)]
+
+
+def test_quoted():
+    assert kinds("'foo''s' \"Foo \"\"bar\"\"\" ''") == [
+        ('string', "foo's"),
+        ('quoted_name', 'Foo "bar"'),
+        ('string', '')]
+
+
+@pytest.mark.parametrize(
+    ('text', 'kind', 'value'),
+    [('10', 'integer', 10),
+     ('-0010', 'integer', -10),
+     ('1.5', 'float', 1.5),
+     ('-1.0e-9', 'float', -1.0e-9),
+     ('1E10', 'float', 1e10)])
+def test_numbers(text, kind, value):
+    assert kinds(text) == [(kind, value)]
+
+
+def test_uuid():
+    u = uuid.uuid4()
+    assert kinds(str(u)) == [('uuid', u)]
+    assert kinds(str(u).upper()) == [('uuid', u)]
+
+
+def test_punctuation():
+    assert [token.text for token in tokenize("<=>=<>=(),.;:?*[]{}")] == [
+        '<=', '>=', '<', '>=', '(', ')', ',', '.', ';', ':', '?', '*', '[',
+        ']', '{', '}']
+
+
+def test_errors():
+    """
+    Unknown characters and unterminated quotes become error tokens.
+    """
+    assert kinds("a @ 'b") == [
+        ('identifier', 'A'),
+        ('error', '@'),
+        ('error', "'"),
+        ('identifier', 'B')]
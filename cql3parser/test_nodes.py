@@ -0,0 +1,114 @@
+import pickle
+
+import pytest
+
+from parsley import termMaker as t
+
+from cql3parser import CQL3, CQL3Nodes, nodes
+from cql3parser.nodes import from_term, to_term
+
+STATEMENTS = [
+    "USE ks",
+    "DROP KEYSPACE ks",
+    "DROP TABLE ks.t",
+    "DROP INDEX idx",
+    "DROP USER 'u'",
+    "TRUNCATE t",
+    "GRANT ALL ON ALL KEYSPACES TO u",
+    "REVOKE SELECT PERMISSION ON TABLE ks.t FROM u",
+    "LIST USERS",
+    "LIST ALL PERMISSIONS ON ks.t OF u NORECURSIVE",
+    "CREATE USER u WITH PASSWORD 'p' SUPERUSER",
+    "ALTER USER u NOSUPERUSER",
+    "CREATE INDEX idx ON ks.t (c)",
+    "CREATE KEYSPACE ks WITH replication = {'class': 'SimpleStrategy', "
+    "'replication_factor': 1} AND durable_writes = false",
+    "ALTER KEYSPACE ks WITH comment = 'x' AND flag = true",
+    "INSERT INTO t (a, b, c, d, e) VALUES (?, 'x', {1, 2}, [1.5], {'k': 1}) "
+    "USING TTL 10 AND TIMESTAMP 100",
+    "SELECT COUNT(*) FROM t",
+    "SELECT a, WRITETIME(b), TTL(c) FROM \"T\" WHERE k = 'x' AND c > ? "
+    "AND d IN (1, 2) AND TOKEN(k, c) > TOKEN('a', 1) "
+    "ORDER BY c DESC LIMIT 10 ALLOW FILTERING",
+    "DELETE a, b['k'] FROM t USING TIMESTAMP 10 WHERE k = 'x'",
+    "BEGIN BATCH INSERT INTO t (a) VALUES (1); DELETE FROM t WHERE a = 2 "
+    "APPLY BATCH",
+]
+
+
+@pytest.mark.parametrize('statement', STATEMENTS)
+def test_to_term(statement):
+    assert to_term(CQL3Nodes(statement).statement()) == CQL3(
+        statement).statement()
+
+
+@pytest.mark.parametrize('statement', STATEMENTS)
+def test_from_term(statement):
+    assert from_term(CQL3(statement).statement()) == CQL3Nodes(
+        statement).statement()
+
+
+def test_nodes():
+    select = CQL3Nodes("SELECT a FROM ks.t WHERE k = 1 LIMIT 5").select()
+
+    assert select == nodes.Select(
+        [nodes.Column(nodes.Identifier('a'))],
+        nodes.Table(nodes.Identifier('t'),
+                    nodes.Keyspace(nodes.Identifier('ks'))),
+        [nodes.Relation(nodes.Column(nodes.Identifier('k')), '=', 1)],
+        None,
+        nodes.Limit(5),
+        None)
+    assert select.table.keyspace.name.name == 'ks'
+    assert select.limit.value == 5
+
+
+def test_slots():
+    column = nodes.Column(nodes.Identifier('a'))
+    assert not hasattr(column, '__dict__')
+
+    with pytest.raises(AttributeError):
+        column.other = 1
+
+
+def test_equality():
+    assert nodes.Limit(10) == nodes.Limit(10)
+    assert nodes.Limit(10) != nodes.TTL(10)
+    assert nodes.Limit(10) != nodes.Limit(11)
+    assert nodes.Limit(10) != (10,)
+
+
+def test_unhashable():
+    with pytest.raises(TypeError):
+        hash(nodes.Identifier('a'))
+    with pytest.raises(TypeError):
+        hash(CQL3Nodes('SELECT * FROM t').statement())
+
+
+def test_node_key():
+    statement = CQL3Nodes("SELECT a, b FROM t WHERE c IN (1, 2)").statement()
+    key = nodes.node_key(statement)
+    assert hash(key) == hash(nodes.node_key(
+        CQL3Nodes("SELECT a, b FROM t WHERE c IN (1, 2)").statement()))
+    assert key != nodes.node_key(
+        CQL3Nodes("SELECT a, b FROM t WHERE c IN (1, 3)").statement())
+    assert nodes.node_key(nodes.Limit(10)) != nodes.node_key(nodes.TTL(10))
+    assert {nodes.node_key(nodes.Limit(10)): 1}[
+        nodes.node_key(nodes.Limit(10))] == 1
+
+
+def test_repr():
+    assert repr(nodes.Table(nodes.Identifier('t'), None)) == (
+        "Table(name=Identifier(name='t'), keyspace=None)")
+
+
+def test_pickle():
+    statement = CQL3Nodes(STATEMENTS[17]).statement()
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        assert pickle.loads(pickle.dumps(statement, protocol)) == statement
+
+
+def test_from_term_values():
+    assert from_term(1) == 1
+    assert from_term(t.Binding()) == nodes.Binding()
+    assert from_term(t.Limit(None)) == nodes.Limit(None)
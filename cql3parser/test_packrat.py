@@ -0,0 +1,58 @@
+import pytest
+
+from parsley import ParseError
+
+from cql3parser import CQL3, CQL3Nodes
+from cql3parser.grammar import node_bindings, packrat_parser
+
+
+def test_same_results(canonical):
+    statement, _ = canonical
+    assert packrat_parser()(statement).statement() == CQL3(
+        statement).statement()
+
+
+def test_nodes(canonical):
+    statement, _ = canonical
+    assert packrat_parser(bindings=node_bindings)(
+        statement).statement() == CQL3Nodes(statement).statement()
+
+
+@pytest.mark.parametrize('memo_size', [0, 1, 10])
+def test_small_memo(canonical_statements, memo_size):
+    parser = packrat_parser(memo_size)
+    for statement in canonical_statements:
+        assert parser(statement).statement() == CQL3(statement).statement()
+
+
+def test_memo_is_bounded():
+    statement = "SELECT * FROM t WHERE {0}".format(
+        ' AND '.join('c{0} = {0}'.format(i) for i in range(100)))
+    parser = packrat_parser(50)(statement)
+    parser.statement()
+    assert len(parser._grammar._memo) == 50
+
+
+def test_memo_is_per_parse():
+    parser = packrat_parser()
+    first = parser("USE ks")
+    first.statement()
+    second = parser("USE ks")
+    assert second._grammar._memo == {}
+    assert second.statement() == CQL3("USE ks").statement()
+
+
+@pytest.mark.parametrize('statement', [
+    "SELECT FROM t",
+    "INSERT INTO t (a) VALUES ({'a': 1, 2})",
+    "SELECT * FROM t WHERE k IN (1, 2",
+])
+def test_same_errors(statement):
+    with pytest.raises(ParseError) as expected:
+        CQL3(statement).statement()
+    with pytest.raises(ParseError) as e:
+        packrat_parser()(statement).statement()
+
+    assert e.type is expected.type
+    assert e.value.position == expected.value.position
+    assert e.value.formatError() == expected.value.formatError()
@@ -0,0 +1,124 @@
+import pytest
+
+from cql3parser import CQL3, CQL3Nodes
+from cql3parser.planner import (
+    FILTERED_SCAN, FULL_SCAN, INDEX_SCAN, MULTI_PARTITION, SCANS,
+    SINGLE_PARTITION, TOKEN_RANGE, Planner)
+from cql3parser.schema import SchemaError
+
+
+@pytest.fixture
+def planner(catalog):
+    return Planner(catalog, partitions=1000)
+
+
+def plan(planner, text):
+    return planner.plan(CQL3Nodes(text).statement())
+
+
+@pytest.mark.parametrize(('where', 'kind', 'cost', 'filtering'), [
+    ("user = ? AND day = 1", SINGLE_PARTITION, 1, False),
+    ("user = ? AND day = 1 AND at > ?", SINGLE_PARTITION, 1, False),
+    ("user = ? AND day = 1 AND at = ? AND kind IN ('a', 'b')",
+     SINGLE_PARTITION, 1, False),
+    ("user = ? AND day = 1 AND email = 'x'", SINGLE_PARTITION, 1, False),
+    ("user = ? AND day = 1 AND kind = 'a'", SINGLE_PARTITION, 1, True),
+    ("user = ? AND day = 1 AND body = 'a'", SINGLE_PARTITION, 1, True),
+    ("user IN (?, ?) AND day IN (1, 2, 3)", MULTI_PARTITION, 6, False),
+    ("TOKEN(user, day) > TOKEN(1, 2)", TOKEN_RANGE, 1000, False),
+    ("TOKEN(user, day) > TOKEN(1, 2) AND body = 'x'",
+     TOKEN_RANGE, 1000, True),
+    ("email = 'x'", INDEX_SCAN, 10, False),
+    ("email = 'x' AND body = 'y'", INDEX_SCAN, 10, True),
+    ("user = ?", FILTERED_SCAN, 1000, True),
+    ("body = 'x'", FILTERED_SCAN, 1000, True),
+    ("email > 'x'", FILTERED_SCAN, 1000, True),
+])
+def test_kinds(planner, where, kind, cost, filtering):
+    result = plan(planner, 'SELECT * FROM events WHERE ' + where)
+    assert result.kind == kind
+    assert result.cost == cost
+    assert result.filtering == filtering
+    assert (kind in SCANS) == (result.partitions is None)
+
+
+def test_full_scan(planner):
+    result = plan(planner, 'SELECT * FROM events')
+    assert result.kind == FULL_SCAN
+    assert result.cost == 1000
+    assert not result.filtering
+    assert result.problems == ()
+
+    assert plan(planner, 'SELECT * FROM events LIMIT 10').cost == 10
+    assert plan(planner, "SELECT * FROM events WHERE body = 'x' "
+                         "LIMIT 10 ALLOW FILTERING").cost == 1000
+
+
+def test_index(planner, catalog):
+    index = catalog.index('events', 'email')
+    assert plan(planner, "SELECT * FROM events WHERE email = 'x'").index == (
+        index)
+    assert plan(planner, "SELECT * FROM events "
+                         "WHERE user = ? AND day = 1 AND email = 'x'"
+                ).index is None
+
+
+def test_partitions(planner):
+    assert plan(planner, "SELECT * FROM events WHERE user = ? AND day = 1"
+                ).partitions == 1
+    assert plan(planner, "SELECT * FROM events "
+                         "WHERE user IN (?, ?) AND day = 1").partitions == 2
+
+
+@pytest.mark.parametrize(('text', 'problem'), [
+    ("SELECT * FROM events WHERE body = 'x'", 'ALLOW FILTERING'),
+    ("SELECT * FROM events WHERE user > ? AND day = 1 ALLOW FILTERING",
+     'Only EQ and IN'),
+    ("SELECT * FROM events WHERE TOKEN(user) > TOKEN(1)", 'token function'),
+    ("SELECT * FROM events ORDER BY at DESC", 'ORDER BY is only supported'),
+    ("SELECT * FROM events WHERE user = ? AND day = 1 ORDER BY body ASC",
+     'clustered columns'),
+])
+def test_problems(planner, text, problem):
+    [message] = plan(planner, text).problems
+    assert problem in message
+
+
+def test_allow_filtering(planner):
+    result = plan(planner, "SELECT * FROM events WHERE body = 'x' "
+                           "ALLOW FILTERING")
+    assert result.filtering
+    assert result.problems == ()
+
+
+def test_unknown_names(planner):
+    with pytest.raises(SchemaError):
+        plan(planner, "SELECT * FROM missing")
+    with pytest.raises(SchemaError):
+        plan(planner, "SELECT * FROM events WHERE missing = 1")
+
+
+def test_other_statements(planner):
+    assert plan(planner, "INSERT INTO events (user) VALUES (?)") is None
+
+
+def test_terms(planner):
+    text = "SELECT * FROM ks.events WHERE user = ? AND day IN (1, 2)"
+    assert planner.plan(CQL3(text).statement()) == plan(planner, text)
+
+
+def test_memoized_by_shape(planner):
+    first = plan(planner, "SELECT a FROM events WHERE user = ? AND day = 1")
+    assert plan(planner, "SELECT b, c FROM events "
+                         "WHERE user = 1 AND day = 2") is first
+    assert planner.cache.info().hits == 1
+
+    plan(planner, "SELECT a FROM events WHERE user IN (1, 2) AND day = 1")
+    assert planner.cache.info().misses == 2
+
+
+def test_schema_changes(planner, catalog):
+    text = "SELECT * FROM events WHERE body = 'x'"
+    assert plan(planner, text).kind == FILTERED_SCAN
+    catalog.apply(CQL3Nodes("CREATE INDEX ON events (body)").statement())
+    assert plan(planner, text).kind == INDEX_SCAN
@@ -0,0 +1,145 @@
+import pytest
+
+from parsley import ParseError
+
+from cql3parser import CQL3Nodes, nodes
+from cql3parser.prepared import Variable, prepare
+
+
+def column(name):
+    return nodes.Column(nodes.Identifier(name))
+
+
+def test_grammar():
+    assert CQL3Nodes(':Foo').term() == nodes.NamedBinding('foo')
+    assert CQL3Nodes('?').term() == nodes.Binding()
+    assert CQL3Nodes('a IN (?, :b, 1)').relation() == nodes.Relation(
+        column('a'), 'in',
+        [nodes.Binding(), nodes.NamedBinding('b'), 1])
+
+    with pytest.raises(ParseError):
+        CQL3Nodes(': 1').term()
+
+
+def test_insert():
+    p = prepare("insert into t (a, b, c) values (?, 'x', ?) using ttl 5")
+
+    assert p.text == "INSERT INTO t (a, b, c) VALUES (?, 'x', ?) USING TTL 5"
+    assert p.variables == (Variable(0, None, column('a'), None),
+                           Variable(1, None, column('c'), None))
+    assert p.bind([1, "it's"]) == (
+        "INSERT INTO t (a, b, c) VALUES (1, 'x', 'it''s') USING TTL 5")
+    assert p.bind(([1, 2], {'k': True})) == (
+        "INSERT INTO t (a, b, c) VALUES ([1, 2], 'x', {'k': true}) "
+        "USING TTL 5")
+
+
+def test_select():
+    p = prepare("SELECT * FROM t WHERE k = ? AND c > ? AND d IN (?, 1, ?) "
+                "AND TOKEN(k) > TOKEN('a')")
+
+    assert [v.column for v in p.variables] == [
+        column('k'), column('c'), column('d'), column('d')]
+    assert p.bind(['a', 1.5, 2, 3]) == (
+        "SELECT * FROM t WHERE k = 'a' AND c > 1.5 AND d IN (2, 1, 3) "
+        "AND TOKEN(k) > TOKEN('a')")
+
+
+def test_delete():
+    p = prepare("DELETE m[?] FROM t WHERE k = ?")
+
+    assert p.variables == (Variable(0, None, None, None),
+                           Variable(1, None, column('k'), None))
+    assert p.bind(['x', 1]) == "DELETE m['x'] FROM t WHERE k = 1"
+
+
+def test_batch():
+    p = prepare("BEGIN BATCH INSERT INTO t (a) VALUES (?); "
+                "DELETE FROM t WHERE a = ? APPLY BATCH")
+
+    assert p.bind([1, 2]) == (
+        "BEGIN BATCH INSERT INTO t (a) VALUES (1); "
+        "DELETE FROM t WHERE a = 2; APPLY BATCH")
+
+
+def test_named():
+    p = prepare("SELECT * FROM t WHERE k = :key AND c > :c AND d < :key")
+
+    assert [v.name for v in p.variables] == ['key', 'c', 'key']
+    assert p.bind({'key': 1, 'c': 'x'}) == (
+        "SELECT * FROM t WHERE k = 1 AND c > 'x' AND d < 1")
+    assert p.bind([1, 2, 3]) == (
+        "SELECT * FROM t WHERE k = 1 AND c > 2 AND d < 3")
+
+    with pytest.raises(ValueError):
+        p.bind({'key': 1})
+
+
+def test_mixed_markers():
+    with pytest.raises(ValueError):
+        prepare("SELECT * FROM t WHERE k = :key AND c > ?")
+
+
+def test_bind_by_name_needs_names():
+    p = prepare("SELECT * FROM t WHERE k = ?")
+
+    with pytest.raises(ValueError):
+        p.bind({'k': 1})
+
+
+def test_wrong_number_of_values():
+    p = prepare("SELECT * FROM t WHERE k = ?")
+
+    with pytest.raises(ValueError):
+        p.bind([])
+    with pytest.raises(ValueError):
+        p.bind([1, 2])
+
+
+def test_no_markers():
+    p = prepare("select * from t")
+    assert p.variables == ()
+    assert p.bind([]) == "SELECT * FROM t"
+
+
+def test_binding_value():
+    p = prepare("SELECT * FROM t WHERE k = ? AND c = ?")
+    assert p.bind([nodes.Binding(), 1]) == (
+        "SELECT * FROM t WHERE k = ? AND c = 1")
+
+
+def test_string_markers_are_text():
+    p = prepare("SELECT * FROM t WHERE k = '?' AND c = ':c' AND d = ?")
+    assert len(p.variables) == 1
+    assert p.bind([1]) == (
+        "SELECT * FROM t WHERE k = '?' AND c = ':c' AND d = 1")
+
+
+def test_map_literals():
+    p = prepare("INSERT INTO t (a, m, n) "
+                "VALUES (?, {'x': true}, {'y': false})")
+    assert p.text == (
+        "INSERT INTO t (a, m, n) VALUES (?, {'x': true}, {'y': false})")
+    assert len(p.variables) == 1
+    assert p.bind([1]) == (
+        "INSERT INTO t (a, m, n) VALUES (1, {'x': true}, {'y': false})")
+
+
+def test_types():
+    p = prepare("SELECT * FROM t WHERE k = ? AND c > ? AND m = ?",
+                {'k': 'uuid', 'c': 'INT'})
+
+    assert [v.type for v in p.variables] == [
+        nodes.NativeType('UUID', 'org.apache.cassandra.db.marshal.UUIDType'),
+        nodes.NativeType('INT', 'org.apache.cassandra.db.marshal.Int32Type'),
+        None]
+
+
+def test_unknown_type():
+    with pytest.raises(ValueError) as e:
+        prepare("SELECT * FROM t WHERE k = ?", {'k': 'integer'})
+    assert str(e.value) == "'integer', the type of k, is not a native type"
+
+
+def test_repr():
+    assert repr(prepare("use ks")) == "PreparedStatement('USE ks')"
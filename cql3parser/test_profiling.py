@@ -0,0 +1,91 @@
+import pstats
+
+import pytest
+
+from parsley import ParseError
+
+from cql3parser import CQL3, CQL3Nodes
+from cql3parser.grammar import GRAMMAR_PATH, node_bindings
+from cql3parser.profiling import Profile, profiling_parser
+
+SELECT = "SELECT a, b FROM ks.t WHERE k = 'x' AND c IN (1, 2) LIMIT 3"
+
+
+@pytest.fixture
+def profile():
+    return Profile()
+
+
+def test_same_results(profile, canonical_statements):
+    parser = profiling_parser(profile)
+    nodes_parser = profiling_parser(profile, node_bindings)
+    for statement in canonical_statements:
+        assert parser(statement).statement() == CQL3(statement).statement()
+        assert nodes_parser(statement).statement() == CQL3Nodes(
+            statement).statement()
+
+
+def test_counts(profile):
+    parser = profiling_parser(profile)
+    for i in range(3):
+        parser(SELECT).statement()
+
+    rules = profile.rules
+    assert rules['statement'].calls == rules['select'].calls == 3
+    assert rules['statement'].consumed == 3 * len(SELECT)
+    assert rules['relation'].calls == 6
+    assert rules['relation'].failures == 0
+    assert rules['column'].consumed == 3 * len('abkc')
+    assert rules['k'].failures > 0
+    assert rules['select'].callers == {'dispatch': 3}
+
+
+def test_times(profile):
+    parser = profiling_parser(profile)
+    parser(SELECT).statement()
+
+    rules = profile.rules
+    total = sum(stats.tottime for stats in rules.values())
+    assert rules['statement'].cumtime == pytest.approx(total)
+    for stats in rules.values():
+        assert 0 <= stats.tottime <= stats.cumtime
+
+
+def test_failures(profile):
+    parser = profiling_parser(profile)
+    with pytest.raises(ParseError):
+        parser('SELECT * FROM').statement()
+    assert profile.rules['statement'].failures == 1
+    assert profile.rules['statement'].consumed == 0
+
+
+def test_table(profile):
+    profiling_parser(profile)(SELECT).statement()
+    lines = profile.table(limit=3).splitlines()
+    assert lines[0].split() == [
+        'rule', 'calls', 'failures', 'tottime', 'cumtime', 'consumed']
+    assert len(lines) == 4
+
+    lines = profile.table(sort='calls').splitlines()
+    assert lines[1].split()[0] == 'k'
+    assert len(lines) == len(profile.rules) + 1
+
+
+def test_pstats(profile, tmpdir):
+    profiling_parser(profile)(SELECT).statement()
+    stats = pstats.Stats(profile)
+    assert stats.total_calls == sum(s.calls for s in profile.rules.values())
+
+    locations = dict((key[2], key) for key in stats.stats)
+    assert locations['select'][0] == GRAMMAR_PATH
+    assert locations['k'][0].endswith('grammar.py')
+
+    path = str(tmpdir.join('cql3.prof'))
+    profile.dump_stats(path)
+    assert pstats.Stats(path).stats == stats.stats
+
+
+def test_clear(profile):
+    profiling_parser(profile)(SELECT).statement()
+    profile.clear()
+    assert profile.rules == {}
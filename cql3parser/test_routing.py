@@ -0,0 +1,191 @@
+import datetime
+import decimal
+import os
+import uuid
+
+import pytest
+
+from cql3parser import CQL3, CQL3Nodes
+from cql3parser import routing
+from cql3parser.routing import (
+    RoutingError, group_by_range, key_tokens, murmur3, murmur3_many,
+    partition_keys, routing_key, serialize, statement_keys,
+    statement_tokens, token_range)
+from cql3parser.schema import SchemaError
+
+# Tokens computed by Cassandra, as used by the python driver's tests.
+TOKENS = [
+    (b'123', -7468325962851647638),
+    (b'\x00\xff\x10\xfa\x99' * 10, 5837342703291459765),
+    (b'\xfe' * 8, -8927430733708461935),
+    (b'\x10' * 8, 1446172840243228796),
+    (b'9223372036854775807', 7162290910810015547),
+    (b'', -2 ** 63),
+]
+
+
+@pytest.fixture(params=['numpy', 'python'])
+def numpy(request, monkeypatch):
+    if request.param == 'numpy':
+        pytest.importorskip('numpy')
+    else:
+        monkeypatch.setattr(routing, 'numpy', None)
+
+
+def statement(text):
+    return CQL3Nodes(text).statement()
+
+
+def native_type(name):
+    return CQL3Nodes(name).native_type()
+
+
+@pytest.mark.parametrize(('key', 'token'), TOKENS)
+def test_murmur3(key, token):
+    assert murmur3(key) == token
+
+
+def test_murmur3_many(numpy):
+    keys = [key for key, _ in TOKENS]
+    assert list(murmur3_many(keys)) == [token for _, token in TOKENS]
+
+    keys = [os.urandom(i % 40) for i in range(500)]
+    assert list(murmur3_many(keys)) == [murmur3(key) for key in keys]
+    assert list(murmur3_many(keys[1:2] * 3)) == [murmur3(keys[1])] * 3
+    assert list(murmur3_many([])) == []
+
+
+@pytest.mark.parametrize(('type', 'value', 'expected'), [
+    ('int', -2, b'\xff\xff\xff\xfe'),
+    ('bigint', 1, b'\x00' * 7 + b'\x01'),
+    ('counter', 1, b'\x00' * 7 + b'\x01'),
+    ('text', u'th\xe9', b'th\xc3\xa9'),
+    ('varchar', b'abc', b'abc'),
+    ('ascii', u'abc', b'abc'),
+    ('boolean', True, b'\x01'),
+    ('blob', b'\x00\x01', b'\x00\x01'),
+    ('blob', bytearray(b'\x00\x01'), b'\x00\x01'),
+    ('blob', memoryview(b'\x00\x01'), b'\x00\x01'),
+    ('double', 1.0, b'?\xf0' + b'\x00' * 6),
+    ('float', 1.0, b'?\x80\x00\x00'),
+    ('uuid', uuid.UUID(int=1), b'\x00' * 15 + b'\x01'),
+    ('timeuuid', uuid.UUID(int=1), b'\x00' * 15 + b'\x01'),
+    ('inet', '127.0.0.1', b'\x7f\x00\x00\x01'),
+    ('inet', '::1', b'\x00' * 15 + b'\x01'),
+    ('varint', 0, b'\x00'),
+    ('varint', 128, b'\x00\x80'),
+    ('varint', -1, b'\xff'),
+    ('varint', -129, b'\xff\x7f'),
+    ('decimal', decimal.Decimal('-1.5'), b'\x00\x00\x00\x01\xf1'),
+    ('decimal', 1.5, b'\x00\x00\x00\x01\x0f'),
+    ('timestamp', 1000, b'\x00' * 6 + b'\x03\xe8'),
+    ('timestamp', datetime.datetime(1970, 1, 1, 0, 0, 1),
+     b'\x00' * 6 + b'\x03\xe8'),
+])
+def test_serialize(type, value, expected):
+    assert serialize(native_type(type), value) == expected
+
+
+@pytest.mark.parametrize(('type', 'value'), [
+    ('int', 2 ** 40),
+    ('int', 'x'),
+    ('ascii', u'\xe9'),
+    ('uuid', 'x'),
+    ('inet', 'x'),
+    ('blob', 2),
+    ('blob', u'x'),
+])
+def test_serialize_invalid(type, value):
+    with pytest.raises(RoutingError):
+        serialize(native_type(type), value)
+
+
+def test_routing_key():
+    assert routing_key([b'ab']) == b'ab'
+    assert routing_key([b'ab', b'c']) == (
+        b'\x00\x02ab\x00\x00\x01c\x00')
+
+
+def test_key_tokens(numpy):
+    for type, values in [('bigint', [1, -5, 2 ** 62]),
+                         ('int', [3, -7]),
+                         ('double', [1.5, 2]),
+                         ('text', [u'a', u'b'])]:
+        type = native_type(type)
+        assert list(key_tokens(type, values)) == [
+            murmur3(serialize(type, value)) for value in values]
+
+    with pytest.raises(RoutingError):
+        key_tokens(native_type('int'), [1, 2 ** 40])
+
+
+def test_partition_keys(catalog):
+    assert partition_keys(statement(
+        "INSERT INTO users (age, name) VALUES (1, 'bob')"), catalog) == [
+        ('bob',)]
+    assert partition_keys(statement(
+        "SELECT * FROM readings WHERE user IN (1, 2) AND day IN ('a', 'b') "
+        "AND at > 1"), catalog) == [
+        (1, 'a'), (1, 'b'), (2, 'a'), (2, 'b')]
+    assert partition_keys(CQL3(
+        "DELETE FROM ks.readings WHERE user = 1 AND day = 'a'").statement(),
+        catalog) == [(1, 'a')]
+
+
+@pytest.mark.parametrize('text', [
+    "INSERT INTO users (age) VALUES (1)",
+    "INSERT INTO users (name) VALUES (?)",
+    "SELECT * FROM readings WHERE user = 1",
+    "SELECT * FROM readings WHERE user = 1 AND day = :day",
+    "SELECT * FROM readings WHERE TOKEN(user, day) > TOKEN(1, 'a')",
+    "USE ks",
+    "INSERT INTO custom (k) VALUES ('x')",
+    "INSERT INTO users (name) VALUES (1)",
+])
+def test_unroutable(catalog, text):
+    with pytest.raises(RoutingError):
+        statement_keys(statement(text), catalog)
+
+
+def test_unknown_table(catalog):
+    with pytest.raises(SchemaError):
+        partition_keys(statement("SELECT * FROM missing WHERE k = 1"),
+                       catalog)
+
+
+def test_statement_tokens(catalog):
+    assert statement_tokens(statement(
+        "INSERT INTO users (name) VALUES ('123')"), catalog) == [
+        -7468325962851647638]
+
+    key = b'\x00\x04\x00\x00\x00\x01\x00\x00\x01a\x00'
+    assert statement_keys(statement(
+        "SELECT * FROM readings WHERE user = 1 AND day = 'a'"), catalog) == [
+        key]
+    assert statement_tokens(statement(
+        "SELECT * FROM readings WHERE user = 1 AND day = 'a'"), catalog) == [
+        murmur3(key)]
+
+
+def test_token_range():
+    ring = [-100, 0, 100]
+    assert token_range(-100, ring) == -100
+    assert token_range(-99, ring) == 0
+    assert token_range(100, ring) == 100
+    assert token_range(101, ring) == -100
+
+
+def test_group_by_range(catalog, numpy):
+    ring = [-2 ** 62, 0, 2 ** 62]
+    statements = [
+        statement("INSERT INTO users (name) VALUES ('{0}')".format(i))
+        for i in range(50)]
+    groups = group_by_range(statements, catalog, ring)
+
+    assert sorted(sum(groups.values(), []), key=statements.index) == (
+        statements)
+    for owner, group in groups.items():
+        assert owner in ring
+        for s in group:
+            [token] = statement_tokens(s, catalog)
+            assert token_range(token, ring) == owner
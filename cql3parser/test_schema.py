@@ -0,0 +1,210 @@
+from io import StringIO
+
+import pytest
+
+from cql3parser import CQL3, CQL3Nodes
+from cql3parser.schema import (
+    Catalog, ColumnSchema, IndexSchema, SchemaError)
+from cql3parser.script import split_statements
+
+MIGRATIONS = u"""
+CREATE KEYSPACE ks WITH replication = {'class': 'SimpleStrategy',
+                                       'replication_factor': 1};
+USE ks;
+CREATE TABLE users (
+    id uuid PRIMARY KEY,
+    "Name" text,
+    email text,
+    tags set<text>
+) WITH comment = 'people';
+CREATE TABLE events (
+    user uuid,
+    day int,
+    at timeuuid,
+    payload 'org.example.Payload',
+    PRIMARY KEY ((user, day), at)
+) WITH CLUSTERING ORDER BY (at DESC) AND COMPACT STORAGE;
+CREATE INDEX ON users (email);
+CREATE INDEX by_name ON ks.users ("Name");
+ALTER TABLE users ADD age int;
+ALTER KEYSPACE ks WITH durable_writes = false;
+"""
+
+
+def apply(catalog, script, parser=CQL3Nodes):
+    for text in split_statements(StringIO(script)):
+        catalog.apply(parser(text).statement())
+    return catalog
+
+
+@pytest.fixture(params=[CQL3Nodes, CQL3], ids=['nodes', 'terms'])
+def catalog(request):
+    return apply(Catalog(), MIGRATIONS, request.param)
+
+
+def test_keyspace(catalog):
+    assert catalog.keyspace == 'ks'
+    keyspace = catalog.get_keyspace('ks')
+    assert keyspace is catalog.get_keyspace()
+    assert keyspace.properties == {
+        'replication': {'class': 'SimpleStrategy', 'replication_factor': 1},
+        'durable_writes': False}
+    assert sorted(keyspace.tables) == ['events', 'users']
+
+
+def test_table(catalog):
+    users = catalog.table('users')
+    assert users is catalog.table(CQL3Nodes('ks.users').table())
+    assert users is catalog.table(CQL3Nodes('users').table())
+    assert users.column_names == ['id', 'Name', 'email', 'tags', 'age']
+    assert users.primary_key == ['id']
+    assert users.properties == {'comment': 'people'}
+    assert not users.compact_storage
+
+    events = catalog.table('events', 'ks')
+    assert events.partition_key == ['user', 'day']
+    assert events.clustering == ['at']
+    assert events.clustering_order == {'at': 'DESC'}
+    assert events.compact_storage
+
+
+def test_column(catalog):
+    column = catalog.column('users', CQL3Nodes('"Name"').column())
+    assert column == ColumnSchema(
+        'Name', CQL3Nodes('text').native_type(), 'regular')
+    assert catalog.column('users', 'id').kind == 'partition_key'
+    assert catalog.column('events', 'at').kind == 'clustering'
+    assert catalog.column('events', 'payload').type == 'org.example.Payload'
+    assert catalog.column('users', 'tags').type == CQL3Nodes(
+        'set<text>').comparator_type()
+
+    with pytest.raises(SchemaError):
+        catalog.column('users', 'name')
+
+
+def test_index(catalog):
+    assert catalog.index('users', 'email') == IndexSchema(
+        'users_email_idx', 'ks', 'users', 'email')
+    assert catalog.index('users', 'Name').name == 'by_name'
+    assert catalog.index('users', 'age') is None
+    assert sorted(catalog.get_keyspace().indexes) == [
+        'by_name', 'users_email_idx']
+
+
+def test_unknown_names():
+    catalog = Catalog()
+    with pytest.raises(SchemaError):
+        catalog.table('users')
+    with pytest.raises(SchemaError):
+        catalog.get_keyspace('ks')
+
+    apply(catalog, u"CREATE KEYSPACE ks WITH a = 1; USE ks")
+    with pytest.raises(SchemaError):
+        catalog.table('users')
+
+
+def test_alter_table(catalog):
+    apply(catalog, u"""
+        ALTER TABLE users ALTER age TYPE varint;
+        ALTER TABLE users DROP email;
+        ALTER TABLE users WITH comment = 'users' AND gc_grace_seconds = 1;
+        ALTER TABLE events RENAME user TO owner AND at TO time;
+    """)
+    users = catalog.table('users')
+    assert catalog.column(users, 'age').type.name == 'VARINT'
+    assert users.column_names == ['id', 'Name', 'tags', 'age']
+    assert catalog.index(users, 'email') is None
+    assert 'users_email_idx' not in catalog.get_keyspace().indexes
+    assert users.properties == {'comment': 'users', 'gc_grace_seconds': 1}
+
+    events = catalog.table('events')
+    assert events.partition_key == ['owner', 'day']
+    assert events.clustering_order == {'time': 'DESC'}
+    assert catalog.column(events, 'time') == ColumnSchema(
+        'time', CQL3Nodes('timeuuid').native_type(), 'clustering')
+
+
+@pytest.mark.parametrize('statement', [
+    "CREATE KEYSPACE ks WITH a = 1",
+    "CREATE TABLE users (id int PRIMARY KEY)",
+    "CREATE TABLE t (id int PRIMARY KEY, id text)",
+    "CREATE TABLE t (id int)",
+    "CREATE TABLE t (id int PRIMARY KEY, v int, PRIMARY KEY (v))",
+    "CREATE TABLE t (id int, PRIMARY KEY (other))",
+    "CREATE TABLE t (k int, c int, PRIMARY KEY (k, c)) "
+    "WITH CLUSTERING ORDER BY (k ASC)",
+    "CREATE TABLE other.t (id int PRIMARY KEY)",
+    "ALTER TABLE users ADD email int",
+    "ALTER TABLE users DROP id",
+    "ALTER TABLE users ALTER missing TYPE int",
+    "ALTER TABLE users RENAME email TO mail",
+    "ALTER TABLE events RENAME user TO day",
+    "ALTER TABLE events RENAME user TO x AND day TO x",
+    "ALTER TABLE events RENAME user TO x AND user TO y",
+    "ALTER TABLE events RENAME user TO x AND x TO y",
+    "ALTER TABLE events RENAME user TO x AND at TO user",
+    "CREATE INDEX ON users (email)",
+    "CREATE INDEX by_name ON users (age)",
+    "DROP INDEX missing",
+    "DROP TABLE missing",
+    "TRUNCATE missing",
+    "USE missing",
+])
+def test_invalid(catalog, statement):
+    columns = dict((name, dict(catalog.table(name).columns))
+                   for name in ['users', 'events'])
+    with pytest.raises(SchemaError):
+        catalog.apply(CQL3Nodes(statement).statement())
+    for name in columns:
+        assert catalog.table(name).columns == columns[name]
+
+
+def test_drop(catalog):
+    apply(catalog, u"DROP INDEX by_name")
+    assert catalog.index('users', 'Name') is None
+    assert sorted(catalog.get_keyspace().indexes) == ['users_email_idx']
+
+    apply(catalog, u"DROP TABLE ks.users")
+    assert list(catalog.get_keyspace().tables) == ['events']
+    assert catalog.get_keyspace().indexes == {}
+
+    apply(catalog, u"CREATE KEYSPACE other WITH a = 1; DROP KEYSPACE other")
+    assert catalog.keyspace == 'ks'
+
+    apply(catalog, u"DROP KEYSPACE ks")
+    assert catalog.keyspaces == {}
+    assert catalog.keyspace is None
+    with pytest.raises(SchemaError) as e:
+        catalog.table('users')
+    assert str(e.value) == 'No keyspace has been specified'
+
+
+def test_other_statements_ignored(catalog):
+    apply(catalog, u"""
+        INSERT INTO users (id) VALUES (?);
+        SELECT * FROM missing;
+        CREATE USER bob;
+        TRUNCATE events;
+    """)
+    assert sorted(catalog.get_keyspace().tables) == ['events', 'users']
+
+
+def test_version(catalog):
+    version = catalog.version
+    apply(catalog, u"USE ks; TRUNCATE users; SELECT * FROM users")
+    assert catalog.version == version
+
+    apply(catalog, u"ALTER TABLE users ADD other int")
+    assert catalog.version == version + 1
+
+    with pytest.raises(SchemaError):
+        apply(catalog, u"ALTER TABLE users ADD other int")
+    assert catalog.version == version + 1
+
+
+def test_apply_all():
+    catalog = Catalog()
+    catalog.apply_all(CQL3Nodes(text).statement() for text in [
+        "CREATE KEYSPACE ks WITH a = 1",
+        "CREATE TABLE ks.t (k int PRIMARY KEY)"])
+    assert catalog.column('t', 'k', 'ks').kind == 'partition_key'
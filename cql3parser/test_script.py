@@ -0,0 +1,145 @@
+from io import StringIO
+
+import pytest
+
+from parsley import ParseError, termMaker as t
+
+from cql3parser import CQL3, iter_statements
+from cql3parser.script import (
+    StatementSplitter, parse_script, recover_statements, split_statements)
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 7, 64 * 1024])
+def test_split_statements(script, script_statements, chunk_size):
+    assert list(split_statements(StringIO(script), chunk_size)) == (
+        script_statements)
+
+
+def test_splitter_feed():
+    splitter = StatementSplitter()
+    assert splitter.feed(u"USE ks; DROP TA") == [u"USE ks"]
+    assert splitter.feed(u"BLE foo;;  ") == [u"DROP TABLE foo"]
+    assert splitter.close() == []
+
+
+def test_splitter_unterminated_string():
+    splitter = StatementSplitter()
+    assert splitter.feed(u"USE ks; SELECT 'oops;") == [u"USE ks"]
+    assert splitter.close() == [u"SELECT 'oops;"]
+
+
+def test_splitter_large_statement():
+    literal = u"it''s;" * 20000
+    blob = u'0x' + u'ab' * 50000
+    text = u"INSERT INTO t (a, b) VALUES ('{0}', {1}); USE ks".format(
+        literal, blob)
+    splitter = StatementSplitter()
+    statements = []
+    for char in text:
+        statements.extend(splitter.feed(char))
+        # Nothing is held back to be scanned again but the quote which
+        # might start an escaped quote.
+        assert len(splitter._buffer) <= 1
+    assert statements == [text[:text.index(u'; USE')]]
+    assert splitter.close() == [u'USE ks']
+
+
+@pytest.mark.parametrize(('text', 'statements'), [
+    (u"BEGIN COUNTER BATCH a; b; APPLY BATCH; c",
+     [u"BEGIN COUNTER BATCH a; b; APPLY BATCH", u"c"]),
+    (u"BEGIN BATCHES a; b", [u"BEGIN BATCHES a", u"b"]),
+    (u"BEGIN 'x' BATCH a; b", [u"BEGIN 'x' BATCH a", u"b"]),
+    (u"BEGIN BATCH a 'APPLY BATCH'; b; APPLY\n\tBATCH; c",
+     [u"BEGIN BATCH a 'APPLY BATCH'; b; APPLY\n\tBATCH", u"c"]),
+    (u"BEGIN BATCH a; XAPPLY BATCH; b",
+     [u"BEGIN BATCH a; XAPPLY BATCH; b"]),
+])
+@pytest.mark.parametrize('chunk_size', [1, 4, 1000])
+def test_splitter_batches(text, statements, chunk_size):
+    assert list(split_statements(StringIO(text), chunk_size)) == statements
+
+
+def test_iter_statements(script):
+    statements = iter_statements(StringIO(script), chunk_size=5)
+    assert next(statements) == t.Use(t.Keyspace(t.Identifier('ks')))
+    assert [s.tag.name for s in statements] == [
+        'CreateKeyspace', 'Insert', 'Select', 'Batch', 'Drop']
+
+
+BROKEN = u"""
+USE ks;
+SELECT * FROM WHERE a = 1;
+INSERT INTO foo (a) VALUES (1)
+DELETE FROM foo WHERE a = 1;
+DROP TABLE foo bar;
+begin batch
+    INSERT INTO foo (bar, baz) VALUES ('a', 'b');
+SELECT * FROM foo;
+TRUNCATE foo
+"""
+
+
+def test_recover_statements():
+    statements = list(recover_statements(StringIO(BROKEN), chunk_size=7))
+    assert [(s.text, s.value is not None, s.error is not None)
+            for s in statements] == [
+        (u"USE ks", True, False),
+        (u"SELECT * FROM WHERE a = 1", False, True),
+        (u"INSERT INTO foo (a) VALUES (1)", True, True),
+        (u"DELETE FROM foo WHERE a = 1", True, False),
+        (u"DROP TABLE foo bar", False, True),
+        (u"begin batch\n"
+         u"    INSERT INTO foo (bar, baz) VALUES ('a', 'b')", False, True),
+        (u"SELECT * FROM foo", True, False),
+        (u"TRUNCATE foo", True, False),
+    ]
+    assert statements[2].error.position == len(statements[2].text)
+    assert statements[2].error.error == [('expected', 'token', ';')]
+    for s in statements:
+        assert BROKEN[s.start:s.end] == s.text
+
+
+def test_parse_script():
+    statements, errors = parse_script(StringIO(BROKEN))
+    assert [s.tag.name for s in statements] == [
+        'Use', 'Insert', 'Delete', 'Select', 'Truncate']
+    assert [offset for offset, _ in errors] == [
+        BROKEN.index(u'a = 1'), BROKEN.index(u'\nDELETE'),
+        BROKEN.index(u'bar;'), BROKEN.index(u';\nSELECT * FROM foo')]
+    assert all(isinstance(e, ParseError) for _, e in errors)
+
+
+def test_parse_script_without_errors(script, script_statements):
+    statements, errors = parse_script(StringIO(script))
+    assert len(statements) == len(script_statements)
+    assert errors == []
+
+
+@pytest.mark.parametrize(
+    ('statement', 'rule'),
+    [('USE ks', 'use'),
+     ('DROP INDEX idx', 'drop'),
+     ('TRUNCATE foo', 'truncate'),
+     ('GRANT ALL ON ALL KEYSPACES TO user', 'grant'),
+     ('REVOKE ALL ON ALL KEYSPACES FROM user', 'revoke'),
+     ('LIST USERS', 'list_users'),
+     ('LIST ALL PERMISSIONS', 'list_permissions'),
+     ("CREATE USER u WITH PASSWORD 'p'", 'create_user'),
+     ('ALTER USER u SUPERUSER', 'alter_user'),
+     ('CREATE INDEX ON foo (bar)', 'create_index'),
+     ("CREATE KEYSPACE ks WITH a = 1", 'create_keyspace'),
+     ("ALTER KEYSPACE ks WITH a = 1", 'alter_keyspace'),
+     ('SELECT * FROM foo', 'select'),
+     ("INSERT INTO foo (a) VALUES (1)", 'insert'),
+     ("DELETE FROM foo WHERE a = 1", 'delete'),
+     ("BEGIN BATCH DELETE FROM foo WHERE a = 1 APPLY BATCH", 'batch')])
+def test_statement(statement, rule):
+    assert CQL3(statement).statement() == getattr(CQL3(statement), rule)()
+
+
+@pytest.mark.parametrize(
+    'statement', ['', 'UPDATE foo SET a = 1', 'foo', 'CREATE TABLE',
+                  'LIST USERS foo'])
+def test_statement_errors(statement):
+    with pytest.raises(ParseError):
+        CQL3(statement).statement()
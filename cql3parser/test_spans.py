@@ -0,0 +1,83 @@
+import pytest
+
+from cql3parser import CQL3Nodes, nodes
+from cql3parser.spans import parse_spans
+
+SELECT = ("SELECT a, ttl(b) FROM ks.t WHERE k = 'x' AND c IN (1, ?) "
+          "ORDER BY c DESC LIMIT 3 ALLOW FILTERING")
+
+
+def walk(value):
+    if isinstance(value, nodes.Node):
+        yield value
+        values = [getattr(value, field) for field in value.__slots__]
+    elif isinstance(value, dict):
+        values = list(value.keys()) + list(value.values())
+    elif isinstance(value, (list, tuple, set)):
+        values = value
+    else:
+        values = []
+
+    for v in values:
+        for node in walk(v):
+            yield node
+
+
+def test_same_results(canonical):
+    statement, _ = canonical
+    value, _ = parse_spans(statement)
+    assert value == CQL3Nodes(statement).statement()
+
+
+def test_every_node_has_a_span(canonical):
+    statement, _ = canonical
+    value, spans = parse_spans(statement)
+    for node in walk(value):
+        assert node in spans
+        start, end = spans[node]
+        assert 0 <= start < end <= len(statement)
+
+
+def test_spans():
+    select, spans = parse_spans(SELECT)
+    assert spans.text(select, SELECT) == SELECT
+    assert spans.text(select.table, SELECT) == 'ks.t'
+    assert spans.text(select.table.keyspace, SELECT) == 'ks'
+    assert [spans.text(s, SELECT) for s in select.selectors] == [
+        'a', 'ttl(b)']
+    assert [spans.text(r, SELECT) for r in select.where] == [
+        "k = 'x'", 'c IN (1, ?)']
+    assert spans.text(select.where[1].value[1], SELECT) == '?'
+    assert spans.text(select.order_by, SELECT) == 'ORDER BY c DESC'
+    assert spans.text(select.limit, SELECT) == 'LIMIT 3'
+    assert spans.text(select.allow_filtering, SELECT) == 'ALLOW FILTERING'
+
+
+def test_equal_nodes():
+    """
+    Spans are looked up by identity, equal nodes have their own spans.
+    """
+    text = 'SELECT a FROM t WHERE a = 1'
+    select, spans = parse_spans(text)
+    first, second = select.selectors[0], select.where[0].lhs
+    assert first == second
+    assert spans[first] == (7, 8)
+    assert spans[second] == (22, 23)
+
+
+def test_parallel_arrays():
+    _, spans = parse_spans(SELECT)
+    assert spans.starts.typecode == spans.ends.typecode == 'i'
+    assert len(spans.nodes) == len(spans.starts) == len(spans.ends)
+    assert len(spans) == len(spans.nodes)
+
+
+def test_other_rules():
+    keyspace, spans = parse_spans('  "Ks"', 'keyspace')
+    assert spans[keyspace] == spans[keyspace.name] == (2, 6)
+
+
+def test_unknown_node():
+    _, spans = parse_spans('USE ks')
+    with pytest.raises(KeyError):
+        spans[nodes.Keyspace(nodes.Identifier('ks'))]
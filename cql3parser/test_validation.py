@@ -0,0 +1,205 @@
+import datetime
+import decimal
+import uuid
+
+import pytest
+
+from cql3parser import CQL3Nodes, nodes, validation
+from cql3parser.prepared import prepare
+from cql3parser.validation import (
+    Invalid, ValidationError, check, invalid_rows, validate)
+
+TIMEUUID = uuid.UUID('62c36092-82a1-11e2-93d1-46196ee77204')
+UUID4 = uuid.UUID('62c36092-82a1-4a00-93d1-46196ee77204')
+
+VALID = [
+    ('ascii', 'abc'),
+    ('ascii', u'abc'),
+    ('bigint', 2 ** 63 - 1),
+    ('bigint', -2 ** 63),
+    ('blob', b'\x00\xff'),
+    ('blob', bytearray(b'x')),
+    ('boolean', True),
+    ('counter', 1),
+    ('decimal', decimal.Decimal('1.5')),
+    ('decimal', 1),
+    ('decimal', 1.5),
+    ('double', 1e300),
+    ('double', 1),
+    ('float', 1.5),
+    ('float', float('inf')),
+    ('inet', '127.0.0.1'),
+    ('inet', '::1'),
+    ('int', 2 ** 31 - 1),
+    ('int', -2 ** 31),
+    ('text', u'caf\xe9'),
+    ('text', u'caf\xe9'.encode('utf-8')),
+    ('timestamp', 1362000000000),
+    ('timestamp', datetime.datetime(2013, 3, 1)),
+    ('uuid', UUID4),
+    ('uuid', TIMEUUID),
+    ('timeuuid', TIMEUUID),
+    ('varchar', 'x'),
+    ('varint', 2 ** 100),
+    ('int', nodes.Binding()),
+    ('int', nodes.NamedBinding('x')),
+]
+
+INVALID = [
+    ('ascii', u'caf\xe9'),
+    ('ascii', u'caf\xe9'.encode('utf-8')),
+    ('ascii', 1),
+    ('bigint', 2 ** 63),
+    ('bigint', 1.0),
+    ('blob', 1),
+    ('boolean', 1),
+    ('counter', True),
+    ('decimal', float('nan')),
+    ('decimal', 'x'),
+    ('double', '1'),
+    ('float', 1e39),
+    ('inet', '256.0.0.1'),
+    ('inet', 'localhost'),
+    ('inet', 1),
+    ('int', 2 ** 31),
+    ('int', -2 ** 31 - 1),
+    ('int', True),
+    ('int', '1'),
+    ('int', None),
+    ('text', b'caf\xe9'),
+    ('text', 1),
+    ('timestamp', '2013-03-01'),
+    ('uuid', str(UUID4)),
+    ('timeuuid', UUID4),
+    ('varint', 1.0),
+]
+
+
+@pytest.mark.parametrize(('type', 'value'), VALID)
+def test_valid(type, value):
+    assert check(type, value)
+
+
+@pytest.mark.parametrize(('type', 'value'), INVALID)
+def test_invalid(type, value):
+    assert not check(type, value)
+
+
+def test_native_type():
+    int_type = nodes.NativeType(
+        'INT', 'org.apache.cassandra.db.marshal.Int32Type')
+    assert check(int_type, 1)
+    assert not check(int_type, 'x')
+
+
+@pytest.mark.parametrize(('type', 'value', 'valid'), [
+    ('MAP<TEXT, INT>', {u'a': 1, 'b': nodes.Binding()}, True),
+    ('MAP<TEXT, INT>', {}, True),
+    ('MAP<TEXT, INT>', {u'a': 2 ** 31}, False),
+    ('MAP<TEXT, INT>', {1: 1}, False),
+    ('MAP<TEXT, INT>', [(u'a', 1)], False),
+    ('LIST<INT>', [1, 2], True),
+    ('LIST<INT>', (1, 2), True),
+    ('LIST<INT>', [1, 'x'], False),
+    ('LIST<INT>', set([1]), False),
+    ('SET<UUID>', set([UUID4]), True),
+    ('SET<UUID>', frozenset([UUID4, TIMEUUID]), True),
+    ('SET<UUID>', set([1]), False),
+    ('SET<UUID>', [UUID4], False),
+    ("LIST<'org.Foo'>", [object()], True),
+    ("LIST<'org.Foo'>", object(), False),
+])
+def test_collection_type(type, value, valid):
+    assert check(CQL3Nodes(type).comparator_type(), value) is valid
+
+
+def test_custom_type():
+    assert check('org.example.PointType', object())
+    assert check(CQL3Nodes("'org.Foo'").comparator_type(), None)
+
+
+@pytest.mark.parametrize('type', ['integer', 'Int32Type', 'list'])
+def test_unknown_type(type):
+    with pytest.raises(ValueError) as e:
+        check(type, 1)
+    assert repr(type) in str(e.value)
+
+
+INSERT = prepare("INSERT INTO t (id, n, name, other) VALUES (?, ?, ?, ?)",
+                 {'id': 'timeuuid', 'n': 'int', 'name': 'ascii'})
+
+
+def test_validate():
+    validate(INSERT, [TIMEUUID, 1, 'x', object()])
+
+    with pytest.raises(ValidationError) as e:
+        validate(INSERT, [TIMEUUID, 2 ** 31, 'x', None])
+
+    assert e.value.variable is INSERT.variables[1]
+    assert e.value.value == 2 ** 31
+
+
+def test_validate_named():
+    p = prepare("SELECT * FROM t WHERE n = :n", {'n': 'int'})
+    validate(p, {'n': 1})
+
+    with pytest.raises(ValidationError):
+        validate(p, {'n': 'x'})
+
+
+def rows():
+    return [
+        [TIMEUUID, 1, 'a', None],
+        [UUID4, 2, 'b', None],
+        [TIMEUUID, 2 ** 40, u'\xe9', None],
+        [TIMEUUID, -5, 'd', None],
+    ]
+
+
+@pytest.fixture(params=['numpy', 'python'])
+def numpy(request, monkeypatch):
+    if request.param == 'numpy':
+        pytest.importorskip('numpy')
+    else:
+        monkeypatch.setattr(validation, 'numpy', None)
+
+
+def test_invalid_rows(numpy):
+    assert invalid_rows(INSERT, rows()) == [
+        Invalid(1, INSERT.variables[0], UUID4),
+        Invalid(2, INSERT.variables[1], 2 ** 40),
+        Invalid(2, INSERT.variables[2], u'\xe9'),
+    ]
+
+
+def test_invalid_rows_mixed_values(numpy):
+    p = prepare("INSERT INTO t (n, f) VALUES (?, ?)",
+                {'n': 'int', 'f': 'float'})
+
+    assert [(i.row, i.variable.index) for i in invalid_rows(p, [
+        [1, 1.0],
+        [True, 1e39],
+        [2 ** 70, 1],
+        [nodes.Binding(), float('nan')],
+        [-2 ** 31, -1e39],
+    ])] == [(1, 0), (1, 1), (2, 0), (4, 1)]
+
+
+def test_invalid_rows_numbers(numpy):
+    p = prepare("INSERT INTO t (n, f) VALUES (?, ?)",
+                {'n': 'int', 'f': 'float'})
+
+    assert invalid_rows(p, [[i, float(i)] for i in range(10)]) == []
+    assert invalid_rows(p, [[2 ** 31, 1e39], [1, 1.0]]) == [
+        Invalid(0, p.variables[0], 2 ** 31),
+        Invalid(0, p.variables[1], 1e39),
+    ]
+
+
+def test_invalid_rows_empty():
+    assert invalid_rows(INSERT, []) == []
+
+
+def test_invalid_rows_wrong_length():
+    with pytest.raises(ValueError):
+        invalid_rows(INSERT, [[1]])
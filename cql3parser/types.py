@@ -1,3 +1,12 @@
+# The python types of the text and integer literals the grammar returns.
+try:
+    text_types = (str, unicode)
+    integer_types = (int, long)
+except NameError:
+    text_types = (str,)
+    integer_types = (int,)
+
+
 def _type(name, package='org.apache.cassandra.db.marshal'):
     return '{0}.{1}'.format(package, name)
 
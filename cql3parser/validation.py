@@ -0,0 +1,272 @@
+"""
+Checking values against the native types of the columns they're bound to.
+
+validate checks one row of values for a PreparedStatement, invalid_rows
+checks a whole batch of rows a column at a time.  Integer and float columns
+are checked with numpy when it is installed and every value in the column
+is a plain python number, otherwise one value at a time.
+"""
+import datetime
+import decimal
+import math
+import re
+import socket
+import uuid
+
+from collections import namedtuple
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from cql3parser import nodes
+from cql3parser.types import integer_types, text_types
+
+# The value of the variable of a PreparedStatement in the given row which
+# isn't valid for its type.
+Invalid = namedtuple('Invalid', 'row variable value')
+
+
+class ValidationError(ValueError):
+    """
+    A value isn't valid for the type of the column it is bound to.
+    """
+    def __init__(self, variable, value):
+        ValueError.__init__(self, '{0!r} is not a valid {1} for {2}'.format(
+            value, variable.type.name, variable.column))
+        self.variable = variable
+        self.value = value
+
+
+_INT32 = (-2 ** 31, 2 ** 31 - 1)
+_INT64 = (-2 ** 63, 2 ** 63 - 1)
+_FLOAT32_MAX = 3.4028234663852886e+38
+
+_non_ascii = re.compile(u'[^\x00-\x7f]')
+
+
+def _integer(value):
+    # bool is an int subclass, but not a number in CQL.
+    return type(value) in integer_types
+
+
+def _integer_range(low, high):
+    def check(value):
+        return _integer(value) and low <= value <= high
+    return check
+
+
+def _number(value):
+    return _integer(value) or type(value) is float
+
+
+def _float(value):
+    return _number(value) and (
+        abs(value) <= _FLOAT32_MAX or math.isinf(value) or
+        math.isnan(value))
+
+
+def _decimal(value):
+    if type(value) is float:
+        return not (math.isinf(value) or math.isnan(value))
+    return _integer(value) or isinstance(value, decimal.Decimal)
+
+
+def _text(value):
+    if not isinstance(value, text_types):
+        return False
+    if isinstance(value, bytes):
+        # python 2 byte strings have to be utf-8.
+        try:
+            value.decode('utf-8')
+        except UnicodeDecodeError:
+            return False
+    return True
+
+
+def _ascii(value):
+    return isinstance(value, text_types) and not _non_ascii.search(value)
+
+
+def _inet(value):
+    if not isinstance(value, text_types):
+        return False
+    for family in (socket.AF_INET, socket.AF_INET6):
+        try:
+            socket.inet_pton(family, value)
+        except (socket.error, ValueError):
+            continue
+        return True
+    return False
+
+
+def _timestamp(value):
+    return (isinstance(value, datetime.datetime) or
+            _integer_range(*_INT64)(value))
+
+
+def _uuid(value):
+    return isinstance(value, uuid.UUID)
+
+
+def _timeuuid(value):
+    return isinstance(value, uuid.UUID) and value.version == 1
+
+
+def _instance(*types):
+    def check(value):
+        return isinstance(value, types)
+    return check
+
+
+# A check for values of each native type keyword.
+checks = {
+    'ASCII': _ascii,
+    'BIGINT': _integer_range(*_INT64),
+    'BLOB': _instance(bytes, bytearray),
+    'BOOLEAN': _instance(bool),
+    'COUNTER': _integer_range(*_INT64),
+    'DECIMAL': _decimal,
+    'DOUBLE': _number,
+    'FLOAT': _float,
+    'INET': _inet,
+    'INT': _integer_range(*_INT32),
+    'TEXT': _text,
+    'TIMESTAMP': _timestamp,
+    'UUID': _uuid,
+    'VARCHAR': _text,
+    'VARINT': _integer,
+    'TIMEUUID': _timeuuid,
+}
+
+
+def _numpy_integers(low, high):
+    def invalid(column):
+        if set(map(type, column)) != set([int]):
+            return None
+        try:
+            values = numpy.fromiter(column, numpy.int64, len(column))
+        except OverflowError:
+            return None
+        return numpy.flatnonzero((values < low) | (values > high)).tolist()
+    return invalid
+
+
+def _numpy_floats(column):
+    if set(map(type, column)) != set([float]):
+        return None
+    values = numpy.fromiter(column, numpy.float64, len(column))
+    with numpy.errstate(invalid='ignore'):
+        return numpy.flatnonzero(
+            numpy.isfinite(values) &
+            (numpy.abs(values) > _FLOAT32_MAX)).tolist()
+
+
+# Whole column checks, returning the indexes of the invalid values or None
+# if the column has values they can't handle.
+_numpy_checks = {
+    'BIGINT': _numpy_integers(*_INT64),
+    'COUNTER': _numpy_integers(*_INT64),
+    'INT': _numpy_integers(*_INT32),
+    'FLOAT': _numpy_floats,
+}
+
+
+def _native_type(type):
+    """
+    The keyword of a native type, or None for a CollectionType or the class
+    name of a custom type.
+
+    :raises ValueError: If type is a keyword which isn't a native type.
+    """
+    if isinstance(type, nodes.NativeType):
+        return type.name
+    if isinstance(type, nodes.CollectionType) or '.' in type:
+        return None
+    if type.upper() not in checks:
+        raise ValueError('{0!r} is not a native type'.format(type))
+    return type.upper()
+
+
+def _collection(type, value):
+    if type.kind == 'MAP':
+        key_type, value_type = type.types
+        return isinstance(value, dict) and all(
+            check(key_type, k) and check(value_type, v)
+            for k, v in value.items())
+
+    [element_type] = type.types
+    if type.kind == 'LIST':
+        collections = (list, tuple)
+    else:
+        collections = (set, frozenset)
+    return isinstance(value, collections) and all(
+        check(element_type, v) for v in value)
+
+
+def check(type, value):
+    """
+    Whether value is valid for a type: a native type, as a NativeType or a
+    type keyword like 'int', or a CollectionType, whose elements are checked
+    against its element types.  Values of custom types, given by their class
+    name like 'org.example.PointType', aren't checked.  Bind markers are
+    valid for every type.
+
+    :raises ValueError: If type is a keyword which isn't a native type.
+    """
+    if isinstance(value, (nodes.Binding, nodes.NamedBinding)):
+        return True
+    if isinstance(type, nodes.CollectionType):
+        return _collection(type, value)
+    native = _native_type(type)
+    if native is None:
+        return True
+    return checks[native](value)
+
+
+def _invalid(type, column):
+    """
+    The indexes of the values in column which aren't valid for type.
+    """
+    native = _native_type(type)
+    if numpy is not None and native in _numpy_checks:
+        invalid = _numpy_checks[native](column)
+        if invalid is not None:
+            return invalid
+
+    return [i for i, value in enumerate(column) if not check(type, value)]
+
+
+def validate(prepared, values):
+    """
+    Check values for a PreparedStatement, as they would be passed to its
+    bind, against the types of its variables.  Variables without a type
+    aren't checked.
+
+    :raises ValidationError: For the first invalid value.
+    """
+    for variable, value in zip(prepared.variables, prepared.ordered(values)):
+        if variable.type is not None and not check(variable.type, value):
+            raise ValidationError(variable, value)
+
+
+def invalid_rows(prepared, rows):
+    """
+    Check a batch of rows of values for a PreparedStatement, validating each
+    column at once, and return an Invalid for every invalid value ordered by
+    row.
+    """
+    rows = [prepared.ordered(values) for values in rows]
+    if not rows:
+        return []
+
+    invalid = []
+    for variable, column in zip(prepared.variables, zip(*rows)):
+        if variable.type is None:
+            continue
+        for row in _invalid(variable.type, column):
+            invalid.append(Invalid(row, variable, column[row]))
+
+    invalid.sort(key=lambda i: (i.row, i.variable.index))
+    return invalid